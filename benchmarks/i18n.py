@@ -0,0 +1,61 @@
+"""Micro-benchmark of gettext setup and App() construction
+
+Compares the gettext setup App() used to do on every construction (replicated
+here as legacy_setup) with the cached catalogs of devops_toolset.i18n.loader,
+and measures switching between languages at runtime.
+
+Args:
+    --number: Number of iterations per measure.
+"""
+
+import argparse
+import gettext
+import os
+import sys
+import timeit
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+import devops_toolset.i18n.loader as loader  # noqa: E402
+from devops_toolset.core.app import App  # noqa: E402
+
+
+def legacy_setup(settings):
+    """Replica of the gettext setup done before the catalog cache."""
+    gettext.translation("base", localedir=settings.locales_path, languages=[settings.language]).install()
+
+
+def measure(number: int):
+    """Measures gettext setup, App() construction and language switching.
+
+    Args:
+        number: Number of iterations per measure.
+    """
+
+    settings = App.instance().settings
+
+    measures = {
+        "gettext setup (legacy)": timeit.timeit(lambda: legacy_setup(settings), number=number),
+        "gettext setup (cached)": timeit.timeit(lambda: loader.setup(settings), number=number),
+        "language switch (cached)": timeit.timeit(
+            lambda: (loader.set_language(settings, "es"), loader.set_language(settings, "en")), number=number) / 2,
+    }
+
+    # Logging configuration is the same in both cases, but it is part of App()
+    with patch.object(loader, "setup", legacy_setup):
+        measures["App() (legacy)"] = timeit.timeit(App, number=number)
+    measures["App() (cached)"] = timeit.timeit(App, number=number)
+    measures["App.instance()"] = timeit.timeit(App.instance, number=number)
+
+    print(f"{number} iterations")
+    for name, seconds in measures.items():
+        print(f"{name:<25} {seconds / number * 1e6:10.3f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    args, args_unknown = parser.parse_known_args()
+
+    measure(args.number)
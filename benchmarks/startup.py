@@ -0,0 +1,284 @@
+"""Measures the startup cost of every devops-toolset entry point
+
+Every module with a `if __name__ == "__main__":` block is imported in a fresh
+interpreter (the same cost a CI step pays before doing any real work) and the
+following metrics are recorded:
+
+    - Cold start wall time of the whole interpreter process (median of runs).
+    - Import wall time of the module itself, measured inside the child.
+    - Peak RSS of the child process.
+    - Per-module `-X importtime` breakdown (slowest modules only).
+
+Network access is stubbed in the child processes: requests and botocore
+calls raise instead of leaving the machine, so the benchmark runs offline.
+
+Args:
+    --record: If present it writes the results as the new baseline.
+    --baseline: Path to the baseline JSON file.
+    --threshold: Allowed relative regression of the cold start time (0.2 = 20%).
+    --repeat: Number of cold starts per entry point.
+    --module: Only benchmark the given module(s). Can be used several times.
+    --top: Number of modules kept in the importtime breakdown.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT_PATH: pathlib.Path = pathlib.Path(__file__).parent.parent.absolute()
+SRC_PATH: pathlib.Path = pathlib.Path.joinpath(ROOT_PATH, "src")
+PACKAGE_PATH: pathlib.Path = pathlib.Path.joinpath(SRC_PATH, "devops_toolset")
+DEFAULT_BASELINE_PATH: pathlib.Path = pathlib.Path.joinpath(ROOT_PATH, "benchmarks", "startup-baseline.json")
+ENTRY_POINT_MARKER: str = 'if __name__ == "__main__":'
+
+# Code run by the child interpreter. Network stubs are installed through a
+# post-import hook so requests/botocore are not imported ahead of the module
+# being measured (that would hide their import cost).
+CHILD_CODE: str = r'''
+import importlib, importlib.abc, importlib.util, json, resource, sys, time
+
+
+class NetworkDisabledError(RuntimeError):
+    pass
+
+
+def _blocked(*args, **kwargs):
+    raise NetworkDisabledError("Network access is disabled while benchmarking")
+
+
+STUBS = {
+    "requests.sessions": lambda m: setattr(m.Session, "request", _blocked),
+    "botocore.endpoint": lambda m: setattr(m.Endpoint, "make_request", _blocked),
+}
+
+
+class StubFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name not in STUBS:
+            return None
+        sys.meta_path.remove(self)
+        try:
+            spec = importlib.util.find_spec(name)
+        finally:
+            sys.meta_path.insert(0, self)
+        exec_module = spec.loader.exec_module
+
+        def patched_exec_module(module):
+            exec_module(module)
+            STUBS[name](module)
+
+        spec.loader.exec_module = patched_exec_module
+        return spec
+
+
+sys.meta_path.insert(0, StubFinder())
+sys.argv = [sys.argv[0]]
+start = time.perf_counter()
+importlib.import_module(MODULE)
+elapsed = time.perf_counter() - start
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.stdout.flush()
+sys.__stdout__.write("\n@@BENCH@@" + json.dumps({"import_s": elapsed, "maxrss_kb": maxrss}) + "\n")
+'''
+
+
+def get_entry_points() -> List[str]:
+    """Gets the dotted names of all the package modules that can be run as
+    scripts.
+
+    Returns:
+        Sorted list of module names.
+    """
+
+    modules = []
+
+    for path in sorted(PACKAGE_PATH.rglob("*.py")):
+        with open(path, "r", encoding="utf-8") as file:
+            if ENTRY_POINT_MARKER not in file.read():
+                continue
+        relative_path = path.relative_to(SRC_PATH).with_suffix("")
+        modules.append(".".join(relative_path.parts))
+
+    return modules
+
+
+def parse_importtime(stderr: str, top: int) -> Dict[str, int]:
+    """Parses the -X importtime output into a module -> cumulative time dict.
+
+    Args:
+        stderr: stderr of a process started with -X importtime.
+        top: Number of slowest modules (by cumulative time) to keep.
+
+    Returns:
+        Dict with module name and cumulative microseconds.
+    """
+
+    timings = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        timings[name.strip()] = max(timings.get(name.strip(), 0), int(cumulative))
+
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:top]
+    return dict(slowest)
+
+
+def run_once(module: str, importtime: bool) -> dict:
+    """Imports a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name.
+        importtime: If True the child is started with -X importtime.
+
+    Returns:
+        Dict with the measured values.
+    """
+
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", f"MODULE = {module!r}\n{CHILD_CODE}"]
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_PATH), env.get("PYTHONPATH")]))
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    env.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    env.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    env.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    env["AWS_EC2_METADATA_DISABLED"] = "true"
+
+    start = time.perf_counter()
+    process = subprocess.run(command, cwd=ROOT_PATH, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             stdin=subprocess.DEVNULL, universal_newlines=True)
+    wall = time.perf_counter() - start
+
+    result = {"wall_s": wall, "returncode": process.returncode, "stderr": process.stderr}
+    for line in process.stdout.splitlines():
+        if line.startswith("@@BENCH@@"):
+            result.update(json.loads(line[len("@@BENCH@@"):]))
+
+    return result
+
+
+def benchmark_module(module: str, repeat: int, top: int) -> dict:
+    """Benchmarks the cold start of a module.
+
+    Args:
+        module: Dotted module name.
+        repeat: Number of cold starts.
+        top: Number of modules kept in the importtime breakdown.
+
+    Returns:
+        Dict with the aggregated metrics.
+    """
+
+    runs = [run_once(module, False) for _ in range(repeat)]
+    failed = [run for run in runs if run["returncode"] != 0 or "import_s" not in run]
+    if failed:
+        return {"error": failed[0]["stderr"].strip().splitlines()[-1:]}
+
+    profile = run_once(module, True)
+
+    return {
+        "wall_s": statistics.median(run["wall_s"] for run in runs),
+        "import_s": statistics.median(run["import_s"] for run in runs),
+        "maxrss_kb": max(run["maxrss_kb"] for run in runs),
+        "importtime_us": parse_importtime(profile["stderr"], top),
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Compares the results against the baseline.
+
+    Args:
+        results: Current results by module.
+        baseline: Baseline results by module.
+        threshold: Allowed relative regression of the cold start time.
+
+    Returns:
+        List of regression messages (empty if there are none).
+    """
+
+    regressions = []
+
+    for module, result in results.items():
+        if module not in baseline or "wall_s" not in result or "wall_s" not in baseline[module]:
+            continue
+        allowed = baseline[module]["wall_s"] * (1 + threshold)
+        if result["wall_s"] > allowed:
+            regressions.append(f"{module}: {result['wall_s']:.3f}s > {allowed:.3f}s "
+                               f"(baseline {baseline[module]['wall_s']:.3f}s + {threshold:.0%})")
+
+    return regressions
+
+
+def main(baseline_path: str, record: bool, threshold: float, repeat: int, modules: List[str], top: int) -> int:
+    """Runs the startup benchmark.
+
+    Args:
+        baseline_path: Path to the baseline JSON file.
+        record: If True the results are saved as the new baseline.
+        threshold: Allowed relative regression of the cold start time.
+        repeat: Number of cold starts per entry point.
+        modules: Modules to benchmark (all entry points if empty).
+        top: Number of modules kept in the importtime breakdown.
+
+    Returns:
+        Exit code: 0 if there are no regressions and every entry point could
+        be imported, 1 otherwise.
+    """
+
+    results = {}
+    errors = 0
+
+    for module in modules or get_entry_points():
+        results[module] = benchmark_module(module, repeat, top)
+        result = results[module]
+        if "error" in result:
+            print(f"{module:<70} ERROR {result['error']}")
+            errors += 1
+        else:
+            print(f"{module:<70} {result['wall_s'] * 1000:8.1f} ms  import {result['import_s'] * 1000:8.1f} ms  "
+                  f"rss {result['maxrss_kb'] / 1024:6.1f} MiB")
+
+    if record:
+        with open(baseline_path, "w", encoding="utf-8") as baseline_file:
+            json.dump({"python": sys.version.split()[0], "results": results}, baseline_file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+        return 1 if errors else 0
+
+    if not os.path.isfile(baseline_path):
+        print(f"No baseline found at {baseline_path}. Run with --record first.")
+        return 1 if errors else 0
+
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    regressions = compare(results, baseline, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH))
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--module", action="append", default=[])
+    parser.add_argument("--top", type=int, default=25)
+    args, args_unknown = parser.parse_known_args()
+
+    sys.exit(main(args.baseline, args.record, args.threshold, args.repeat, args.module, args.top))
@@ -0,0 +1,50 @@
+"""Micro-benchmark of the per-call overhead of tools.cli subprocess calls
+
+Runs a short command many times as a shell command (how every command used to
+be run) and as a list of arguments built with cli.build_argv(), which is run
+without a shell.
+
+Args:
+    --number: Number of calls per measure.
+    --command: Short command to be run (uname by default). Avoid shell
+        builtins such as true, which the shell runs without a new process.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+import devops_toolset.tools.cli as cli  # noqa: E402
+
+
+def measure(number: int, command: str):
+    """Measures the time per call of both execution paths.
+
+    Args:
+        number: Number of calls per measure.
+        command: Short command to be run.
+    """
+
+    argv = cli.build_argv(command)
+
+    measures = {
+        "shell (str)": timeit.timeit(lambda: cli.call_subprocess_with_result(command), number=number),
+        "build_argv": timeit.timeit(lambda: cli.build_argv(command), number=number),
+        "no shell (argv)": timeit.timeit(lambda: cli.call_subprocess_with_result(argv), number=number),
+    }
+
+    print(f"{command!r}, {number} calls")
+    for name, seconds in measures.items():
+        print(f"{name:<25} {seconds / number * 1e6:10.3f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--command", default="uname")
+    args, args_unknown = parser.parse_known_args()
+
+    measure(args.number, args.command)
@@ -0,0 +1,74 @@
+"""Micro-benchmark of LiteralsCore construction and lookups
+
+Compares the per-instance merge that ValueDictsBase used to do (replicated
+here as LegacyValueDicts) with the cached class-level registry, using the
+biggest Literals classes of the package.
+
+Args:
+    --number: Number of constructions / lookups per measure.
+"""
+
+import argparse
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from devops_toolset.core.LiteralsCore import LiteralsCore  # noqa: E402
+from devops_toolset.devops_platforms.Literals import Literals as PlatformLiterals  # noqa: E402
+from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals  # noqa: E402
+from devops_toolset.tools.Literals import Literals as ToolsLiterals  # noqa: E402
+
+VALUE_LIST = [WordpressLiterals, PlatformLiterals, ToolsLiterals]
+
+
+class LegacyValueDicts(object):
+    """Replica of the per-instance merge ValueDictsBase did before the registry."""
+
+    def __init__(self, instance_class, value_list):
+        all_dictionaries = self.get_dicts(instance_class)
+        for values in value_list:
+            all_dictionaries += self.get_dicts(values)
+        self.all = {}
+        for dictionary in all_dictionaries:
+            self.all.update(dictionary[1])
+
+    @staticmethod
+    def get_dicts(values_class):
+        return inspect.getmembers(values_class(), lambda m: type(m) is dict and len(m) > 0)
+
+    def get(self, key: str) -> str:
+        return str(self.all[key])
+
+
+def measure(number: int):
+    """Measures construction and lookup times.
+
+    Args:
+        number: Number of constructions / lookups per measure.
+    """
+
+    legacy = LegacyValueDicts(LiteralsCore, VALUE_LIST)
+    cached = LiteralsCore(VALUE_LIST)
+    keys = list(cached.all.keys())
+
+    measures = {
+        "construction (legacy)": timeit.timeit(lambda: LegacyValueDicts(LiteralsCore, VALUE_LIST), number=number),
+        "construction (registry)": timeit.timeit(lambda: LiteralsCore(VALUE_LIST), number=number),
+        "lookup (legacy)": timeit.timeit(lambda: [legacy.get(key) for key in keys], number=number) / len(keys),
+        "lookup (registry)": timeit.timeit(lambda: [cached.get(key) for key in keys], number=number) / len(keys),
+    }
+
+    print(f"{len(keys)} values, {number} iterations")
+    for name, seconds in measures.items():
+        print(f"{name:<25} {seconds / number * 1e6:10.3f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    args, args_unknown = parser.parse_known_args()
+
+    measure(args.number)
@@ -28,7 +28,8 @@ setuptools.setup(
     install_requires=install_requires,
     include_package_data=True,
     package_data={"devops_toolset.core": ["*.json"],
-                  "devops_toolset.locales": ["**/LC_MESSAGES/*.mo"]},
+                  "devops_toolset.locales": ["**/LC_MESSAGES/*.mo"],
+                  "devops_toolset.project_types.wordpress": ["php/*.php"]},
     url='https://github.com/aheadlabs/devops-toolset/',
     license='https://github.com/aheadlabs/devops-toolset/blob/master/LICENSE',
     author='Ivan Sainz | Alberto Carbonell',
@@ -1,7 +1,7 @@
 """ This script allows the user to configure some initial settings """
 import argparse
+import importlib.resources
 import json
-import pkg_resources
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 def main(devops_platform: str, language: str):
     """ Sets the configuration inside settings.json """
-    settings_path = pkg_resources.resource_filename("devops_toolset.core", "settings.json")
+    settings_path = importlib.resources.files("devops_toolset.core").joinpath("settings.json")
 
     with open(settings_path, 'r') as settings_file:
         settings = json.load(settings_file)
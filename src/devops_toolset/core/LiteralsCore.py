@@ -3,7 +3,7 @@
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 
 
 class LiteralsCore(ValueDictsBase):
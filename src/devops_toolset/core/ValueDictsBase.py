@@ -1,11 +1,22 @@
 """Base class for ValueDicts"""
 
 import inspect
-from typing import List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+# Flattened values by class and by combination of classes. They live outside
+# the class so they are not taken as value dictionaries themselves.
+_registry: Dict[type, Mapping[str, str]] = {}
+_combinations: Dict[Tuple[type, ...], Mapping[str, str]] = {}
 
 
 class ValueDictsBase(object):
-    """Base class for ValueDicts"""
+    """Base class for ValueDicts
+
+    Each ValueDicts class is flattened only once per process into an immutable
+    mapping, and each combination of classes is merged only once too. Later
+    instances with the same classes share the cached mapping.
+    """
 
     def __init__(self, value_list: List = None):
         """Plains all values from all the dictionaries passed as a parameter
@@ -15,16 +26,7 @@ class ValueDictsBase(object):
             value_list: List of class types where values should be found.
         """
 
-        self._all_dictionaries = self.get_dicts()
-
-        if value_list:
-            for values in value_list:
-                _external = values()
-                self._all_dictionaries += _external.get_dicts()
-
-        self.all = {}
-        for dictionary in self._all_dictionaries:
-            self.all.update(dictionary[1])
+        self.all = self.get_combined_values((type(self),) + tuple(value_list or ()))
 
     def get(self, key: str) -> str:
         """Gets a literal from a given key.
@@ -39,3 +41,43 @@ class ValueDictsBase(object):
         """Gets all dict objects of the class."""
 
         return inspect.getmembers(self, lambda m: type(m) is dict and len(m) > 0)
+
+    @classmethod
+    def get_values(cls) -> Mapping[str, str]:
+        """Gets all the values of the class dictionaries, flattened.
+
+        Returns:
+            Immutable mapping with all the values of the class.
+        """
+
+        values = _registry.get(cls)
+
+        if values is None:
+            flattened = {}
+            for name, dictionary in inspect.getmembers(cls, lambda m: type(m) is dict and len(m) > 0):
+                flattened.update(dictionary)
+            values = _registry[cls] = MappingProxyType(flattened)
+
+        return values
+
+    @staticmethod
+    def get_combined_values(classes: Tuple[type, ...]) -> Mapping[str, str]:
+        """Gets all the values of several ValueDicts classes, merged in order.
+
+        Args:
+            classes: ValueDicts classes. Later classes override the values of
+                the former ones.
+
+        Returns:
+            Immutable mapping with all the values.
+        """
+
+        values = _combinations.get(classes)
+
+        if values is None:
+            merged = {}
+            for values_class in classes:
+                merged.update(values_class.get_values())
+            values = _combinations[classes] = MappingProxyType(merged)
+
+        return values
@@ -4,38 +4,180 @@ Args:
     --skip-i18n: If present it will skip loading gettext
 """
 
-import importlib.util
+import importlib
 import pathlib
 from devops_toolset.core.settings import Settings
+from types import ModuleType
+from typing import List
 import devops_toolset.i18n.loader
 import devops_toolset.core.log_setup
 
+PLATFORMS_PACKAGE: str = "devops_toolset.devops_platforms"
+
+
+class PlatformSpecific(object):
+    """Proxy to a platform-specific module of the active platform.
+
+    The module is imported on first attribute access and resolved again on
+    every access, so switching the platform with App.set_platform() affects
+    every module that already holds a proxy.
+    """
+
+    def __init__(self, app: "App", name: str):
+        """
+        Args:
+            app: App object that resolves the active platform.
+            name: Name of the platform-specific module (environment, restapi...)
+        """
+
+        self._app = app
+        self._name = name
+
+    def __getattr__(self, attribute: str):
+        # Private names are looked up by introspection (mock, copy...), which
+        # must not import the module
+        if attribute.startswith("_"):
+            raise AttributeError(attribute)
+        return getattr(self._app.get_platform_module(self._name), attribute)
+
+    def __repr__(self):
+        return f"<PlatformSpecific {self._name!r} ({self._app.settings.platform})>"
+
 
 class App(object):
-    """App object that contains core settings and functionalities."""
+    """App object that contains core settings and functionalities.
+
+    Modules should get the process-wide object with App.instance() instead of
+    constructing their own, so gettext and logging are bootstrapped only once.
+    """
 
     # Initialize settings
     settings: Settings = Settings()
 
+    # Process-wide instance, created on the first call to App.instance()
+    _instance: "App" = None
+
     def __init__(self, skip_i18n: bool = False):
         """
         Args:
             skip_i18n: If True it does not load the gettext engine
         """
 
+        self.i18n_loaded: bool = False
+
         # Load gettext
         if not skip_i18n:
-            devops_toolset.i18n.loader.setup(self.settings)
+            self.load_i18n()
 
         # Configure logging
-        devops_toolset.core.log_setup.configure(self.settings.log_config_file_path)
-
-    def load_platform_specific(self, name: str):
-        module_path = pathlib.Path.joinpath(self.settings.platform_specific_path, f"{name}.py")
-        spec = importlib.util.spec_from_file_location(name, module_path)
-        platform_specific = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(platform_specific)
-        return platform_specific
+        devops_toolset.core.log_setup.configure(self.settings.log_config_file_path,
+                                                use_queue=self.settings.log_queue,
+                                                queue_size=self.settings.log_queue_size)
+
+    @classmethod
+    def instance(cls, skip_i18n: bool = False) -> "App":
+        """Gets the process-wide App object, bootstrapping it on first use.
+
+        Args:
+            skip_i18n: If True it does not load the gettext engine. If the
+                instance already exists without gettext and this is False,
+                gettext is loaded then.
+
+        Returns:
+            The shared App object.
+        """
+
+        if cls._instance is None:
+            cls._instance = cls(skip_i18n)
+        elif not skip_i18n and not cls._instance.i18n_loaded:
+            cls._instance.load_i18n()
+
+        return cls._instance
+
+    def load_i18n(self):
+        """Loads the gettext engine for the configured language."""
+
+        devops_toolset.i18n.loader.setup(self.settings)
+        self.i18n_loaded = True
+
+    def set_language(self, language: str):
+        """Switches the gettext engine to another language.
+
+        Catalogs are cached, so switching between already loaded languages is
+        cheap.
+
+        Args:
+            language: Language code (en, es...).
+        """
+
+        devops_toolset.i18n.loader.set_language(self.settings, language)
+        self.i18n_loaded = True
+
+    def load_platform_specific(self, name: str) -> PlatformSpecific:
+        """Gets a platform-specific module of the active platform.
+
+        Args:
+            name: Name of the module inside the platform directory.
+
+        Returns:
+            Proxy to the module, which is imported on first use.
+        """
+
+        return PlatformSpecific(self, name)
+
+    def get_platform_module(self, name: str, platform: str = None) -> ModuleType:
+        """Imports a platform-specific module.
+
+        Modules are registered in sys.modules as
+        devops_toolset.devops_platforms.<platform>.<name>, so each one is
+        executed only once per process.
+
+        Args:
+            name: Name of the module inside the platform directory.
+            platform: Platform the module belongs to. Defaults to the active
+                platform.
+
+        Returns:
+            The imported module.
+        """
+
+        platform = platform if platform else self.settings.platform
+        return importlib.import_module(f"{PLATFORMS_PACKAGE}.{platform}.{name}")
+
+    def preload_platform_specific(self, names: List[str], platform: str = None) -> List[ModuleType]:
+        """Imports platform-specific modules ahead of their first use.
+
+        Args:
+            names: Names of the modules inside the platform directory.
+            platform: Platform the modules belong to. Defaults to the active
+                platform.
+
+        Returns:
+            List with the imported modules.
+        """
+
+        return [self.get_platform_module(name, platform) for name in names]
+
+    def set_platform(self, platform: str):
+        """Switches the active platform.
+
+        Platform-specific proxies returned by load_platform_specific() resolve
+        to the new platform modules from now on. Modules already imported for
+        any platform are not executed again.
+
+        Args:
+            platform: Name of the platform directory (azuredevops, aws...).
+
+        Raises:
+            ValueError: If the platform does not exist.
+        """
+
+        platform_specific_path = pathlib.Path.joinpath(self.settings.devops_path, platform).absolute()
+        if not platform_specific_path.is_dir():
+            raise ValueError(f"Unknown platform: {platform}")
+
+        self.settings.platform = platform
+        self.settings.platform_specific_path = platform_specific_path
 
 
 if __name__ == "__main__":
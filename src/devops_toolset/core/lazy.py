@@ -0,0 +1,78 @@
+"""Lazy loading of expensive objects
+
+Some third-party dependencies (like boto3) are slow to import or create
+objects at import time. Wrapping them in a LazyObject defers that cost until
+the object is actually used, so scripts that never use them don't pay for it.
+
+    s3 = LazyObject(lambda: importlib.import_module("boto3").client("s3"))
+    s3.put_object(...)  # boto3 is imported and the client created here
+"""
+
+import importlib
+import threading
+from typing import Any, Callable
+
+
+class LazyObject(object):
+    """Proxy that creates the wrapped object on first attribute access."""
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Args:
+            factory: Callable that creates the wrapped object.
+        """
+
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_wrapped", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def __getattr__(self, name: str):
+        # Private names are looked up by introspection (mock, copy, asyncio...),
+        # which must not create the object
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_wrapped(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self.get_wrapped(), name, value)
+
+    def __repr__(self):
+        if self._wrapped is None:
+            return f"<LazyObject (not created) {self._factory!r}>"
+        return repr(self._wrapped)
+
+    def get_wrapped(self):
+        """Gets the wrapped object, creating it if needed."""
+
+        if self._wrapped is None:
+            with self._lock:
+                if self._wrapped is None:
+                    object.__setattr__(self, "_wrapped", self._factory())
+        return self._wrapped
+
+    @property
+    def is_created(self) -> bool:
+        """True if the wrapped object has already been created."""
+
+        return self._wrapped is not None
+
+
+def lazy_boto3_client(service_name: str, **kwargs) -> LazyObject:
+    """Creates a boto3 client on first use.
+
+    boto3 is imported when the client is first used, not when this function is
+    called.
+
+    Args:
+        service_name: Name of the AWS service (s3, cloudfront, ...).
+        kwargs: Additional arguments passed to boto3.client().
+
+    Returns:
+        LazyObject wrapping the boto3 client.
+    """
+
+    return LazyObject(lambda: importlib.import_module("boto3").client(service_name, **kwargs))
+
+
+if __name__ == "__main__":
+    help(__name__)
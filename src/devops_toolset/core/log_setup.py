@@ -1,27 +1,93 @@
 """Logging configuration"""
 
+import atexit
 import logging as logger
 import logging.handlers
+import queue
+from enum import Enum
 from logging.config import dictConfig
 from devops_toolset.core.ColorFormatter import ColorFormatter
 import devops_toolset.core.settings as settings
 
 import json
 
+DEFAULT_QUEUE_SIZE: int = 10000
 
-def configure(filepath):
+
+class OverflowPolicy(Enum):
+    """What to do with a log record when the logging queue is full
+
+    block: Wait until there is room in the queue. No records are lost.
+    drop: Discard the record.
+    drop_below_warning: Discard debug and info records, wait for the rest.
+    """
+    block = "block"
+    drop = "drop"
+    drop_below_warning = "drop_below_warning"
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that applies an overflow policy when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue, overflow_policy: OverflowPolicy):
+        """
+        Args:
+            log_queue: Bounded queue shared with the QueueListener.
+            overflow_policy: What to do with a record when the queue is full.
+        """
+
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+
+    def enqueue(self, record: logger.LogRecord):
+        if self.overflow_policy == OverflowPolicy.block:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow_policy == OverflowPolicy.drop_below_warning and record.levelno >= logger.WARNING:
+                self.queue.put(record)
+            else:
+                self.dropped += 1
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that waits for room for its stop sentinel, so stopping
+    with a full queue still flushes every queued record"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+_queue_handler: BoundedQueueHandler = None
+_queue_listener: FlushingQueueListener = None
+
+
+def configure(filepath, use_queue: bool = False, queue_size: int = DEFAULT_QUEUE_SIZE,
+              overflow_policy: OverflowPolicy = OverflowPolicy.drop_below_warning):
     """Configures the Python logging using a dictionary from a json file and adding a default
     fallback configuration with the basics
 
     Args:
         filepath: Path of the file which contains the configuration
         (See https://docs.python.org/2/library/logging.config.html#logging-config-api)
+        use_queue: If True, records are handed to a background thread through
+            a bounded queue, so the logging thread never waits on I/O.
+        queue_size: Maximum number of records waiting in the queue.
+        overflow_policy: What to do with a record when the queue is full.
     """
 
+    stop_queue()
+
     try:
         configure_by_file(filepath)
         add_filter_to_console_handler(logger.WARNING)
         add_colored_formatter_to_console_handlers()
+        if use_queue:
+            start_queue(queue_size, overflow_policy)
     except Exception as err:
         logger.error(f"Cannot configure logger: {format(err)}")
         configure_by_default(logger.INFO)
@@ -81,7 +147,11 @@ def add_time_rotated_file_handler(backupcount=10, filepath=".", when='midnight')
     """
     log = logger.getLogger()
     file_handler = logging.handlers.TimedRotatingFileHandler(filename=filepath, when=when, backupCount=backupcount)
-    log.addHandler(file_handler)
+
+    if _queue_listener:
+        _queue_listener.handlers = _queue_listener.handlers + (file_handler,)
+    else:
+        log.addHandler(file_handler)
 
 
 def add_colored_formatter_to_console_handlers():
@@ -92,5 +162,63 @@ def add_colored_formatter_to_console_handlers():
         handler.setFormatter(color_formatter)
 
 
+def start_queue(queue_size: int = DEFAULT_QUEUE_SIZE,
+                overflow_policy: OverflowPolicy = OverflowPolicy.drop_below_warning):
+    """Moves the root logger handlers behind a QueueHandler/QueueListener pair.
+
+    The handlers are run by the listener thread. The queue is flushed at exit.
+
+    Args:
+        queue_size: Maximum number of records waiting in the queue.
+        overflow_policy: What to do with a record when the queue is full.
+    """
+
+    global _queue_handler, _queue_listener
+
+    if _queue_listener:
+        return
+
+    log = logger.getLogger()
+    handlers = tuple(log.handlers)
+    log_queue = queue.Queue(maxsize=queue_size)
+
+    _queue_handler = BoundedQueueHandler(log_queue, overflow_policy)
+    _queue_listener = FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    for handler in handlers:
+        log.removeHandler(handler)
+    log.addHandler(_queue_handler)
+    _queue_listener.start()
+
+
+def stop_queue():
+    """Flushes the logging queue and moves the handlers back to the root logger.
+
+    Logs a warning with the number of dropped records, if any.
+    """
+
+    global _queue_handler, _queue_listener
+
+    if not _queue_listener:
+        return
+
+    _queue_listener.stop()
+
+    log = logger.getLogger()
+    log.removeHandler(_queue_handler)
+    for handler in _queue_listener.handlers:
+        log.addHandler(handler)
+
+    dropped = _queue_handler.dropped
+    _queue_handler = None
+    _queue_listener = None
+
+    if dropped:
+        logger.warning(f"Logging queue was full: {dropped} records were dropped.")
+
+
+atexit.register(stop_queue)
+
+
 if __name__ == "__main__":
     configure(settings.log_config_file_path)
@@ -1,9 +1,9 @@
 """Loads settings from the settings.json file"""
 
+import importlib.resources
 import pathlib
 import os
 import json
-import pkg_resources
 
 
 class Settings(object):
@@ -21,11 +21,17 @@ class Settings(object):
     project_xml_path = root_path.parent.parent.absolute()
     devops_path: pathlib.Path = pathlib.Path.joinpath(root_path, _DEVOPS).absolute()
     locales_path: pathlib.Path = pathlib.Path.joinpath(root_path, _LOCALES).absolute()
-    log_config_file_path: pathlib.Path = pathlib.Path(pkg_resources.resource_filename
-                                                      (__name__, _CONFIG_SETTINGS_FILE_NAME))
-    settings_path: pathlib.Path = pathlib.Path(pkg_resources.resource_filename(__name__, _SETTINGS_FILE_NAME))
+    log_config_file_path: pathlib.Path = pathlib.Path(str(importlib.resources.files(__package__)
+                                                          .joinpath(_CONFIG_SETTINGS_FILE_NAME)))
+    settings_path: pathlib.Path = pathlib.Path(str(importlib.resources.files(__package__)
+                                                   .joinpath(_SETTINGS_FILE_NAME)))
     language: str = "en"
     platform: str = "azuredevops"
+    log_queue: bool = False
+    log_queue_size: int = 10000
+    cache_path: pathlib.Path = pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home().joinpath(".cache")),
+                                            "devops-toolset")
+    cache_max_size: int = 2 * 1024 ** 3
     platform_specific_path: pathlib.Path = pathlib.Path.joinpath(devops_path, platform).absolute()
 
     def __init__(self):
@@ -55,3 +61,8 @@ class Settings(object):
         # Add your setting mappings here
         self.language = settings["language"]
         self.platform = settings["platform"]
+        self.log_queue = settings.get("log_queue", self.log_queue)
+        self.log_queue_size = settings.get("log_queue_size", self.log_queue_size)
+        # The cache can be shared by several checkouts (for instance in CI agents) with DT_CACHE_PATH
+        self.cache_path = pathlib.Path(os.environ.get("DT_CACHE_PATH", settings.get("cache_path", self.cache_path)))
+        self.cache_max_size = settings.get("cache_max_size", self.cache_max_size)
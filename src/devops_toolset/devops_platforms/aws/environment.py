@@ -11,7 +11,7 @@ import devops_toolset.devops_platforms.common
 import logging
 import os
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([CommonLiterals, AwsLiterals])
 linux_commands = CommandsCore([LinuxCommands])
 
@@ -9,7 +9,7 @@ from devops_toolset.devops_platforms.azuredevops.commands import Commands as Pla
 import logging
 
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([PlatformSpecificLiterals])
 commands = CommandsCore([PlatformSpecificCommands])
 
@@ -8,7 +8,7 @@ from enum import Enum
 import logging
 import sys
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([CommonLiterals, AzureDevOpsLiterals])
 
 
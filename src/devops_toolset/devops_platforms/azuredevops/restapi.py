@@ -6,13 +6,14 @@ from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.devops_platforms.azuredevops.Literals import Literals as PlatformSpecificLiterals
 from devops_toolset.devops_platforms.azuredevops.commands import Commands as PlatformSpecificCommands
 import devops_toolset.filesystem.paths
+from devops_toolset.filesystem.cache import ArtifactCache
 from devops_toolset.tools.xcoding64 import encode
-from typing import Union
+from typing import Optional, Union
 import logging
 import requests
 
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([PlatformSpecificLiterals])
 commands = CommandsCore([PlatformSpecificCommands])
 
@@ -122,7 +123,7 @@ def get_last_build(organization: str, project: str, artifact_name: str,
 
 
 def get_artifact(organization: str, project: str, build_id: int, artifact_name: str, destination_path: str,
-                 user_name: str, access_token: str):
+                 user_name: str, access_token: str, cache: Optional[ArtifactCache] = None):
     """Gets a build for a project.
 
     Args:
@@ -133,17 +134,24 @@ def get_artifact(organization: str, project: str, build_id: int, artifact_name:
         destination_path: Path where the artifact will be saved.
         user_name: Token name as defined in Azure Devops personal access tokens
         access_token: Token as defined in Azure DevOps personal access tokens
+        cache: Cache of downloaded artifacts. The artifacts of a build do not
+            change, so a cached one is used without downloading it again.
     """
     build = get_build(organization, project, build_id, artifact_name, user_name, access_token)
     download_url = build["resource"]["downloadUrl"]
     if download_url:
         headers = generate_authentication_header(user_name, access_token)
-        devops_toolset.filesystem.paths.download_file(
-            build["resource"]["downloadUrl"], destination_path, f"{artifact_name}.zip", headers)
+        if cache is None:
+            devops_toolset.filesystem.paths.download_file(
+                build["resource"]["downloadUrl"], destination_path, f"{artifact_name}.zip", headers)
+        else:
+            devops_toolset.filesystem.paths.download_file_cached(
+                build["resource"]["downloadUrl"], destination_path, f"{artifact_name}.zip", headers, cache,
+                f"azdevops/{organization}/{project}/{build_id}/{artifact_name}", immutable=True)
 
 
 def get_last_artifact(organization: str, project: str, artifact_name: str, destination_path: str,
-                      user_name: str, access_token: str):
+                      user_name: str, access_token: str, cache: Optional[ArtifactCache] = None):
     """Gets the last build for a project.
 
     Args:
@@ -153,10 +161,12 @@ def get_last_artifact(organization: str, project: str, artifact_name: str, desti
         destination_path: Path where the artifact will be saved.
         user_name: Token name as defined in Azure Devops personal access tokens
         access_token: Token as defined in Azure DevOps personal access tokens
+        cache: Cache of downloaded artifacts.
     """
     last_build_id = get_last_build_id(organization, project, user_name, access_token)
     if last_build_id:
-        get_artifact(organization, project, last_build_id, artifact_name, destination_path, user_name, access_token)
+        get_artifact(organization, project, last_build_id, artifact_name, destination_path, user_name, access_token,
+                     cache)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ from devops_toolset.devops_platforms.azuredevops.Literals import Literals as Azu
 import devops_toolset.tools.cli as cli
 import logging
 
-app: App = App()
+app: App = App.instance()
 commands = CommandsCore([CommonCommands])
 literals = LiteralsCore([CommonLiterals, AzureDevOpsLiterals])
 
@@ -11,7 +11,7 @@ import devops_toolset.core.log_tools as log_tools
 import logging
 import requests
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([DevopsLiterals])
 platform_specific = app.load_platform_specific("environment")
 
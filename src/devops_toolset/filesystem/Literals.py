@@ -3,7 +3,7 @@
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 
 
 class Literals(ValueDictsBase):
@@ -11,7 +11,10 @@ class Literals(ValueDictsBase):
 
     _titles = {}
     _info = {
+        "fs_cache_added": _("Added {key} to the cache."),
+        "fs_cache_evicted": _("Evicted {key} from the cache."),
         "fs_composer_path_is": _("Composer file path is {path}."),
+        "fs_download_cache_not_modified": _("{url} has not changed, taking it from the cache."),
         "fs_file_content": _("File content => {content}."),
         "fs_file_moving": _("Moving file {origin_file_path} to {destination_file_path}."),
         "fs_file_path": _("File path is: {path}"),
@@ -22,7 +25,13 @@ class Literals(ValueDictsBase):
         "fs_writing_file": _("Writing file \"{path}\""),
         "fs_zip_added_file": _("[{zip_file_name}] Added file: {added_file}."),
     }
+    _warnings = {
+        "fs_download_cache_fallback": _("{url} cannot be downloaded, taking it from the cache."),
+        "fs_cache_checksum_mismatch": _("The cached file for {key} does not match its checksum and has been "
+                                        "removed from the cache."),
+    }
     _errors = {
+        "fs_download_cache_miss_offline": _("{url} is not in the cache and I cannot download it in offline mode."),
         "fs_not_dir": _("Path must be a dir, not a file."),
         "list_length_zero": _("List length is 0."),
         "list_length_higher_than": _("List length is higher than {length} and must be lower."),
@@ -0,0 +1,267 @@
+"""Content-addressed on-disk cache for downloaded artifacts
+
+Files are stored once under the SHA-256 of their content (objects/<sha256>)
+and are found through an index that maps keys to objects, so several keys
+can share the same file. The checksum is verified every time a file is
+taken from the cache, and the least recently used entries are evicted when
+the cache grows over its size limit.
+
+The index is written atomically, so processes sharing the cache never read a
+broken index. If two processes update it at the same time one of the updates
+can be lost, which only means that an artifact is downloaded again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from devops_toolset.core.app import App
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.filesystem.Literals import Literals as FileSystemLiterals
+
+app: App = App.instance()
+literals = LiteralsCore([FileSystemLiterals])
+
+INDEX_FILE_NAME: str = "index.json"
+OBJECTS_DIRECTORY_NAME: str = "objects"
+HASH_CHUNK_SIZE: int = 1024 * 1024
+
+# Seconds a last use time is kept before a hit updates it, so cache hits
+# rarely rewrite the index
+LAST_USED_RESOLUTION: float = 60
+
+
+def get_file_sha256(path: str) -> str:
+    """Gets the SHA-256 checksum of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hexadecimal SHA-256 checksum.
+    """
+
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+class ArtifactCache(object):
+    """Content-addressed cache with size-bounded LRU eviction."""
+
+    def __init__(self, path: str, max_size: Optional[int] = None):
+        """
+        Args:
+            path: Path to the cache directory. It is created if needed.
+            max_size: Maximum size of the cached files in bytes. None for no
+                limit.
+        """
+
+        self.path = pathlib.Path(path)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        return self.path.joinpath(INDEX_FILE_NAME)
+
+    @property
+    def objects_path(self) -> pathlib.Path:
+        return self.path.joinpath(OBJECTS_DIRECTORY_NAME)
+
+    def get_object_path(self, sha256: str) -> pathlib.Path:
+        """Gets the path where the file with a checksum is stored."""
+        return self.objects_path.joinpath(sha256)
+
+    def keys(self) -> List[str]:
+        """Gets the keys in the cache."""
+        return list(self.__read_index())
+
+    def size(self) -> int:
+        """Gets the size in bytes of the files in the cache."""
+        return sum(entry["size"] for entry in self.__unique_objects(self.__read_index()).values())
+
+    def get_entry(self, key: str) -> Optional[dict]:
+        """Gets the index entry of a key without verifying its file.
+
+        Args:
+            key: Key of the artifact.
+
+        Returns:
+            Dict with sha256, size, last_used and metadata, or None if the key
+            is not in the cache.
+        """
+
+        return self.__read_index().get(key)
+
+    def get(self, key: str) -> Optional[pathlib.Path]:
+        """Gets the file of a key, verifying its checksum.
+
+        Files that do not match their checksum are removed from the cache.
+
+        Args:
+            key: Key of the artifact.
+
+        Returns:
+            Path to the cached file (it must not be modified), or None if the
+            key is not in the cache.
+        """
+
+        with self._lock:
+            index = self.__read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+
+            object_path = self.get_object_path(entry["sha256"])
+            if not object_path.is_file() or get_file_sha256(str(object_path)) != entry["sha256"]:
+                logging.warning(literals.get("fs_cache_checksum_mismatch").format(key=key))
+                del index[key]
+                self.__remove_unreferenced_object(index, entry["sha256"])
+                self.__write_index(index)
+                return None
+
+            now = time.time()
+            if now - entry["last_used"] >= LAST_USED_RESOLUTION:
+                entry["last_used"] = now
+                self.__write_index(index)
+
+        return object_path
+
+    def put(self, key: str, file_path: str, metadata: Optional[dict] = None) -> pathlib.Path:
+        """Adds a file to the cache, evicting the least recently used entries
+        if the cache grows over its size limit.
+
+        Args:
+            key: Key of the artifact.
+            file_path: Path to the file to be cached. It is copied.
+            metadata: JSON-serializable data stored with the entry.
+
+        Returns:
+            Path to the cached file.
+        """
+
+        sha256 = get_file_sha256(file_path)
+        object_path = self.get_object_path(sha256)
+
+        with self._lock:
+            self.objects_path.mkdir(parents=True, exist_ok=True)
+            if not object_path.is_file():
+                file_descriptor, temp_path = tempfile.mkstemp(dir=self.objects_path, prefix=".", suffix=".tmp")
+                os.close(file_descriptor)
+                try:
+                    shutil.copyfile(file_path, temp_path)
+                    os.replace(temp_path, object_path)
+                except BaseException:
+                    os.remove(temp_path)
+                    raise
+
+            index = self.__read_index()
+            previous = index.get(key)
+            index[key] = {"sha256": sha256, "size": object_path.stat().st_size, "last_used": time.time(),
+                          "metadata": metadata or {}}
+            if previous is not None and previous["sha256"] != sha256:
+                self.__remove_unreferenced_object(index, previous["sha256"])
+            self.__evict(index, keep=key)
+            self.__write_index(index)
+
+        logging.info(literals.get("fs_cache_added").format(key=key))
+        return object_path
+
+    def update_metadata(self, key: str, metadata: dict):
+        """Replaces the metadata of a key and marks it as recently used.
+
+        Args:
+            key: Key of the artifact.
+            metadata: JSON-serializable data stored with the entry.
+        """
+
+        with self._lock:
+            index = self.__read_index()
+            if key in index:
+                index[key]["metadata"] = metadata
+                index[key]["last_used"] = time.time()
+                self.__write_index(index)
+
+    def remove(self, key: str):
+        """Removes a key from the cache, and its file if no other key uses it.
+
+        Args:
+            key: Key of the artifact.
+        """
+
+        with self._lock:
+            index = self.__read_index()
+            entry = index.pop(key, None)
+            if entry is not None:
+                self.__remove_unreferenced_object(index, entry["sha256"])
+                self.__write_index(index)
+
+    def __evict(self, index: Dict[str, dict], keep: str):
+        if self.max_size is None:
+            return
+
+        for key in sorted(index, key=lambda index_key: index[index_key]["last_used"]):
+            if sum(entry["size"] for entry in self.__unique_objects(index).values()) <= self.max_size:
+                break
+            if key == keep:
+                continue
+            entry = index.pop(key)
+            self.__remove_unreferenced_object(index, entry["sha256"])
+            logging.info(literals.get("fs_cache_evicted").format(key=key))
+
+    @staticmethod
+    def __unique_objects(index: Dict[str, dict]) -> Dict[str, dict]:
+        return {entry["sha256"]: entry for entry in index.values()}
+
+    def __remove_unreferenced_object(self, index: Dict[str, dict], sha256: str):
+        if all(entry["sha256"] != sha256 for entry in index.values()):
+            self.get_object_path(sha256).unlink(missing_ok=True)
+
+    def __read_index(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_path, "r") as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def __write_index(self, index: Dict[str, dict]):
+        # Written atomically as write_file_atomically() in filesystem.tools does,
+        # without logging every write nor syncing it (a lost update only
+        # means an artifact is downloaded again)
+        self.path.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.path, prefix=f".{INDEX_FILE_NAME}.", suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as index_file:
+                json.dump(index, index_file, indent=2)
+            os.replace(temp_path, self.index_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+def get_cache(directory_name: str) -> ArtifactCache:
+    """Gets a cache in a directory of the configured cache path.
+
+    Args:
+        directory_name: Name of the cache directory.
+
+    Returns:
+        The cache, bounded to the configured maximum size.
+    """
+
+    return ArtifactCache(str(pathlib.Path(app.settings.cache_path, directory_name)), app.settings.cache_max_size)
+
+
+if __name__ == "__main__":
+    help(__name__)
@@ -14,7 +14,7 @@ from devops_toolset.filesystem.Literals import Literals as FileSystemLiterals
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([FileSystemLiterals])
 wp_literals = LiteralsCore([WordpressLiterals])
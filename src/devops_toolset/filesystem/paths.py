@@ -5,17 +5,22 @@ import os
 import pathlib
 import requests
 import shutil
+import tempfile
 from devops_toolset.core.app import App
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.filesystem.Literals import Literals as FileSystemLiterals
+from devops_toolset.filesystem.cache import ArtifactCache
 from devops_toolset.filesystem.constants import Directions, FileNames, FileType
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([FileSystemLiterals])
 
+DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+DOWNLOAD_TIMEOUT: int = 60
+
 
 # noinspection PyTypeChecker
 def download_file(url: str, destination: str, save_as: str = None, headers: dict = None,
@@ -49,6 +54,100 @@ def download_file(url: str, destination: str, save_as: str = None, headers: dict
     return file_name, full_destination_path
 
 
+def download_file_cached(url: str, destination: str, save_as: str = None, headers: dict = None,
+                         cache: Optional[ArtifactCache] = None, key: str = None, immutable: bool = False,
+                         offline: bool = False, timeout: int = DOWNLOAD_TIMEOUT) -> tuple:
+    """Downloads a binary file from a URL through an artifact cache.
+
+    A cached file is revalidated with the ETag / Last-Modified values the
+    server sent with it, so it is only downloaded again if it has changed. If
+    the server cannot be reached the cached file is used.
+
+    Args:
+        url: Where to download the file from.
+        destination: Path to the directory where the file will be downloaded.
+        save_as: File name to save the downloaded file as.
+        headers: Authentication headers.
+        cache: Cache of downloaded files. If None the file is downloaded
+            without caching it.
+        key: Key of the file in the cache. Defaults to the URL.
+        immutable: If True the content of the key never changes (for instance
+            a build artifact keyed by its build id), so a cached file is used
+            without revalidating it.
+        offline: If True the file is taken from the cache without any request.
+        timeout: Seconds to wait for the server.
+
+    Returns:
+        Tuple with (file name, file path)
+    """
+
+    if cache is None:
+        return download_file(url, destination, save_as, headers)
+
+    if not os.path.isdir(destination):
+        raise ValueError(literals.get("fs_not_dir"))
+
+    file_name = save_as if save_as else get_file_name_from_url(url)
+    full_destination_path = pathlib.Path.joinpath(pathlib.Path(destination), file_name)
+    key = key if key else url
+
+    entry = cache.get_entry(key)
+    cached_path = cache.get(key) if entry is not None else None
+
+    if offline or (immutable and cached_path is not None):
+        if cached_path is None:
+            raise ValueError(literals.get("fs_download_cache_miss_offline").format(url=url))
+        shutil.copyfile(cached_path, full_destination_path)
+        return file_name, full_destination_path
+
+    request_headers = dict(headers) if headers else {}
+    if cached_path is not None:
+        if entry["metadata"].get("etag"):
+            request_headers["If-None-Match"] = entry["metadata"]["etag"]
+        if entry["metadata"].get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["metadata"]["last_modified"]
+
+    try:
+        response = requests.get(url, headers=request_headers, stream=True, timeout=timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException:
+        if cached_path is None:
+            raise
+        logging.warning(literals.get("fs_download_cache_fallback").format(url=url))
+        shutil.copyfile(cached_path, full_destination_path)
+        return file_name, full_destination_path
+
+    with response:
+        if response.status_code == 304 and cached_path is not None:
+            logging.info(literals.get("fs_download_cache_not_modified").format(url=url))
+            cache.update_metadata(key, __get_validators(url, response, entry["metadata"]))
+            shutil.copyfile(cached_path, full_destination_path)
+            return file_name, full_destination_path
+
+        # Streamed next to the destination so large files are never held in memory
+        file_descriptor, temp_path = tempfile.mkstemp(dir=destination, prefix=".", suffix=".download")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+            cache.put(key, temp_path, __get_validators(url, response))
+            os.replace(temp_path, full_destination_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    return file_name, full_destination_path
+
+
+def __get_validators(url: str, response: requests.Response, previous: dict = None) -> dict:
+    previous = previous or {}
+    return {"url": url,
+            "etag": response.headers.get("ETag", previous.get("etag")),
+            "last_modified": response.headers.get("Last-Modified", previous.get("last_modified"))}
+
+
 def files_exist(path: str, file_names: List[str]) -> List[Tuple[str, bool]]:
     """Determines if every file path in the list exists in the specified path.
 
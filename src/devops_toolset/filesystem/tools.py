@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import pathlib
+import tempfile
 import xml.etree.ElementTree as ElementTree
 
 from devops_toolset.core.app import App
@@ -12,7 +13,7 @@ from devops_toolset.filesystem.Literals import Literals as FileSystemLiterals
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([FileSystemLiterals])
 wp_literals = LiteralsCore([WordpressLiterals])
@@ -100,5 +101,39 @@ def update_xml_file_entity_text(entity_xpath: str, entity_value: str, xml_file_p
     xml_tree.write(xml_file_path)
 
 
+def write_file_atomically(path: str, content: str, encoding: str = "utf-8", mode: int = 0o644):
+    """Writes a text file atomically.
+
+    The content is written to a temporary file in the same directory, which
+    then replaces the destination file, so readers get either the old or the
+    new content but never a partially written file.
+
+    Args:
+        path: Path to the file.
+        content: Content of the file.
+        encoding: Encoding of the file.
+        mode: Permissions of the file if it does not exist yet. If it exists
+            its permissions are kept.
+    """
+
+    path_obj = pathlib.Path(path)
+    if path_obj.exists():
+        mode = path_obj.stat().st_mode & 0o7777
+
+    logging.info(literals.get("fs_writing_file").format(path=path))
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=path_obj.parent, prefix=f".{path_obj.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding=encoding, newline="") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path_obj)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
 if __name__ == "__main__":
     help(__name__)
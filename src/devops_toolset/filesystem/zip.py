@@ -11,7 +11,7 @@ import pathlib
 import shutil
 import zipfile
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([FileSystemLiterals])
 
 
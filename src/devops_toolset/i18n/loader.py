@@ -1,9 +1,107 @@
-"""Initializes gettext"""
+"""Initializes gettext
+
+Parsed catalogs are cached per (locale directory, language), so setting up
+gettext again or switching between already loaded languages does not touch
+the file system. Big catalogs are parsed from a memory-mapped file.
+"""
 
 import gettext
+import mmap
+import os
+import threading
 from devops_toolset.core.settings import Settings
+from typing import Dict, Tuple
+
+DOMAIN: str = "base"
+
+# Catalogs bigger than this (in bytes) are memory-mapped instead of read
+MMAP_THRESHOLD: int = 64 * 1024
+
+_translations: Dict[Tuple[str, str], gettext.GNUTranslations] = {}
+_translations_lock = threading.Lock()
+
+
+class _MappedFile(object):
+    """Minimal file object that hands a memory-mapped buffer to gettext.
+
+    GNUTranslations only reads the whole file and slices it, which mmap
+    objects support without copying the file into memory first.
+    """
+
+    def __init__(self, name: str, buffer: mmap.mmap):
+        self.name = name
+        self._buffer = buffer
+
+    def read(self) -> mmap.mmap:
+        return self._buffer
+
+
+def get_translation(locales_path: str, language: str) -> gettext.GNUTranslations:
+    """Gets the parsed catalog for a language, loading it only once.
+
+    Args:
+        locales_path: Path to the locales directory.
+        language: Language code (en, es...).
+
+    Returns:
+        The translations object for the language.
+
+    Raises:
+        FileNotFoundError: If there is no catalog for the language.
+    """
+
+    key = (str(locales_path), language)
+    translation = _translations.get(key)
+
+    if translation is None:
+        with _translations_lock:
+            translation = _translations.get(key)
+            if translation is None:
+                translation = _translations[key] = load_catalog(locales_path, language)
+
+    return translation
+
+
+def load_catalog(locales_path: str, language: str) -> gettext.GNUTranslations:
+    """Parses the .mo catalog of a language.
+
+    Args:
+        locales_path: Path to the locales directory.
+        language: Language code (en, es...).
+
+    Returns:
+        The translations object for the language.
+
+    Raises:
+        FileNotFoundError: If there is no catalog for the language.
+    """
+
+    mo_file = gettext.find(DOMAIN, localedir=locales_path, languages=[language])
+    if mo_file is None:
+        raise FileNotFoundError(f"No translation file found for domain {DOMAIN} and language {language}")
+
+    with open(mo_file, "rb") as file:
+        if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+            return gettext.GNUTranslations(file)
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return gettext.GNUTranslations(_MappedFile(mo_file, buffer))
 
 
 def setup(settings: Settings):
     """Sets up translations for the selected language"""
-    gettext.translation("base", localedir=settings.locales_path, languages=[settings.language]).install()
+    get_translation(settings.locales_path, settings.language).install()
+
+
+def set_language(settings: Settings, language: str):
+    """Switches the installed translations to another language.
+
+    Literals already evaluated keep the language they were evaluated with.
+
+    Args:
+        settings: Application settings.
+        language: Language code (en, es...).
+    """
+
+    get_translation(settings.locales_path, language).install()
+    settings.language = language
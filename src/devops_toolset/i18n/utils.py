@@ -7,6 +7,7 @@ Args:
     --generate-pot: If present it generates the .pot file
     --compile: If present it compiles .po files to .mo format
     --merge: If present it merges the .pot file with the existing po files.
+    --parallel: If present .po files are compiled concurrently
 """
 
 from typing import List
@@ -23,9 +24,10 @@ parser.add_argument("--generate-pot", action="store_true")
 parser.add_argument("--compile", action="store_true")
 parser.add_argument("--skip-i18n", action="store_true")
 parser.add_argument("--merge", action="store_true")
+parser.add_argument("--parallel", action="store_true")
 args, args_unknown = parser.parse_known_args()
 
-app: devops_toolset.core.app.App = devops_toolset.core.app.App(args.skip_i18n)
+app: devops_toolset.core.app.App = devops_toolset.core.app.App.instance(args.skip_i18n)
 
 base_pot_file_name = "base.pot"
 
@@ -63,10 +65,17 @@ def generate_pot_file():
     distribute_pot()
 
 
-def compile_po_files():
-    """Compiles .po files to .mo files"""
+def compile_po_files(parallel: bool = False, max_workers: int = tools_cli.DEFAULT_MAX_WORKERS):
+    """Compiles .po files to .mo files
+
+    Args:
+        parallel: If True the files are compiled concurrently.
+        max_workers: Maximum number of files compiled at the same time in
+            parallel mode.
+    """
 
     paths = get_files(str(app.settings.locales_path), "**/*.po")
+    commands = []
 
     for file in paths:
         po_file = pathlib.Path(file)
@@ -76,8 +85,13 @@ def compile_po_files():
             os.remove(mo_file)
 
         py = ".py" if args.py else ""
-        command = f"msgfmt{py} -o {mo_file} {file}"
+        commands.append(f"msgfmt{py} -o {mo_file} {file}")
+
+    if parallel:
+        tools_cli.run_commands(commands, max_workers=max_workers)
+        return
 
+    for command in commands:
         tools_cli.call_subprocess(command)
 
 
@@ -124,6 +138,6 @@ if __name__ == "__main__":
     if args.generate_pot:
         generate_pot_file()
     if args.compile:
-        compile_po_files()
+        compile_po_files(args.parallel)
     if args.merge:
         merge_pot_file()
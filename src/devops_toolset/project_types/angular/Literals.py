@@ -3,7 +3,7 @@
 from devops_toolset.core.app import App
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 
-app: App = App()
+app: App = App.instance()
 
 
 class Literals(ValueDictsBase):
@@ -10,7 +10,7 @@ from devops_toolset.project_types.dotnet.Literals import Literals as DotnetLiter
 from devops_toolset.project_types.angular.utils import get_packagejson_project_version
 from devops_toolset.tools.git import get_current_branch_simplified
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([DotnetLiterals])
 
 
@@ -10,7 +10,7 @@ import devops_toolset.filesystem.parsers as parsers
 import logging
 import devops_toolset.filesystem.tools as filesystem
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([AngularLiterals])
 commands = CommandsCore([AngularCommands])
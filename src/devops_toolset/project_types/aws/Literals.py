@@ -3,7 +3,7 @@
 from devops_toolset.core.app import App
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 
-app: App = App()
+app: App = App.instance()
 
 
 class Literals(ValueDictsBase):
@@ -18,4 +18,6 @@ class Literals(ValueDictsBase):
         "s3_got_x_objects_from_s3_bucket": _("Got a list of {number} objects from the {bucket} bucket"),
         "s3_uploaded_object_to_s3_bucket": _("Uploaded object {object_key} to {bucket} bucket"),
     }
-    _errors = {}
+    _errors = {
+        "aws_resources_not_obtained": _("AWS resources {name} could not be obtained. Skipping them..."),
+    }
@@ -1,15 +1,15 @@
 """Provides tools for managing the AWS CloudFront service"""
 
 from devops_toolset.core.app import App
+from devops_toolset.core.lazy import lazy_boto3_client
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.project_types.aws.Literals import Literals as AwsLiterals
 
-import boto3
 import logging
 import time
 
-app: App = App()
-cloudfront = boto3.client("cloudfront")
+app: App = App.instance()
+cloudfront = lazy_boto3_client("cloudfront")
 literals = LiteralsCore([AwsLiterals])
 
 
@@ -3,52 +3,63 @@ authentication settings)"""
 
 import argparse
 import json
+import logging
 import devops_toolset.tools.argument_validators
 import devops_toolset.tools.cli as cli
+from devops_toolset.core.app import App
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.project_types.aws.Literals import Literals as AwsLiterals
 
+app: App = App.instance()
+literals = LiteralsCore([AwsLiterals])
 
-def main(json_path: str, hosted_zone: str):
+
+def main(json_path: str, hosted_zone: str, parallel: bool = False, max_workers: int = cli.DEFAULT_MAX_WORKERS):
     """Gets the AWS resources and writes them to a JSON file.
 
     Args:
         json_path: Path to the JSON file to be written.
         hosted_zone: DNS zone ID to be queried.
             ie: /hostedzone/ABCDEFGHIJKL123456789 (must pass everything)
+        parallel: If True, the AWS CLI calls are run concurrently, and the
+            resources whose call fails are logged and skipped.
+        max_workers: Maximum number of AWS CLI calls running at the same time
+            in parallel mode.
     """
 
-    resources: dict = {}
-
-    resources["commit_repositories"] = json.loads(cli.call_subprocess_with_result(
-        "aws codecommit list-repositories --query \"repositories[].repositoryName\""))
-    resources["codebuild_projects"] = json.loads(cli.call_subprocess_with_result(
-        "aws codebuild list-projects --query \"projects[]\""))
-    resources["codepipeline_pipelines"] = json.loads(cli.call_subprocess_with_result(
-        "aws codepipeline list-pipelines --query \"pipelines[].name\""))
-    resources["codeartifact_repositories"] = json.loads(cli.call_subprocess_with_result(
-        "aws codeartifact list-repositories"))
-    resources["event_buses"] = json.loads(cli.call_subprocess_with_result(
-        "aws events list-event-buses --query \"EventBuses[].Name\""))
-    resources["event_rules"] = json.loads(cli.call_subprocess_with_result(
-        "aws events list-rules"))
-    resources["ec2_instances"] = json.loads(cli.call_subprocess_with_result(
-        "aws ec2 describe-instances"))
-    resources["elasticbeanstalk_applications"] = json.loads(cli.call_subprocess_with_result(
-        "aws elasticbeanstalk describe-applications"))
-    resources["elasticbeanstalk_environments"] = json.loads(cli.call_subprocess_with_result(
-        "aws elasticbeanstalk describe-environments"))
-    resources["s3_buckets"] = json.loads(cli.call_subprocess_with_result(
-        "aws s3api list-buckets --query \"Buckets[].Name\""))
-    resources["route53_hosted_zones"] = json.loads(cli.call_subprocess_with_result(
-        "aws route53 list-hosted-zones --query \"HostedZones[].Name\""))
+    resource_commands: dict = {
+        "commit_repositories": "aws codecommit list-repositories --query \"repositories[].repositoryName\"",
+        "codebuild_projects": "aws codebuild list-projects --query \"projects[]\"",
+        "codepipeline_pipelines": "aws codepipeline list-pipelines --query \"pipelines[].name\"",
+        "codeartifact_repositories": "aws codeartifact list-repositories",
+        "event_buses": "aws events list-event-buses --query \"EventBuses[].Name\"",
+        "event_rules": "aws events list-rules",
+        "ec2_instances": "aws ec2 describe-instances",
+        "elasticbeanstalk_applications": "aws elasticbeanstalk describe-applications",
+        "elasticbeanstalk_environments": "aws elasticbeanstalk describe-environments",
+        "s3_buckets": "aws s3api list-buckets --query \"Buckets[].Name\"",
+        "route53_hosted_zones": "aws route53 list-hosted-zones --query \"HostedZones[].Name\""
+    }
 
     if hosted_zone is not None:
-        resources["route53_recordsets"] = json.loads(cli.call_subprocess_with_result(
-            f"aws route53 list-resource-record-sets --hosted-zone-id {hosted_zone}"))
+        resource_commands["route53_recordsets"] = \
+            f"aws route53 list-resource-record-sets --hosted-zone-id {hosted_zone}"
+
+    resource_commands["iam_custom_policies"] = "aws iam list-policies --scope Local --query \"Policies[].PolicyName\""
+    resource_commands["iam_roles"] = "aws iam list-roles --query \"Roles[].RoleName\""
 
-    resources["iam_custom_policies"] = json.loads(cli.call_subprocess_with_result(
-        "aws iam list-policies --scope Local --query \"Policies[].PolicyName\""))
-    resources["iam_roles"] = json.loads(cli.call_subprocess_with_result(
-        "aws iam list-roles --query \"Roles[].RoleName\""))
+    if parallel:
+        results = cli.run_commands(list(resource_commands.values()), max_workers=max_workers, stop_on_failure=False)
+        resources: dict = {}
+        for name, result in zip(resource_commands.keys(), results):
+            if result.succeeded and result.out:
+                resources[name] = json.loads(result.out)
+            else:
+                logging.error(literals.get("aws_resources_not_obtained").format(name=name))
+    else:
+        # Lazy, so the calls stop at the first one with a wrong output
+        outputs = (cli.call_subprocess_with_result(command) for command in resource_commands.values())
+        resources: dict = {name: json.loads(output) for name, output in zip(resource_commands.keys(), outputs)}
 
     with open(json_path, 'w') as data_file:
         json.dump(resources, data_file)
@@ -58,6 +69,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("json-path", action=tools.argument_validators.PathValidator)
     parser.add_argument("--hosted-zone", default=None)
+    parser.add_argument("--parallel", action="store_true")
+    parser.add_argument("--max-workers", type=int, default=cli.DEFAULT_MAX_WORKERS)
     args, args_unknown = parser.parse_known_args()
 
-    main(args.json_path, args.hosted_zone)
+    main(args.json_path, args.hosted_zone, args.parallel, args.max_workers)
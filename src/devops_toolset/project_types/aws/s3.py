@@ -1,6 +1,5 @@
 """Provides tools for managing the AWS S3 service"""
 
-import boto3
 import devops_toolset.filesystem.paths as paths
 import logging
 import os
@@ -8,12 +7,13 @@ import pathlib
 import shutil
 
 from devops_toolset.core.app import App
+from devops_toolset.core.lazy import lazy_boto3_client
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.project_types.aws.Literals import Literals as AwsLiterals
 
 
-app: App = App()
-s3 = boto3.client("s3")
+app: App = App.instance()
+s3 = lazy_boto3_client("s3")
 literals = LiteralsCore([AwsLiterals])
 
 
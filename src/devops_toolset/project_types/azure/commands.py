@@ -4,7 +4,7 @@ from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 from enum import Enum
 
-app: App = App()
+app: App = App.instance()
 
 
 class Log(Enum):
@@ -11,7 +11,7 @@ import json
 import logging
 
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([AzureLiterals])
 commands = CommandsCore([AzureCommands])
 
@@ -13,7 +13,7 @@ import logging
 import re
 import pathlib
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([AzureLiterals])
 commands = CommandsCore([AzureCommands])
 rule_name_fix_regex = "[^A-Za-z0-9-_]"
@@ -3,7 +3,7 @@
 from devops_toolset.core.app import App
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 
-app: App = App()
+app: App = App.instance()
 
 
 class Literals(ValueDictsBase):
@@ -36,6 +36,8 @@ class Literals(ValueDictsBase):
         "dotnet_ef_migrations_info":
             "Number of migrations: {number}, applied migrations: {applied}, last applied migration: {name}",
         "dotnet_ef_migrations_list": "Listing migrations (will take a while)...",
+        "dotnet_ef_migrations_list_error": "Migrations could not be listed for {environment} environment. "
+                                           "Skipping it...",
         "dotnet_ef_migrations_list_output": "I got this output getting the migration's list:\n{output}",
         "dotnet_ef_migrations_script": "Generating SQL script (will take a while)...",
         "dotnet_ef_no_pending_migrations": "There are no pending migrations to be applied.",
@@ -12,7 +12,7 @@ from devops_toolset.project_types.dotnet.utils import get_csproj_project_version
 from devops_toolset.tools.git import get_current_branch_simplified
 from devops_toolset.tools.http_protocol import get_public_ip_address
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([DotnetLiterals])
 
 
@@ -7,7 +7,7 @@ from devops_toolset.project_types.dotnet.Literals import Literals as DotnetLiter
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.project_types.dotnet.commands import Commands as DotnetCommands
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([DotnetLiterals])
 commands = CommandsCore([DotnetCommands])
 
@@ -28,7 +28,7 @@ def build(path: str, configuration: str = "Release", output: str = ".", framewor
     More info: https://docs.microsoft.com/es-es/dotnet/core/tools/dotnet-build
 
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("dotnet_build").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("dotnet_build"),
         force=convert_force_parameter(force),
         path=path,
         debug=convert_debug_parameter(debug),
@@ -87,7 +87,7 @@ def restore(path: str, force: bool = False, debug: bool = False):
     More info: https://docs.microsoft.com/es-es/dotnet/core/tools/dotnet-restore
 
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("dotnet_restore").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("dotnet_restore"),
         force=convert_force_parameter(force),
         path=path,
         debug=convert_debug_parameter(debug)),
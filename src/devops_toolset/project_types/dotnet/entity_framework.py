@@ -13,7 +13,7 @@ import logging
 import pathlib
 import re
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([DotnetLiterals])
 commands = CommandsCore([DotnetCommands])
@@ -34,18 +34,65 @@ def __generate_sql_script(startup_project_path: str, script_path: str, environme
 
     logging.info(literals.get("dotnet_ef_migrations_script"))
 
-    cli.call_subprocess(commands.get("dotnet_ef_migrations_script").format(
-        migration_from=migration_from,
-        path=startup_project_path,
-        script_path=script_path,
-        no_build="--no-build" if no_build else "",
-        idempotent="--idempotent" if idempotent else "",
-        env=environment
-    ))
+    cli.call_subprocess(__get_sql_script_command(startup_project_path, script_path, environment, migration_from,
+                                                 no_build, idempotent))
 
     return script_path
 
 
+def __generate_sql_scripts_concurrently(startup_project_path: str, environments: list, script_paths: list,
+                                        no_build: bool, idempotent: bool, max_workers: int) -> list[str]:
+    """ Generates the SQL migration scripts of several environments running the
+    dotnet ef commands concurrently, and returns the paths of the scripts generated
+
+    The project is built only once, by the first migrations list command, as
+    concurrent builds of the same project collide.
+
+    Args:
+        startup_project_path: Path to the startup project.
+        environments: Names of the environments.
+        script_paths: Path to the SQL script of every environment, with a #date# token.
+        no_build: Skips build if True.
+        idempotent: If True it creates idempotent scripts.
+        max_workers: Maximum number of dotnet ef commands running at the same time.
+    """
+
+    outputs = []
+    if not no_build and environments:
+        outputs.append(cli.call_subprocess_with_result(
+            __get_migrations_list_command(startup_project_path, environments[0], False)))
+
+    # Without stop on failure, so an environment that fails does not prevent the scripts of the others
+    results = cli.run_commands([__get_migrations_list_command(startup_project_path, environment, True)
+                                for environment in environments[len(outputs):]], max_workers=max_workers,
+                               stop_on_failure=False)
+    outputs += [result.out if result.succeeded else None for result in results]
+
+    scripts = []
+    for environment, script_path, output in zip(environments, script_paths, outputs):
+        if output is None:
+            logging.error(literals.get("dotnet_ef_migrations_list_error").format(environment=environment))
+            continue
+
+        logging.info(literals.get("dotnet_ef_script_for_environment").format(environment=environment))
+
+        migrations_list = __parse_migrations_list(output)
+        migration_name, migration_date = __get_first_migration_not_applied(migrations_list)
+        migrations, applied_migrations, last_migration_applied = \
+            __parse_data_from_migrations_json_array(migrations_list)
+
+        if migration_name is not None and migrations != applied_migrations:
+            script_path = script_path.replace("#date#", migration_date)
+            logging.info(literals.get("dotnet_ef_script_being_generated").format(script_path=script_path))
+            scripts.append((script_path, __get_sql_script_command(
+                startup_project_path, script_path, environment, last_migration_applied, True, idempotent)))
+
+    results = cli.run_commands([command for script_path, command in scripts], max_workers=max_workers,
+                               stop_on_failure=False)
+
+    return [script_path for (script_path, command), result in zip(scripts, results) if result.succeeded]
+
+
 def __get_first_migration_not_applied(migrations_list: list) -> ([str, None], [str, None]):
     """ Returns the first migration in the list that has not been applied.
 
@@ -85,14 +132,64 @@ def __get_migrations_list(startup_project_path: str, environment: str, no_build:
 
     logging.info(literals.get("dotnet_ef_migrations_list"))
 
-    ef_command: str = commands.get("dotnet_ef_migrations_list").format(
+    ef_command: str = __get_migrations_list_command(startup_project_path, environment, no_build)
+    logging.info(literals.get("dotnet_ef_script_executing_command").format(command=ef_command))
+
+    result: str = cli.call_subprocess_with_result(ef_command)
+
+    return __parse_migrations_list(result)
+
+
+def __get_migrations_list_command(startup_project_path: str, environment: str, no_build: bool = False) -> str:
+    """ Gets the command that lists the migrations of a specific environment
+
+    Args:
+        startup_project_path: Path to the startup project
+        environment: Name for the environment to get the migrations for
+        no_build: Skips build if True
+    """
+
+    return commands.get("dotnet_ef_migrations_list").format(
         path=startup_project_path,
         no_build="--no-build" if no_build else "",
         env=environment
     )
-    logging.info(literals.get("dotnet_ef_script_executing_command").format(command=ef_command))
 
-    result: str = cli.call_subprocess_with_result(ef_command)
+
+def __get_sql_script_command(startup_project_path: str, script_path: str, environment: str, migration_from: str,
+                             no_build: bool, idempotent: bool) -> str:
+    """ Gets the command that generates a SQL script to apply ad hoc migrations
+
+    Args:
+        startup_project_path: Path to the startup project.
+        script_path: Path where the script will be generated at.
+        environment: Name for the environment to generate the script for.
+        migration_from: ID / name of the last migration applied.
+        no_build: Skips build if True.
+        idempotent: If True it creates an idempotent script.
+    """
+
+    return commands.get("dotnet_ef_migrations_script").format(
+        migration_from=migration_from,
+        path=startup_project_path,
+        script_path=script_path,
+        no_build="--no-build" if no_build else "",
+        idempotent="--idempotent" if idempotent else "",
+        env=environment
+    )
+
+
+def __parse_migrations_list(result: str) -> list:
+    """ Parses the output of the migrations list command
+
+    Args:
+        result: Output of the command, that may include build messages before
+            the JSON array
+
+    Returns:
+        Migrations JSON array
+    """
+
     logging.info(literals.get("dotnet_ef_migrations_list_output").format(output=result))
 
     migrations: str = ""
@@ -194,7 +291,8 @@ def generate_migration_sql_script(startup_project_path: str, environment: str, s
 
 def generate_migration_sql_scripts_for_all_environments(startup_project_path: str, scripts_base_path: str,
                                                         include_development: bool = False, no_build: bool = False,
-                                                        idempotent: bool = True) -> list[str]:
+                                                        idempotent: bool = True, parallel: bool = False,
+                                                        max_workers: int = cli.DEFAULT_MAX_WORKERS) -> list[str]:
     """ Generates a SQL migration script for every environment configured in
     the appsettings.*.json files and returns a list with the script paths generated
 
@@ -205,6 +303,11 @@ def generate_migration_sql_scripts_for_all_environments(startup_project_path: st
         include_development: If True, Development/Dev is included in the list.
         no_build: Skips build if True.
         idempotent: If True it creates an idempotent script.
+        parallel: If True the dotnet ef commands of the environments are run
+            concurrently. Only the scripts that were generated successfully
+            are returned.
+        max_workers: Maximum number of dotnet ef commands running at the same
+            time in parallel mode.
     """
     script_paths = []
     environments = utils.get_appsettings_environments(startup_project_path, include_development)
@@ -212,6 +315,13 @@ def generate_migration_sql_scripts_for_all_environments(startup_project_path: st
 
     base_path_obj = pathlib.Path(scripts_base_path)
 
+    if parallel:
+        return __generate_sql_scripts_concurrently(
+            startup_project_path, environments,
+            [str(pathlib.Path.joinpath(base_path_obj, f"database-migration-{environment.lower()}-from-#date#.sql"))
+             for environment in environments],
+            no_build, idempotent, max_workers)
+
     for environment in environments:
         logging.info(literals.get("dotnet_ef_script_for_environment").format(environment=environment))
 
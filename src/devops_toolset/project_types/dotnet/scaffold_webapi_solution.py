@@ -15,7 +15,7 @@ from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.project_types.dotnet.commands import Commands as DotnetCommands
 from devops_toolset.project_types.dotnet.Literals import Literals as DotnetLiterals
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([DotnetLiterals])
 commands = CommandsCore([DotnetCommands])
 template_config: dict = {}
@@ -12,7 +12,7 @@ from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.project_types.dotnet.commands import Commands as DotnetCommands
 
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([DotnetLiterals])
 commands = CommandsCore([DotnetCommands])
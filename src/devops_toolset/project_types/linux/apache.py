@@ -7,7 +7,7 @@ from devops_toolset.project_types.linux.Literals import Literals as LinuxLiteral
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.project_types.linux.commands import Commands as LinuxCommands
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([LinuxLiterals])
 commands = CommandsCore([LinuxCommands])
 
@@ -8,7 +8,7 @@ from devops_toolset.tools import cli
 import argparse
 import json
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([LinuxLiterals])
 commands = CommandsCore([LinuxCommands])
 
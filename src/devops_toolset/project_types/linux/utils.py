@@ -9,7 +9,7 @@ import logging
 import pathlib
 import devops_toolset.tools.cli as tools_cli
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([LinuxLiterals])
 commands = CommandsCore([LinuxCommands])
 
@@ -7,7 +7,7 @@ from devops_toolset.project_types.node.commands import Commands as NodeCommands
 from devops_toolset.project_types.node.Literals import Literals as NodeLiterals
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([NodeLiterals])
 commands = CommandsCore([NodeCommands])
 
@@ -69,7 +69,8 @@ def install(folder: str = ""):
         folder=folder,
     ), log_before_out=[literals.get("npm_install_before")],
      log_after_out=[literals.get("npm_install_after")],
-     log_after_err=[literals.get("npm_install_error")])
+     log_after_err=[literals.get("npm_install_error")],
+     stream=True)
 
 
 if __name__ == "__main__":
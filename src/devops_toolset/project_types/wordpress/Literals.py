@@ -3,7 +3,7 @@
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 
 
 class Literals(ValueDictsBase):
@@ -63,10 +63,20 @@ class Literals(ValueDictsBase):
         "wp_wpcli_config_created_ok": _("File wp-config.php created successfully."),
         "wp_wpcli_core_install_before": _("Preparing wordpress core files to install..."),
         "wp_wpcli_creating_config": _("Creating wp-config.php..."),
+        "wp_wpcli_db_check_connection_before": _("Checking the database connection..."),
         "wp_wpcli_db_create_before":
             _("Creating Wordpress database (by default, user_name and host will be taken from wp_config)"),
         "wp_wpcli_db_import_before": _("Importing database dump from file:"),
         "wp_wpcli_db_export_before": _("Exporting database dump to: {path}"),
+        "wp_dump_metrics": _("Database dump {path} ({compression}): {size} bytes, {uncompressed_size} bytes of SQL "
+                             "(ratio {ratio:.1f}) in {seconds:.1f} seconds."),
+        "wp_dump_stage_delta": _("Dump stage {stage}: {changed} changed table(s), {dropped} dropped table(s) since "
+                                 "stage {previous}."),
+        "wp_table_dump_exported": _("{tables} tables exported with {workers} workers: {size} bytes, "
+                                    "{uncompressed_size} bytes of SQL in {seconds:.1f} seconds."),
+        "wp_table_dump_imported": _("{tables} tables imported with {workers} workers: {size} bytes, "
+                                    "{uncompressed_size} bytes of SQL in {seconds:.1f} seconds."),
+        "wp_dump_stage_restoring": _("Restoring dump stage {stage} from {file}..."),
         "wp_wpcli_db_query_user_creating": _("Creating database user {user} for host {host}"),
         "wp_wpcli_db_query_user_granting": _("Granting database user {user} for host {host} the following privileges "
                                              "on schema {schema}: {privileges}"),
@@ -81,19 +91,32 @@ class Literals(ValueDictsBase):
         "wp_wpcli_import_after": _("{type} content imported successfully. "),
         "wp_wpcli_import_before": _("Importing {type} content..."),
         "wp_wpcli_import_error": _("There was an error when importing {type} content..."),
+        "wp_core_cache_hit": _("WordPress core {key} found in the cache, extracting it to {path}..."),
         "wp_wpcli_info": _("Here is the WP-CLI information:"),
         "wp_wpcli_install_ok": _("WP-CLI installation was successful."),
         "wp_wpcli_option_add_before": _("Adding database option {option_name}..."),
         "wp_wpcli_option_update_before": _("Updating database option {option_name}..."),
+        "wp_wpcli_option_added": _("Database option {option_name} added"),
+        "wp_wpcli_option_updated": _("Database option {option_name} updated"),
+        "wp_wpcli_option_invalid": _("Skipping option {option_name} since its name, value or autoload flag is "
+                                     "empty."),
+        "wp_wpcli_options_batch_before": _("Adding / updating {count} database options..."),
         "wp_wpcli_option_skipping": _("Skipping option update for {option_name} since the new value is the same as the "
                                       "existing one."),
         "wp_wpcli_plugin_install_before": _("Installing plugin {plugin_name}..."),
+        "wp_wpcli_plugins_install_before": _("Installing plugins {plugin_names} in a single WP-CLI process..."),
         "wp_wpcli_plugin_install_error": _("An error occurred installing plugin {plugin_name}..."),
         "wp_wpcli_post_delete_post_type_before": _("Deleting posts of type {post_type}..."),
+        "wp_wxr_attachments_import_before": _("Importing {attachments} downloaded attachments..."),
+        "wp_wxr_import_report": _("{posts} posts and {attachments} attachments imported in {seconds:.1f} seconds "
+                                  "({rate:.1f} posts/s) with {workers} workers."),
+        "wp_wpcli_post_delete_post_type_progress": _("{deleted} posts of type {post_type} deleted..."),
         "wp_wpcli_setting_value_ok": _("Config value {name} set as {value}"),
         "wp_wpcli_theme_install_before": _("Installing wordpress theme {theme_name}"),
         "wp_wpcli_user_creating": _("Creating WordPress user {user}..."),
         "wp_wpcli_user_created": _("Created WordPress user {user}."),
+        "wp_wpcli_user_password": _("Password: {password}"),
+        "wp_wpcli_users_batch_before": _("Creating {count} WordPress users..."),
         "wp_write_default_content": _("Writing default content to file \"{file}\" from {source}"),
         "wp_gulp_build_before": _("Gulp build task has launched for theme {theme_slug}."),
         "wp_gulp_build_after": _("Gulp build task has completed successfully for theme {theme_slug}."),
@@ -105,6 +128,8 @@ class Literals(ValueDictsBase):
                                                          "(db privileges) {db_privileges}; "
                                                          "(global privileges) {global_privileges};"),
         "mysql_db_exists_skipping_creation": _("Database {schema} exists. I will not create any database..."),
+        "wp_token_env_not_found": _("Environment variable {name} is not set, replacing its token with an empty "
+                                    "value."),
         "wp_wpcli_export_db_skipping_as_set": _("I am skipping the {dump} database dump as configured in settings..."),
         "wp_wpcli_user_exists": _("User {user} already exists. Skipping user creation..."),
         "wp_plugin_tag_already_exists": _("The tag {tag_name} already exist. Are you sure it is correct?")
@@ -141,13 +166,26 @@ class Literals(ValueDictsBase):
         "wp_theme_feed_no_info": _("The {theme} theme has a source type of feed, but it has no feed configuration. "
                                    "Please, check the configuration file."),
         "wp_wordpress_path_mandatory": _("wordpress-path is a mandatory parameter. I cannot continue."),
+        "wp_core_cache_miss_offline": _("WordPress core {key} is not in the cache and I cannot download it in "
+                                        "offline mode."),
         "wp_wpcli_config_create_err": _("File wp-config.php cannot be created."),
+        "wp_wpcli_db_check_connection_err": _("Cannot connect to the database with the settings in wp-config.php."),
         "wp_wpcli_config_set_value_err": _("Cannot set {name} property as {value}"),
         "wp_wpcli_core_install_error": _("Wordpress installation could not be done."),
         "wp_wpcli_core_version_already_downloaded": _("Wordpress {version} is already present in the specified path. "
                                                       "Skipping download..."),
         "wp_wpcli_db_export_error": _("Database dump could not be exported due to an error."),
         "wp_wpcli_db_import_error": _("Dump file could not be imported due to an error."),
+        "wp_dump_checksums_error": _("Table checksums could not be obtained. A full dump will be exported."),
+        "wp_dump_stage_not_found": _("Dump stage {stage} is not in the dumps manifest {path}."),
+        "wp_rollback_db_error": _("The database could not be rolled back from {path}."),
+        "wp_wxr_attachment_download_error": _("Attachment {url} could not be downloaded: {error}"),
+        "wp_wxr_attachment_import_error": _("Attachment {post_id} could not be imported: {message}"),
+        "wp_wxr_attachments_import_error": _("Attachments could not be imported due to an error."),
+        "wp_table_dump_manifest_not_found": _("There is no tables manifest at {path}."),
+        "wp_table_dump_no_tables": _("There are no WordPress tables to be exported."),
+        "wp_dump_zstd_not_installed": _("The zstandard package is needed for .zst database dumps. Please install "
+                                        "it with pip install zstandard."),
         "wp_wpcli_db_query_user_creating_err": _("Database user {user} for host {host} could not be created"),
         "wp_wpcli_db_query_user_granting_err": _("Privileges could not be granted to database user {user} for host "
                                                  "{host} on schema {schema}"),
@@ -159,9 +197,11 @@ class Literals(ValueDictsBase):
             _("Database option {option_name} cannot be added due to an error."),
         "wp_wpcli_option_update_error":
             _("Database option {option_name} cannot be set to {option_value} due to an error."),
+        "wp_wpcli_options_batch_error": _("Database options could not be added / updated due to an error."),
         "wp_wpcli_plugin_install_err": _("Plugin {plugin_name} could not be installed due to an error."),
         "wp_wpcli_post_delete_post_type_err": _("Unable to delete content from type {post_type} due to an error."),
         "wp_wpcli_user_creating_err": _("An error occurred creating the user {user}."),
+        "wp_wpcli_users_batch_error": _("WordPress users could not be created due to an error."),
         "wp_src_theme_not_found": _("Create development theme was called but no src themes found. Please check your "
                                     "themes configuration and try again."),
         "wp_wpcli_theme_install_error": _("Theme {theme_name} could not be installed."),
@@ -10,7 +10,7 @@ from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 from typing import Union
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals])
 
 
@@ -22,7 +22,7 @@ from devops_toolset.project_types.wordpress import generate_wordpress
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 from devops_toolset.tools import git
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals])
 
 
@@ -3,7 +3,7 @@
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 
 
 class Commands(ValueDictsBase):
@@ -23,32 +23,40 @@ class Commands(ValueDictsBase):
         "wpcli_core_version": "wp core version --path={path}",
         "wpcli_db_create": "wp db create {db_user} {db_pass} --path={path} {debug_info}",
         "wpcli_db_export": "wp db export \"{core_dump_path}\" --path={path} --extended-insert=false {debug_info}",
+        "wpcli_db_export_stdout": "wp db export - --path={path} {tables} {extended_insert} {debug_info}",
         "wpcli_db_reset": "wp db reset --path={path} {yes} {debug_info}",
         "wpcli_db_import": "wp db import {file} --path={path} {debug_info}",
+        "wpcli_db_import_stdin": "wp db import - --path={path} {debug_info}",
+        "wpcli_db_tables": "wp db tables --all-tables-with-prefix --format=list --path={path} {debug_info}",
         "wpcli_db_delete_transient": "wp transient delete --all --path={path}",
+        "wpcli_db_query_check_connection": "wp db query \"SELECT 1\" --skip-column-names --path={path} {debug_info}",
         "wpcli_db_query_create_user":
             "wp db query \"create user '{user}'@'{host}' identified by '{password}'\" "
             "--dbuser={admin_user} --dbpass={admin_password} --path={path}",
         "wpcli_db_query_db_exists": "wp db query \"select exists (select 1 from information_schema.schemata where "
                                     "schema_name = '{schema}')\" --dbuser={admin_user} --dbpass={admin_password} "
                                       "--path={path}",
+        "wpcli_db_query_drop_tables": "wp db query \"DROP TABLE IF EXISTS {tables}\" --path={path} {debug_info}",
         "wpcli_db_query_grant": "wp db query \"grant {privileges} on {schema}.* to '{user}'@'{host}'\" "
             "--dbuser={admin_user} --dbpass={admin_password} --path={path}",
         "wpcli_db_query_user_exists": "wp db query \"select exists (select 1 from mysql.user where user='{user}')\" "
                                       "--dbuser={admin_user} --dbpass={admin_password} "
                                       "--path={path}",
         "wpcli_post_list_ids": "wp post list --post_type={post_type} --path={path} --format=ids",
-        "wpcli_post_delete_post_type": "wp post delete {id_list} --force --path={path} {debug_info}",
         "wpcli_eval": "wp eval \"{php_code}\" --path={path}",
+        "wpcli_eval_file": "wp eval-file {file} {args} --path={path} {debug_info}",
         "wpcli_export": "wp export --path=\"{path}\" --dir=\"{destination_path}\" "
                         "--filename_format={date}_UTC-content{suffix}.xml",
         "wpcli_import": "wp import \"{file}\" --authors={authors} --path=\"{path}\" {debug_info}",
         "wpcli_info": "wp --info",
         "wpcli_option_add": "wp option add {option_name} \"{option_value}\" {autoload} --path={path} {debug_info}",
         "wpcli_option_get": "wp option get {option_name} --path={path} {debug_info}",
+        "wpcli_option_list": "wp option list --format=json --fields=option_name,option_value,autoload "
+                             "--path={path} {debug_info}",
         "wpcli_option_update": "wp option update {option_name} \"{option_value}\" {autoload} "
                                "--path={path} {debug_info}",
         "wpcli_plugin_install": "wp plugin install {source} --path={path} {force} {activate} {debug_info}",
+        "wpcli_plugin_list": "wp plugin list --format=json --fields=name,status --path={path} {debug_info}",
         "wpcli_rewrite_structure": "wp rewrite structure {structure} --path={path} {debug_info}",
         "wpcli_theme_install": "wp theme install {source} --path={path} {activate} --force {debug_info}",
         "wp_theme_src_build": "gulp build --theme-slug=\"{theme_slug}\" --dist=\"{path}\"",
@@ -56,5 +64,6 @@ class Commands(ValueDictsBase):
             "gulp watch --theme-slug=\"{theme_slug}\" --dev-proxy=\"{local_web_server}\" --wordpress-path=\"{path}\"",
         "wp_user_create": "wp user create {user_login} {user_email} "
                           "{role} {display_name} {first_name} {last_name} {send_email} --path={path} {debug_info}",
-        "wp_user_get": "wp user get {user_login} --format=json --path={path} {debug_info}"
+        "wp_user_get": "wp user get {user_login} --format=json --path={path} {debug_info}",
+        "wp_user_list": "wp user list --format=json --fields=user_login --path={path} {debug_info}"
     }
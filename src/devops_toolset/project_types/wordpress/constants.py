@@ -1,5 +1,10 @@
 """Defines constants for the module."""
 
+import pathlib
+
+# Source root of the WordPress project type (default-files, php scripts...)
+devops_toolset_wordpress_path = str(pathlib.Path(__file__).parent)
+
 required_files_suffixes = {
     "site_configuration_file_path": "site.json"
 }
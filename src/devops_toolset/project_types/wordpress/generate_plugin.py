@@ -23,7 +23,7 @@ from devops_toolset.devops_platforms.constants import Urls
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 from devops_toolset.project_types.wordpress.wp_plugin_tools import create_plugin
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals])
 
 
@@ -10,9 +10,9 @@ import devops_toolset.core.log_tools
 import devops_toolset.filesystem.paths as paths
 import os
 import devops_toolset.project_types.wordpress.constants as constants
+import devops_toolset.project_types.wordpress.wp_config as wp_config
 import devops_toolset.project_types.wordpress.wp_theme_tools as theme_tools
 import devops_toolset.project_types.wordpress.wptools
-import shutil
 import devops_toolset.tools.cli as cli
 import devops_toolset.tools.argument_validators
 import devops_toolset.tools.devops_toolset_utils
@@ -23,13 +23,16 @@ from devops_toolset.core.app import App
 from devops_toolset.devops_platforms.constants import Urls
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals])
 
 
 def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin_password: str,
          environment: str, additional_environments: list, environments_db_user_passwords: dict,
-         create_db: bool, skip_partial_dumps: bool, create_development_theme: bool, **kwargs_):
+         create_db: bool, skip_partial_dumps: bool, create_development_theme: bool, offline: bool = False,
+         per_plugin_dumps: bool = False,
+         plugin_download_workers: int = devops_toolset.project_types.wordpress.wptools.DEFAULT_PLUGIN_DOWNLOAD_WORKERS,
+         **kwargs_):
     """Generates a new Wordpress site based on the site configuration file
 
     Args:
@@ -47,6 +50,12 @@ def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin
             (after installing WordPress, themes and plugins).
         create_development_theme: If True generates the file structure for a
             development theme
+        offline: If True the WordPress core and the plugins and themes
+            downloaded from URLs are taken from the cache.
+        per_plugin_dumps: If True the database is dumped after installing
+            every plugin instead of once after installing all of them.
+        plugin_download_workers: Maximum number of plugins downloaded at the
+            same time.
         kwargs_: Platform-specific arguments
     """
 
@@ -96,6 +105,8 @@ def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin
 
     # Parse configuration data
     site_config: dict = devops_toolset.project_types.wordpress.wptools.get_site_configuration(required_file_paths[0])
+    site_config = devops_toolset.project_types.wordpress.wptools.expand_site_configuration_tokens(
+        site_config, environment, root_path)
     environment_config = devops_toolset.project_types.wordpress.wptools.get_environment(site_config, environment)
 
     # Get future paths (from the constants.json file)
@@ -113,7 +124,7 @@ def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin
 
     # Download WordPress core files
     devops_toolset.project_types.wordpress.wptools.download_wordpress(site_config, wordpress_path,
-                                                                      environment_config["wp_cli_debug"])
+                                                                      environment_config["wp_cli_debug"], offline)
 
     # Create development theme (if needed)
     if create_development_theme:
@@ -123,10 +134,8 @@ def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin
     theme_tools.build_theme(site_config["settings"]["themes"], themes_path, root_path)
 
     # Configure WordPress site
-    devops_toolset.project_types.wordpress.wptools.set_wordpress_config_from_configuration_file(site_config,
-                                                                                                environment_config,
-                                                                                                wordpress_path,
-                                                                                                db_user_password)
+    devops_toolset.project_types.wordpress.wptools.set_wordpress_config_from_configuration_file(
+        environment_config, wordpress_path, constants.devops_toolset_wordpress_path, db_user_password)
 
     # Create database and users
     if create_db:
@@ -140,15 +149,16 @@ def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin
 
     # Add / update WordPress options
     devops_toolset.project_types.wordpress.wptools.add_wp_options(
-        site_config["settings"]["options"], wordpress_path, environment_config["wp_cli_debug"])
+        site_config["settings"]["options"], wordpress_path, environment_config["wp_cli_debug"], batch=True)
 
     # Install site theme
     theme_tools.install_themes_from_configuration_file(
-        site_config, environment_config, global_constants, root_path, skip_partial_dumps, **kwargs_)
+        site_config, environment_config, global_constants, root_path, skip_partial_dumps, offline, **kwargs_)
 
     # Install site plugins
     devops_toolset.project_types.wordpress.wptools.install_plugins_from_configuration_file(
-        site_config, environment_config, global_constants, root_path, skip_partial_dumps)
+        site_config, environment_config, global_constants, root_path, skip_partial_dumps, offline, per_plugin_dumps,
+        plugin_download_workers, batch=not per_plugin_dumps)
 
     # Create additional users
     devops_toolset.project_types.wordpress.wptools.create_users(site_config["settings"]["users"], wordpress_path,
@@ -168,11 +178,11 @@ def main(root_path: str, db_user_password: str, db_admin_password: str, wp_admin
 
     # Backup database
     core_dump_path_converted = devops_toolset.project_types.wordpress.wptools.convert_wp_config_token(
-        site_config["settings"]["dumps"]["core"], wordpress_path)
+        site_config["settings"]["dumps"]["core"], wordpress_path, environment)
     database_core_dump_directory_path = pathlib.Path.joinpath(root_path_obj, database_files_path)
     database_core_dump_path = pathlib.Path.joinpath(database_core_dump_directory_path, core_dump_path_converted)
     devops_toolset.project_types.wordpress.wptools.export_database(
-        environment_config, wordpress_path_as_posix, database_core_dump_path.as_posix())
+        environment_config, wordpress_path_as_posix, database_core_dump_path.as_posix(), "final")
     git_tools.purge_gitkeep(database_core_dump_directory_path.as_posix())
 
     # Move config files to devops directory
@@ -200,6 +210,9 @@ def generate_additional_wpconfig_files(site_config: dict, environments: dict, ad
                                        wordpress_path: str):
     """Generates additional wp-config.php files for different environments.
 
+    Every wp-config-<environment>.php file is rendered in memory, and the
+    files are written concurrently. The wp-config.php file is not touched.
+
     Args:
         site_config: Parsed site configuration file
         environments: All the available environment configurations.
@@ -210,30 +223,14 @@ def generate_additional_wpconfig_files(site_config: dict, environments: dict, ad
         wordpress_path: Path to the WordPress installation.
     """
 
-    wordpress_path_obj = pathlib.Path(wordpress_path)
-    wp_config_path = pathlib.Path.joinpath(wordpress_path_obj, "wp-config.php")
-    wp_config_path_temp = pathlib.Path.joinpath(wordpress_path_obj, "wp-config-temp.php")
-
-    # Rename original file
-    if paths.is_valid_path(wp_config_path.as_posix(), True):
-        shutil.move(wp_config_path, wp_config_path_temp)
-
     # Filter environments
     filtered_environments = list(filter(lambda environment_x: environment_x["name"] in additional_environments,
                                         environments))
 
     # Create additional configuration files for the filtered environments
-    for environment in filtered_environments:
-        devops_toolset.project_types.wordpress.wptools.set_wordpress_config_from_configuration_file(
-            site_config,
-            environment,
-            wordpress_path,
-            environments_db_user_passwords[environment["name"]])
-        shutil.move(wp_config_path, pathlib.Path.joinpath(wordpress_path_obj, f"wp-config-{environment['name']}.php"))
-
-    # Rename original file
-    if paths.is_valid_path(str(wp_config_path_temp), True):
-        shutil.move(wp_config_path_temp, wp_config_path)
+    snippets = {environment["name"]: devops_toolset.project_types.wordpress.wptools.get_wp_config_snippets(
+        environment, constants.devops_toolset_wordpress_path) for environment in filtered_environments}
+    wp_config.render_environments(filtered_environments, environments_db_user_passwords, wordpress_path, snippets)
 
 
 def delete_sample_wp_config_file(wordpress_path: str):
@@ -259,6 +256,10 @@ if __name__ == "__main__":
     parser.add_argument("--create-db", action="store_true", default=False)
     parser.add_argument("--skip-partial-dumps", action="store_true", default=False)
     parser.add_argument("--create-development-theme", action="store_true", default=False)
+    parser.add_argument("--offline", action="store_true", default=False)
+    parser.add_argument("--per-plugin-dumps", action="store_true", default=False)
+    parser.add_argument("--plugin-download-workers", type=int,
+                        default=devops_toolset.project_types.wordpress.wptools.DEFAULT_PLUGIN_DOWNLOAD_WORKERS)
     args, args_unknown = parser.parse_known_args()
     kwargs = {}
     for kwarg in args_unknown:
@@ -277,4 +278,7 @@ if __name__ == "__main__":
          args.create_db,
          args.skip_partial_dumps,
          args.create_development_theme,
+         args.offline,
+         args.per_plugin_dumps,
+         args.plugin_download_workers,
          **kwargs)
@@ -0,0 +1,106 @@
+<?php
+/**
+ * Imports a batch of WXR attachments whose files are already downloaded, in
+ * one WordPress bootstrap.
+ *
+ * Usage: wp eval-file attachments-import.php <attachments JSON file> --path=<path>
+ *
+ * The JSON file contains a list of {"post_id", "post_title", "post_name",
+ * "post_date", "post_date_gmt", "post_content", "post_excerpt",
+ * "post_parent", "url", "file", "postmeta"} objects, taken from the WXR
+ * items. Attachments are created as the WordPress importer does: the file is
+ * copied to the uploads directory of the post date, the original post id is
+ * kept if it is free, image sizes are generated and the old URL is replaced
+ * in the post contents. Prints a JSON list with a {"post_id", "result",
+ * "message"} object per attachment, where result is imported, exists or
+ * error.
+ */
+
+require_once ABSPATH . 'wp-admin/includes/post.php';
+require_once ABSPATH . 'wp-admin/includes/file.php';
+require_once ABSPATH . 'wp-admin/includes/image.php';
+
+global $wpdb;
+
+$attachments = json_decode( file_get_contents( $args[0] ), true );
+$results = array();
+$url_remap = array();
+
+foreach ( $attachments as $attachment ) {
+	$result = array( 'post_id' => $attachment['post_id'], 'result' => 'error', 'message' => '' );
+
+	if ( post_exists( $attachment['post_title'], '', $attachment['post_date'], 'attachment' ) ) {
+		$result['result'] = 'exists';
+		$results[] = $result;
+		continue;
+	}
+
+	$name     = basename( parse_url( $attachment['url'], PHP_URL_PATH ) );
+	$filetype = wp_check_filetype( $name );
+	if ( ! $filetype['type'] ) {
+		$result['message'] = 'Invalid file type';
+		$results[] = $result;
+		continue;
+	}
+
+	// Uploads directory of the post date (yyyy/mm), as the importer does
+	$month   = substr( $attachment['post_date'], 0, 7 );
+	$uploads = wp_upload_dir( preg_match( '/^\d{4}-\d{2}$/', $month ) && '0000-00' !== $month ? str_replace( '-', '/', $month ) : null );
+	if ( $uploads['error'] ) {
+		$result['message'] = $uploads['error'];
+		$results[] = $result;
+		continue;
+	}
+
+	$file_name = wp_unique_filename( $uploads['path'], $name );
+	$new_file  = $uploads['path'] . '/' . $file_name;
+	if ( ! copy( $attachment['file'], $new_file ) ) {
+		$result['message'] = 'The file could not be copied to the uploads directory';
+		$results[] = $result;
+		continue;
+	}
+
+	$parent = (int) $attachment['post_parent'];
+	$post_id = wp_insert_attachment(
+		array(
+			'import_id'      => (int) $attachment['post_id'],
+			'post_title'     => $attachment['post_title'],
+			'post_name'      => $attachment['post_name'],
+			'post_content'   => $attachment['post_content'],
+			'post_excerpt'   => $attachment['post_excerpt'],
+			'post_date'      => $attachment['post_date'],
+			'post_date_gmt'  => $attachment['post_date_gmt'],
+			'post_mime_type' => $filetype['type'],
+			'guid'           => $uploads['url'] . '/' . $file_name,
+		),
+		$new_file,
+		$parent && get_post( $parent ) ? $parent : 0,
+		true
+	);
+
+	if ( is_wp_error( $post_id ) ) {
+		$result['message'] = $post_id->get_error_message();
+		$results[] = $result;
+		continue;
+	}
+
+	wp_update_attachment_metadata( $post_id, wp_generate_attachment_metadata( $post_id, $new_file ) );
+
+	foreach ( $attachment['postmeta'] as $meta ) {
+		if ( ! in_array( $meta['key'], array( '_wp_attached_file', '_wp_attachment_metadata' ), true ) ) {
+			add_post_meta( $post_id, $meta['key'], maybe_unserialize( $meta['value'] ) );
+		}
+	}
+
+	$url_remap[ $attachment['url'] ] = $uploads['url'] . '/' . $file_name;
+	$result['result'] = 'imported';
+	$results[] = $result;
+}
+
+// Longest URLs first, so no URL is replaced inside a longer one
+uksort( $url_remap, function ( $a, $b ) { return strlen( $b ) - strlen( $a ); } );
+foreach ( $url_remap as $from_url => $to_url ) {
+	$wpdb->query( $wpdb->prepare( "UPDATE {$wpdb->posts} SET post_content = REPLACE(post_content, %s, %s)", $from_url, $to_url ) );
+}
+
+echo json_encode( $results ) . "\n";
@@ -0,0 +1,50 @@
+<?php
+/**
+ * Adds or updates a batch of WordPress options in one WordPress bootstrap.
+ *
+ * Usage: wp eval-file options-upsert.php <options JSON file> <update permalinks (1|0)> --path=<path>
+ *
+ * The JSON file contains a list of {"name", "value", "autoload"} objects.
+ * Prints a JSON list with a {"name", "result", "message"} object per option,
+ * where result is added, updated, unchanged, invalid or error.
+ */
+
+$options = json_decode( file_get_contents( $args[0] ), true );
+$update_permalinks = isset( $args[1] ) && '1' === $args[1];
+$missing = new stdClass();
+$results = array();
+
+foreach ( $options as $option ) {
+	$name = isset( $option['name'] ) ? $option['name'] : null;
+	$value = isset( $option['value'] ) ? $option['value'] : null;
+	$autoload = isset( $option['autoload'] ) ? $option['autoload'] : null;
+	$result = array( 'name' => $name, 'result' => 'invalid', 'message' => '' );
+
+	if ( null === $name || '' === $name || null === $value || null === $autoload ) {
+		$results[] = $result;
+		continue;
+	}
+
+	$autoload = $autoload ? 'yes' : 'no';
+	$existing = get_option( $name, $missing );
+
+	if ( $existing === $missing ) {
+		$result['result'] = add_option( $name, $value, '', $autoload ) ? 'added' : 'error';
+	} elseif ( is_scalar( $existing ) && (string) $existing === $value ) {
+		$result['result'] = 'unchanged';
+	} else {
+		$result['result'] = update_option( $name, $value, $autoload ) ? 'updated' : 'error';
+	}
+
+	if ( 'error' !== $result['result'] && 'permalink_structure' === $name && $update_permalinks ) {
+		// Same as wp rewrite structure: set the structure and soft flush the rules
+		global $wp_rewrite;
+		$wp_rewrite->set_permalink_structure( $value );
+		flush_rewrite_rules( false );
+		$result['message'] = 'rewrite rules flushed';
+	}
+
+	$results[] = $result;
+}
+
+echo json_encode( $results ) . "\n";
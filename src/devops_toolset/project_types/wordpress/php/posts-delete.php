@@ -0,0 +1,56 @@
+<?php
+/**
+ * Deletes every post of a post type in batches, in one WordPress bootstrap.
+ *
+ * Usage: wp eval-file posts-delete.php <post type> <batch size> --path=<path>
+ *
+ * Posts are deleted permanently with wp_delete_post(), which also deletes
+ * their metadata, term relationships and comments, whatever their status.
+ * Only one batch of ids is loaded at a time, and the runtime object cache is
+ * flushed after every batch, so memory does not grow with the number of
+ * posts. Prints a {"deleted", "failed"} JSON line after every batch, the
+ * last one being the totals.
+ */
+
+$post_type  = $args[0];
+$batch_size = max( 1, (int) $args[1] );
+$deleted    = 0;
+$failed_ids = array();
+
+wp_defer_term_counting( true );
+wp_defer_comment_counting( true );
+
+do {
+	$ids = get_posts(
+		array(
+			'post_type'        => $post_type,
+			'post_status'      => array_keys( get_post_stati() ),
+			'fields'           => 'ids',
+			'posts_per_page'   => $batch_size,
+			'orderby'          => 'ID',
+			'order'            => 'ASC',
+			'post__not_in'     => $failed_ids,
+			'no_found_rows'    => true,
+			'suppress_filters' => true,
+		)
+	);
+
+	foreach ( $ids as $id ) {
+		if ( wp_delete_post( $id, true ) ) {
+			$deleted++;
+		} else {
+			$failed_ids[] = $id;
+		}
+	}
+
+	if ( function_exists( 'wp_cache_flush_runtime' ) ) {
+		wp_cache_flush_runtime();
+	} else {
+		wp_cache_flush();
+	}
+
+	echo json_encode( array( 'deleted' => $deleted, 'failed' => count( $failed_ids ) ) ) . "\n";
+} while ( count( $ids ) === $batch_size );
+
+wp_defer_term_counting( false );
+wp_defer_comment_counting( false );
@@ -0,0 +1,26 @@
+<?php
+/**
+ * Gets the checksum and row count of every WordPress table in one WordPress
+ * bootstrap.
+ *
+ * Usage: wp eval-file tables-checksum.php --path=<path>
+ *
+ * Prints a JSON object with a {"checksum", "rows"} object per table with the
+ * WordPress table prefix. The checksum is the one of CHECKSUM TABLE, which
+ * is null for tables that cannot be checksummed.
+ */
+
+global $wpdb;
+
+$tables = $wpdb->get_col( $wpdb->prepare( 'SHOW TABLES LIKE %s', $wpdb->esc_like( $wpdb->base_prefix ) . '%' ) );
+$results = new stdClass();
+
+foreach ( $tables as $table ) {
+	$checksum = $wpdb->get_row( "CHECKSUM TABLE `$table`", ARRAY_A );
+	$results->$table = array(
+		'checksum' => isset( $checksum['Checksum'] ) ? $checksum['Checksum'] : null,
+		'rows'     => (int) $wpdb->get_var( "SELECT COUNT(*) FROM `$table`" ),
+	);
+}
+
+echo json_encode( $results ) . "\n";
@@ -0,0 +1,55 @@
+<?php
+/**
+ * Creates a batch of WordPress users in one WordPress bootstrap.
+ *
+ * Usage: wp eval-file users-create.php <users JSON file> --path=<path>
+ *
+ * The JSON file contains a list of {"user_login", "user_email", "role",
+ * "display_name", "first_name", "last_name", "send_email"} objects. Users are
+ * created the same way wp user create does, with a generated password.
+ * Prints a JSON list with a {"user_login", "result", "message"} object per
+ * user, where result is created, exists or error, plus the "password" of
+ * the created users, as wp user create prints it.
+ */
+
+$users = json_decode( file_get_contents( $args[0] ), true );
+$results = array();
+
+foreach ( $users as $user ) {
+	$user_login = isset( $user['user_login'] ) ? $user['user_login'] : '';
+	$result = array( 'user_login' => $user_login, 'result' => 'error', 'message' => '' );
+
+	if ( username_exists( $user_login ) ) {
+		$result['result'] = 'exists';
+		$results[] = $result;
+		continue;
+	}
+
+	$user_data = array(
+		'user_login' => $user_login,
+		'user_email' => isset( $user['user_email'] ) ? $user['user_email'] : '',
+		'user_pass'  => wp_generate_password( 24 ),
+		'role'       => ! empty( $user['role'] ) ? $user['role'] : get_option( 'default_role' ),
+	);
+	foreach ( array( 'display_name', 'first_name', 'last_name' ) as $field ) {
+		if ( ! empty( $user[ $field ] ) ) {
+			$user_data[ $field ] = $user[ $field ];
+		}
+	}
+
+	$user_id = wp_insert_user( $user_data );
+
+	if ( is_wp_error( $user_id ) ) {
+		$result['message'] = $user_id->get_error_message();
+	} else {
+		$result['result']   = 'created';
+		$result['password'] = $user_data['user_pass'];
+		if ( ! empty( $user['send_email'] ) ) {
+			wp_new_user_notification( $user_id, null, 'both' );
+		}
+	}
+
+	$results[] = $result;
+}
+
+echo json_encode( $results ) . "\n";
@@ -1,41 +1,79 @@
 """Rollbacks a database using a dump, removing first all existing tables."""
 
 import argparse
+import logging
+import sys
+import devops_toolset.tools.argument_validators
+import devops_toolset.tools.cli
 from devops_toolset.core.app import App
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.tools.commands import Commands as ToolsCommands
 from devops_toolset.tools.Literals import Literals as ToolsLiterals
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
-from devops_toolset.project_types.wordpress import wp_cli
+from devops_toolset.project_types.wordpress import wp_cli, wp_dump, wp_table_dump
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals, ToolsLiterals])
 commands = CommandsCore([ToolsCommands])
 
 
-def main(wordpress_path: str, database_dump_path: str, quiet: bool):
+def main(wordpress_path: str, database_dump_path: str, quiet: bool, debug: bool = False, stage: str = None,
+         max_workers: int = devops_toolset.tools.cli.DEFAULT_MAX_WORKERS) -> bool:
     """Rollbacks a database using a dump, dropping and re-creating the database
 
+    Dumps are streamed into the database, and compressed ones (.gz or .zst)
+    are decompressed while they are imported.
+    Differential dumps are rebuilt from their base dump and the deltas that
+    follow it, as recorded in the dumps manifest. Table by table dumps
+    (directories with a tables manifest) are imported concurrently.
+
     Args:
         wordpress_path: Path to WordPress directory.
-        database_dump_path: Path to the database dump file to be restored.
+        database_dump_path: Path to the database dump file to be restored, or
+            to the dumps directory if a stage is given.
         quiet: If True, no questions are asked and defaults are assumed.
+        debug: If True, --debug will be added to the WP-CLI commands.
+        stage: Name of the differentially dumped stage to be restored.
+        max_workers: Maximum number of tables imported at the same time from
+            a table by table dump.
+
+    Returns:
+        False if the dump could not be imported.
     """
 
+    chain = wp_dump.get_stage_chain(database_dump_path, stage)
+    if stage is not None and chain is None:
+        return False
+
     # Drop the database and create an empty one
-    wp_cli.reset_database(wordpress_path, quiet)
+    wp_cli.reset_database(wordpress_path, quiet, debug)
 
     # Imports a dump in the newly created database
-    wp_cli.import_database(wordpress_path, database_dump_path)
+    if wp_table_dump.is_table_dump(database_dump_path):
+        imported = wp_table_dump.import_tables(wordpress_path, database_dump_path, max_workers, debug) is not None
+    elif chain is not None:
+        imported = wp_dump.restore_stage_chain(
+            wordpress_path, str(wp_dump.get_manifest_path(database_dump_path).parent), chain, debug)
+    else:
+        imported = wp_dump.import_database(wordpress_path, database_dump_path, debug) is not None
+
+    if not imported:
+        logging.error(literals.get("wp_rollback_db_error").format(path=database_dump_path))
+
+    return imported
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("wordpress-path", action=tools.argument_validators.PathValidator)
-    parser.add_argument("database-dump-path", action=tools.argument_validators.PathValidator)
+    parser.add_argument("wordpress-path", action=devops_toolset.tools.argument_validators.PathValidator)
+    parser.add_argument("database-dump-path", action=devops_toolset.tools.argument_validators.PathValidator)
     parser.add_argument("--quiet", action="store_true", default=False)
+    parser.add_argument("--debug", action="store_true", default=False)
+    parser.add_argument("--stage", default=None)
+    parser.add_argument("--max-workers", type=int, default=devops_toolset.tools.cli.DEFAULT_MAX_WORKERS)
     args, args_unknown = parser.parse_known_args()
 
-    tools.cli.print_title(literals.get("wp_title_wordpress_rollback_db"))
-    main(args.wordpress_path, args.database_dump_path, args.quiet)
+    devops_toolset.tools.cli.print_title(literals.get("wp_title_wordpress_rollback_db"))
+    if not main(args.wordpress_path, args.database_dump_path, args.quiet, args.debug, args.stage, args.max_workers):
+        sys.exit(1)
@@ -1,7 +1,15 @@
 """Contains wrappers for WP CLI commands"""
 
 import datetime
+import importlib.resources
+import json
 import logging
+import os
+import pathlib
+import re
+import tempfile
+import devops_toolset.core.log_tools as log_tools
+import devops_toolset.project_types.wordpress.wp_core as wp_core
 import devops_toolset.tools.cli as cli
 from devops_toolset.core.app import App
 from devops_toolset.core.LiteralsCore import LiteralsCore
@@ -9,11 +17,26 @@ from devops_toolset.project_types.wordpress.Literals import Literals as Wordpres
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
 from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals])
 commands = CommandsCore([WordpressCommands])
 
+# PHP scripts run with wp eval-file
+php_scripts_path: pathlib.Path = pathlib.Path(str(importlib.resources.files(__package__))).joinpath("php")
+
+# Snapshots of the options table per WordPress path (see load_options_snapshot).
+# Every option maps to (value, autoload), or to None if it was written and
+# has to be checked again. autoload is None if it is not known.
+_options_snapshots: Dict[str, Dict[str, Optional[Tuple[str, Optional[bool]]]]] = {}
+
+# Matches the last line of wp plugin install (Success: Installed 2 of 2 plugins.)
+PLUGIN_INSTALL_SUMMARY_REGEX = re.compile(r"[Ii]nstalled (\d+) of (\d+) plugins?")
+
+# Posts deleted per batch by delete_post_type_content()
+POST_DELETE_BATCH_SIZE: int = 500
+
 
 class ValueType(Enum):
     """Defines value types for values at the wp-config.php file"""
@@ -41,11 +64,97 @@ def add_update_option(option: dict, wordpress_path: str, debug: bool = False, up
         add_database_option(option["name"], option["value"], wordpress_path, debug, option["autoload"])
 
     if option["name"] == "permalink_structure" and update_permalinks:
-        cli.call_subprocess(commands.get("wpcli_rewrite_structure").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_rewrite_structure"),
             structure=option["value"],
             path=wordpress_path,
             debug_info=convert_wp_parameter_debug(debug)
         ))
+        __set_snapshot_option(wordpress_path, "rewrite_rules", None)
+
+
+def add_update_options(options: List[dict], wordpress_path: str, debug: bool = False,
+                       update_permalinks: bool = True) -> List[dict]:
+    """Adds WordPress options or updates them if they exist, all of them in
+    a single WP-CLI process.
+
+    WordPress is bootstrapped once for the whole batch, instead of up to three
+    times per option as add_update_option() does. The permalink structure is
+    rewritten in the same pass.
+
+    Args:
+        options: WordPress options.
+        wordpress_path: Path to the WordPress installation.
+        debug: It True logs debug information.
+        update_permalinks: If True updates the permalink structure.
+
+    Returns:
+        List with a dict per option with its name and result, which can be
+        added, updated, unchanged, invalid or error.
+    """
+
+    # Values are passed as strings, the same way the WP-CLI option commands get them
+    options = [{"name": option.get("name"),
+                "value": None if option.get("value") is None else str(option["value"]),
+                "autoload": option.get("autoload")} for option in options]
+
+    # Options known to be unchanged are not sent to WP-CLI
+    snapshot = _options_snapshots.get(__snapshot_key(wordpress_path))
+    results = {}
+    if snapshot is not None:
+        for option in options:
+            entry = snapshot.get(option["name"])
+            if entry is not None and entry[0] == option["value"] and option["autoload"] is not None \
+                    and not (option["name"] == "permalink_structure" and update_permalinks):
+                results[option["name"]] = {"name": option["name"], "result": "unchanged", "message": ""}
+    pending = [option for option in options if option["name"] not in results]
+
+    logging.info(literals.get("wp_wpcli_options_batch_before").format(count=len(pending)))
+
+    if pending:
+        for result in __upsert_options(pending, wordpress_path, debug, update_permalinks):
+            results[result["name"]] = result
+
+    results = [results.get(option["name"], {"name": option["name"], "result": "error", "message": ""})
+               for option in options]
+
+    for option, result in zip(options, results):
+        log_option_result(result)
+        if result["result"] in ("added", "updated"):
+            __set_snapshot_option(wordpress_path, option["name"], (option["value"], bool(option["autoload"])))
+        if option["name"] == "permalink_structure" and update_permalinks and result["result"] != "error":
+            __set_snapshot_option(wordpress_path, "rewrite_rules", None)
+
+    return results
+
+
+def __upsert_options(options: List[dict], wordpress_path: str, debug: bool, update_permalinks: bool) -> List[dict]:
+    """Runs the options-upsert.php script with a batch of options.
+
+    Args:
+        options: WordPress options, with their values as strings.
+        wordpress_path: Path to the WordPress installation.
+        debug: It True logs debug information.
+        update_permalinks: If True updates the permalink structure.
+
+    Returns:
+        List with a dict per option with its name and result.
+    """
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as options_file:
+        json.dump(options, options_file)
+
+    try:
+        output = eval_file(str(php_scripts_path.joinpath("options-upsert.php")), wordpress_path,
+                           [options_file.name, "1" if update_permalinks else "0"], debug)
+    finally:
+        os.remove(options_file.name)
+
+    results = parse_json_output(output)
+    if results is None:
+        logging.error(literals.get("wp_wpcli_options_batch_error"))
+        return [{"name": option["name"], "result": "error", "message": ""} for option in options]
+
+    return results
 
 
 def add_database_option(option_name: str, option_value: str, wordpress_path: str,
@@ -71,7 +180,7 @@ def add_database_option(option_name: str, option_value: str, wordpress_path: str
 
     # Adds the option if it does not exist
     if not option_exists and check_if_option_is_valid(option_name, option_value, autoload):
-        cli.call_subprocess(commands.get("wpcli_option_add").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_option_add"),
             option_name=option_name,
             option_value=option_value,
             autoload=convert_wp_parameter_autoload(autoload),
@@ -83,6 +192,7 @@ def add_database_option(option_name: str, option_value: str, wordpress_path: str
             log_after_err=[literals.get("wp_wpcli_option_add_error").format(
                 option_name=option_name,
                 option_value=option_value)])
+        __set_snapshot_option(wordpress_path, option_name, None)
 
 
 def check_if_option_exists(option_name: str, wordpress_path: str, debug_info: bool = False) -> (bool, str):
@@ -99,11 +209,21 @@ def check_if_option_exists(option_name: str, wordpress_path: str, debug_info: bo
         wordpress_path: Path to WordPress files.
         debug_info: Toggles debug info on the command.
 
+    If there is an options snapshot for the WordPress path (see
+    load_options_snapshot), the check is answered from it.
+
     Returns:
         The option value if it exists
     """
 
-    value = cli.call_subprocess_with_result(commands.get("wpcli_option_get").format(
+    snapshot = _options_snapshots.get(__snapshot_key(wordpress_path))
+    if snapshot is not None:
+        if option_name not in snapshot:
+            return False, None
+        if snapshot[option_name] is not None:
+            return True, snapshot[option_name][0]
+
+    value = cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_option_get"),
         option_name=option_name,
         path=wordpress_path,
         debug_info=convert_wp_parameter_debug(debug_info)
@@ -112,6 +232,12 @@ def check_if_option_exists(option_name: str, wordpress_path: str, debug_info: bo
     option_exists: bool = True if value is not None else False
     option_value: str = value.rstrip("\n") if option_exists else None
 
+    if snapshot is not None:
+        if option_exists:
+            snapshot[option_name] = (option_value, None)
+        else:
+            snapshot.pop(option_name, None)
+
     return option_exists, option_value
 
 
@@ -145,7 +271,7 @@ def convert_wp_parameter_autoload(autoload: bool):
 def convert_wp_parameter_db_user(db_user: str):
     """Converts a str value to a --db_user parameter."""
     if db_user:
-        return "--dbuser=" + "\"" + db_user + "\""
+        return "--dbuser=" + db_user
     else:
         return ""
 
@@ -153,7 +279,7 @@ def convert_wp_parameter_db_user(db_user: str):
 def convert_wp_parameter_db_pass(db_pass: str):
     """Converts a str value to a --db_pass parameter."""
     if db_pass:
-        return "--dbpass=" + "\"" + db_pass + "\""
+        return "--dbpass=" + db_pass
     else:
         return ""
 
@@ -169,7 +295,7 @@ def convert_wp_parameter_activate(activate: bool):
 def convert_wp_parameter_admin_password(admin_password: str):
     """Converts a str value to a --admin_password parameter."""
     if admin_password:
-        return "--admin_password=" + "\"" + admin_password + "\""
+        return "--admin_password=" + admin_password
     else:
         return ""
 
@@ -236,7 +362,8 @@ def convert_wp_parameter_str_key_value(key: str, value: str, quoted: bool = Fals
     Args:
         key: WordPress parameter name.
         value: Value for the WordPress parameter.
-        quoted: If True quotes the value
+        quoted: If True quotes the value. Not needed for commands built with
+            cli.build_argv(), which keeps every value in a single argument.
 
     Returns:
         Parameter build as --key=value
@@ -275,7 +402,7 @@ def create_configuration_file(wordpress_path: str, db_host: str, db_name: str, d
         skip_check: Skip check parameter --skip-check
         debug: If present, --debug will be added to the command showing all debug trace information.
     """
-    tools.cli.call_subprocess(commands.get("wpcli_config_create").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_config_create"),
         path=wordpress_path,
         db_host=db_host,
         db_name=db_name,
@@ -292,6 +419,31 @@ def create_configuration_file(wordpress_path: str, db_host: str, db_name: str, d
     )
 
 
+def check_database_connection(wordpress_path: str, debug: bool) -> bool:
+    """Checks that WordPress can connect to its database with the settings in
+    wp-config.php, as wp config create does unless --skip-check is present.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        True if the database can be queried.
+    """
+
+    logging.info(literals.get("wp_wpcli_db_check_connection_before"))
+
+    result = cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_db_query_check_connection"),
+        path=wordpress_path,
+        debug_info=convert_wp_parameter_debug(debug)
+    ))
+
+    if result is None:
+        logging.error(literals.get("wp_wpcli_db_check_connection_err"))
+        return False
+    return True
+
+
 def create_database(wordpress_path: str, debug: bool, db_user: str, db_password: str, schema: str):
     """ Calls wp db create with the parameters
     Args
@@ -302,7 +454,7 @@ def create_database(wordpress_path: str, debug: bool, db_user: str, db_password:
         schema: Schema name to be checked for existence
     """
     # Check if the database exists
-    output = cli.call_subprocess_with_result(commands.get("wpcli_db_query_db_exists").format(
+    output = cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_db_query_db_exists"),
         schema=schema,
         admin_user=db_user,
         admin_password=db_password,
@@ -312,7 +464,7 @@ def create_database(wordpress_path: str, debug: bool, db_user: str, db_password:
 
     # Create the database
     if not database_exists:
-        tools.cli.call_subprocess(commands.get("wpcli_db_create").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_create"),
             path=wordpress_path,
             db_user=convert_wp_parameter_db_user(db_user),
             db_pass=convert_wp_parameter_db_pass(db_password),
@@ -334,13 +486,13 @@ def create_user(user: dict, wordpress_path: str, debug: bool):
         debug: If present, --debug will be added to the command showing all debug trace information.
     """
 
-    cli.call_subprocess(commands.get("wp_user_create").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wp_user_create"),
         user_login=user["user_login"],
         user_email=user["user_email"],
         role=convert_wp_parameter_str_key_value("role", user["role"]),
-        display_name=convert_wp_parameter_str_key_value("display_name", user["display_name"], True),
-        first_name=convert_wp_parameter_str_key_value("first_name", user["first_name"], True),
-        last_name=convert_wp_parameter_str_key_value("last_name", user["last_name"], True),
+        display_name=convert_wp_parameter_str_key_value("display_name", user["display_name"]),
+        first_name=convert_wp_parameter_str_key_value("first_name", user["first_name"]),
+        last_name=convert_wp_parameter_str_key_value("last_name", user["last_name"]),
         send_email=convert_wp_parameter_send_email(user["send_email"]),
         path=wordpress_path,
         debug_info=convert_wp_parameter_debug(debug)
@@ -351,6 +503,128 @@ def create_user(user: dict, wordpress_path: str, debug: bool):
     )
 
 
+def create_users(users: List[dict], wordpress_path: str, debug: bool) -> List[dict]:
+    """Creates the WordPress users that do not exist with two WP-CLI
+    processes, whatever the number of users.
+
+    The existing logins are listed with a single wp user list, and the missing
+    users are created in one WordPress bootstrap by the users-create.php
+    script, instead of running wp user get and wp user create for every user.
+
+    Args:
+        users: Users to be created based on #/definitions/user at
+            https://dev.aheadlabs.com/schemas/json/wordpress-site-schema.json
+        wordpress_path: Path to WordPress files.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        List with a dict per user with its login, result and message, and
+        the generated password of the created users. The result can be
+        created, exists or error.
+    """
+
+    # If the logins cannot be listed the script checks every user anyway
+    existing_logins = get_user_logins(wordpress_path, debug) or set()
+
+    results: List[Optional[dict]] = []
+    pending: List[dict] = []
+    for user in users:
+        if user["user_login"] in existing_logins:
+            results.append({"user_login": user["user_login"], "result": "exists", "message": ""})
+        else:
+            existing_logins.add(user["user_login"])
+            pending.append(user)
+            results.append(None)
+
+    logging.info(literals.get("wp_wpcli_users_batch_before").format(count=len(pending)))
+
+    created = iter(__create_users(pending, wordpress_path, debug) if pending else [])
+    results = [result if result is not None else next(created) for result in results]
+
+    for result in results:
+        log_user_result(result)
+
+    return results
+
+
+def __create_users(users: List[dict], wordpress_path: str, debug: bool) -> List[dict]:
+    """Runs the users-create.php script with a batch of users.
+
+    Args:
+        users: Users to be created.
+        wordpress_path: Path to WordPress files.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        List with a dict per user with its login, result and password, in
+        the same order as users.
+    """
+
+    fields = ["user_login", "user_email", "role", "display_name", "first_name", "last_name", "send_email"]
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as users_file:
+        json.dump([{field: user.get(field) for field in fields} for user in users], users_file)
+
+    try:
+        output = eval_file(str(php_scripts_path.joinpath("users-create.php")), wordpress_path, [users_file.name],
+                           debug)
+    finally:
+        os.remove(users_file.name)
+
+    results = parse_json_output(output)
+    if results is None or len(results) != len(users):
+        logging.error(literals.get("wp_wpcli_users_batch_error"))
+        return [{"user_login": user["user_login"], "result": "error", "message": ""} for user in users]
+
+    return results
+
+
+def get_user_logins(wordpress_path: str, debug: bool = False) -> Optional[Set[str]]:
+    """Gets the logins of the WordPress users with a single WP-CLI process.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/user/list/
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        Set with the user logins, or None if the users could not be listed.
+    """
+
+    users = parse_json_output(cli.call_subprocess_with_result(cli.build_argv(
+        commands.get("wp_user_list"),
+        path=wordpress_path,
+        debug_info=convert_wp_parameter_debug(debug))))
+
+    if users is None:
+        return None
+
+    return {user["user_login"] for user in users}
+
+
+def log_user_result(result: dict):
+    """Logs the result of a user of a batch run by create_users().
+
+    Args:
+        result: Dict with the login, result and password of the user.
+    """
+
+    user_login = result.get("user_login")
+    outcome = result.get("result")
+
+    if outcome == "created":
+        logging.info(literals.get("wp_wpcli_user_created").format(user=user_login))
+        if result.get("password"):
+            logging.info(literals.get("wp_wpcli_user_password").format(password=result["password"]))
+    elif outcome == "exists":
+        logging.warning(literals.get("wp_wpcli_user_exists").format(user=user_login))
+    else:
+        logging.error(literals.get("wp_wpcli_user_creating_err").format(user=user_login))
+        if result.get("message"):
+            logging.error(result["message"])
+
+
 def user_exists(user_login: str, wordpress_path: str, debug: bool) -> bool:
     """Creates a WordPress user.
 
@@ -363,7 +637,7 @@ def user_exists(user_login: str, wordpress_path: str, debug: bool) -> bool:
         True if the user exists.
     """
 
-    result = cli.call_subprocess_with_result(commands.get("wp_user_get").format(
+    result = cli.call_subprocess_with_result(cli.build_argv(commands.get("wp_user_get"),
         user_login=user_login,
         path=wordpress_path,
         debug_info=convert_wp_parameter_debug(debug)
@@ -404,7 +678,7 @@ def create_wordpress_database_user(wordpress_path: str, admin_user: str, admin_p
                 e.g.: 'process'
     """
     # Check if the user exists
-    output = cli.call_subprocess_with_result(commands.get("wpcli_db_query_user_exists").format(
+    output = cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_db_query_user_exists"),
         user=user,
         host=host,
         admin_user=admin_user,
@@ -416,7 +690,7 @@ def create_wordpress_database_user(wordpress_path: str, admin_user: str, admin_p
 
     # Create user
     if not user_exists_db:
-        cli.call_subprocess(commands.get("wpcli_db_query_create_user").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_query_create_user"),
             user=user,
             host=host,
             password=password,
@@ -428,7 +702,7 @@ def create_wordpress_database_user(wordpress_path: str, admin_user: str, admin_p
         )
 
         # Grant user privileges on the database
-        cli.call_subprocess(commands.get("wpcli_db_query_grant").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_query_grant"),
             privileges=db_privileges,
             schema=schema,
             user=user,
@@ -443,7 +717,7 @@ def create_wordpress_database_user(wordpress_path: str, admin_user: str, admin_p
         )
 
         # Grant user global privileges
-        cli.call_subprocess(commands.get("wpcli_db_query_grant").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_query_grant"),
             privileges=global_privileges,
             schema="*",
             user=user,
@@ -468,22 +742,52 @@ def create_wordpress_database_user(wordpress_path: str, admin_user: str, admin_p
         ))
 
 
-def delete_post_type_content(wordpress_path: str, content_type: str, debug_info: bool = False):
-    """ Calls db in order to delete content from a concrete post type
+def delete_post_type_content(wordpress_path: str, content_type: str, debug_info: bool = False,
+                             batch_size: int = POST_DELETE_BATCH_SIZE) -> Optional[int]:
+    """ Deletes all the posts of a post type in batches, in one WP-CLI process
+
+    The posts-delete.php script loads and permanently deletes one batch of
+    posts at a time, with their metadata, term relationships and comments, so
+    neither the command line nor the memory grow with the number of posts.
+    Progress is logged after every batch.
+
     Args:
         wordpress_path: Path to WordPress files.
         content_type: Type of the content to be deleted
         debug_info: If true, --debug will be added to the command showing all debug trace information.
-    """
+        batch_size: Number of posts deleted per batch.
 
-    id_list = get_post_type_ids(wordpress_path, content_type)
+    Returns:
+        The number of posts deleted, or None if the deletion failed.
+    """
 
-    cli.call_subprocess(commands.get("wpcli_post_delete_post_type").format(
-        id_list=id_list,
+    logging.info(literals.get("wp_wpcli_post_delete_post_type_before").format(post_type=content_type))
+    progress = {}
+    pending = b""
+
+    def log_progress(chunk: bytes):
+        nonlocal pending
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            batch = parse_json_output(line.decode("utf-8", errors="replace"))
+            if isinstance(batch, dict) and "deleted" in batch:
+                progress.update(batch)
+                logging.info(literals.get("wp_wpcli_post_delete_post_type_progress").format(
+                    post_type=content_type, deleted=batch["deleted"]))
+
+    returncode, err = cli.pipe_subprocess(cli.build_argv(commands.get("wpcli_eval_file"),
+        file=str(php_scripts_path.joinpath("posts-delete.php")),
+        args=[content_type, str(batch_size)],
         path=wordpress_path,
-        debug_info=convert_wp_parameter_debug(debug_info)),
-        log_before_out=[literals.get("wp_wpcli_post_delete_post_type_before").format(post_type=content_type)],
-        log_before_err=[literals.get("wp_wpcli_post_delete_post_type_err").format(post_type=content_type)])
+        debug_info=convert_wp_parameter_debug(debug_info)), stdout_handler=log_progress)
+
+    if returncode != 0 or progress.get("failed"):
+        if err:
+            logging.error(err.decode("utf-8", errors="backslashreplace"))
+        logging.error(literals.get("wp_wpcli_post_delete_post_type_err").format(post_type=content_type))
+        return None if returncode != 0 else progress["deleted"]
+
+    return progress.get("deleted", 0)
 
 
 def get_post_type_ids(wordpress_path: str, post_type: str):
@@ -494,23 +798,34 @@ def get_post_type_ids(wordpress_path: str, post_type: str):
         post_type: Post type name to filter by.
     """
 
-    return cli.call_subprocess_with_result(commands.get("wpcli_post_list_ids").format(
+    return cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_post_list_ids"),
         post_type=post_type,
         path=wordpress_path
     ))
 
 
-def wordpress_is_downloaded(path: str) -> bool:
+def wordpress_is_downloaded(path: str, wp_cli_fallback: bool = False) -> bool:
     """Checks if WordPress is downloaded at the specified path.
 
+    The core files and wp-includes/version.php are inspected directly (see
+    wp_core.get_version), so no process is started.
+
     Args:
         path: Path to be checked for WordPress files.
+        wp_cli_fallback: If True and the files do not look like a WordPress
+            core, wp core version is run to check it.
 
     Returns:
         True if WordPress files are present at the specified path.
     """
 
-    version = cli.call_subprocess_with_result(commands.get("wpcli_core_version").format(path=path))
+    wordpress_version = wp_core.get_version(path)
+    if wordpress_version is not None:
+        version = wordpress_version.version
+    elif wp_cli_fallback:
+        version = cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_core_version"), path=path))
+    else:
+        version = None
 
     if version:
         logging.warning(literals.get("wp_wpcli_core_version_already_downloaded")
@@ -534,7 +849,7 @@ def download_wordpress(destination_path: str, version: str, locale: str, skip_co
         debug: If present, --debug will be added to the command showing all debug trace information.
     """
     if not wordpress_is_downloaded(destination_path):
-        cli.call_subprocess(commands.get("wpcli_core_download").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_core_download"),
             version=version,
             locale=locale,
             path=destination_path,
@@ -551,13 +866,35 @@ def download_wordpress(destination_path: str, version: str, locale: str, skip_co
         )
 
 
+def eval_file(file_path: str, wordpress_path: str, args: List[str] = None, debug: bool = False) -> str:
+    """ Executes a php file after loading WordPress
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/eval-file/
+
+     Args:
+        file_path: Path to the php file.
+        wordpress_path: Path to WordPress files.
+        args: Arguments passed to the file in the $args variable.
+        debug: If True, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        The stdout of the file.
+    """
+    return cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_eval_file"),
+                                                          file=file_path,
+                                                          args=args or [],
+                                                          path=wordpress_path,
+                                                          debug_info=convert_wp_parameter_debug(debug)))
+
+
 def eval_code(php_code: str, wordpress_path: str) -> str:
     """ Executes a piece of php code
      Args:
         php_code: Piece of php code to be evaluated
         wordpress_path: Path to WordPress files.
     """
-    return cli.call_subprocess_with_result(commands.get("wpcli_eval").format(
+    return cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_eval"),
         php_code=php_code,
         path=wordpress_path))
 
@@ -575,12 +912,13 @@ def export_database(wordpress_path: str, dump_file_path: str, debug: bool):
         dump_file_path: Path to the destination dump file.
         debug: If present, --debug will be added to the command showing all debug trace information.
     """
-    cli.call_subprocess(commands.get("wpcli_db_export").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_export"),
         core_dump_path=dump_file_path,
         path=wordpress_path,
         debug_info=convert_wp_parameter_debug(debug)),
         log_before_out=[literals.get("wp_wpcli_db_export_before").format(path=dump_file_path)],
-        log_after_err=[literals.get("wp_wpcli_db_export_error")])
+        log_after_err=[literals.get("wp_wpcli_db_export_error")],
+        stream=True)
 
 
 def export_content_to_wxr(wordpress_path: str, destination_path: str, wrx_file_suffix: str = None):
@@ -597,7 +935,7 @@ def export_content_to_wxr(wordpress_path: str, destination_path: str, wrx_file_s
     date = datetime.datetime.utcnow().strftime("%Y.%m.%d")
     suffix = "" if wrx_file_suffix is None else f"-{wrx_file_suffix}"
 
-    cli.call_subprocess(commands.get("wpcli_export").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_export"),
         path=wordpress_path,
         destination_path=destination_path,
         date=date,
@@ -616,10 +954,12 @@ def import_database(wordpress_path: str, dump_file_path: str, debug: bool):
         dump_file_path: Path to dump file to be imported.
         debug: If present, --debug will be added to the command showing all debug trace information.
     """
-    cli.call_subprocess(commands.get("wpcli_db_import").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_import"),
         file=dump_file_path, path=wordpress_path, debug_info=convert_wp_parameter_debug(debug)),
                         log_before_process=[literals.get("wp_wpcli_db_import_before"), dump_file_path],
-                        log_after_err=[literals.get("wp_wpcli_db_import_error")])
+                        log_after_err=[literals.get("wp_wpcli_db_import_error")],
+                        stream=True)
+    invalidate_options_snapshot(wordpress_path)
 
 
 def import_wxr_content(wordpress_path: str, wxr_path: str, authors: str, debug: bool):
@@ -635,10 +975,12 @@ def import_wxr_content(wordpress_path: str, wxr_path: str, authors: str, debug:
         debug: If present, --debug will be added to the command showing all debug trace information.
 
     """
-    cli.call_subprocess(commands.get("wpcli_import").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_import"),
         file=wxr_path, path=wordpress_path, authors=authors, debug_info=convert_wp_parameter_debug(debug)),
         log_before_process=[literals.get("wp_wpcli_import_before"), wxr_path],
-        log_after_err=[literals.get("wp_wpcli_import_error")])
+        log_after_err=[literals.get("wp_wpcli_import_error")],
+        stream=True)
+    invalidate_options_snapshot(wordpress_path)
 
 
 def install_theme(wordpress_path: str, source: str, activate: bool, debug: bool, theme_name: str):
@@ -658,13 +1000,14 @@ def install_theme(wordpress_path: str, source: str, activate: bool, debug: bool,
        theme_name: Name of the theme to be installed (just used for log purposes)
 
     """
-    cli.call_subprocess(commands.get("wpcli_theme_install").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_theme_install"),
         path=wordpress_path,
         source=source,
         activate=convert_wp_parameter_activate(activate),
         debug_info=convert_wp_parameter_debug(debug)),
         log_before_process=[literals.get("wp_wpcli_theme_install_before").format(theme_name=theme_name)],
         log_after_err=[literals.get("wp_wpcli_theme_install_error").format(theme_name=theme_name)])
+    invalidate_options_snapshot(wordpress_path)
 
 
 def install_plugin(plugin_name: str, wordpress_path: str, activate: bool, force: bool, source: str, debug: bool):
@@ -683,7 +1026,7 @@ def install_plugin(plugin_name: str, wordpress_path: str, activate: bool, force:
                source: Source of the installation.
                debug: Adds optional --debug parameter in order to better track the command result.
            """
-    cli.call_subprocess(commands.get("wpcli_plugin_install").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_plugin_install"),
         path=wordpress_path,
         activate=convert_wp_parameter_activate(activate),
         force=convert_wp_parameter_force(force),
@@ -692,6 +1035,122 @@ def install_plugin(plugin_name: str, wordpress_path: str, activate: bool, force:
     ),
         log_before_process=[literals.get("wp_wpcli_plugin_install_before").format(plugin_name=plugin_name)],
         log_after_err=[literals.get("wp_wpcli_plugin_install_error").format(plugin_name=plugin_name)])
+    invalidate_options_snapshot(wordpress_path)
+
+
+def install_plugins(plugins: List[dict], wordpress_path: str, debug: bool) -> Dict[str, bool]:
+    """ Uses WP-CLI to install several plugins with as few 'wp plugin install'
+    processes as possible.
+
+    Plugins with the same activate and force flags are installed by the same
+    process, so WordPress is bootstrapped once per group instead of once per
+    plugin. Groups are installed in the order their first plugin appears.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/plugin/install/
+
+    Args:
+        plugins: Plugin configurations with name, source, activate and force.
+        wordpress_path: Path to the wordpress installation.
+        debug: Adds optional --debug parameter in order to better track the command result.
+
+    Returns:
+        Dict with True for every plugin name that was installed (and
+        activated if requested).
+    """
+
+    groups: Dict[Tuple[bool, bool], List[dict]] = {}
+    for plugin in plugins:
+        groups.setdefault((bool(plugin["activate"]), bool(plugin["force"])), []).append(plugin)
+
+    results: Dict[str, bool] = {}
+    unverified: List[dict] = []
+    for (activate, force), group in groups.items():
+        plugin_names = ", ".join(plugin["name"] for plugin in group)
+        logging.info(literals.get("wp_wpcli_plugins_install_before").format(plugin_names=plugin_names))
+        out = []
+        returncode, err = cli.pipe_subprocess(cli.build_argv(commands.get("wpcli_plugin_install"),
+            path=wordpress_path,
+            activate=convert_wp_parameter_activate(activate),
+            force=convert_wp_parameter_force(force),
+            source=[plugin["source"] for plugin in group],
+            debug_info=convert_wp_parameter_debug(debug)
+        ), stdout_handler=out.append)
+
+        # The download, unpack and activate messages of every plugin, as call_subprocess logs them
+        output = b"".join(out)
+        log_tools.log_stdouterr(output, log_tools.LogLevel.info)
+
+        # WP-CLI reports "Success: Installed <n> of <n> plugins." only if every plugin of the process succeeded
+        summary = parse_plugin_install_summary(output.decode("utf-8", errors="replace"))
+        if returncode == 0 and summary is not None and summary[0] == summary[1] == len(group):
+            results.update({plugin["name"]: True for plugin in group})
+        else:
+            if err:
+                logging.error(err.decode("utf-8", errors="backslashreplace"))
+            unverified.extend(group)
+
+    if plugins:
+        invalidate_options_snapshot(wordpress_path)
+
+    # The output does not say which plugins of a failed process were installed, so they are checked one by one
+    if unverified:
+        installed_plugins = get_installed_plugins(wordpress_path, debug) or {}
+        for plugin in unverified:
+            status = installed_plugins.get(plugin["name"])
+            results[plugin["name"]] = status is not None and (
+                not plugin["activate"] or status in ("active", "active-network"))
+
+    for plugin_name, success in results.items():
+        if not success:
+            logging.error(literals.get("wp_wpcli_plugin_install_error").format(plugin_name=plugin_name))
+
+    return results
+
+
+def parse_plugin_install_summary(output: str) -> Optional[Tuple[int, int]]:
+    """Parses the summary line printed by 'wp plugin install'.
+
+    Args:
+        output: stdout of the command.
+
+    Returns:
+        Tuple with (installed plugins, requested plugins), or None if there is
+        no summary line.
+    """
+
+    matches = PLUGIN_INSTALL_SUMMARY_REGEX.findall(output or "")
+    if not matches:
+        return None
+
+    installed, requested = matches[-1]
+    return int(installed), int(requested)
+
+
+def get_installed_plugins(wordpress_path: str, debug: bool = False) -> Optional[Dict[str, str]]:
+    """Gets the installed plugins with a single WP-CLI process.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/plugin/list/
+
+    Args:
+        wordpress_path: Path to the wordpress installation.
+        debug: If True, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        Dict with the status of every plugin name, or None if the plugins
+        could not be listed.
+    """
+
+    plugins = parse_json_output(cli.call_subprocess_with_result(cli.build_argv(
+        commands.get("wpcli_plugin_list"),
+        path=wordpress_path,
+        debug_info=convert_wp_parameter_debug(debug))))
+
+    if plugins is None:
+        return None
+
+    return {plugin["name"]: plugin["status"] for plugin in plugins}
 
 
 def install_wordpress_core(wordpress_path: str, url: str, title: str, admin_user: str, admin_email: str,
@@ -713,7 +1172,7 @@ def install_wordpress_core(wordpress_path: str, url: str, title: str, admin_user
             skip_email: --skip-mail parameter will send an email to the address specified if present.
             debug: Adds optional --debug parameter in order to better track the command result.
         """
-    cli.call_subprocess(commands.get("wpcli_core_install").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_core_install"),
         path=wordpress_path,
         url=url,
         title=title,
@@ -725,6 +1184,121 @@ def install_wordpress_core(wordpress_path: str, url: str, title: str, admin_user
         log_before_process=[literals.get("wp_wpcli_core_install_before")],
         log_after_err=[literals.get("wp_wpcli_core_install_error")]
     )
+    invalidate_options_snapshot(wordpress_path)
+
+
+def invalidate_options_snapshot(wordpress_path: str = None):
+    """Discards the options snapshot of a WordPress path, so option checks run
+    WP-CLI again.
+
+    Args:
+        wordpress_path: Path to WordPress files. If None all the snapshots
+            are discarded.
+    """
+
+    if wordpress_path is None:
+        _options_snapshots.clear()
+    else:
+        _options_snapshots.pop(__snapshot_key(wordpress_path), None)
+
+
+def load_options_snapshot(wordpress_path: str, debug: bool = False) -> Optional[dict]:
+    """Takes a snapshot of the options table with a single WP-CLI process.
+
+    Until it is invalidated, check_if_option_exists() answers from the
+    snapshot. Options written by this module are updated in the snapshot or
+    checked again the next time, and commands that may write many options
+    (imports, installs, resets) discard the whole snapshot.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/option/list/
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        debug: If True, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        Dict with the (value, autoload) tuple of every option, or None if the
+        options could not be listed.
+    """
+
+    options = parse_json_output(cli.call_subprocess_with_result(cli.build_argv(
+        commands.get("wpcli_option_list"),
+        path=wordpress_path,
+        debug_info=convert_wp_parameter_debug(debug))))
+
+    if options is None:
+        invalidate_options_snapshot(wordpress_path)
+        return None
+
+    snapshot = {option["option_name"]: (option["option_value"], option.get("autoload") not in ("no", "off", "auto-off"))
+                for option in options}
+    _options_snapshots[__snapshot_key(wordpress_path)] = snapshot
+
+    return snapshot
+
+
+def __snapshot_key(wordpress_path: str) -> str:
+    """Gets the key of the options snapshot of a WordPress path, which is the
+    same for its native and POSIX forms."""
+    return pathlib.Path(wordpress_path).as_posix()
+
+
+def __set_snapshot_option(wordpress_path: str, option_name: str, entry: Optional[Tuple[str, Optional[bool]]]):
+    """Updates an option in the options snapshot of a WordPress path, if any.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        option_name: Name for the option.
+        entry: (value, autoload) tuple, or None if the option has to be checked again.
+    """
+
+    snapshot = _options_snapshots.get(__snapshot_key(wordpress_path))
+    if snapshot is not None:
+        snapshot[option_name] = entry
+
+
+def log_option_result(result: dict):
+    """Logs the result of an option of a batch run by add_update_options().
+
+    Args:
+        result: Dict with the name and result of the option.
+    """
+
+    option_name = result.get("name")
+    outcome = result.get("result")
+
+    if outcome == "added":
+        logging.info(literals.get("wp_wpcli_option_added").format(option_name=option_name))
+    elif outcome == "updated":
+        logging.info(literals.get("wp_wpcli_option_updated").format(option_name=option_name))
+    elif outcome == "unchanged":
+        logging.warning(literals.get("wp_wpcli_option_skipping").format(option_name=option_name))
+    elif outcome == "invalid":
+        logging.warning(literals.get("wp_wpcli_option_invalid").format(option_name=option_name))
+    else:
+        logging.error(literals.get("wp_wpcli_option_add_error").format(option_name=option_name))
+
+
+def parse_json_output(output: str):
+    """Parses the JSON printed by a php file run with eval_file().
+
+    The JSON must be in the last line, as WordPress or plugins may print
+    notices before it.
+
+    Args:
+        output: stdout of the php file.
+
+    Returns:
+        The parsed JSON, or None if there is no valid JSON in the last line.
+    """
+
+    lines = output.strip().splitlines() if output else []
+
+    try:
+        return json.loads(lines[-1]) if lines else None
+    except ValueError:
+        return None
 
 
 def reset_database(wordpress_path: str, quiet: bool, debug_info: bool):
@@ -738,12 +1312,13 @@ def reset_database(wordpress_path: str, quiet: bool, debug_info: bool):
         wordpress_path: Path to WordPress files.
         quiet: If True, no questions are asked.
     """
-    cli.call_subprocess(commands.get("wpcli_db_reset").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_reset"),
         path=wordpress_path,
         yes=convert_wp_parameter_yes(quiet),
         debug_info=convert_wp_parameter_debug(debug_info)),
         log_before_process=[literals.get("wp_wpcli_db_reset_before")],
         log_after_err=[literals.get("wp_wpcli_db_reset_error")])
+    invalidate_options_snapshot(wordpress_path)
 
 
 def reset_transients(wordpress_path: str):
@@ -753,7 +1328,7 @@ def reset_transients(wordpress_path: str):
         wordpress_path: Path to WordPress files.
     """
 
-    cli.call_subprocess(commands.get("wpcli_db_delete_transient").format(path=wordpress_path),
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_delete_transient"), path=wordpress_path),
                         log_before_out=[literals.get("wp_wpcli_delete_transients")],
                         log_after_err=[literals.get("wp_wpcli_delete_transients_err")])
 
@@ -773,7 +1348,7 @@ def set_configuration_value(name: str, value: str, value_type: ValueType, wordpr
             raw: Toggles --raw as parameter that decides if value will placed as it gets, without quotes
             debug: Toggles --debug_info as a parameter inside the command.
     """
-    cli.call_subprocess(commands.get("wpcli_config_set").format(
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_config_set"),
         name=name,
         value=value,
         raw=convert_wp_parameter_raw(raw),
@@ -807,7 +1382,7 @@ def update_database_option(option_name: str, option_value: str, wordpress_path:
 
     # Update the option if the new value is different than the existing one
     if option_exists and existing_option_value != option_value:
-        cli.call_subprocess(commands.get("wpcli_option_update").format(
+        cli.call_subprocess(cli.build_argv(commands.get("wpcli_option_update"),
             option_name=option_name,
             option_value=option_value,
             autoload=convert_wp_parameter_autoload(autoload),
@@ -819,13 +1394,14 @@ def update_database_option(option_name: str, option_value: str, wordpress_path:
             log_after_err=[literals.get("wp_wpcli_option_update_error").format(
                 option_name=option_name,
                 option_value=option_value)])
+        __set_snapshot_option(wordpress_path, option_name, None)
     else:
         logging.warning(literals.get("wp_wpcli_option_skipping").format(option_name=option_name))
 
 
 def wp_cli_info():
     """Executes wp info command and logs output based on the result. """
-    cli.call_subprocess(commands.get("wpcli_info"),
+    cli.call_subprocess(cli.build_argv(commands.get("wpcli_info")),
                         log_before_out=[literals.get("wp_wpcli_install_ok"), literals.get("wp_wpcli_info")],
                         log_after_out=[literals.get("wp_wpcli_add_ev")])
 
@@ -0,0 +1,235 @@
+"""Renders wp-config.php files without WP-CLI
+
+The layout is the same as the one of the files created by wp config create,
+so the result is equivalent to running wp config create followed by one
+wp config set per property, but in a single pass and without bootstrapping
+PHP for every value.
+"""
+
+import concurrent.futures
+import pathlib
+import secrets
+from typing import Dict, List, Optional
+
+import devops_toolset.filesystem.tools as filesystem_tools
+from devops_toolset.core.app import App
+
+app: App = App.instance()
+
+# Same names and character set WP-CLI uses to generate the keys and salts
+SALT_NAMES: List[str] = ["AUTH_KEY", "SECURE_AUTH_KEY", "LOGGED_IN_KEY", "NONCE_KEY",
+                         "AUTH_SALT", "SECURE_AUTH_SALT", "LOGGED_IN_SALT", "NONCE_SALT"]
+SALT_CHARACTERS: str = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()-_ []{}<>~`+=,.;:/?|"
+SALT_LENGTH: int = 64
+
+DEFAULT_MAX_WORKERS: int = 4
+
+WP_CONFIG_HEADER: str = """<?php
+/**
+ * The base configuration for WordPress
+ *
+ * The wp-config.php creation script uses this file during the installation.
+ * You don't have to use the web site, you can copy this file to "wp-config.php"
+ * and fill in the values.
+ *
+ * This file contains the following configurations:
+ *
+ * * Database settings
+ * * Secret keys
+ * * Database table prefix
+ * * ABSPATH
+ *
+ * @link https://wordpress.org/documentation/article/editing-wp-config-php/
+ *
+ * @package WordPress
+ */
+"""
+
+WP_CONFIG_FOOTER: str = """/* That's all, stop editing! Happy publishing. */
+
+/** Absolute path to the WordPress directory. */
+if ( ! defined( 'ABSPATH' ) ) {
+	define( 'ABSPATH', __DIR__ . '/' );
+}
+
+/** Sets up WordPress vars and included files. */
+require_once ABSPATH . 'wp-settings.php';
+"""
+
+
+def generate_salts() -> Dict[str, str]:
+    """Generates the authentication unique keys and salts.
+
+    Returns:
+        Dict with a random value for every key and salt.
+    """
+
+    return {name: "".join(secrets.choice(SALT_CHARACTERS) for _ in range(SALT_LENGTH)) for name in SALT_NAMES}
+
+
+def php_value(value, raw: bool = None) -> str:
+    """Converts a value into its PHP literal.
+
+    Args:
+        value: Value to be converted.
+        raw: If True the value is placed as it is, without quotes. By default
+            only strings are quoted, as set_wordpress_config_from_configuration_file
+            has always done.
+
+    Returns:
+        The PHP literal.
+    """
+
+    if raw is None:
+        raw = not isinstance(value, str)
+
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if raw:
+        return str(value)
+
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def render_property(name: str, value, property_type: str = "constant", raw: bool = None) -> str:
+    """Renders a constant definition or a variable assignment.
+
+    Args:
+        name: Name of the constant or variable.
+        value: Value of the property.
+        property_type: constant or variable, the same as the --type argument
+            of wp config set.
+        raw: If True the value is placed as it is, without quotes.
+
+    Returns:
+        The PHP statement.
+    """
+
+    if property_type == "variable":
+        return f"${name} = {php_value(value, raw)};"
+
+    return f"define( '{name}', {php_value(value, raw)} );"
+
+
+def render(environment_config: dict, db_user_password: str, snippets: Optional[List[str]] = None,
+           salts: Optional[Dict[str, str]] = None) -> str:
+    """Renders the content of a wp-config.php file for an environment.
+
+    Args:
+        environment_config: Environment configuration.
+        db_user_password: Database user password.
+        snippets: PHP code to be placed after the configuration properties.
+        salts: Keys and salts. New ones are generated if None.
+
+    Returns:
+        The content of the wp-config.php file.
+    """
+
+    database = environment_config["database"]
+    salts = salts if salts is not None else generate_salts()
+
+    lines = [
+        WP_CONFIG_HEADER,
+        "// ** Database settings - You can get this info from your web host ** //",
+        "/** The name of the database for WordPress */",
+        render_property("DB_NAME", database["db_name"]),
+        "",
+        "/** Database username */",
+        render_property("DB_USER", database["db_user"]),
+        "",
+        "/** Database password */",
+        render_property("DB_PASSWORD", db_user_password),
+        "",
+        "/** Database hostname */",
+        render_property("DB_HOST", database["host"]),
+        "",
+        "/** Database charset to use in creating database tables. */",
+        render_property("DB_CHARSET", database.get("charset") or "utf8"),
+        "",
+        "/** The database collate type. Don't change this if in doubt. */",
+        render_property("DB_COLLATE", database.get("collate") or ""),
+        "",
+        "/**#@+",
+        " * Authentication unique keys and salts.",
+        " *",
+        " * Change these to different unique phrases! You can generate these using",
+        " * the {@link https://api.wordpress.org/secret-key/1.1/salt/ WordPress.org secret-key service}.",
+        " *",
+        " * You can change these at any point in time to invalidate all existing cookies.",
+        " * This will force all users to have to log in again.",
+        " */",
+        *[render_property(name, value) for name, value in salts.items()],
+        "",
+        "/**#@-*/",
+        "",
+        "/**",
+        " * WordPress database table prefix.",
+        " */",
+        render_property("table_prefix", database["table_prefix"], "variable"),
+        "",
+        "/* Add any custom values between this line and the \"stop editing\" line. */",
+        "",
+    ]
+
+    properties = environment_config.get("wp_config", {}).values()
+    lines.extend(render_property(prop.get("name"), prop.get("value"), prop.get("type", "constant"))
+                 for prop in properties)
+
+    if not any(prop.get("name") == "WP_DEBUG" for prop in properties):
+        lines.extend(["", "/**", " * For developers: WordPress debugging mode.", " */",
+                      render_property("WP_DEBUG", False)])
+
+    for snippet in snippets or []:
+        lines.extend(["", snippet.rstrip("\n")])
+
+    lines.extend(["", WP_CONFIG_FOOTER])
+
+    return "\n".join(lines)
+
+
+def write(content: str, file_path: str):
+    """Writes a wp-config.php file atomically.
+
+    Args:
+        content: Content of the file.
+        file_path: Path to the file.
+    """
+
+    filesystem_tools.write_file_atomically(file_path, content)
+
+
+def render_environments(environments: List[dict], db_user_passwords: Dict[str, str], wordpress_path: str,
+                        snippets: Optional[Dict[str, List[str]]] = None,
+                        max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, str]:
+    """Renders and writes a wp-config-<environment>.php file for every
+    environment concurrently.
+
+    Args:
+        environments: Environment configurations.
+        db_user_passwords: Database user password of every environment.
+        wordpress_path: Path to the WordPress installation.
+        snippets: PHP snippets of every environment.
+        max_workers: Maximum number of files rendered at the same time.
+
+    Returns:
+        Dict with the path of the file of every environment.
+    """
+
+    snippets = snippets or {}
+
+    def render_environment(environment: dict) -> str:
+        file_path = str(pathlib.Path(wordpress_path, f"wp-config-{environment['name']}.php"))
+        write(render(environment, db_user_passwords[environment["name"]], snippets.get(environment["name"])),
+              file_path)
+        return file_path
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        file_paths = list(executor.map(render_environment, environments))
+
+    return {environment["name"]: file_path for environment, file_path in zip(environments, file_paths)}
+
+
+if __name__ == "__main__":
+    help(__name__)
@@ -0,0 +1,310 @@
+"""Inspects and caches WordPress core files without WP-CLI
+
+The version information is parsed from wp-includes/version.php, which is what
+wp core version reads after bootstrapping PHP and WP-CLI.
+
+Downloaded cores are kept as zip archives in an ArtifactCache keyed by
+(version, locale, skip content), so the same core is downloaded only once
+per cache directory.
+"""
+
+import logging
+import os
+import pathlib
+import re
+import tempfile
+import zipfile
+from typing import Dict, List, Optional, Set
+
+import requests
+
+import devops_toolset.filesystem.cache as cache_tools
+from devops_toolset.core.app import App
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.filesystem.cache import ArtifactCache
+from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
+
+app: App = App.instance()
+literals = LiteralsCore([WordpressLiterals])
+
+CORE_CACHE_DIRECTORY: str = "wordpress-core"
+VERSION_CHECK_URL: str = "https://api.wordpress.org/core/version-check/1.7/"
+VERSION_CHECK_TIMEOUT: int = 10
+
+# Files that must exist for the core to be considered downloaded. wp-content is
+# not included because it is not downloaded with --skip-content.
+CORE_FILES: List[str] = ["wp-load.php", "wp-settings.php", "wp-includes/version.php", "wp-admin/index.php"]
+
+VERSION_FILE: str = "wp-includes/version.php"
+
+# Matches the $name = value; assignments of version.php
+VERSION_VARIABLE_REGEX = re.compile(r"""^\$(\w+)\s*=\s*(?:'([^']*)'|"([^"]*)"|(\d+))\s*;""", re.MULTILINE)
+
+
+class WordPressVersion(object):
+    """Version information of a WordPress core."""
+
+    def __init__(self, variables: Dict[str, str]):
+        """
+        Args:
+            variables: Variables assigned in wp-includes/version.php.
+        """
+
+        self.version: str = variables["wp_version"]
+        self.db_version: Optional[int] = int(variables["wp_db_version"]) if "wp_db_version" in variables else None
+        self.required_php_version: Optional[str] = variables.get("required_php_version")
+        self.required_mysql_version: Optional[str] = variables.get("required_mysql_version")
+        self.local_package: Optional[str] = variables.get("wp_local_package")
+
+    def __repr__(self):
+        return f"<WordPressVersion {self.version} db_version={self.db_version}>"
+
+
+def has_core_files(wordpress_path: str) -> bool:
+    """Checks if the WordPress core files are present at a path.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+
+    Returns:
+        True if all the core files exist.
+    """
+
+    path = pathlib.Path(wordpress_path)
+    return all(path.joinpath(file).is_file() for file in CORE_FILES)
+
+
+def parse_version_file(content: str) -> Dict[str, str]:
+    """Parses the variables of a wp-includes/version.php file.
+
+    Args:
+        content: Content of the file.
+
+    Returns:
+        Dict with the value of every variable.
+    """
+
+    return {match.group(1): next(group for group in match.groups()[1:] if group is not None)
+            for match in VERSION_VARIABLE_REGEX.finditer(content)}
+
+
+def get_version(wordpress_path: str) -> Optional[WordPressVersion]:
+    """Gets the version of the WordPress core at a path.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+
+    Returns:
+        The version information, or None if the core files are not present or
+        the version cannot be parsed.
+    """
+
+    if not has_core_files(wordpress_path):
+        return None
+
+    try:
+        content = pathlib.Path(wordpress_path, VERSION_FILE).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+    variables = parse_version_file(content)
+    if "wp_version" not in variables:
+        return None
+
+    return WordPressVersion(variables)
+
+
+def __version_tuple(version: str) -> tuple:
+    return tuple(int(part) if part.isdigit() else 0 for part in re.split(r"[.-]", version))
+
+
+def get_core_cache() -> ArtifactCache:
+    """Gets the cache of WordPress core archives.
+
+    Returns:
+        The cache in the core directory of the configured cache path, bounded
+        to the configured maximum size.
+    """
+
+    return cache_tools.get_cache(CORE_CACHE_DIRECTORY)
+
+
+def get_cache_key(version: str, locale: str, skip_content: bool) -> str:
+    """Gets the cache key of a WordPress core.
+
+    Args:
+        version: Exact WordPress version.
+        locale: WordPress locale.
+        skip_content: True if the core was downloaded without wp-content.
+
+    Returns:
+        The cache key.
+    """
+
+    return f"{version}/{locale}/{'no-content' if skip_content else 'full'}"
+
+
+def get_latest_version(locale: str) -> Optional[str]:
+    """Gets the latest WordPress version from the WordPress.org API.
+
+    Args:
+        locale: WordPress locale.
+
+    Returns:
+        The version, or None if it cannot be obtained.
+    """
+
+    try:
+        response = requests.get(VERSION_CHECK_URL, params={"locale": locale}, timeout=VERSION_CHECK_TIMEOUT)
+        response.raise_for_status()
+        return response.json()["offers"][0]["current"]
+    except (requests.RequestException, ValueError, KeyError, IndexError):
+        return None
+
+
+def get_latest_cached_version(cache: ArtifactCache, locale: str, skip_content: bool) -> Optional[str]:
+    """Gets the newest version of the cores cached for a locale.
+
+    Args:
+        cache: Cache of WordPress core archives.
+        locale: WordPress locale.
+        skip_content: True to look for cores downloaded without wp-content.
+
+    Returns:
+        The version, or None if there is no cached core for the locale.
+    """
+
+    suffix = get_cache_key("", locale, skip_content)
+    versions = [key[:-len(suffix)] for key in cache.keys() if key.endswith(suffix)]
+    return max(versions, key=__version_tuple) if versions else None
+
+
+def resolve_version(version: str, locale: str, skip_content: bool, cache: ArtifactCache,
+                    offline: bool = False) -> Optional[str]:
+    """Resolves the exact version of a WordPress core to be downloaded.
+
+    Args:
+        version: Version from the site configuration (latest or exact).
+        locale: WordPress locale.
+        skip_content: True if wp-content is not downloaded.
+        cache: Cache of WordPress core archives.
+        offline: If True the latest version is the newest cached one.
+
+    Returns:
+        The exact version, or None if it cannot be resolved.
+    """
+
+    if version != "latest":
+        return version
+
+    return get_latest_cached_version(cache, locale, skip_content) if offline else get_latest_version(locale)
+
+
+def list_files(wordpress_path: str) -> Set[str]:
+    """Lists the files under a path.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+
+    Returns:
+        Set with the POSIX paths of the files relative to wordpress_path.
+    """
+
+    root = pathlib.Path(wordpress_path)
+    if not root.is_dir():
+        return set()
+
+    return {pathlib.Path(path, file).relative_to(root).as_posix()
+            for path, directories, files in os.walk(root) for file in files}
+
+
+def archive_core(wordpress_path: str, archive_path: str, exclude: Set[str] = frozenset()):
+    """Archives the WordPress core files of a path in a zip file.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        archive_path: Path to the zip file.
+        exclude: Relative POSIX paths of the files that are not part of the
+            core (files that were there before downloading it).
+    """
+
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file in sorted(list_files(wordpress_path) - set(exclude)):
+            archive.write(pathlib.Path(wordpress_path, file), file)
+
+
+def extract_core(archive_path: str, wordpress_path: str):
+    """Extracts an archived WordPress core.
+
+    Args:
+        archive_path: Path to the zip file.
+        wordpress_path: Path to WordPress files.
+    """
+
+    with zipfile.ZipFile(archive_path, "r") as archive:
+        archive.extractall(wordpress_path)
+
+
+def restore_from_cache(cache: ArtifactCache, version: str, locale: str, skip_content: bool,
+                       wordpress_path: str) -> bool:
+    """Extracts a WordPress core from the cache if it is there.
+
+    Args:
+        cache: Cache of WordPress core archives.
+        version: Exact WordPress version.
+        locale: WordPress locale.
+        skip_content: True if wp-content is not downloaded.
+        wordpress_path: Path to WordPress files.
+
+    Returns:
+        True if the core was extracted from the cache.
+    """
+
+    key = get_cache_key(version, locale, skip_content)
+    archive_path = cache.get(key)
+    if archive_path is None:
+        return False
+
+    logging.info(literals.get("wp_core_cache_hit").format(key=key, path=wordpress_path))
+    extract_core(str(archive_path), wordpress_path)
+    return True
+
+
+def add_to_cache(cache: ArtifactCache, locale: str, skip_content: bool, wordpress_path: str,
+                 exclude: Set[str] = frozenset()) -> Optional[str]:
+    """Adds a downloaded WordPress core to the cache.
+
+    The key uses the version read from the downloaded files, so cores
+    downloaded as latest are found by their exact version.
+
+    Args:
+        cache: Cache of WordPress core archives.
+        locale: WordPress locale.
+        skip_content: True if wp-content was not downloaded.
+        wordpress_path: Path to WordPress files.
+        exclude: Relative POSIX paths of the files that are not part of the
+            core.
+
+    Returns:
+        The cache key, or None if there is no WordPress core in the path.
+    """
+
+    wordpress_version = get_version(wordpress_path)
+    if wordpress_version is None:
+        return None
+
+    key = get_cache_key(wordpress_version.version, locale, skip_content)
+    file_descriptor, archive_path = tempfile.mkstemp(suffix=".zip")
+    os.close(file_descriptor)
+    try:
+        archive_core(wordpress_path, archive_path, exclude)
+        cache.put(key, archive_path, {"version": wordpress_version.version, "locale": locale,
+                                      "skip_content": skip_content})
+    finally:
+        os.remove(archive_path)
+
+    return key
+
+
+if __name__ == "__main__":
+    help(__name__)
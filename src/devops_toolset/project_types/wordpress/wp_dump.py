@@ -0,0 +1,510 @@
+"""Streams WordPress database dumps through compression
+
+wp db export - writes the dump to stdout, which is compressed chunk by chunk
+while it arrives, so the dump is never held in memory nor written to disk
+uncompressed. Imports go the other way, decompressing the dump into the
+stdin of wp db import -.
+
+The compression is taken from the extension of the dump file: .gz for gzip
+and .zst for zstd (which needs the zstandard package). Any other extension
+is written as plain SQL.
+
+Provisioning stages can also be dumped differentially: the first stage takes
+a full base dump and every following stage only dumps the tables whose
+CHECKSUM TABLE or row count changed since the previous stage. The stages
+are recorded in a manifest next to the dump files, so any stage is rebuilt
+by importing its base dump and the deltas that follow it.
+"""
+
+import gzip
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import devops_toolset.project_types.wordpress.wp_cli as wp_cli
+import devops_toolset.filesystem.tools as filesystem_tools
+import devops_toolset.tools.cli as cli
+from devops_toolset.core.app import App
+from devops_toolset.core.CommandsCore import CommandsCore
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
+from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
+
+app: App = App.instance()
+literals = LiteralsCore([WordpressLiterals])
+commands = CommandsCore([WordpressCommands])
+
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".zst": "zstd"}
+
+# Fast levels, dumps are compressed while WP-CLI writes them
+GZIP_LEVEL: int = 6
+ZSTD_LEVEL: int = 3
+
+CHUNK_SIZE: int = 1024 * 1024
+
+MANIFEST_FILE_NAME: str = "dumps-manifest.json"
+
+
+class DumpMetrics(object):
+    """Size and duration of a dump export or import."""
+
+    def __init__(self, path: str, compression: Optional[str], uncompressed_size: int, size: int, seconds: float):
+        """
+        Args:
+            path: Path to the dump file.
+            compression: gzip, zstd or None.
+            uncompressed_size: Bytes of SQL exported or imported.
+            size: Bytes of the dump file.
+            seconds: Duration of the operation.
+        """
+
+        self.path = path
+        self.compression = compression
+        self.uncompressed_size = uncompressed_size
+        self.size = size
+        self.seconds = seconds
+
+    @property
+    def ratio(self) -> float:
+        """Compression ratio (uncompressed size / file size)."""
+        return self.uncompressed_size / self.size if self.size else 0.0
+
+    def __repr__(self):
+        return f"<DumpMetrics {self.path} {self.size}/{self.uncompressed_size} bytes in {self.seconds:.2f}s>"
+
+
+def get_compression(dump_file_path: str) -> Optional[str]:
+    """Gets the compression of a dump file from its extension.
+
+    Args:
+        dump_file_path: Path to the dump file.
+
+    Returns:
+        gzip, zstd or None for plain SQL.
+    """
+
+    return COMPRESSION_EXTENSIONS.get(pathlib.Path(dump_file_path).suffix.lower())
+
+
+def open_dump(path: str, mode: str, compression: Optional[str], level: int = None):
+    """Opens a dump file, compressing or decompressing it on the fly.
+
+    Args:
+        path: Path to the dump file.
+        mode: rb or wb.
+        compression: gzip, zstd or None.
+        level: Compression level. Defaults to a fast one.
+
+    Returns:
+        Binary file object.
+    """
+
+    if compression == "gzip":
+        return gzip.open(path, mode, compresslevel=level if level is not None else GZIP_LEVEL)
+
+    if compression == "zstd":
+        # zstandard is only needed for .zst dumps
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError(literals.get("wp_dump_zstd_not_installed"))
+
+        file = open(path, mode)
+        if "w" in mode:
+            return zstandard.ZstdCompressor(level=level if level is not None else ZSTD_LEVEL).stream_writer(file)
+        return zstandard.ZstdDecompressor().stream_reader(file)
+
+    return open(path, mode)
+
+
+def export_database(wordpress_path: str, dump_file_path: str, debug: bool = False, extended_insert: bool = True,
+                    compression: str = None, level: int = None, tables: List[str] = None) -> Optional[DumpMetrics]:
+    """Exports a WordPress database streaming it into a (compressed) dump file.
+
+    The dump is written to a temporary file next to dump_file_path that
+    replaces it only if the export succeeds.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/db/export/
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        dump_file_path: Path to the destination dump file.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+        extended_insert: If True rows are written in multiple-row INSERT
+            statements, which are smaller and much faster to import.
+        compression: gzip, zstd or None. Taken from the extension of
+            dump_file_path if None.
+        level: Compression level.
+        tables: Tables to be exported. All the tables if None.
+
+    Returns:
+        The metrics of the export, or None if it failed.
+    """
+
+    compression = compression if compression is not None else get_compression(dump_file_path)
+    dump_path = pathlib.Path(dump_file_path)
+    dump_path.parent.mkdir(parents=True, exist_ok=True)
+    logging.info(literals.get("wp_wpcli_db_export_before").format(path=dump_file_path))
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=dump_path.parent, prefix=".", suffix=".tmp")
+    os.close(file_descriptor)
+    uncompressed_size = 0
+    start = time.monotonic()
+
+    try:
+        with open_dump(temp_path, "wb", compression, level) as dump_file:
+            def write(chunk: bytes):
+                nonlocal uncompressed_size
+                uncompressed_size += len(chunk)
+                dump_file.write(chunk)
+
+            returncode, err = cli.pipe_subprocess(cli.build_argv(commands.get("wpcli_db_export_stdout"),
+                path=wordpress_path,
+                tables=convert_wp_parameter_tables(tables),
+                extended_insert=convert_wp_parameter_extended_insert(extended_insert),
+                debug_info=wp_cli.convert_wp_parameter_debug(debug)), stdout_handler=write)
+
+        if returncode != 0:
+            __log_error(err, "wp_wpcli_db_export_error")
+            os.remove(temp_path)
+            return None
+
+        os.replace(temp_path, dump_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    metrics = DumpMetrics(dump_file_path, compression, uncompressed_size, dump_path.stat().st_size,
+                          time.monotonic() - start)
+    __log_metrics(metrics)
+    return metrics
+
+
+def import_database(wordpress_path: str, dump_file_path: str, debug: bool = False,
+                    compression: str = None, init_sql: bytes = b"") -> Optional[DumpMetrics]:
+    """Imports a WordPress database streaming a (compressed) dump file into
+    WP-CLI.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/db/import/
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        dump_file_path: Path to dump file to be imported.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+        compression: gzip, zstd or None. Taken from the extension of
+            dump_file_path if None.
+        init_sql: SQL statements streamed before the dump, in the same
+            session (e.g. to disable foreign key checks).
+
+    Returns:
+        The metrics of the import, or None if it failed.
+    """
+
+    compression = compression if compression is not None else get_compression(dump_file_path)
+    logging.info(literals.get("wp_wpcli_db_import_before"))
+    logging.info(dump_file_path)
+
+    uncompressed_size = 0
+    start = time.monotonic()
+
+    try:
+        with open_dump(dump_file_path, "rb", compression) as dump_file:
+            def read() -> bytes:
+                nonlocal uncompressed_size, init_sql
+                if init_sql:
+                    chunk, init_sql = init_sql, b""
+                    return chunk
+                chunk = dump_file.read(CHUNK_SIZE)
+                uncompressed_size += len(chunk)
+                return chunk
+
+            returncode, err = cli.pipe_subprocess(cli.build_argv(commands.get("wpcli_db_import_stdin"),
+                path=wordpress_path,
+                debug_info=wp_cli.convert_wp_parameter_debug(debug)), stdin_source=read)
+    except (OSError, EOFError) as error:
+        # A truncated or corrupt dump, the import process has been killed
+        returncode, err = None, str(error).encode("utf-8")
+
+    wp_cli.invalidate_options_snapshot(wordpress_path)
+
+    if returncode != 0:
+        __log_error(err, "wp_wpcli_db_import_error")
+        return None
+
+    metrics = DumpMetrics(dump_file_path, compression, uncompressed_size, os.path.getsize(dump_file_path),
+                          time.monotonic() - start)
+    __log_metrics(metrics)
+    return metrics
+
+
+def get_table_checksums(wordpress_path: str, debug: bool = False) -> Optional[Dict[str, dict]]:
+    """Gets the checksum and row count of every WordPress table in one WP-CLI
+    process.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        Dict with a {"checksum", "rows"} dict per table, or None if they could
+        not be obtained.
+    """
+
+    output = wp_cli.eval_file(str(wp_cli.php_scripts_path.joinpath("tables-checksum.php")), wordpress_path,
+                              debug=debug)
+    checksums = wp_cli.parse_json_output(output)
+    return checksums if isinstance(checksums, dict) else None
+
+
+def get_changed_tables(previous: Dict[str, dict], current: Dict[str, dict]) -> Tuple[List[str], List[str]]:
+    """Compares the table checksums of two stages.
+
+    Tables that cannot be checksummed (null checksum) are always considered
+    changed.
+
+    Args:
+        previous: Table checksums of the previous stage.
+        current: Table checksums of the current stage.
+
+    Returns:
+        Tuple with the sorted lists of changed (or new) and dropped tables.
+    """
+
+    changed = [table for table, checksum in current.items()
+               if checksum.get("checksum") is None or previous.get(table) != checksum]
+    dropped = [table for table in previous if table not in current]
+    return sorted(changed), sorted(dropped)
+
+
+def get_manifest_path(dump_path: str) -> pathlib.Path:
+    """Gets the path of the dumps manifest of a dump file or dumps directory.
+
+    Args:
+        dump_path: Path to a dump file or to the directory of the dumps.
+
+    Returns:
+        Path to the manifest.
+    """
+
+    path = pathlib.Path(dump_path)
+    if path.name == MANIFEST_FILE_NAME:
+        return path
+    return (path if path.is_dir() else path.parent).joinpath(MANIFEST_FILE_NAME)
+
+
+def read_manifest(manifest_path: pathlib.Path) -> dict:
+    """Reads a dumps manifest.
+
+    Args:
+        manifest_path: Path to the manifest.
+
+    Returns:
+        The manifest, with no stages if it does not exist.
+    """
+
+    if not manifest_path.is_file():
+        return {"stages": []}
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def get_stage_chain(dump_path: str, stage: str = None) -> Optional[List[dict]]:
+    """Gets the stages that rebuild a differentially dumped stage.
+
+    The stage is looked for by name, or by the file name of dump_path if no
+    name is given. If it was dumped more than once, the latest one is taken.
+
+    Args:
+        dump_path: Path to a dump file, to the dumps directory or to the
+            manifest.
+        stage: Name of the stage.
+
+    Returns:
+        The list of stages from the base dump to the requested stage, or None
+        if the stage is not in the manifest.
+    """
+
+    manifest_path = get_manifest_path(dump_path)
+    stages = read_manifest(manifest_path)["stages"]
+    name = pathlib.Path(dump_path).name
+
+    matches = [index for index, entry in enumerate(stages)
+               if (entry["stage"] == stage if stage is not None else entry["file"] == name)]
+    if not matches:
+        if stage is not None:
+            logging.error(literals.get("wp_dump_stage_not_found").format(stage=stage, path=manifest_path))
+        return None
+
+    end = matches[-1]
+    start = max(index for index in range(end + 1) if stages[index]["base"])
+    return stages[start:end + 1]
+
+
+def export_stage(wordpress_path: str, dump_file_path: str, stage: str, base: bool = False, debug: bool = False,
+                 extended_insert: bool = True) -> Optional[dict]:
+    """Exports a provisioning stage differentially.
+
+    A base stage (or the first one) is a full dump. Any other stage only
+    dumps the tables that changed since the previous stage, and records the
+    tables that were dropped. Dumping the same stage again replaces it, so it
+    holds every change since the stage before it.
+
+    Stages are not written over the files of the stages they depend on: if
+    the dump file is already used in the chain, the stage name is added to
+    the file name. Stages of older chains that depended on an overwritten
+    file are removed from the manifest.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        dump_file_path: Path to the destination dump file.
+        stage: Name of the stage (core, theme, plugins...).
+        base: If True a full dump starts a new chain of stages.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+        extended_insert: If True rows are written in multiple-row INSERT
+            statements.
+
+    Returns:
+        The manifest entry of the stage, or None if it could not be exported.
+    """
+
+    dump_path = pathlib.Path(dump_file_path)
+    manifest_path = get_manifest_path(dump_file_path)
+    stages = read_manifest(manifest_path)["stages"]
+
+    checksums = get_table_checksums(wordpress_path, debug)
+    if checksums is None:
+        logging.warning(literals.get("wp_dump_checksums_error"))
+        base = True
+        checksums = {}
+
+    chain = __get_last_chain(stages)
+    if chain and not base and chain[-1]["stage"] == stage:
+        stages.remove(chain.pop())
+    base = base or not chain
+
+    file_name = dump_path.name
+    if not base and any(entry["file"] == file_name for entry in chain):
+        file_name = __add_stage_to_file_name(file_name, stage)
+    stages = __remove_stages_using_file(stages, file_name)
+
+    if base:
+        changed, dropped = sorted(checksums), []
+        tables = None
+    else:
+        previous = chain[-1]
+        changed, dropped = get_changed_tables(previous["checksums"], checksums)
+        tables = changed
+        logging.info(literals.get("wp_dump_stage_delta").format(
+            stage=stage, changed=len(changed), dropped=len(dropped), previous=previous["stage"]))
+
+    entry = {"stage": stage, "file": file_name if base or changed else None, "base": base, "tables": changed,
+             "dropped": dropped, "checksums": checksums}
+
+    if entry["file"] is not None and export_database(wordpress_path, str(dump_path.with_name(file_name)), debug,
+                                                     extended_insert, tables=tables) is None:
+        return None
+
+    stages.append(entry)
+    filesystem_tools.write_file_atomically(str(manifest_path), json.dumps({"stages": stages}, indent=2))
+    return entry
+
+
+def restore_stage_chain(wordpress_path: str, dumps_path: str, chain: List[dict], debug: bool = False) -> bool:
+    """Rebuilds a differentially dumped stage importing its base dump and the
+    deltas that follow it in an empty database.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        dumps_path: Path to the directory of the dumps.
+        chain: Stages from the base dump to the stage, from get_stage_chain().
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        True if every stage was restored.
+    """
+
+    for entry in chain:
+        if entry["dropped"]:
+            cli.call_subprocess(cli.build_argv(commands.get("wpcli_db_query_drop_tables"),
+                tables=", ".join(f"`{table}`" for table in entry["dropped"]),
+                path=wordpress_path,
+                debug_info=wp_cli.convert_wp_parameter_debug(debug)),
+                log_after_err=[literals.get("wp_wpcli_db_import_error")])
+
+        if entry["file"] is None:
+            continue
+
+        dump_file_path = str(pathlib.Path(dumps_path, entry["file"]))
+        logging.info(literals.get("wp_dump_stage_restoring").format(stage=entry["stage"], file=dump_file_path))
+        if import_database(wordpress_path, dump_file_path, debug) is None:
+            return False
+
+    wp_cli.invalidate_options_snapshot(wordpress_path)
+    return True
+
+
+def convert_wp_parameter_tables(tables: Optional[List[str]]):
+    """Converts a list of tables into the --tables parameter, which is not
+    passed to export all the tables."""
+    return f"--tables={','.join(tables)}" if tables else ""
+
+
+def convert_wp_parameter_extended_insert(value: bool):
+    """Converts the extended insert flag into the --extended-insert=false
+    parameter, which is only passed to disable it."""
+    return "" if value else "--extended-insert=false"
+
+
+def __add_stage_to_file_name(file_name: str, stage: str) -> str:
+    """Adds the name of a stage to a dump file name (core.sql.gz -> core-theme.sql.gz)."""
+
+    path = pathlib.Path(file_name)
+    compression_suffix = path.suffix if path.suffix.lower() in COMPRESSION_EXTENSIONS else ""
+    name = file_name[:len(file_name) - len(compression_suffix)]
+    sql_suffix = pathlib.Path(name).suffix
+    stem = name[:len(name) - len(sql_suffix)]
+    return f"{stem}-{stage}{sql_suffix}{compression_suffix}"
+
+
+def __get_last_chain(stages: List[dict]) -> List[dict]:
+    """Gets the stages from the last base dump on."""
+
+    bases = [index for index, entry in enumerate(stages) if entry["base"]]
+    return stages[bases[-1]:] if bases else []
+
+
+def __remove_stages_using_file(stages: List[dict], file_name: str) -> List[dict]:
+    """Removes the stages whose dump file is going to be overwritten, and the
+    stages of the same chain that depend on them."""
+
+    result = []
+    broken = False
+    for entry in stages:
+        if entry["base"]:
+            broken = False
+        broken = broken or entry["file"] == file_name
+        if not broken:
+            result.append(entry)
+    return result
+
+
+def __log_error(err: bytes, literal: str):
+    if err:
+        logging.error(err.decode("utf-8", errors="backslashreplace"))
+    logging.error(literals.get(literal))
+
+
+def __log_metrics(metrics: DumpMetrics):
+    logging.info(literals.get("wp_dump_metrics").format(
+        path=metrics.path, compression=metrics.compression or "none", size=metrics.size,
+        uncompressed_size=metrics.uncompressed_size, ratio=metrics.ratio, seconds=metrics.seconds))
+
+
+if __name__ == "__main__":
+    help(__name__)
@@ -16,7 +16,7 @@ from devops_toolset.project_types.wordpress.basic_structure_starter import Basic
 from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
 from devops_toolset.tools.dicts import replace_string_in_dict
 
-app: App = App()
+app: App = App.instance()
 platform_specific_restapi = app.load_platform_specific("restapi")
 literals = LiteralsCore([WordpressLiterals])
 platform_literals = LiteralsCore([PlatformLiterals])
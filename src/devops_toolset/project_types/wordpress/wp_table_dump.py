@@ -0,0 +1,196 @@
+"""Exports and imports WordPress databases table by table, concurrently
+
+Every table is streamed to its own (compressed) dump file by a separate
+wp db export process, so big tables are dumped at the same time instead of
+one after another. A manifest lists the dump files, and is only written when
+every table has been exported, so a partial dump is never imported.
+
+Imports run a wp db import process per table file, with foreign key and
+unique checks disabled in every session, as tables are created in no
+particular order.
+"""
+
+import concurrent.futures
+import json
+import logging
+import pathlib
+import threading
+import time
+from typing import Callable, List, Optional
+
+import devops_toolset.filesystem.tools as filesystem_tools
+import devops_toolset.project_types.wordpress.wp_cli as wp_cli
+import devops_toolset.project_types.wordpress.wp_dump as wp_dump
+import devops_toolset.tools.cli as cli
+from devops_toolset.core.app import App
+from devops_toolset.core.CommandsCore import CommandsCore
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
+from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
+
+app: App = App.instance()
+literals = LiteralsCore([WordpressLiterals])
+commands = CommandsCore([WordpressCommands])
+
+MANIFEST_FILE_NAME: str = "tables-manifest.json"
+
+DUMP_EXTENSIONS = {"gzip": ".sql.gz", "zstd": ".sql.zst", None: ".sql"}
+
+# Tables are imported in no particular order and may reference each other
+IMPORT_INIT_SQL: bytes = b"SET FOREIGN_KEY_CHECKS=0;\nSET UNIQUE_CHECKS=0;\n"
+
+
+def is_table_dump(path: str) -> bool:
+    """Checks if a path is a directory with a table by table dump.
+
+    Args:
+        path: Path to check.
+
+    Returns:
+        True if the directory contains a tables manifest.
+    """
+
+    return pathlib.Path(path, MANIFEST_FILE_NAME).is_file()
+
+
+def list_tables(wordpress_path: str, debug: bool = False) -> List[str]:
+    """Lists the tables with the WordPress table prefix.
+
+    For more information see:
+        https://developer.wordpress.org/cli/commands/db/tables/
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        List with the table names.
+    """
+
+    output = cli.call_subprocess_with_result(cli.build_argv(commands.get("wpcli_db_tables"),
+                                                            path=wordpress_path,
+                                                            debug_info=wp_cli.convert_wp_parameter_debug(debug)))
+    return output.split() if output else []
+
+
+def export_tables(wordpress_path: str, directory: str, max_workers: int = cli.DEFAULT_MAX_WORKERS,
+                  debug: bool = False, extended_insert: bool = True,
+                  compression: Optional[str] = "gzip") -> Optional[List[wp_dump.DumpMetrics]]:
+    """Exports a WordPress database to a dump file per table, concurrently.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        directory: Path to the directory of the dump files.
+        max_workers: Maximum number of tables exported at the same time.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+        extended_insert: If True rows are written in multiple-row INSERT
+            statements.
+        compression: gzip, zstd or None.
+
+    Returns:
+        The metrics of every table export, or None if any of them failed.
+    """
+
+    tables = list_tables(wordpress_path, debug)
+    if not tables:
+        logging.error(literals.get("wp_table_dump_no_tables"))
+        return None
+
+    directory_path = pathlib.Path(directory)
+    directory_path.mkdir(parents=True, exist_ok=True)
+    manifest_path = directory_path.joinpath(MANIFEST_FILE_NAME)
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    extension = DUMP_EXTENSIONS[compression]
+    start = time.monotonic()
+
+    results = __run_concurrently(
+        lambda table: wp_dump.export_database(wordpress_path, str(directory_path.joinpath(f"{table}{extension}")),
+                                              debug, extended_insert, compression, tables=[table]),
+        tables, max_workers)
+    if results is None:
+        return None
+
+    manifest = {"compression": compression,
+                "tables": [{"table": table, "file": pathlib.Path(metrics.path).name, "size": metrics.size,
+                            "uncompressed_size": metrics.uncompressed_size}
+                           for table, metrics in zip(tables, results)]}
+    filesystem_tools.write_file_atomically(str(manifest_path), json.dumps(manifest, indent=2))
+
+    __log_finished("wp_table_dump_exported", results, max_workers, start)
+    return results
+
+
+def import_tables(wordpress_path: str, directory: str, max_workers: int = cli.DEFAULT_MAX_WORKERS,
+                  debug: bool = False) -> Optional[List[wp_dump.DumpMetrics]]:
+    """Imports a table by table dump, concurrently.
+
+    Every table file is imported in its own session with foreign key and
+    unique checks disabled. Tables are dropped and created by their dump, so
+    the rest of the database is kept.
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        directory: Path to the directory of the dump files.
+        max_workers: Maximum number of tables imported at the same time.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        The metrics of every table import, or None if any of them failed.
+    """
+
+    manifest_path = pathlib.Path(directory, MANIFEST_FILE_NAME)
+    if not manifest_path.is_file():
+        logging.error(literals.get("wp_table_dump_manifest_not_found").format(path=manifest_path))
+        return None
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    # Biggest tables first, so they do not end up running alone at the end
+    entries = sorted(manifest["tables"], key=lambda entry: entry["size"], reverse=True)
+    start = time.monotonic()
+
+    results = __run_concurrently(
+        lambda entry: wp_dump.import_database(wordpress_path, str(pathlib.Path(directory, entry["file"])), debug,
+                                              manifest["compression"], init_sql=IMPORT_INIT_SQL),
+        entries, max_workers)
+    if results is None:
+        return None
+
+    __log_finished("wp_table_dump_imported", results, max_workers, start)
+    return results
+
+
+def __run_concurrently(function: Callable, items: list, max_workers: int) -> Optional[list]:
+    """Runs a function for every item concurrently. When it returns None for
+    an item, the items that are not started yet are skipped.
+
+    Returns:
+        The results in the same order as items, or None if any of them is None.
+    """
+
+    failed = threading.Event()
+
+    def run(item):
+        if failed.is_set():
+            return None
+        result = function(item)
+        if result is None:
+            failed.set()
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(run, items))
+
+    return None if failed.is_set() else results
+
+
+def __log_finished(literal: str, results: List[wp_dump.DumpMetrics], max_workers: int, start: float):
+    logging.info(literals.get(literal).format(
+        tables=len(results), size=sum(metrics.size for metrics in results),
+        uncompressed_size=sum(metrics.uncompressed_size for metrics in results), workers=max_workers,
+        seconds=time.monotonic() - start))
+
+
+if __name__ == "__main__":
+    help(__name__)
@@ -21,12 +21,13 @@ from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.devops_platforms import constants as devops_platforms_constants
 from devops_toolset.devops_platforms.azuredevops.Literals import Literals as PlatformLiterals
+from devops_toolset.filesystem.cache import ArtifactCache
 from devops_toolset.project_types.wordpress.basic_structure_starter import BasicStructureStarter
 from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 from devops_toolset.tools import cli
 
-app: App = App()
+app: App = App.instance()
 platform_specific_restapi = app.load_platform_specific("restapi")
 literals = LiteralsCore([WordpressLiterals])
 platform_literals = LiteralsCore([PlatformLiterals])
@@ -169,7 +170,8 @@ def create_development_theme(theme_configuration: dict, root_path: str, constant
         logging.warning(literals.get("wp_src_theme_not_found"))
 
 
-def download_wordpress_theme(theme_config: dict, destination_path: str, **kwargs):
+def download_wordpress_theme(theme_config: dict, destination_path: str, cache: ArtifactCache = None,
+                             offline: bool = False, **kwargs):
     """Downloads a WordPress theme from a feed or a URL.
 
     NOTE: The URL must download a zip file that contains the theme. If the ZIP
@@ -179,6 +181,10 @@ def download_wordpress_theme(theme_config: dict, destination_path: str, **kwargs
     Args:
         theme_config: Theme configuration.
         destination_path: Path where the theme will be downloaded.
+        cache: Cache of downloaded packages. If None the theme is downloaded
+            without caching it.
+        offline: If True a theme downloaded from a URL is taken from the
+            cache. Feeds are always queried for their last build.
         kwargs: Platform-specific arguments
     """
     source_type: str = theme_config["source_type"]
@@ -190,12 +196,13 @@ def download_wordpress_theme(theme_config: dict, destination_path: str, **kwargs
         if "azdevops_user" in kwargs and "azdevops_token" in kwargs:
             platform_specific_restapi.get_last_artifact(organization, feed_config["name"], feed_config["package"],
                                                         destination_path, kwargs["azdevops_user"],
-                                                        kwargs["azdevops_token"])
+                                                        kwargs["azdevops_token"], cache)
         else:
             logging.warning(platform_literals.get("azdevops_token_not_found"))
             logging.warning(platform_literals.get("azdevops_download_package_manually"))
     elif source_type == "url":
-        paths.download_file(theme_config["source"], destination_path, f"{theme_config['name']}.zip")
+        paths.download_file_cached(theme_config["source"], destination_path, f"{theme_config['name']}.zip",
+                                   cache=cache, offline=offline)
 
 
 def get_themes_path_from_root_path(root_path: str, constants: dict) -> str:
@@ -215,7 +222,7 @@ def get_themes_path_from_root_path(root_path: str, constants: dict) -> str:
 
 
 def install_themes_from_configuration_file(site_configuration: dict, environment_config: dict, global_constants: dict,
-                                           root_path: str, skip_partial_dumps: bool, **kwargs):
+                                           root_path: str, skip_partial_dumps: bool, offline: bool = False, **kwargs):
     """Installs WordPress's theme files (and child themes also) using a site configuration file
 
     For more information see:
@@ -227,6 +234,8 @@ def install_themes_from_configuration_file(site_configuration: dict, environment
         global_constants: Global constants ofr WordPress.
         root_path: Path to project root.
         skip_partial_dumps: If True skips database dumps.
+        offline: If True the themes downloaded from URLs are taken from the
+            package cache.
     """
 
     child_theme_config: dict
@@ -238,6 +247,7 @@ def install_themes_from_configuration_file(site_configuration: dict, environment
     wordpress_path = str(pathlib.Path.joinpath(root_path_obj, global_constants["paths"]["wordpress"]))
     themes_path = pathlib.Path.joinpath(root_path_obj, global_constants["paths"]["content"]["themes"])
     debug_info = environment_config["wp_cli_debug"]
+    package_cache = wptools.get_package_cache()
 
     # Check themes configuration
     if not check_themes_configuration(themes):
@@ -255,7 +265,7 @@ def install_themes_from_configuration_file(site_configuration: dict, environment
 
         # Download theme if needed
         if theme["source_type"] in ["url", "feed"]:
-            download_wordpress_theme(theme, str(themes_path), **kwargs)
+            download_wordpress_theme(theme, str(themes_path), package_cache, offline, **kwargs)
 
         # Get template for the theme if it has one
         style_content: bytes = devops_toolset.filesystem.zip.read_text_file_in_zip(
@@ -282,9 +292,9 @@ def install_themes_from_configuration_file(site_configuration: dict, environment
     if not skip_partial_dumps:
         database_path = pathlib.Path.joinpath(root_path_obj, global_constants["paths"]["database"])
         core_dump_path_converted = wptools.convert_wp_config_token(
-            site_configuration["database"]["dumps"]["theme"], wordpress_path)
+            site_configuration["settings"]["dumps"]["theme"], wordpress_path)
         database_core_dump_path = pathlib.Path.joinpath(database_path, core_dump_path_converted)
-        wptools.export_database(site_configuration, wordpress_path, database_core_dump_path.as_posix())
+        wptools.export_database(environment_config, wordpress_path, database_core_dump_path.as_posix(), "theme")
 
     # Warn the user we are skipping the backup dump
     else:
@@ -0,0 +1,297 @@
+"""Expands tokens in site configuration values
+
+Tokens are written between brackets, with an optional argument after a pipe:
+
+    [date|Y.m.d-Hisve]  Current date and time, formatted like PHP date().
+    [env|NAME]          Value of the NAME environment variable.
+    [commit]            Short SHA of the HEAD commit ([commit|long] for the
+                        full one). [git_sha] is the same token.
+    [environment]       Name of the environment being processed.
+
+Unknown tokens are left as they are.
+"""
+
+import calendar
+import datetime
+import logging
+import os
+import re
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import devops_toolset.tools.git as git_tools
+from devops_toolset.core.app import App
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
+
+app: App = App.instance()
+literals = LiteralsCore([WordpressLiterals])
+
+TOKEN_REGEX = re.compile(r"\[(\w+)(?:\|([^\[\]]*))?\]")
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October",
+               "November", "December"]
+
+
+class TokenContext(object):
+    """Values shared by all the tokens expanded in the same pass.
+
+    The date is taken once, so all the [date|...] tokens of a pass get the
+    same moment, and the commit SHA is read only if a token needs it.
+    """
+
+    def __init__(self, environment: str = None, repository_path: str = None, now: datetime.datetime = None):
+        """
+        Args:
+            environment: Name of the environment being processed.
+            repository_path: Path inside the Git repository, used by the
+                commit token.
+            now: Moment used by the date token. Defaults to the current time
+                in UTC with whole seconds, which is what PHP date() gets under
+                WordPress.
+        """
+
+        self.environment = environment
+        self.repository_path = repository_path
+        self.now = now if now is not None else datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        self._commits: Dict[bool, str] = {}
+
+    def get_commit(self, short: bool = True) -> str:
+        """Gets the SHA of the HEAD commit, reading it only once.
+
+        Args:
+            short: If True gets the short SHA.
+
+        Returns:
+            The SHA, or an empty string if it cannot be read.
+        """
+
+        if short not in self._commits:
+            self._commits[short] = git_tools.get_head_commit_sha(self.repository_path or os.getcwd(), short) or ""
+        return self._commits[short]
+
+
+# region PHP date()
+
+def __timezone_abbreviation(moment: datetime.datetime) -> str:
+    name = moment.tzname()
+    # Fixed offsets are named UTC+hh:mm by Python and +hh:mm by PHP
+    if name == "UTC" or (name and not name.startswith("UTC")):
+        return name
+    return __utc_offset(moment, ":")
+
+
+def __timezone_identifier(moment: datetime.datetime) -> str:
+    key = getattr(moment.tzinfo, "key", None)
+    return key if key else __timezone_abbreviation(moment)
+
+
+def __utc_offset(moment: datetime.datetime, separator: str = "") -> str:
+    seconds = int(moment.utcoffset().total_seconds()) if moment.utcoffset() is not None else 0
+    sign = "-" if seconds < 0 else "+"
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return f"{sign}{hours:02d}{separator}{minutes:02d}"
+
+
+def __ordinal_suffix(day: int) -> str:
+    if day in (11, 12, 13):
+        return "th"
+    return {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+
+
+def __swatch_beat(moment: datetime.datetime) -> str:
+    utc = moment.astimezone(datetime.timezone.utc)
+    seconds = (utc.hour * 3600 + utc.minute * 60 + utc.second + 3600) % 86400
+    return f"{int(seconds / 86.4):03d}"
+
+
+def __expanded_year(year: int, always_signed: bool) -> str:
+    if always_signed or year >= 10000 or year < 0:
+        return f"{'-' if year < 0 else '+'}{abs(year):04d}"
+    return f"{year:04d}"
+
+
+PHP_DATE_CHARACTERS: Dict[str, Callable[[datetime.datetime], str]] = {
+    # Day
+    "d": lambda moment: f"{moment.day:02d}",
+    "D": lambda moment: DAY_NAMES[moment.weekday()][:3],
+    "j": lambda moment: str(moment.day),
+    "l": lambda moment: DAY_NAMES[moment.weekday()],
+    "N": lambda moment: str(moment.isoweekday()),
+    "S": lambda moment: __ordinal_suffix(moment.day),
+    "w": lambda moment: str(moment.isoweekday() % 7),
+    "z": lambda moment: str(moment.timetuple().tm_yday - 1),
+    # Week
+    "W": lambda moment: f"{moment.isocalendar()[1]:02d}",
+    # Month
+    "F": lambda moment: MONTH_NAMES[moment.month - 1],
+    "m": lambda moment: f"{moment.month:02d}",
+    "M": lambda moment: MONTH_NAMES[moment.month - 1][:3],
+    "n": lambda moment: str(moment.month),
+    "t": lambda moment: str(calendar.monthrange(moment.year, moment.month)[1]),
+    # Year
+    "L": lambda moment: "1" if calendar.isleap(moment.year) else "0",
+    "o": lambda moment: str(moment.isocalendar()[0]),
+    "X": lambda moment: __expanded_year(moment.year, True),
+    "x": lambda moment: __expanded_year(moment.year, False),
+    "Y": lambda moment: f"{moment.year:04d}",
+    "y": lambda moment: f"{moment.year % 100:02d}",
+    # Time
+    "a": lambda moment: "am" if moment.hour < 12 else "pm",
+    "A": lambda moment: "AM" if moment.hour < 12 else "PM",
+    "B": __swatch_beat,
+    "g": lambda moment: str(moment.hour % 12 or 12),
+    "G": lambda moment: str(moment.hour),
+    "h": lambda moment: f"{moment.hour % 12 or 12:02d}",
+    "H": lambda moment: f"{moment.hour:02d}",
+    "i": lambda moment: f"{moment.minute:02d}",
+    "s": lambda moment: f"{moment.second:02d}",
+    "u": lambda moment: f"{moment.microsecond:06d}",
+    "v": lambda moment: f"{moment.microsecond // 1000:03d}",
+    # Timezone
+    "e": __timezone_identifier,
+    "I": lambda moment: "1" if moment.dst() else "0",
+    "O": lambda moment: __utc_offset(moment),
+    "P": lambda moment: __utc_offset(moment, ":"),
+    "p": lambda moment: "Z" if not moment.utcoffset() else __utc_offset(moment, ":"),
+    "T": __timezone_abbreviation,
+    "Z": lambda moment: str(int(moment.utcoffset().total_seconds()) if moment.utcoffset() is not None else 0),
+    # Full date / time
+    "c": lambda moment: format_php_date("Y-m-d\\TH:i:sP", moment),
+    "r": lambda moment: format_php_date("D, d M Y H:i:s O", moment),
+    "U": lambda moment: str(int(moment.timestamp())),
+}
+
+
+def format_php_date(date_format: str, moment: datetime.datetime) -> str:
+    """Formats a date and time like PHP date() / DateTime::format() does.
+
+    For more information see:
+        https://www.php.net/manual/en/datetime.format.php
+
+    Args:
+        date_format: PHP format string. A backslash escapes the next
+            character, and characters that are not format characters are
+            copied as they are.
+        moment: Date and time to be formatted. Naive datetimes are taken as
+            UTC.
+
+    Returns:
+        The formatted date.
+    """
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+
+    result = []
+    escaped = False
+    for character in date_format:
+        if escaped:
+            result.append(character)
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif character in PHP_DATE_CHARACTERS:
+            result.append(PHP_DATE_CHARACTERS[character](moment))
+        else:
+            result.append(character)
+
+    return "".join(result)
+
+# endregion
+
+
+# region Tokens
+
+def __date_token(argument: Optional[str], context: TokenContext) -> Optional[str]:
+    return format_php_date(argument if argument is not None else "c", context.now)
+
+
+def __env_token(argument: Optional[str], context: TokenContext) -> Optional[str]:
+    if not argument:
+        return None
+    if argument not in os.environ:
+        logging.warning(literals.get("wp_token_env_not_found").format(name=argument))
+    return os.environ.get(argument, "")
+
+
+def __commit_token(argument: Optional[str], context: TokenContext) -> Optional[str]:
+    return context.get_commit(argument != "long")
+
+
+def __environment_token(argument: Optional[str], context: TokenContext) -> Optional[str]:
+    return context.environment
+
+
+# Functions that expand every token. They get the argument (None if there is
+# no pipe) and the context, and return None to leave the token as it is.
+token_handlers: Dict[str, Callable[[Optional[str], TokenContext], Optional[str]]] = {
+    "date": __date_token,
+    "env": __env_token,
+    "commit": __commit_token,
+    "git_sha": __commit_token,
+    "environment": __environment_token,
+}
+
+
+def expand(text: str, context: TokenContext = None) -> str:
+    """Expands all the tokens of a text in one pass.
+
+    Args:
+        text: Text with tokens.
+        context: Values shared by the tokens. A new one is created if None.
+
+    Returns:
+        The text with the tokens expanded.
+    """
+
+    if "[" not in text:
+        return text
+
+    context = context if context is not None else TokenContext()
+
+    def replace(match: re.Match) -> str:
+        handler = token_handlers.get(match.group(1))
+        value = handler(match.group(2), context) if handler else None
+        return match.group(0) if value is None else value
+
+    return TOKEN_REGEX.sub(replace, text)
+
+
+def expand_configuration(configuration, context: TokenContext = None,
+                         skip: Iterable[Tuple[str, ...]] = (), _path: Tuple = ()):
+    """Expands the tokens of every string in a parsed configuration.
+
+    All the tokens are expanded with the same context, so they get the same
+    date and the commit SHA is read once.
+
+    Args:
+        configuration: Parsed JSON configuration (dicts, lists and values).
+        context: Values shared by the tokens. A new one is created if None.
+        skip: Key paths that are not expanded, for instance
+            [("settings", "dumps")] for values that must be expanded later.
+
+    Returns:
+        A copy of the configuration with the tokens expanded.
+    """
+
+    context = context if context is not None else TokenContext()
+    skip = tuple(tuple(path) for path in skip)
+
+    if _path in skip:
+        return configuration
+    if isinstance(configuration, str):
+        return expand(configuration, context)
+    if isinstance(configuration, dict):
+        return {key: expand_configuration(value, context, skip, _path + (key,))
+                for key, value in configuration.items()}
+    if isinstance(configuration, list):
+        return [expand_configuration(value, context, skip, _path) for value in configuration]
+
+    return configuration
+
+# endregion
+
+
+if __name__ == "__main__":
+    help(__name__)
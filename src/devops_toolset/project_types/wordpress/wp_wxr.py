@@ -0,0 +1,433 @@
+"""Splits WXR files and imports them concurrently
+
+wp import runs post by post in a single process, so big WXR files are split
+into chunks of items that are imported by several wp import processes at
+the same time. Files are read with iterparse and every item is released
+once it is written, so they are never loaded whole.
+
+Not every file can be split: the WordPress importer only links a post to its
+parent, and a menu item to its object, when both are imported by the same
+process. Files with child posts are imported in a single chunk, and files
+with menu items are imported after all the others.
+
+Attachments are taken out of the chunks. Their files are downloaded
+concurrently (through an artifact cache) while the posts are imported, and
+they are created afterwards in a single WP-CLI process, keeping their
+original ids so featured images and parents still match.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+import xml.etree.ElementTree as ElementTree
+from typing import List, Optional
+
+import devops_toolset.filesystem.cache as cache_tools
+import devops_toolset.filesystem.paths as paths
+import devops_toolset.project_types.wordpress.wp_cli as wp_cli
+import devops_toolset.tools.cli as cli
+from devops_toolset.core.app import App
+from devops_toolset.core.CommandsCore import CommandsCore
+from devops_toolset.core.LiteralsCore import LiteralsCore
+from devops_toolset.filesystem.cache import ArtifactCache
+from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
+from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
+
+app: App = App.instance()
+literals = LiteralsCore([WordpressLiterals])
+commands = CommandsCore([WordpressCommands])
+
+ATTACHMENT_CACHE_DIRECTORY: str = "wordpress-attachments"
+
+DEFAULT_CHUNK_SIZE: int = 500
+DEFAULT_IMPORT_WORKERS: int = 4
+DEFAULT_DOWNLOAD_WORKERS: int = 8
+
+# Post types whose items reference other posts by their original id
+DEFERRED_POST_TYPES: List[str] = ["nav_menu_item"]
+
+
+class WxrSplit(object):
+    """Chunks and attachments of a split WXR file."""
+
+    def __init__(self, path: str, header_path: str, chunks: List[str], posts: int, attachments: List[dict],
+                 deferred: bool):
+        """
+        Args:
+            path: Path to the WXR file.
+            header_path: Path to a WXR file with the authors and terms of the
+                file, but no items.
+            chunks: Paths to the WXR files with the items (but attachments).
+            posts: Number of items in the chunks.
+            attachments: Attachment items, as dicts for attachments-import.php.
+            deferred: True if the file must be imported after the others.
+        """
+
+        self.path = path
+        self.header_path = header_path
+        self.chunks = chunks
+        self.posts = posts
+        self.attachments = attachments
+        self.deferred = deferred
+
+    def __repr__(self):
+        return f"<WxrSplit {self.path} {len(self.chunks)} chunks, {self.posts} posts>"
+
+
+class WxrImportReport(object):
+    """Result of an import of WXR files."""
+
+    def __init__(self, posts: int, attachments: int, seconds: float, workers: int):
+        """
+        Args:
+            posts: Number of posts imported (but attachments).
+            attachments: Number of attachments imported.
+            seconds: Duration of the import.
+            workers: Maximum number of wp import processes run at the same time.
+        """
+
+        self.posts = posts
+        self.attachments = attachments
+        self.seconds = seconds
+        self.workers = workers
+
+    @property
+    def posts_per_second(self) -> float:
+        """Throughput of the import, attachments included."""
+        return (self.posts + self.attachments) / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return f"<WxrImportReport {self.posts} posts, {self.attachments} attachments in {self.seconds:.2f}s>"
+
+
+def get_attachment_cache() -> ArtifactCache:
+    """Gets the cache of attachment files downloaded from WXR files.
+
+    Returns:
+        The cache in the attachments directory of the configured cache path,
+        bounded to the configured maximum size.
+    """
+
+    return cache_tools.get_cache(ATTACHMENT_CACHE_DIRECTORY)
+
+
+def scan_wxr(wxr_path: str) -> dict:
+    """Reads a WXR file item by item to know how it can be split.
+
+    Args:
+        wxr_path: Path to the WXR file.
+
+    Returns:
+        Dict with the number of items, and if it can be split (no item has a
+        parent) and if it has to be imported after the others (it has
+        deferred post types).
+    """
+
+    items = 0
+    splittable = True
+    deferred = False
+
+    for item in __iterate_items(wxr_path):
+        if __get_text(item, "post_type") == "attachment":
+            continue
+        items += 1
+        splittable = splittable and __get_text(item, "post_parent") in ("", "0")
+        deferred = deferred or __get_text(item, "post_type") in DEFERRED_POST_TYPES
+
+    return {"items": items, "splittable": splittable and not deferred, "deferred": deferred}
+
+
+def split_wxr(wxr_path: str, directory: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> WxrSplit:
+    """Splits a WXR file in chunks of items, streaming it.
+
+    Every chunk has the header of the file (site, authors and terms), so it
+    can be imported on its own. Attachments are not written to any chunk.
+
+    Args:
+        wxr_path: Path to the WXR file.
+        directory: Path to the directory of the chunks.
+        chunk_size: Maximum number of items per chunk. Files that cannot be
+            split are written in a single chunk.
+
+    Returns:
+        The chunks and attachments of the file.
+    """
+
+    scan = scan_wxr(wxr_path)
+    chunk_size = max(1, chunk_size) if scan["splittable"] else max(1, scan["items"])
+    directory_path = pathlib.Path(directory)
+    directory_path.mkdir(parents=True, exist_ok=True)
+    stem = pathlib.Path(wxr_path).stem
+
+    namespaces = {}
+    header = []
+    chunks = []
+    attachments = []
+
+    def open_chunk(path: pathlib.Path):
+        declarations = "".join(f' xmlns:{prefix}="{uri}"' for prefix, uri in namespaces.items() if prefix)
+        chunk_file = open(path, "w", encoding="utf-8")
+        chunk_file.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"{declarations}>\n<channel>\n')
+        chunk_file.writelines(header)
+        return chunk_file
+
+    def close_chunk(chunk_file):
+        chunk_file.write("</channel>\n</rss>\n")
+        chunk_file.close()
+
+    chunk_file = None
+    chunk_items = 0
+    try:
+        for element in __iterate_items(wxr_path, namespaces, header):
+            if __get_text(element, "post_type") == "attachment":
+                attachments.append(__get_attachment(element))
+                continue
+
+            # The header is complete once the first item is read
+            if chunk_file is None:
+                path = directory_path.joinpath(f"{stem}-{len(chunks):04d}.xml")
+                chunk_file = open_chunk(path)
+                chunks.append(str(path))
+
+            chunk_file.write(ElementTree.tostring(element, encoding="unicode"))
+            chunk_items += 1
+            if chunk_items >= chunk_size:
+                close_chunk(chunk_file)
+                chunk_file = None
+                chunk_items = 0
+    finally:
+        if chunk_file is not None:
+            close_chunk(chunk_file)
+
+    header_path = directory_path.joinpath(f"{stem}-header.xml")
+    close_chunk(open_chunk(header_path))
+
+    return WxrSplit(wxr_path, str(header_path), chunks, scan["items"], attachments, scan["deferred"])
+
+
+def download_attachments(attachments: List[dict], directory: str, max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                         cache: Optional[ArtifactCache] = None) -> List[concurrent.futures.Future]:
+    """Starts downloading the files of attachments concurrently.
+
+    Args:
+        attachments: Attachments from split_wxr(). The path of the downloaded
+            file is set in their "file" key.
+        directory: Path to the directory of the downloaded files.
+        max_workers: Maximum number of files downloaded at the same time.
+        cache: Cache of attachment files.
+
+    Returns:
+        A future per attachment, with True if its file was downloaded. The
+        downloads run while the caller does other work.
+    """
+
+    pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers))
+    futures = [executor.submit(__download_attachment, attachment, directory, cache) for attachment in attachments]
+    executor.shutdown(wait=False)
+    return futures
+
+
+def import_wxr_files(wordpress_path: str, wxr_paths: List[str], authors: str, debug: bool = False,
+                     max_workers: int = DEFAULT_IMPORT_WORKERS, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                     cache: Optional[ArtifactCache] = None) -> Optional[WxrImportReport]:
+    """Imports WXR files splitting them in chunks imported concurrently.
+
+    The authors and terms of every file are imported first, one file after
+    another, so concurrent chunks do not create them twice. Then the chunks
+    are imported concurrently, and the files with deferred post types after
+    them. Attachment files are downloaded meanwhile, and the attachments are
+    created at the end.
+
+    For more info, see: https://developer.wordpress.org/cli/commands/import/
+
+    Args:
+        wordpress_path: Path to WordPress files.
+        wxr_paths: Paths to the WXR files.
+        authors: Value for the authors argument of wp import.
+        debug: If present, --debug will be added to the command showing all debug trace information.
+        max_workers: Maximum number of wp import processes at the same time.
+        chunk_size: Maximum number of items per chunk.
+        download_workers: Maximum number of attachment files downloaded at
+            the same time.
+        cache: Cache of attachment files. Defaults to get_attachment_cache().
+
+    Returns:
+        The report of the import, or None if it failed.
+    """
+
+    start = time.monotonic()
+    cache = cache if cache is not None else get_attachment_cache()
+
+    with tempfile.TemporaryDirectory() as directory:
+        splits = [split_wxr(wxr_path, str(pathlib.Path(directory, str(index))), chunk_size)
+                  for index, wxr_path in enumerate(wxr_paths)]
+        attachments = [attachment for split in splits for attachment in split.attachments]
+        downloads = download_attachments(attachments, str(pathlib.Path(directory, "attachments")),
+                                         download_workers, cache)
+
+        succeeded = \
+            __import_chunks(wordpress_path, [split.header_path for split in splits], authors, debug, 1) and \
+            __import_chunks(wordpress_path, [chunk for split in splits if not split.deferred
+                                             for chunk in split.chunks], authors, debug, max_workers) and \
+            __import_chunks(wordpress_path, [chunk for split in splits if split.deferred
+                                             for chunk in split.chunks], authors, debug, 1)
+
+        if not succeeded:
+            for download in downloads:
+                download.cancel()
+            concurrent.futures.wait(downloads)
+            wp_cli.invalidate_options_snapshot(wordpress_path)
+            logging.error(literals.get("wp_wpcli_import_error"))
+            return None
+
+        downloaded = [attachment for attachment, download in zip(attachments, downloads) if download.result()]
+        imported_attachments = __import_attachments(wordpress_path, downloaded, debug, directory)
+
+    wp_cli.invalidate_options_snapshot(wordpress_path)
+
+    report = WxrImportReport(sum(split.posts for split in splits), imported_attachments, time.monotonic() - start,
+                             max_workers)
+    logging.info(literals.get("wp_wxr_import_report").format(
+        posts=report.posts, attachments=report.attachments, seconds=report.seconds,
+        rate=report.posts_per_second, workers=report.workers))
+    return report
+
+
+def __iterate_items(wxr_path: str, namespaces: dict = None, header: List[str] = None):
+    """Yields the items of a WXR file one by one, releasing them afterwards.
+
+    Args:
+        wxr_path: Path to the WXR file.
+        namespaces: If present, filled with the namespaces of the file.
+        header: If present, filled with the serialized channel elements that
+            are not items.
+    """
+
+    channel = None
+    depth = 0
+
+    for event, value in ElementTree.iterparse(wxr_path, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            prefix, uri = value
+            if namespaces is not None:
+                namespaces[prefix] = uri
+            if prefix:
+                ElementTree.register_namespace(prefix, uri)
+            continue
+
+        if event == "start":
+            depth += 1
+            if depth == 2:
+                channel = value
+            continue
+
+        depth -= 1
+        if depth != 2:
+            continue
+
+        if __local_name(value.tag) == "item":
+            yield value
+        elif header is not None:
+            header.append(ElementTree.tostring(value, encoding="unicode"))
+        channel.remove(value)
+
+
+def __local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def __get_text(element: ElementTree.Element, name: str) -> str:
+    """Gets the text of the first child with a local name (any namespace)."""
+
+    for child in element:
+        if __local_name(child.tag) == name:
+            return (child.text or "").strip()
+    return ""
+
+
+def __get_attachment(item: ElementTree.Element) -> dict:
+    """Gets the fields of an attachment item that attachments-import.php needs."""
+
+    postmeta = [{"key": __get_text(meta, "meta_key"), "value": __get_text(meta, "meta_value")}
+                for meta in item if __local_name(meta.tag) == "postmeta"]
+    return {"post_id": __get_text(item, "post_id"), "post_title": __get_text(item, "title"),
+            "post_name": __get_text(item, "post_name"), "post_date": __get_text(item, "post_date"),
+            "post_date_gmt": __get_text(item, "post_date_gmt"), "post_content": __get_encoded(item, "content"),
+            "post_excerpt": __get_encoded(item, "excerpt"), "post_parent": __get_text(item, "post_parent"),
+            "url": __get_text(item, "attachment_url"), "postmeta": postmeta}
+
+
+def __get_encoded(item: ElementTree.Element, namespace: str) -> str:
+    """Gets the text of content:encoded or excerpt:encoded, which only differ
+    in their namespace."""
+
+    for child in item:
+        if __local_name(child.tag) == "encoded" and f"/{namespace}/" in child.tag:
+            return child.text or ""
+    return ""
+
+
+def __download_attachment(attachment: dict, directory: str, cache: Optional[ArtifactCache]) -> bool:
+    try:
+        file_name, file_path = paths.download_file_cached(
+            attachment["url"], directory, f"{attachment['post_id']}-{paths.get_file_name_from_url(attachment['url'])}",
+            cache=cache)
+    except Exception as error:
+        logging.warning(literals.get("wp_wxr_attachment_download_error").format(url=attachment["url"], error=error))
+        return False
+
+    attachment["file"] = str(file_path)
+    return True
+
+
+def __import_chunks(wordpress_path: str, chunks: List[str], authors: str, debug: bool, max_workers: int) -> bool:
+    """Imports WXR files with a wp import process each, concurrently."""
+
+    results = cli.run_commands([cli.build_argv(commands.get("wpcli_import"),
+                                               file=chunk,
+                                               path=wordpress_path,
+                                               authors=authors,
+                                               debug_info=wp_cli.convert_wp_parameter_debug(debug))
+                                for chunk in chunks], max_workers=max_workers)
+    return all(result.succeeded for result in results)
+
+
+def __import_attachments(wordpress_path: str, attachments: List[dict], debug: bool, directory: str) -> int:
+    """Creates the downloaded attachments with attachments-import.php.
+
+    Returns:
+        The number of attachments imported.
+    """
+
+    if not attachments:
+        return 0
+
+    attachments_file_path = pathlib.Path(directory, "attachments.json")
+    attachments_file_path.write_text(json.dumps(attachments), encoding="utf-8")
+    logging.info(literals.get("wp_wxr_attachments_import_before").format(attachments=len(attachments)))
+
+    output = wp_cli.eval_file(str(wp_cli.php_scripts_path.joinpath("attachments-import.php")), wordpress_path,
+                              [str(attachments_file_path)], debug)
+    os.remove(attachments_file_path)
+
+    results = wp_cli.parse_json_output(output)
+    if not isinstance(results, list):
+        logging.error(literals.get("wp_wxr_attachments_import_error"))
+        return 0
+
+    for result in results:
+        if result.get("result") == "error":
+            logging.warning(literals.get("wp_wxr_attachment_import_error").format(
+                post_id=result.get("post_id"), message=result.get("message")))
+
+    return sum(1 for result in results if result.get("result") == "imported")
+
+
+if __name__ == "__main__":
+    help(__name__)
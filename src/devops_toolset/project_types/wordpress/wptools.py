@@ -1,4 +1,5 @@
 """Contains several tools for WordPress"""
+import concurrent.futures
 import json
 import logging
 import os
@@ -11,57 +12,86 @@ from typing import List, Tuple
 import requests
 
 import devops_toolset.core.log_tools
+import devops_toolset.filesystem.cache as cache_tools
 import devops_toolset.filesystem.paths as paths
 import devops_toolset.filesystem.tools
 import devops_toolset.project_types.wordpress.constants as wp_constants
 import devops_toolset.project_types.wordpress.wp_cli as wp_cli
+import devops_toolset.project_types.wordpress.wp_config as wp_config
+import devops_toolset.project_types.wordpress.wp_core as wp_core
+import devops_toolset.project_types.wordpress.wp_dump as wp_dump
+import devops_toolset.project_types.wordpress.wp_table_dump as wp_table_dump
+import devops_toolset.project_types.wordpress.wp_tokens as wp_tokens
+import devops_toolset.project_types.wordpress.wp_wxr as wp_wxr
 import devops_toolset.tools.git as git_tools
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.core.app import App
 from devops_toolset.devops_platforms import constants as devops_platforms_constants
 from devops_toolset.devops_platforms.azuredevops.Literals import Literals as PlatformLiterals
+from devops_toolset.filesystem.cache import ArtifactCache
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 from devops_toolset.project_types.wordpress.basic_structure_starter import BasicStructureStarter
 from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
 
 import re
 
-app: App = App()
+app: App = App.instance()
 platform_specific_restapi = app.load_platform_specific("restapi")
 literals = LiteralsCore([WordpressLiterals])
 platform_literals = LiteralsCore([PlatformLiterals])
 commands = CommandsCore([WordpressCommands])
 
+PACKAGE_CACHE_DIRECTORY: str = "wordpress-packages"
+DEFAULT_PLUGIN_DOWNLOAD_WORKERS: int = 4
 
-def add_wp_options(wp_options: dict, wordpress_path: str, debug: bool = False):
+
+def add_wp_options(wp_options: dict, wordpress_path: str, debug: bool = False, batch: bool = False):
     """Adds or updates WordPress options in the wp_options table
 
     Args:
         wp_options: WordPress options.
         wordpress_path: Path to the WordPress installation.
         debug: If True logs debug information.
+        batch: If True all the options are added / updated in a single WP-CLI
+            process.
     """
+    if batch:
+        wp_cli.add_update_options(wp_options, wordpress_path, debug)
+        return
+
     for option in wp_options:
         wp_cli.add_update_option(option, wordpress_path, debug)
 
 
-def convert_wp_config_token(token: str, wordpress_path: str) -> str:
-    """ Replaces [] tokens inside configuration parameters using php syntax
+def convert_wp_config_token(token: str, wordpress_path: str, environment: str = None) -> str:
+    """ Replaces [] tokens inside configuration parameters (see wp_tokens)
 
     Args:
         token: The token to replace (for example: [date|Y.m.d-Hisve])
         wordpress_path: Wordpress installation path
+        environment: Name of the environment for the [environment] token.
+    """
+    return wp_tokens.expand(token, wp_tokens.TokenContext(environment, wordpress_path))
+
+
+def expand_site_configuration_tokens(site_configuration: dict, environment: str, root_path: str) -> dict:
+    """ Replaces [] tokens in all the site configuration values in one pass
+    (see wp_tokens).
+
+    Dump file names are not replaced, because every dump must get the date
+    and time it is taken at (see convert_wp_config_token).
+
+    Args:
+        site_configuration: Parsed site configuration.
+        environment: Name of the environment being processed.
+        root_path: Path to the repository root.
+
+    Returns:
+        A copy of the site configuration with the tokens replaced.
     """
-    result = token
-    # parse token [date|Y.m.d-Hisve]
-    if token.find("[date|") != -1:
-        date_format = token[token.find("[date|") + 1:token.find("]")]
-        date_token = date_format.split("|")[1]
-        result = result.replace(
-            "[" + date_format + "]", wp_cli.eval_code("echo date('" + date_token + "');", wordpress_path))
-    # NOTE: Add more tokens if needed
-    return result
+    return wp_tokens.expand_configuration(site_configuration, wp_tokens.TokenContext(environment, root_path),
+                                          skip=[("settings", "dumps")])
 
 
 def create_wp_cli_bat_file(phar_path: str):
@@ -106,29 +136,35 @@ def create_configuration_file(environment_configuration: dict, wordpress_path: s
                                      )
 
 
-def create_users(users: dict, wordpress_path: str, debug: bool):
-    """Creates WordPress users.
+def create_users(users: dict, wordpress_path: str, debug: bool) -> List[dict]:
+    """Creates WordPress users that do not exist, all of them in a single
+    batch (see wp_cli.create_users).
 
     Args:
         users: Users based on #/definitions/user at
             https://dev.aheadlabs.com/schemas/json/wordpress-site-schema.json
         wordpress_path: Path to WordPress files.
         debug: If present, --debug will be added to the command showing all debug trace information.
+
+    Returns:
+        List with a dict per user with its login, result (created, exists or
+        error) and message.
     """
 
-    for user in users:
-        # Create the user if does not exist
-        if not wp_cli.user_exists(user["user_login"], wordpress_path, debug):
-            wp_cli.create_user(user, wordpress_path, debug)
+    if not users:
+        return []
 
-        # Warn the user I am skipping the creation
-        else:
-            logging.warning(literals.get("wp_wpcli_user_exists").format(user=user["user_login"]))
+    return wp_cli.create_users(users, wordpress_path, debug)
 
 
-def download_wordpress(site_configuration: dict, destination_path: str, wp_cli_debug: bool = False):
+def download_wordpress(site_configuration: dict, destination_path: str, wp_cli_debug: bool = False,
+                       offline: bool = False):
     """ Downloads the latest version of the WordPress core files using a site configuration file.
 
+    Cores are taken from the core cache (see wp_core.get_core_cache) when
+    the same version, locale and content option were downloaded before, and
+    are added to it after downloading them with WP-CLI.
+
     For more information see:
         https://developer.wordpress.org/cli/commands/core/download/
 
@@ -136,6 +172,8 @@ def download_wordpress(site_configuration: dict, destination_path: str, wp_cli_d
         site_configuration: parsed site configuration.
         destination_path: Path where WP-CLI will be downloaded.
         wp_cli_debug: True if logging must be verbose.
+        offline: If True the core must be in the cache, which is not
+            refreshed, and nothing is downloaded.
     """
 
     if not paths.is_valid_path(destination_path):
@@ -144,11 +182,26 @@ def download_wordpress(site_configuration: dict, destination_path: str, wp_cli_d
     version = site_configuration["settings"]["version"]
     locale = site_configuration["settings"]["locale"]
     skip_content = site_configuration["settings"]["skip_content_download"]
-    wp_cli.download_wordpress(destination_path, version, locale, skip_content, wp_cli_debug)
+
+    if not wp_cli.wordpress_is_downloaded(destination_path):
+        core_cache = wp_core.get_core_cache()
+        resolved_version = wp_core.resolve_version(version, locale, skip_content, core_cache, offline)
+
+        if resolved_version is None or \
+                not wp_core.restore_from_cache(core_cache, resolved_version, locale, skip_content, destination_path):
+            if offline:
+                raise ValueError(literals.get("wp_core_cache_miss_offline").format(
+                    key=wp_core.get_cache_key(resolved_version or version, locale, skip_content)))
+
+            existing_files = wp_core.list_files(destination_path)
+            wp_cli.download_wordpress(destination_path, version, locale, skip_content, wp_cli_debug)
+            wp_core.add_to_cache(core_cache, locale, skip_content, destination_path, existing_files)
+
     git_tools.purge_gitkeep(destination_path)
 
 
-def download_wordpress_plugin(plugin_config: dict, destination_path: str):
+def download_wordpress_plugin(plugin_config: dict, destination_path: str, cache: ArtifactCache = None,
+                              offline: bool = False):
     """Downloads a WordPress plugin from an URL.
 
     NOTE: The URL must download a zip file that contains the plugin. If the ZIP
@@ -158,13 +211,17 @@ def download_wordpress_plugin(plugin_config: dict, destination_path: str):
     Args:
         plugin_config: Plugin configuration.
         destination_path: Path where the plugin will be downloaded.
+        cache: Cache of downloaded packages. If None the plugin is downloaded
+            without caching it.
+        offline: If True the plugin is taken from the cache.
     """
-    with open(destination_path, "wb") as file:
-        response = requests.get(plugin_config["source"])
-        file.write(response.content)
+    destination = pathlib.Path(destination_path)
+    paths.download_file_cached(plugin_config["source"], str(destination.parent), destination.name, cache=cache,
+                               offline=offline)
 
 
-def export_database(environment_config: dict, wordpress_path: str, dump_file_path: str):
+def export_database(environment_config: dict, wordpress_path: str, dump_file_path: str, stage: str = None,
+                    base: bool = False):
     """Exports a WordPress database to a dump file using a site configuration file.
 
     All parameters are obtained from a site configuration file.
@@ -172,12 +229,55 @@ def export_database(environment_config: dict, wordpress_path: str, dump_file_pat
     For more information see:
         https://developer.wordpress.org/cli/commands/db/export/
 
+    Dump files ending in .gz or .zst, and environments with
+    database.dump_extended_insert set, are streamed through wp_dump, which
+    compresses the dump while it is exported. Stages of environments with
+    database.differential_dumps set only dump the tables changed since the
+    previous stage (see wp_dump.export_stage()). Environments with
+    database.dump_workers greater than 1 dump every table to its own file
+    in a directory at dump_file_path, concurrently (see wp_table_dump).
+
     Args:
         environment_config: parsed site configuration.
         wordpress_path: Path to WordPress files.
         dump_file_path: Path to the destination dump file.
+        stage: Name of the provisioning stage of the dump.
+        base: If True the stage is a full dump that starts a new chain of
+            differential dumps.
+    """
+    debug = environment_config.get("wp_cli_debug", False)
+    database_config = environment_config.get("database", {})
+    extended_insert = database_config.get("dump_extended_insert", False)
+
+    dump_workers = database_config.get("dump_workers", 1)
+
+    if stage is not None and database_config.get("differential_dumps", False):
+        wp_dump.export_stage(wordpress_path, dump_file_path, stage, base, debug, extended_insert)
+    elif dump_workers > 1:
+        wp_table_dump.export_tables(wordpress_path, dump_file_path, dump_workers, debug, extended_insert,
+                                    wp_dump.get_compression(dump_file_path))
+    elif extended_insert or wp_dump.get_compression(dump_file_path) is not None:
+        wp_dump.export_database(wordpress_path, dump_file_path, debug, extended_insert)
+    else:
+        wp_cli.export_database(wordpress_path, dump_file_path, debug)
+
+
+def export_plugins_database_dump(site_configuration: dict, environment_config: dict, global_constants: dict,
+                                 root_path: str, wordpress_path: str):
+    """Exports the database to the plugins dump file of the site configuration.
+
+    Args:
+        site_configuration: Parsed site configuration.
+        environment_config: Parsed environment configuration.
+        global_constants: Parsed global constants.
+        root_path: Path to project root.
+        wordpress_path: Path to the WordPress installation.
     """
-    wp_cli.export_database(wordpress_path, dump_file_path, environment_config["wp_cli_debug"])
+    database_path = pathlib.Path.joinpath(pathlib.Path(root_path), global_constants["paths"]["database"])
+    plugins_dump_path_converted = convert_wp_config_token(site_configuration["settings"]["dumps"]["plugins"],
+                                                          wordpress_path)
+    database_plugins_dump_path = pathlib.Path.joinpath(database_path, plugins_dump_path_converted)
+    export_database(environment_config, wordpress_path, database_plugins_dump_path.as_posix(), "plugins")
 
 
 def get_constants() -> dict:
@@ -290,6 +390,15 @@ def get_environment(site_config: dict, environment_name: str) -> dict:
     return environment
 
 
+def get_package_cache() -> ArtifactCache:
+    """Gets the cache of the plugins and themes downloaded from URLs and feeds.
+
+    Returns:
+        The cache in the packages directory of the configured cache path.
+    """
+    return cache_tools.get_cache(PACKAGE_CACHE_DIRECTORY)
+
+
 def get_wordpress_path_from_root_path(root_path: str, constants: dict = None) -> str:
     """ Gets the wordpress path based on the constants.json from a desired root path
 
@@ -317,6 +426,10 @@ def import_content_from_configuration_file(site_configuration: dict, environment
     NOTE: content entries in the configuration file must be named after post
     types in singular form. Otherwise they will be ignored. ie: post, page.
 
+    If content.import_workers is greater than 1, the existing content of
+    every type is deleted first and the files are split and imported
+    concurrently (see wp_wxr.import_wxr_files()).
+
     Args:
         site_configuration: Parsed site configuration.
         environment_config: Parsed environment configuration.
@@ -339,6 +452,19 @@ def import_content_from_configuration_file(site_configuration: dict, environment
         authors = author_handling
 
     debug_info = environment_config["wp_cli_debug"]
+    import_workers = site_configuration["content"].get("import_workers", 1)
+
+    # Split the files and import them concurrently
+    if import_workers > 1:
+        content_types = site_configuration["content"]["sources"]
+        for content_type in content_types:
+            wp_cli.delete_post_type_content(wordpress_path, content_type, debug_info)
+        wp_wxr.import_wxr_files(wordpress_path,
+                                [str(pathlib.Path.joinpath(wxr_path, f"{content_type}.xml"))
+                                 for content_type in content_types],
+                                authors, debug_info, import_workers,
+                                site_configuration["content"].get("chunk_size", wp_wxr.DEFAULT_CHUNK_SIZE))
+        return
 
     for content_type in site_configuration["content"]["sources"]:
 
@@ -353,9 +479,16 @@ def import_content_from_configuration_file(site_configuration: dict, environment
 
 
 def install_plugins_from_configuration_file(site_configuration: dict, environment_config: dict, global_constants: dict,
-                                            root_path: str, skip_partial_dumps: bool):
+                                            root_path: str, skip_partial_dumps: bool, offline: bool = False,
+                                            per_plugin_dumps: bool = False,
+                                            max_download_workers: int = DEFAULT_PLUGIN_DOWNLOAD_WORKERS,
+                                            batch: bool = False):
     """Installs WordPress's plugin files using WP-CLI.
 
+       Plugins downloaded from URLs are fetched concurrently while the plugins
+       are installed in the configuration order, each one as soon as its file
+       is ready.
+
        For more information see:
            https://developer.wordpress.org/cli/commands/plugin/install/
 
@@ -365,6 +498,16 @@ def install_plugins_from_configuration_file(site_configuration: dict, environmen
            global_constants: Parsed global constants.
            root_path: Path to project root.
            skip_partial_dumps: If True skips database dumps.
+           offline: If True the plugins downloaded from URLs are taken from the
+               package cache.
+           per_plugin_dumps: If True the database is dumped after installing
+               every plugin instead of once after installing all of them.
+           max_download_workers: Maximum number of plugins downloaded at the
+               same time.
+           batch: If True the plugins are installed once all of them are
+               downloaded, grouped in as few WP-CLI processes as possible
+               (see wp_cli.install_plugins). Partial dumps are not taken per
+               plugin in this mode.
        """
     # Get data needed in the process
     plugins: dict = site_configuration["settings"]["plugins"]
@@ -372,37 +515,60 @@ def install_plugins_from_configuration_file(site_configuration: dict, environmen
     wordpress_path = str(pathlib.Path.joinpath(root_path_obj, global_constants["paths"]["wordpress"]))
     plugins_path = str(pathlib.Path.joinpath(root_path_obj, global_constants["paths"]["content"]["plugins"]))
     debug_info = environment_config["wp_cli_debug"]
+    package_cache = get_package_cache()
+
+    # Get plugin paths
+    plugin_paths = [paths.get_file_path_from_pattern(plugins_path, f"{plugin['name']}*.zip") for plugin in plugins]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_download_workers)) as executor:
+        # Start every download before installing the first plugin
+        downloads = {index: executor.submit(download_wordpress_plugin, plugin, plugin_paths[index], package_cache,
+                                            offline)
+                     for index, plugin in enumerate(plugins) if plugin["source_type"] == "url"}
 
-    for plugin in plugins:
-        # Get plugin path
-        plugin_path = paths.get_file_path_from_pattern(plugins_path, f"{plugin['name']}*.zip")
-        logging.info(literals.get("wp_plugin_path").format(path=plugin_path))
+        try:
+            for index, plugin in enumerate(plugins):
+                logging.info(literals.get("wp_plugin_path").format(path=plugin_paths[index]))
 
-        # Download plugin if needed
-        if plugin["source_type"] == "url":
-            download_wordpress_plugin(plugin, plugin_path)
+                # Wait for the plugin to be downloaded if needed
+                if index in downloads:
+                    downloads[index].result()
 
-            # Once downloaded, should have a .zip under plugins path, so can freely add this source as a .zip one for
-            # further installing this plugin as a zip
-            plugin["source_type"] = "zip"
+                    # Once downloaded, should have a .zip under plugins path, so can freely add this source as a .zip
+                    # one for further installing this plugin as a zip
+                    plugin["source_type"] = "zip"
 
-        if plugin["source_type"] == "zip":
-            plugin["source"] = plugin_path
+                if plugin["source_type"] == "zip":
+                    plugin["source"] = plugin_paths[index]
 
-        wp_cli.install_plugin(plugin["name"], wordpress_path, plugin["activate"], plugin["force"], plugin["source"],
-                              debug_info)
+                if batch:
+                    continue
 
-        # Backup database after plugin install
-        if not skip_partial_dumps:
-            database_path = pathlib.Path.joinpath(root_path_obj, global_constants["paths"]["database"])
-            core_dump_path_converted = convert_wp_config_token(
-                site_configuration["settings"]["dumps"]["plugins"], wordpress_path)
-            database_core_dump_path = pathlib.Path.joinpath(database_path, core_dump_path_converted)
-            export_database(site_configuration, wordpress_path, database_core_dump_path.as_posix())
+                wp_cli.install_plugin(plugin["name"], wordpress_path, plugin["activate"], plugin["force"],
+                                      plugin["source"], debug_info)
 
-        # Warn the user we are skipping the backup dump
-        else:
-            logging.warning(literals.get("wp_wpcli_export_db_skipping_as_set").format(dump="plugins"))
+                # Backup database after plugin install
+                if per_plugin_dumps and not skip_partial_dumps:
+                    export_plugins_database_dump(site_configuration, environment_config, global_constants, root_path,
+                                                 wordpress_path)
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    if not plugins:
+        return
+
+    if batch:
+        wp_cli.install_plugins(plugins, wordpress_path, debug_info)
+
+    # Backup database after installing all the plugins
+    if (batch or not per_plugin_dumps) and not skip_partial_dumps:
+        export_plugins_database_dump(site_configuration, environment_config, global_constants, root_path,
+                                     wordpress_path)
+
+    # Warn the user we are skipping the backup dump
+    if skip_partial_dumps:
+        logging.warning(literals.get("wp_wpcli_export_db_skipping_as_set").format(dump="plugins"))
 
 
 def install_recommended_plugins():
@@ -501,6 +667,9 @@ def install_wordpress_site(site_configuration: dict, environment_config: dict, g
     # Install wordpress
     install_wordpress_core(site_configuration, environment_config, wordpress_path_as_posix, admin_password)
 
+    # Answer the option checks of this run from a single options listing
+    wp_cli.load_options_snapshot(wordpress_path_as_posix, environment_config["wp_cli_debug"])
+
     # Update description option
     description = site_configuration["settings"]["description"]
     wp_cli.update_database_option(
@@ -512,7 +681,8 @@ def install_wordpress_site(site_configuration: dict, environment_config: dict, g
             convert_wp_config_token(site_configuration["settings"]["dumps"]["core"], wordpress_path)
         database_core_dump_directory_path = pathlib.Path.joinpath(root_path_obj, database_path)
         database_core_dump_path = pathlib.Path.joinpath(database_core_dump_directory_path, core_dump_path_converted)
-        export_database(environment_config, wordpress_path_as_posix, database_core_dump_path.as_posix())
+        export_database(environment_config, wordpress_path_as_posix, database_core_dump_path.as_posix(), "core",
+                        base=True)
         git_tools.purge_gitkeep(database_core_dump_directory_path.as_posix())
 
     # Warn the user we are skipping the backup dump
@@ -523,6 +693,15 @@ def install_wordpress_site(site_configuration: dict, environment_config: dict, g
 def set_wordpress_config_from_configuration_file(environment_config: dict, wordpress_path: str,
                                                  devops_toolset_wordpress_path: str, db_user_password: str) -> None:
     """ Sets all configuration parameters in pristine WordPress core files
+
+    The whole wp-config.php file (database settings, keys and salts,
+    configuration properties and snippets) is rendered in a single pass and
+    written atomically, instead of running wp config create and one
+    wp config set per property.
+
+    Unless database.skip_check is true, the database connection is checked
+    afterwards, as wp config create did.
+
     Args:
         environment_config: Environment configuration.
         wordpress_path: Path to wordpress installation.
@@ -532,24 +711,40 @@ def set_wordpress_config_from_configuration_file(environment_config: dict, wordp
 
     """
 
-    # Create wp-config.php file
-    create_configuration_file(environment_config, wordpress_path, db_user_password)
+    logging.info(literals.get("wp_wpcli_creating_config"))
+
+    content = wp_config.render(environment_config, db_user_password,
+                               get_wp_config_snippets(environment_config, devops_toolset_wordpress_path))
+    wp_config.write(content, str(pathlib.Path(wordpress_path, "wp-config.php")))
+
+    logging.info(literals.get("wp_wpcli_config_created_ok"))
+
+    if not environment_config["database"]["skip_check"]:
+        wp_cli.check_database_connection(wordpress_path, environment_config["wp_cli_debug"])
+
+
+def get_wp_config_snippets(environment_config: dict, devops_toolset_wordpress_path: str) -> List[str]:
+    """ Gets the PHP snippets to be added to the wp-config.php file of an
+    environment.
+
+    Args:
+        environment_config: Environment configuration.
+        devops_toolset_wordpress_path: Path to the source root of the WordPress
+            project type in devops-toolset.
+
+    Returns:
+        List with the snippets.
+    """
 
-    # Get config properties to set from site configuration
-    wp_config_properties = environment_config["wp_config"]
-    debug = environment_config["wp_cli_debug"]
+    snippets = []
 
-    # Foreach variable to set: execute wp config set
-    for prop in wp_config_properties.values():
-        # This value will place the value as it gets, without quotes
-        value = prop.get("value")
-        raw = type(value) != str
-        wp_cli.set_configuration_value(
-            prop.get("name"), value, prop.get("type"),
-            wordpress_path, raw, debug)
+    # Same condition as add_cloudfront_forwarded_proto_to_config
+    if environment_config["settings"].get("aws_cloudfront", False) is not False:
+        snippet = get_snippet_cloudfront(devops_toolset_wordpress_path)
+        if snippet:
+            snippets.append(snippet)
 
-    # Add cloudfront snippet to wp_config.php if needed
-    add_cloudfront_forwarded_proto_to_config(environment_config, wordpress_path, devops_toolset_wordpress_path)
+    return snippets
 
 
 def add_cloudfront_forwarded_proto_to_config(
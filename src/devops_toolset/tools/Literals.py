@@ -3,7 +3,7 @@
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 
 
 class Literals(ValueDictsBase):
@@ -40,6 +40,7 @@ class Literals(ValueDictsBase):
     }
 
     _errors = {
+        "cli_command_stopped": _("Command stopped because another command of the batch failed: {command}"),
         "git_err_create_repo": _("Git error: repository couldn't be created"),
         "git_non_valid_dir_path": _("Path must be an existent dir."),
         "git_regex1cg": _("RegEx must have 1 capture group. No less, no more."),
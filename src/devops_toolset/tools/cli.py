@@ -1,38 +1,391 @@
 """Contains tools for working with the command line"""
 
+import collections
 import devops_toolset.core.log_tools
+import functools
+import importlib
 import subprocess
-from pyfiglet import Figlet
-from typing import List
+from devops_toolset.core.lazy import LazyObject
+from typing import Callable, List, Optional, Tuple, Union
 
+# Creating the literals bootstraps the App (gettext and logging), which is slow
+# and only needed by run_commands(), so it is deferred until they are used
+literals = LazyObject(lambda: importlib.import_module("devops_toolset.core.LiteralsCore").LiteralsCore(
+    [importlib.import_module("devops_toolset.tools.Literals").Literals]))
+
+# Number of stderr lines kept for error reporting in streaming mode
+STREAM_TAIL_LINES: int = 200
+
+# Size of the chunks moved through the pipes by pipe_subprocess()
+PIPE_CHUNK_SIZE: int = 1024 * 1024
+
+# Return code of argv commands that cannot be started, as a shell does for a
+# command that is not found
+COMMAND_NOT_FOUND_RETURNCODE: int = 127
+
+# A str command is run by the shell, a list of arguments is run directly
+Command = Union[str, List[str]]
+
+# Number of commands run at the same time by run_commands()
+DEFAULT_MAX_WORKERS: int = 4
 
 def print_title(text: str):
     """Prints a title in the console"""
+
+    # pyfiglet is slow to import and only needed here
+    from pyfiglet import Figlet
+
     f = Figlet()
     print(f.renderText(text))
 
 
-def call_subprocess_with_result(command: str) -> str:
+def build_argv(template: str, **params) -> List[str]:
+    """Renders a command template as a list of arguments to be run without a
+    shell.
+
+    The template is split with shell rules (quotes group words and are
+    removed) before the parameters are applied, so every parameter value ends
+    up in a single argument whatever its content, with no quoting or escaping.
+    A token that is just a placeholder takes a list or tuple value as several
+    arguments, and is dropped if the value is None. Unquoted tokens rendered
+    as an empty string are dropped, so optional flags can be passed as "".
+    Quoted tokens are values and are kept even if empty ("{option_value}").
+
+    Args:
+        template: Command template, e.g. commands.get("git_init").
+        params: Values for the template placeholders.
+
+    Returns:
+        List of arguments, starting with the executable.
+    """
+
+    argv = []
+
+    for token, quoted in __split_template(template):
+        if token.startswith("{") and token.endswith("}") and token[1:-1].isidentifier():
+            value = params[token[1:-1]]
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                argv.extend(str(item) for item in value)
+                continue
+
+        rendered = token.format(**params)
+        if rendered or quoted:
+            argv.append(rendered)
+
+    return argv
+
+
+@functools.lru_cache(maxsize=None)
+def __split_template(template: str) -> Tuple[Tuple[str, bool], ...]:
+    """Splits a command template with shell rules, only once per template.
+
+    Returns:
+        Tuple with a (token, quoted) tuple per token, where quoted is True if
+        any part of the token was quoted.
+    """
+
+    tokens = []
+    token = None
+    quoted = False
+    quote = None
+    characters = iter(template)
+
+    for character in characters:
+        if quote is None and character.isspace():
+            if token is not None:
+                tokens.append((token, quoted))
+            token, quoted = None, False
+            continue
+
+        token = token or ""
+        if character == "\\" and quote != "'":
+            escaped = next(characters, "")
+            # Inside double quotes only quotes and backslashes are escaped
+            token += escaped if quote is None or escaped in "\"\\" else character + escaped
+        elif quote is not None and character == quote:
+            quote = None
+        elif quote is None and character in "'\"":
+            quote, quoted = character, True
+        else:
+            token += character
+
+    if quote is not None:
+        raise ValueError(f"No closing quotation in command template: {template}")
+    if token is not None:
+        tokens.append((token, quoted))
+
+    return tuple(tokens)
+
+
+@functools.lru_cache(maxsize=None)
+def __which(executable: str) -> str:
+    """Resolves an executable in PATH, only once per name."""
+
+    # shutil imports the compression modules, slow and not needed otherwise
+    import shutil
+
+    return shutil.which(executable) or executable
+
+
+def __popen(command: Command, stdin=None) -> subprocess.Popen:
+    """Starts a subprocess with both pipes.
+
+    A list of arguments is run without a shell. The executable is passed as an
+    absolute path and file descriptors are left alone (they are not
+    inheritable anyway), which lets Popen use posix_spawn() instead of fork()
+    and exec().
+
+    Args:
+        command: Command to be executed.
+        stdin: stdin of the process (subprocess.PIPE to write to it). If
+            None, a list of arguments gets no stdin (so a command that
+            prompts for input reads EOF instead of waiting) and a shell
+            command inherits it.
+
+    Returns:
+        The started process.
+    """
+
+    pipes = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
+    if stdin is not None:
+        pipes["stdin"] = stdin
+
+    if isinstance(command, str):
+        return subprocess.Popen(command.strip(), shell=True, **pipes)
+
+    pipes.setdefault("stdin", subprocess.DEVNULL)
+    return subprocess.Popen(command, executable=__which(command[0]), close_fds=False, **pipes)
+
+
+def __communicate(command: Command) -> Tuple[bytes, bytes, int]:
+    """Calls a subprocess and waits for it to finish.
+
+    Args:
+        command: Command to be executed.
+
+    Returns:
+        Tuple with (stdout, stderr, return code).
+    """
+
+    try:
+        process = __popen(command)
+    except OSError as error:
+        return b"", str(error).encode("utf-8"), COMMAND_NOT_FOUND_RETURNCODE
+
+    out, err = process.communicate()
+    process.wait()
+
+    return out, err, process.returncode
+
+
+def __command_text(command: Command) -> str:
+    """Gets the text of a command to be logged."""
+
+    import shlex
+
+    return command if isinstance(command, str) else shlex.join(command)
+
+
+def stream_subprocess(command: Command, stdout_handler: Callable[[bytes], None],
+                      stderr_handler: Callable[[bytes], None]) -> int:
+    """Calls a subprocess and hands every output line to a handler as it
+    arrives.
+
+    Both pipes are read concurrently, so the process never blocks on a full
+    pipe and no output is held in memory by this function.
+
+    Args:
+        command: Command to be executed. A str is run by the shell and a
+            list of arguments (see build_argv) is run without it.
+        stdout_handler: Called with every stdout line (bytes).
+        stderr_handler: Called with every stderr line (bytes).
+
+    Returns:
+        The return code of the process.
+    """
+
+    try:
+        process = __popen(command)
+    except OSError as error:
+        stderr_handler(str(error).encode("utf-8") + b"\n")
+        return COMMAND_NOT_FOUND_RETURNCODE
+
+    # Imported here, as most callers of this module never need it
+    import threading
+
+    stderr_reader = threading.Thread(target=__read_lines, args=(process.stderr, stderr_handler), daemon=True)
+    stderr_reader.start()
+    __read_lines(process.stdout, stdout_handler)
+    stderr_reader.join()
+
+    return process.wait()
+
+
+def __read_lines(pipe, handler: Callable[[bytes], None]):
+    """Reads a pipe line by line until it is closed.
+
+    Args:
+        pipe: Pipe to be read.
+        handler: Called with every line.
+    """
+
+    with pipe:
+        for line in iter(pipe.readline, b""):
+            handler(line)
+
+
+def pipe_subprocess(command: Command, stdout_handler: Callable[[bytes], None] = None,
+                    stdin_source: Callable[[], bytes] = None, chunk_size: int = PIPE_CHUNK_SIZE) -> Tuple[int, bytes]:
+    """Calls a subprocess moving binary data through its pipes in chunks.
+
+    Unlike stream_subprocess() stdout is not split in lines, so binary or
+    very long lines (like the ones of a SQL dump) are handled with bounded
+    memory. stdin is written from another thread, so the process never
+    blocks on a full pipe.
+
+    Args:
+        command: Command to be executed. A str is run by the shell and a
+            list of arguments (see build_argv) is run without it.
+        stdout_handler: Called with every stdout chunk. If None stdout lines
+            are logged as debug.
+        stdin_source: Called to get the next chunk to be written to stdin,
+            which is closed when it returns an empty chunk. If None the
+            process gets no stdin (see __popen).
+        chunk_size: Size of the stdout chunks.
+
+    Returns:
+        Tuple with (return code, last STREAM_TAIL_LINES lines of stderr).
+
+    Raises:
+        Exception: Any exception raised by stdin_source, after killing the process.
+    """
+
+    err_tail = collections.deque(maxlen=STREAM_TAIL_LINES)
+
+    def handle_err(line: bytes):
+        err_tail.append(line)
+        devops_toolset.core.log_tools.log_stdouterr(line, devops_toolset.core.log_tools.LogLevel.debug)
+
+    def handle_out(line: bytes):
+        devops_toolset.core.log_tools.log_stdouterr(line, devops_toolset.core.log_tools.LogLevel.debug)
+
+    try:
+        process = __popen(command, subprocess.PIPE if stdin_source is not None else None)
+    except OSError as error:
+        return COMMAND_NOT_FOUND_RETURNCODE, str(error).encode("utf-8")
+
+    stdin_errors = []
+    # Imported here, as most callers of this module never need it
+    import threading
+
+    threads = [threading.Thread(target=__read_lines, args=(process.stderr, handle_err), daemon=True)]
+    if stdin_source is not None:
+        threads.append(threading.Thread(target=__write_chunks, args=(stdin_source, process, stdin_errors),
+                                        daemon=True))
+    if stdout_handler is None:
+        threads.append(threading.Thread(target=__read_lines, args=(process.stdout, handle_out), daemon=True))
+
+    for thread in threads:
+        thread.start()
+
+    if stdout_handler is not None:
+        with process.stdout:
+            for chunk in iter(lambda: process.stdout.read(chunk_size), b""):
+                stdout_handler(chunk)
+
+    for thread in threads:
+        thread.join()
+
+    returncode = process.wait()
+    if stdin_errors:
+        raise stdin_errors[0]
+
+    return returncode, b"".join(err_tail)
+
+
+def __write_chunks(source: Callable[[], bytes], process: subprocess.Popen, errors: list):
+    """Writes chunks to the stdin of a process until the source returns an
+    empty one, and closes it.
+
+    If the source fails the process is killed, so it does not take the
+    partial input as complete, and the exception is added to errors.
+
+    Args:
+        source: Called to get the next chunk.
+        process: Process to be written.
+        errors: Gets the exception raised by the source, if any.
+    """
+
+    try:
+        for chunk in iter(source, b""):
+            process.stdin.write(chunk)
+    except BrokenPipeError:
+        # The process exited before reading everything, its return code tells why
+        pass
+    except BaseException as error:
+        # Killed before closing its stdin, otherwise it would read the end of the input
+        process.kill()
+        errors.append(error)
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def call_subprocess_with_result(command: Command, stream: bool = False) -> str:
     """Calls a subprocess and returns the stdout
 
         Args:
-            command: Command to be executed.
+            command: Command to be executed. A str is run by the shell and
+                a list of arguments (see build_argv) is run without it.
+            stream: If True both pipes are read line by line while the process
+                runs, stderr lines are logged as debug and only the last
+                STREAM_TAIL_LINES lines of stderr are kept.
         """
-    process = subprocess.Popen(command.strip(), shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    out, err = process.communicate()
-    process.wait()
+
+    if stream:
+        out, err, returncode = __stream_subprocess_with_result(command)
+    else:
+        out, err, returncode = __communicate(command)
 
     if out:
         return out.decode("utf-8", errors="backslashreplace")
 
 
-def call_subprocess(command: str, log_before_process: List[str] = None,
+def __stream_subprocess_with_result(command: Command) -> Tuple[bytes, bytes, int]:
+    """Calls a subprocess in streaming mode keeping the whole stdout.
+
+    Args:
+        command: Command to be executed.
+
+    Returns:
+        Tuple with (stdout, stderr tail, return code).
+    """
+
+    out_lines = []
+    err_tail = collections.deque(maxlen=STREAM_TAIL_LINES)
+
+    def handle_err(line: bytes):
+        err_tail.append(line)
+        devops_toolset.core.log_tools.log_stdouterr(line, devops_toolset.core.log_tools.LogLevel.debug)
+
+    returncode = stream_subprocess(command, out_lines.append, handle_err)
+
+    return b"".join(out_lines), b"".join(err_tail), returncode
+
+
+def call_subprocess(command: Command, log_before_process: List[str] = None,
                     log_before_out: List[str] = None, log_after_out: List[str] = None,
-                    log_before_err: List[str] = None, log_after_err: List[str] = None):
+                    log_before_err: List[str] = None, log_after_err: List[str] = None,
+                    stream: bool = False):
     """Calls a subprocess.
 
     Args:
-        command: Command to be executed.
+        command: Command to be executed. A str is run by the shell and a
+            list of arguments (see build_argv) is run without it.
         log_before_process: List of strings to log as info before the process
             call.
         log_before_out: List of strings to log as info before the stdout, if
@@ -43,25 +396,205 @@ def call_subprocess(command: str, log_before_process: List[str] = None,
             errors.
         log_after_err: List of strings to log as error after the stderr, if
             errors.
+        stream: If True stdout lines are logged as they arrive instead of when
+            the process exits, and only the last STREAM_TAIL_LINES lines of
+            stderr are kept for error reporting. Use it for long-running
+            commands with big outputs.
     """
 
-    devops_toolset.core.log_tools.log_list([command], devops_toolset.core.log_tools.LogLevel.info)
+    devops_toolset.core.log_tools.log_list([__command_text(command)], devops_toolset.core.log_tools.LogLevel.info)
     devops_toolset.core.log_tools.log_list(log_before_process, devops_toolset.core.log_tools.LogLevel.info)
 
-    process = subprocess.Popen(command.strip(), shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    out, err = process.communicate()
-    process.wait()
+    if stream:
+        __stream_subprocess(command, log_before_out, log_after_out, log_before_err, log_after_err)
+        return
+
+    out, err, returncode = __communicate(command)
 
     if out:
         devops_toolset.core.log_tools.log_list(log_before_out, devops_toolset.core.log_tools.LogLevel.info)
         devops_toolset.core.log_tools.log_stdouterr(out, devops_toolset.core.log_tools.LogLevel.info)
         devops_toolset.core.log_tools.log_list(log_after_out, devops_toolset.core.log_tools.LogLevel.info)
 
-    if err and process.returncode != 0:
+    if err and returncode != 0:
         devops_toolset.core.log_tools.log_list(log_before_err, devops_toolset.core.log_tools.LogLevel.error)
         devops_toolset.core.log_tools.log_stdouterr(err, devops_toolset.core.log_tools.LogLevel.error)
         devops_toolset.core.log_tools.log_list(log_after_err, devops_toolset.core.log_tools.LogLevel.error)
 
 
+def __stream_subprocess(command: Command, log_before_out: List[str] = None, log_after_out: List[str] = None,
+                        log_before_err: List[str] = None, log_after_err: List[str] = None):
+    """Calls a subprocess logging stdout lines as they arrive.
+
+    stderr lines are logged as debug as they arrive, and the last
+    STREAM_TAIL_LINES ones are logged as error if the process fails.
+
+    Args:
+        command: Command to be executed.
+        log_before_out: List of strings to log as info before the first
+            stdout line.
+        log_after_out: List of strings to log as info after the stdout, if
+            there was any.
+        log_before_err: List of strings to log as error before the stderr, if
+            errors.
+        log_after_err: List of strings to log as error after the stderr, if
+            errors.
+    """
+
+    has_out = False
+    err_tail = collections.deque(maxlen=STREAM_TAIL_LINES)
+
+    def handle_out(line: bytes):
+        nonlocal has_out
+        if not has_out:
+            has_out = True
+            devops_toolset.core.log_tools.log_list(log_before_out, devops_toolset.core.log_tools.LogLevel.info)
+        devops_toolset.core.log_tools.log_stdouterr(line, devops_toolset.core.log_tools.LogLevel.info)
+
+    def handle_err(line: bytes):
+        err_tail.append(line)
+        devops_toolset.core.log_tools.log_stdouterr(line, devops_toolset.core.log_tools.LogLevel.debug)
+
+    returncode = stream_subprocess(command, handle_out, handle_err)
+
+    if has_out:
+        devops_toolset.core.log_tools.log_list(log_after_out, devops_toolset.core.log_tools.LogLevel.info)
+
+    if err_tail and returncode != 0:
+        devops_toolset.core.log_tools.log_list(log_before_err, devops_toolset.core.log_tools.LogLevel.error)
+        devops_toolset.core.log_tools.log_stdouterr(b"".join(err_tail), devops_toolset.core.log_tools.LogLevel.error)
+        devops_toolset.core.log_tools.log_list(log_after_err, devops_toolset.core.log_tools.LogLevel.error)
+
+
+class CommandResult(object):
+    """Result of a command run by run_commands()."""
+
+    def __init__(self, command: Command, returncode: Optional[int] = None, out: Optional[str] = None,
+                 err: Optional[str] = None, stopped: bool = False):
+        """
+        Args:
+            command: Command that was run.
+            returncode: Return code of the process, None if it was not started.
+            out: Decoded stdout, None if it was empty.
+            err: Decoded stderr, None if it was empty.
+            stopped: True if the command was not started or was terminated
+                because another command failed.
+        """
+
+        self.command = command
+        self.returncode = returncode
+        self.out = out
+        self.err = err
+        self.stopped = stopped
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the command ran to the end with return code 0."""
+        return self.returncode == 0 and not self.stopped
+
+    def __repr__(self):
+        return f"<CommandResult {self.command!r} returncode={self.returncode} stopped={self.stopped}>"
+
+
+def run_commands(commands: List[Command], max_workers: int = DEFAULT_MAX_WORKERS,
+                 stop_on_failure: bool = True) -> List[CommandResult]:
+    """Runs a batch of independent commands concurrently.
+
+    The output of every command is logged in one block when the command
+    finishes, so outputs of different commands are never interleaved.
+
+    Args:
+        commands: Commands to be executed. A str is run by the shell and a
+            list of arguments (see build_argv) is run without it.
+        max_workers: Maximum number of commands running at the same time.
+        stop_on_failure: If True, when a command fails the commands that are
+            running are terminated and the pending ones are not started.
+
+    Returns:
+        List with a CommandResult for every command, in the same order as
+        commands.
+    """
+
+    # Imported here, as most callers of this module never need them
+    import concurrent.futures
+    import threading
+
+    stop = threading.Event()
+    running = {}
+    lock = threading.Lock()
+    # Keeps the output of every command together in the log
+    log_lock = threading.Lock()
+
+    def run(index: int, command: Command) -> CommandResult:
+        with lock:
+            if stop.is_set():
+                result = CommandResult(command, stopped=True)
+                __log_result(result, b"", b"", log_lock)
+                return result
+            try:
+                process = __popen(command)
+            except OSError as error:
+                process = None
+                out, err, returncode = b"", str(error).encode("utf-8"), COMMAND_NOT_FOUND_RETURNCODE
+            else:
+                running[index] = process
+
+        if process is not None:
+            out, err = process.communicate()
+            returncode = process.returncode
+
+        with lock:
+            running.pop(index, None)
+            stopped = returncode != 0 and stop.is_set()
+            if returncode != 0 and not stopped and stop_on_failure:
+                stop.set()
+                for other in running.values():
+                    other.terminate()
+
+        result = CommandResult(command, returncode, __decode(out), __decode(err), stopped)
+        __log_result(result, out, err, log_lock)
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(run, index, command) for index, command in enumerate(commands)]
+
+    return [future.result() for future in futures]
+
+
+def __decode(output: bytes) -> Optional[str]:
+    """Decodes a process output as call_subprocess_with_result() does."""
+    if output:
+        return output.decode("utf-8", errors="backslashreplace")
+
+
+def __log_result(result: CommandResult, out: bytes, err: bytes, log_lock):
+    """Logs the command and its output in one block.
+
+    Args:
+        result: Result of the command.
+        out: Raw stdout of the command.
+        err: Raw stderr of the command.
+        log_lock: Lock held while logging, shared by the commands of a batch.
+    """
+
+    with log_lock:
+        if result.stopped:
+            devops_toolset.core.log_tools.log_list(
+                [literals.get("cli_command_stopped").format(command=__command_text(result.command))],
+                devops_toolset.core.log_tools.LogLevel.warning)
+            return
+
+        devops_toolset.core.log_tools.log_list([__command_text(result.command)],
+                                               devops_toolset.core.log_tools.LogLevel.info)
+        if out:
+            devops_toolset.core.log_tools.log_stdouterr(out, devops_toolset.core.log_tools.LogLevel.info)
+        if result.returncode != 0:
+            if err:
+                devops_toolset.core.log_tools.log_stdouterr(err, devops_toolset.core.log_tools.LogLevel.error)
+            devops_toolset.core.log_tools.log_list(
+                [literals.get("cli_return_code").format(code=result.returncode)],
+                devops_toolset.core.log_tools.LogLevel.error)
+
+
 if __name__ == "__main__":
     help(__name__)
@@ -3,7 +3,7 @@
 from devops_toolset.core.ValueDictsBase import ValueDictsBase
 from devops_toolset.core.app import App
 
-app: App = App()
+app: App = App.instance()
 
 
 class Commands(ValueDictsBase):
@@ -14,6 +14,7 @@ class Commands(ValueDictsBase):
         "git_init": "git init {path}",
         "git_add": "git add .",
         "git_commit_m": "git commit -m \"{message}\"",
+        "git_rev_parse_head": "git -C {path} rev-parse {short} HEAD",
         "git_push_tag": "git {auth} push origin {tag_name}",
         "git_push_tag_delete": "git {auth} push --delete origin {tag_name}",
         "git_tag_add": "git tag -a {tag_name} {commit_name} -m {tag_name}",
@@ -13,7 +13,7 @@ import pathlib
 import shutil
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 
-app: App = App()
+app: App = App.instance()
 literals = LiteralsCore([WordpressLiterals])
 
 
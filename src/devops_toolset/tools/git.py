@@ -12,6 +12,7 @@ import os
 import pathlib
 import re
 from clint.textui import prompt
+from typing import Optional
 
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.core.LiteralsCore import LiteralsCore
@@ -19,7 +20,7 @@ from devops_toolset.filesystem.constants import FileNames, Directions
 from devops_toolset.tools.commands import Commands as ToolsCommands
 from devops_toolset.tools.Literals import Literals as ToolsLiterals
 
-app: devops_toolset.core.app.App = devops_toolset.core.app.App()
+app: devops_toolset.core.app.App = devops_toolset.core.app.App.instance()
 literals = LiteralsCore([ToolsLiterals])
 commands = CommandsCore([ToolsCommands])
 platform_specific = app.load_platform_specific("environment")
@@ -78,6 +79,23 @@ def get_current_branch_simplified(branch: str, environment_variable_name: str =
     return simplified_branch_name
 
 
+def get_head_commit_sha(path: str, short: bool = True) -> Optional[str]:
+    """Gets the SHA of the HEAD commit of a Git repository.
+
+    Args:
+        path: Path inside the Git repository.
+        short: If True gets the abbreviated SHA.
+
+    Returns:
+        The SHA, or None if it cannot be read.
+    """
+
+    sha = devops_toolset.tools.cli.call_subprocess_with_result(devops_toolset.tools.cli.build_argv(
+        commands.get("git_rev_parse_head"), path=path, short="--short" if short else None))
+
+    return sha.strip() if sha else None
+
+
 def get_gitignore_path(path: str = None, direction: Directions = Directions.ASCENDING) -> str:
     """Gets the path to the .gitignore file.
 
@@ -110,12 +128,12 @@ def git_commit(skip: bool):
         skip: Boolean that determines if the user want or don't want to create the .git repository.
     """
     if not skip:
-        devops_toolset.tools.cli.call_subprocess(commands.get("git_add"),
+        devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("git_add")),
                                                  log_before_process=[literals.get(
                                                      "git_before_adding_project_structure_files_to_stage")],
                                                  log_after_err=[
                                                      literals.get("git_err_adding_project_structure_files_to_stage")])
-        devops_toolset.tools.cli.call_subprocess(commands.get("git_commit_m").format(
+        devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("git_commit_m"),
             message=literals.get("git_add_project_structure_message")),
             log_before_process=[literals.get("git_before_project_structure_commit")],
             log_after_err=[literals.get("git_err_commit_project_structure")],
@@ -135,7 +153,8 @@ def git_init(path: str, skip: bool, prompt_user: bool = False):
     if not skip:
         init_git = prompt.yn(literals.get("git_init_repo")) if prompt_user is True else True
         if init_git:
-            devops_toolset.tools.cli.call_subprocess(commands.get("git_init").format(path=path),
+            devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("git_init"),
+                                                                                         path=path),
                                                      log_before_process=[literals.get("git_repo_to_be_created")],
                                                      log_after_err=[literals.get("git_err_create_repo")],
                                                      log_after_out=[literals.get("git_repo_created")])
@@ -187,14 +206,14 @@ def git_tag_add(tag_name: str, commit_name: str, push_to_origin: bool = True, au
 
     """
     devops_toolset.tools.cli.call_subprocess(
-        commands.get("git_tag_add").format(tag_name=tag_name, commit_name=commit_name),
+        devops_toolset.tools.cli.build_argv(commands.get("git_tag_add"), tag_name=tag_name, commit_name=commit_name),
         log_before_process=[literals.get("git_tag_add_init").format(tag_name=tag_name, commit_name=commit_name)],
         log_after_err=[literals.get("git_tag_add_err")])
 
     if push_to_origin:
-        devops_toolset.tools.cli.call_subprocess(commands.get("git_push_tag").format(
+        devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("git_push_tag"),
             tag_name=tag_name,
-            auth=commands.get("git_auth").format(auth_header=auth_header)
+            auth=devops_toolset.tools.cli.build_argv(commands.get("git_auth"), auth_header=auth_header)
         ),
             log_before_process=[literals.get("git_push_tag_init").format(tag_name=tag_name)],
             log_after_err=[literals.get("git_push_tag_err")])
@@ -208,15 +227,16 @@ def git_tag_delete(tag_name: str, push_to_origin: bool = True, auth_header: str
         auth_header: Includes an auth header into the git command (needed for elevated privilege operations).
         Normally, it will be ["basic <BASIC_AUTH_TOKEN>"] or "bearer <BEARER_TOKEN>"]
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("git_tag_delete").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("git_tag_delete"),
         tag_name=tag_name
     ),
         log_before_process=[literals.get("git_tag_delete_init").format(tag_name=tag_name)],
         log_after_err=[literals.get("git_tag_delete_err").format(tag_name=tag_name)])
     if push_to_origin:
-        devops_toolset.tools.cli.call_subprocess(commands.get("git_push_tag_delete").format(
+        devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(
+            commands.get("git_push_tag_delete"),
             tag_name=tag_name,
-            auth=commands.get("git_auth").format(auth_header=auth_header)
+            auth=devops_toolset.tools.cli.build_argv(commands.get("git_auth"), auth_header=auth_header)
         ),
             log_before_process=[literals.get("git_push_tag_delete_init").format(tag_name=tag_name)],
             log_after_err=[literals.get("git_push_tag_delete_err")])
@@ -230,9 +250,10 @@ def git_tag_exist(tag_name: str, auth_header: str = '', remote_name: str = 'orig
         Normally, it will be ["basic <BASIC_AUTH_TOKEN>"] or "bearer <BEARER_TOKEN>"]
             :param remote_name: Name of the remote. <origin> by default.
         """
-    result: str = devops_toolset.tools.cli.call_subprocess_with_result(commands.get("git_tag_check").format(
+    result: str = devops_toolset.tools.cli.call_subprocess_with_result(devops_toolset.tools.cli.build_argv(
+        commands.get("git_tag_check"),
         remote_name=remote_name,
-        auth=commands.get("git_auth").format(auth_header=auth_header),
+        auth=devops_toolset.tools.cli.build_argv(commands.get("git_auth"), auth_header=auth_header),
         tag_name=tag_name
     ))
 
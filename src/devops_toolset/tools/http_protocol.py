@@ -10,7 +10,7 @@ import logging
 import re
 import requests
 
-app: App = App()
+app: App = App.instance()
 platform_specific = app.load_platform_specific("environment")
 literals = LiteralsCore([ToolsLiterals])
 commands = CommandsCore([ToolsCommands])
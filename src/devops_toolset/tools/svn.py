@@ -10,7 +10,7 @@ from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.tools.Literals import Literals as ToolsLiterals
 from devops_toolset.tools.commands import Commands as ToolsCommands
 
-app: devops_toolset.core.app.App = devops_toolset.core.app.App()
+app: devops_toolset.core.app.App = devops_toolset.core.app.App.instance()
 literals = LiteralsCore([ToolsLiterals])
 commands = CommandsCore([ToolsCommands])
 platform_specific = app.load_platform_specific("environment")
@@ -21,7 +21,7 @@ def svn_add(files_glob: str):
         Args:
             :param files_glob: Glob representing a group of files F.I -> trunk/*
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("svn_add").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("svn_add"),
         files_glob=files_glob
     ),
         log_before_process=[literals.get("svn_add_init")],
@@ -35,7 +35,7 @@ def svn_checkin(comment: str, username: str, password: str):
             :param username: Username of the owner of the repository who will perform the operation
             :param password: Password of the owner of the repository who will perform the operation
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("svn_checkin").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("svn_checkin"),
         comment=comment,
         username=username,
         password=password
@@ -50,7 +50,7 @@ def svn_checkout(repo_url: str, local_path: str = '.'):
             :param repo_url: Full url for the svn repository, F.I -> https://plugins.svn.wordpress.org/your-plugin-name
             :param local_path: Path where the repository will be checked out.
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("svn_checkout").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("svn_checkout"),
         url=repo_url,
         local_path=local_path
     ),
@@ -64,7 +64,7 @@ def svn_copy(origin: str, destination: str = '.'):
             :param origin: Origin path to copy from
             :param destination: Destination path where the files will be copied to.
     """
-    devops_toolset.tools.cli.call_subprocess(commands.get("svn_copy").format(
+    devops_toolset.tools.cli.call_subprocess(devops_toolset.tools.cli.build_argv(commands.get("svn_copy"),
         origin=origin,
         destination=destination
     ),
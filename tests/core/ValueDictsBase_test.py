@@ -0,0 +1,72 @@
+"""Unit core for the core.ValueDictsBase file"""
+
+from unittest.mock import patch
+from devops_toolset.core.ValueDictsBase import ValueDictsBase
+
+
+class FooValues(ValueDictsBase):
+    """Sample values"""
+    _info = {"foo": "foo value", "shared": "foo shared"}
+    _errors = {"foo_error": "foo error"}
+    _empty = {}
+
+
+class BarValues(ValueDictsBase):
+    """Sample values that override FooValues"""
+    _info = {"bar": "bar value", "shared": "bar shared"}
+
+
+# region ValueDictsBase()
+
+def test_value_dicts_base_given_value_list_merges_all_values():
+    """Given a list of classes, values of all classes must be available and
+    later classes must override former ones"""
+
+    # Arrange
+    value_list = [BarValues]
+
+    # Act
+    result = FooValues(value_list)
+
+    # Assert
+    assert result.get("foo") == "foo value"
+    assert result.get("foo_error") == "foo error"
+    assert result.get("bar") == "bar value"
+    assert result.get("shared") == "bar shared"
+
+
+def test_value_dicts_base_given_same_classes_twice_merges_once():
+    """Given the same classes twice, values must be flattened only once and the
+    same mapping shared"""
+
+    # Arrange
+    value_list = [BarValues]
+    first = FooValues(value_list)
+
+    # Act
+    with patch("inspect.getmembers") as getmembers_mock:
+        second = FooValues(value_list)
+
+    # Assert
+    getmembers_mock.assert_not_called()
+    assert first.all is second.all
+
+
+def test_value_dicts_base_all_is_immutable():
+    """The values mapping must be immutable"""
+
+    # Arrange
+    values = FooValues()
+
+    # Act
+    try:
+        values.all["foo"] = "changed"
+        changed = True
+    except TypeError:
+        changed = False
+
+    # Assert
+    assert not changed
+    assert values.get("foo") == "foo value"
+
+# endregion
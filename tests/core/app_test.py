@@ -1,5 +1,7 @@
 """Unit core for the core.app file"""
 
+import pytest
+import sys
 from unittest.mock import patch
 from devops_toolset.core.app import App
 
@@ -37,3 +39,104 @@ def test_app_given_skip_i18n_parameter_does_not_load_gettext_engine(i18n_loader_
 
 
 # endregion
+
+
+# region instance()
+
+@patch("devops_toolset.core.log_setup.configure")
+@patch("devops_toolset.i18n.loader.setup")
+def test_instance_given_several_calls_bootstraps_once(i18n_loader_setup, log_setup_configure):
+    """Given several calls, gettext and logging must be set up only once"""
+
+    # Arrange
+    with patch.object(App, "_instance", None):
+
+        # Act
+        first = App.instance()
+        second = App.instance()
+
+    # Assert
+    assert first is second
+    i18n_loader_setup.assert_called_once()
+    log_setup_configure.assert_called_once()
+
+
+@patch("devops_toolset.core.log_setup.configure")
+@patch("devops_toolset.i18n.loader.setup")
+def test_instance_given_skip_i18n_first_loads_gettext_when_later_requested(i18n_loader_setup, log_setup_configure):
+    """Given a first call with skip_i18n, gettext must be loaded when a later
+    call requests it"""
+
+    # Arrange
+    with patch.object(App, "_instance", None):
+        App.instance(True)
+        i18n_loader_setup.assert_not_called()
+
+        # Act
+        App.instance()
+
+    # Assert
+    i18n_loader_setup.assert_called_once()
+    log_setup_configure.assert_called_once()
+
+# endregion
+
+
+# region load_platform_specific()
+
+def test_load_platform_specific_given_name_imports_module_once():
+    """Given a module name, the platform-specific module must be registered in
+    sys.modules and executed only once"""
+
+    # Arrange
+    app = App.instance()
+
+    # Act
+    first = app.load_platform_specific("environment")
+    second = app.load_platform_specific("environment")
+
+    # Assert
+    module = sys.modules[f"devops_toolset.devops_platforms.{app.settings.platform}.environment"]
+    assert first.create_environment_variables is module.create_environment_variables
+    assert second.create_environment_variables is module.create_environment_variables
+
+# endregion
+
+
+# region set_platform()
+
+def test_set_platform_given_platform_switches_existing_proxies():
+    """Given a platform, existing platform-specific proxies must resolve to the
+    modules of the new platform"""
+
+    # Arrange
+    app = App.instance()
+    platform_specific = app.load_platform_specific("environment")
+    original_platform = app.settings.platform
+    original_path = app.settings.platform_specific_path
+
+    # Act
+    try:
+        app.set_platform("aws")
+        result = platform_specific.create_environment_variables
+    finally:
+        app.set_platform(original_platform)
+
+    # Assert
+    aws_module = sys.modules["devops_toolset.devops_platforms.aws.environment"]
+    assert result is aws_module.create_environment_variables
+    assert app.settings.platform_specific_path == original_path
+
+
+def test_set_platform_given_unknown_platform_raises_valueerror():
+    """Given an unknown platform, raises a ValueError"""
+
+    # Arrange
+    app = App.instance()
+
+    # Act
+    with pytest.raises(ValueError):
+        # Assert
+        app.set_platform("foo")
+
+# endregion
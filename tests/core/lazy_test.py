@@ -0,0 +1,79 @@
+"""Unit core for the core.lazy file"""
+
+from unittest.mock import MagicMock, patch
+from devops_toolset.core.lazy import LazyObject, lazy_boto3_client
+
+
+# region LazyObject
+
+def test_lazy_object_given_no_access_does_not_create_object():
+    """Given no attribute access, the factory must not be called"""
+
+    # Arrange
+    factory = MagicMock()
+
+    # Act
+    lazy = LazyObject(factory)
+
+    # Assert
+    factory.assert_not_called()
+    assert not lazy.is_created
+
+
+def test_lazy_object_given_several_accesses_creates_object_once():
+    """Given several attribute accesses, the factory must be called once and
+    the attributes of the wrapped object returned"""
+
+    # Arrange
+    factory = MagicMock()
+    factory.return_value.name = "foo"
+    lazy = LazyObject(factory)
+
+    # Act
+    first = lazy.name
+    second = lazy.name
+
+    # Assert
+    factory.assert_called_once()
+    assert first == second == "foo"
+    assert lazy.is_created
+
+
+def test_lazy_object_given_private_attribute_does_not_create_object():
+    """Given a private attribute lookup (introspection), the factory must not
+    be called"""
+
+    # Arrange
+    factory = MagicMock()
+    lazy = LazyObject(factory)
+
+    # Act
+    result = hasattr(lazy, "_is_coroutine")
+
+    # Assert
+    assert not result
+    factory.assert_not_called()
+
+# endregion
+
+
+# region lazy_boto3_client
+
+@patch("importlib.import_module")
+def test_lazy_boto3_client_given_service_creates_client_on_first_use(import_module_mock):
+    """Given a service name, boto3 must be imported and the client created on
+    first use only"""
+
+    # Arrange
+    service_name = "s3"
+
+    # Act
+    client = lazy_boto3_client(service_name)
+    import_module_mock.assert_not_called()
+    client.put_object()
+
+    # Assert
+    import_module_mock.assert_called_once_with("boto3")
+    import_module_mock.return_value.client.assert_called_once_with(service_name)
+
+# endregion
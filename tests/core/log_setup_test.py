@@ -1,7 +1,7 @@
 """Unit core for the log_setup file"""
 
 import logging
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, MagicMock
 import devops_toolset.core.log_setup as sut
 from tests.core.conftest import CoreTestsFixture as Fixture
 
@@ -184,3 +184,73 @@ def test_add_time_rotated_file_handler_given_filepath_adds_handler_to_the_log():
             # Assert
             add_handler_mock.assert_called_once
 # endregion
+
+# region start_queue / stop_queue
+
+
+def test_start_queue_moves_handlers_behind_queue_and_stop_queue_restores_them():
+    """Starting the queue must leave only a queue handler on the root logger and
+    stopping it must flush the records and restore the original handlers"""
+    import logging.handlers
+
+    # Arrange
+    log = logging.getLogger()
+    original_handlers = log.handlers[:]
+    handler = logging.handlers.MemoryHandler(capacity=100)
+    log.handlers = [handler]
+
+    try:
+        # Act
+        sut.start_queue(queue_size=10)
+        queued_handlers = log.handlers[:]
+        log.warning("foo")
+        sut.stop_queue()
+
+        # Assert
+        assert len(queued_handlers) == 1
+        assert isinstance(queued_handlers[0], sut.BoundedQueueHandler)
+        assert log.handlers == [handler]
+        assert [record.getMessage() for record in handler.buffer] == ["foo"]
+    finally:
+        log.handlers = original_handlers
+
+
+def test_bounded_queue_handler_given_full_queue_and_drop_policy_drops_record():
+    """Given a full queue and the drop policy, the record is discarded and
+    counted"""
+    import queue
+
+    # Arrange
+    log_queue = queue.Queue(maxsize=1)
+    handler = sut.BoundedQueueHandler(log_queue, sut.OverflowPolicy.drop)
+    record = logging.LogRecord("foo", logging.INFO, __file__, 1, "foo", None, None)
+
+    # Act
+    handler.enqueue(record)
+    handler.enqueue(record)
+
+    # Assert
+    assert log_queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_bounded_queue_handler_given_full_queue_and_drop_below_warning_policy_drops_info_record():
+    """Given a full queue and the drop_below_warning policy, info records are
+    discarded and warnings wait for room"""
+    import queue
+
+    # Arrange
+    log_queue = MagicMock()
+    log_queue.put_nowait.side_effect = queue.Full
+    handler = sut.BoundedQueueHandler(log_queue, sut.OverflowPolicy.drop_below_warning)
+    info_record = logging.LogRecord("foo", logging.INFO, __file__, 1, "info", None, None)
+    warning_record = logging.LogRecord("foo", logging.WARNING, __file__, 1, "warning", None, None)
+
+    # Act
+    handler.enqueue(info_record)
+    handler.enqueue(warning_record)
+
+    # Assert
+    assert handler.dropped == 1
+    log_queue.put.assert_called_once_with(warning_record)
+# endregion
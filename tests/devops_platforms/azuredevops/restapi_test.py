@@ -224,7 +224,7 @@ def test_get_last_artifact_given_args_when_last_build_id_retrieved_then_calls_ge
     sut.get_last_artifact(organization, project, artifact_name, destination, user_name, access_token)
     # Assert
     get_artifact_mock.assert_called_once_with(organization, project, build_id, artifact_name, destination, user_name,
-                                              access_token)
+                                              access_token, None)
 # endregion get_last_artifact
 
 
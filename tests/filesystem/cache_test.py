@@ -0,0 +1,138 @@
+"""Unit core for the filesystem/cache.py file"""
+
+import json
+import devops_toolset.filesystem.cache as sut
+from unittest.mock import patch
+
+
+def write_file(path, content: bytes):
+    """Writes a file and returns its path as a string"""
+    path.write_bytes(content)
+    return str(path)
+
+
+# region ArtifactCache.put() / get()
+
+
+def test_get_given_cached_file_returns_verified_object(tmp_path):
+    """Given a cached file, returns the path to its content-addressed copy"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"))
+    file_path = write_file(tmp_path / "artifact.zip", b"artifact")
+
+    # Act
+    cache.put("key", file_path, {"etag": "1"})
+    result = cache.get("key")
+
+    # Assert
+    assert result == cache.get_object_path(sut.get_file_sha256(file_path))
+    assert result.read_bytes() == b"artifact"
+    assert cache.get_entry("key")["metadata"] == {"etag": "1"}
+    assert cache.get("other") is None
+
+
+def test_put_given_same_content_twice_stores_it_once(tmp_path):
+    """Given two keys with the same content, stores a single object"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"))
+    file_path = write_file(tmp_path / "artifact.zip", b"artifact")
+
+    # Act
+    cache.put("key1", file_path)
+    cache.put("key2", file_path)
+
+    # Assert
+    assert len(list(cache.objects_path.iterdir())) == 1
+    assert cache.size() == len(b"artifact")
+
+
+@patch("logging.warning")
+def test_get_when_checksum_does_not_match_removes_entry(logging_warning_mock, tmp_path):
+    """Given a cached file, when its content changed, removes it and returns
+    None"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"))
+    object_path = cache.put("key", write_file(tmp_path / "artifact.zip", b"artifact"))
+    object_path.write_bytes(b"corrupted")
+
+    # Act
+    result = cache.get("key")
+
+    # Assert
+    assert result is None
+    assert cache.keys() == []
+    assert not object_path.exists()
+    logging_warning_mock.assert_called_once()
+
+
+def test_put_when_over_max_size_evicts_least_recently_used(tmp_path):
+    """Given a size limit, when a new file does not fit, evicts the least
+    recently used entries"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"), max_size=20)
+    cache.put("old", write_file(tmp_path / "old", b"o" * 10))
+    cache.put("used", write_file(tmp_path / "used", b"u" * 10))
+
+    # Act
+    with patch("time.time", return_value=9999999999):
+        cache.get("old")
+    cache.put("new", write_file(tmp_path / "new", b"n" * 10))
+
+    # Assert
+    assert sorted(cache.keys()) == ["new", "old"]
+    assert cache.size() == 20
+    assert len(list(cache.objects_path.iterdir())) == 2
+
+
+@patch("logging.info")
+def test_get_when_recently_used_does_not_write_the_index(logging_info_mock, tmp_path):
+    """Given a cached file used less than LAST_USED_RESOLUTION seconds ago,
+    returns it without rewriting the index, and never logs the index writes"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"))
+    cache.put("key", write_file(tmp_path / "artifact.zip", b"artifact"))
+    last_used = cache.get_entry("key")["last_used"]
+    logging_info_mock.reset_mock()
+
+    # Act
+    with patch("os.replace") as replace_mock:
+        result = cache.get("key")
+    with patch("time.time", return_value=last_used + sut.LAST_USED_RESOLUTION):
+        cache.get("key")
+
+    # Assert
+    assert result is not None
+    replace_mock.assert_not_called()
+    assert cache.get_entry("key")["last_used"] == last_used + sut.LAST_USED_RESOLUTION
+    logging_info_mock.assert_not_called()
+
+# endregion
+
+# region ArtifactCache.remove()
+
+
+def test_remove_keeps_objects_used_by_other_keys(tmp_path):
+    """Given two keys sharing an object, removing one keeps the object"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"))
+    file_path = write_file(tmp_path / "artifact.zip", b"artifact")
+    cache.put("key1", file_path)
+    object_path = cache.put("key2", file_path)
+
+    # Act
+    cache.remove("key1")
+    kept = object_path.exists()
+    cache.remove("key2")
+
+    # Assert
+    assert kept
+    assert not object_path.exists()
+    assert json.loads(cache.index_path.read_text()) == {}
+
+# endregion
@@ -6,8 +6,125 @@ import pathlib
 import pytest
 from tests.conftest import FileNames as FileNameFixtures
 from tests.filesystem.conftest import Paths
+from devops_toolset.filesystem.cache import ArtifactCache
 from devops_toolset.filesystem.constants import Directions, FileNames
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+import requests
+
+
+def download_response(status_code: int, content: bytes = b"", headers: dict = None):
+    """Creates a streamed requests response"""
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [content]
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+# region download_file_cached()
+
+
+@patch("requests.get")
+def test_download_file_cached_given_cache_miss_downloads_and_caches_file(get_mock, tmp_path):
+    """Given a URL that is not cached, downloads the file and caches it with its validators"""
+
+    # Arrange
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    get_mock.return_value = download_response(200, b"plugin", {"ETag": "\"v1\""})
+
+    # Act
+    result = sut.download_file_cached("https://example.com/plugin.zip", str(tmp_path), cache=cache)
+
+    # Assert
+    assert result == ("plugin.zip", tmp_path / "plugin.zip")
+    assert (tmp_path / "plugin.zip").read_bytes() == b"plugin"
+    assert cache.get_entry("https://example.com/plugin.zip")["metadata"]["etag"] == "\"v1\""
+    assert get_mock.call_args.kwargs["headers"] == {}
+
+
+@patch("requests.get")
+def test_download_file_cached_given_not_modified_copies_cached_file(get_mock, tmp_path):
+    """Given a cached URL that has not changed, revalidates it and copies the cached file"""
+
+    # Arrange
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    (tmp_path / "cached.zip").write_bytes(b"cached")
+    cache.put("https://example.com/theme.zip", str(tmp_path / "cached.zip"),
+              {"etag": "\"v1\"", "last_modified": "Mon, 05 Oct 2026 10:00:00 GMT"})
+    get_mock.return_value = download_response(304)
+
+    # Act
+    sut.download_file_cached("https://example.com/theme.zip", str(tmp_path), "theme.zip", {"Authorization": "a"},
+                             cache)
+
+    # Assert
+    assert (tmp_path / "theme.zip").read_bytes() == b"cached"
+    assert get_mock.call_args.kwargs["headers"] == {"Authorization": "a", "If-None-Match": "\"v1\"",
+                                                    "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT"}
+
+
+@patch("requests.get")
+@pytest.mark.parametrize("offline, immutable", [(True, False), (False, True)])
+def test_download_file_cached_given_offline_or_immutable_hit_does_not_request(get_mock, offline, immutable,
+                                                                              tmp_path):
+    """Given a cached file in offline mode or with an immutable key, copies it without any request"""
+
+    # Arrange
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    (tmp_path / "cached.zip").write_bytes(b"cached")
+    cache.put("key", str(tmp_path / "cached.zip"))
+
+    # Act
+    sut.download_file_cached("https://example.com/a.zip", str(tmp_path), "a.zip", cache=cache, key="key",
+                             immutable=immutable, offline=offline)
+
+    # Assert
+    assert (tmp_path / "a.zip").read_bytes() == b"cached"
+    get_mock.assert_not_called()
+
+
+def test_download_file_cached_given_offline_miss_raises_value_error(tmp_path):
+    """Given a URL that is not cached in offline mode, raises ValueError"""
+
+    # Arrange
+    cache = ArtifactCache(str(tmp_path / "cache"))
+
+    # Act
+    with pytest.raises(ValueError):
+        sut.download_file_cached("https://example.com/a.zip", str(tmp_path), cache=cache, offline=True)
+
+
+@patch("logging.warning")
+@patch("requests.get")
+def test_download_file_cached_given_network_error_falls_back_to_cache(get_mock, warning_mock, tmp_path):
+    """Given a cached URL that cannot be downloaded, copies the cached file and warns"""
+
+    # Arrange
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    (tmp_path / "cached.zip").write_bytes(b"cached")
+    cache.put("https://example.com/a.zip", str(tmp_path / "cached.zip"))
+    get_mock.return_value = download_response(503)
+
+    # Act
+    sut.download_file_cached("https://example.com/a.zip", str(tmp_path), cache=cache)
+
+    # Assert
+    assert (tmp_path / "a.zip").read_bytes() == b"cached"
+    warning_mock.assert_called_once()
+
+
+@patch("devops_toolset.filesystem.paths.download_file")
+def test_download_file_cached_given_no_cache_calls_download_file(download_file_mock, tmp_path):
+    """Given no cache, downloads the file without caching it"""
+
+    # Act
+    sut.download_file_cached("https://example.com/a.zip", str(tmp_path), "a.zip", {"h": "v"})
+
+    # Assert
+    download_file_mock.assert_called_once_with("https://example.com/a.zip", str(tmp_path), "a.zip", {"h": "v"})
+
+# endregion
+
 
 # region files_exist()
 
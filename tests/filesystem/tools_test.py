@@ -174,3 +174,44 @@ def test_update_xml_file_entity_text_parse_file(parse_mock):
 
 
 # endregion update_xml_file_entity_text()
+
+# region write_file_atomically()
+
+
+def test_write_file_atomically_replaces_content_keeping_permissions(tmp_path):
+    """Given an existing file, replaces its content, keeps its permissions and
+    leaves no temporary files behind."""
+
+    # Arrange
+    file_path = tmp_path.joinpath("file.txt")
+    file_path.write_text("old")
+    file_path.chmod(0o600)
+
+    # Act
+    sut.write_file_atomically(str(file_path), "new")
+
+    # Assert
+    assert file_path.read_text() == "new"
+    assert file_path.stat().st_mode & 0o777 == 0o600
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+def test_write_file_atomically_when_write_fails_keeps_old_content(tmp_path):
+    """Given an existing file, when writing fails, keeps the old content and
+    removes the temporary file."""
+
+    # Arrange
+    file_path = tmp_path.joinpath("file.txt")
+    file_path.write_text("old")
+
+    # Act
+    with patch("os.replace", side_effect=OSError):
+        with pytest.raises(OSError):
+            sut.write_file_atomically(str(file_path), "new")
+
+    # Assert
+    assert file_path.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+# endregion write_file_atomically()
@@ -0,0 +1,94 @@
+"""Unit core for the i18n/loader.py file"""
+
+import builtins
+import gettext
+import pytest
+import devops_toolset.i18n.loader as sut
+from devops_toolset.core.app import App
+from unittest.mock import patch
+
+app: App = App.instance()
+
+
+# region get_translation()
+
+def test_get_translation_given_same_language_twice_loads_catalog_once():
+    """Given the same locales path and language twice, the catalog must be
+    loaded only once"""
+
+    # Arrange
+    locales_path = app.settings.locales_path
+
+    # Act
+    with patch.dict(sut._translations, clear=True):
+        with patch.object(sut, "load_catalog", wraps=sut.load_catalog) as load_catalog_mock:
+            first = sut.get_translation(locales_path, "es")
+            second = sut.get_translation(locales_path, "es")
+
+    # Assert
+    load_catalog_mock.assert_called_once_with(locales_path, "es")
+    assert first is second
+
+
+def test_get_translation_given_unknown_language_raises_filenotfounderror():
+    """Given a language without catalog, raises a FileNotFoundError"""
+
+    # Arrange
+    locales_path = app.settings.locales_path
+
+    # Act
+    with patch.dict(sut._translations, clear=True):
+        with pytest.raises(FileNotFoundError):
+            # Assert
+            sut.get_translation(locales_path, "foo")
+
+# endregion
+
+
+# region load_catalog()
+
+def test_load_catalog_given_big_catalog_parses_memory_mapped_file():
+    """Given a catalog bigger than the mmap threshold, it must be parsed from a
+    memory-mapped file with the same result"""
+
+    # Arrange
+    locales_path = app.settings.locales_path
+    expected = sut.load_catalog(locales_path, "en")
+
+    # Act
+    with patch.object(sut, "MMAP_THRESHOLD", 0):
+        with patch.object(sut, "_MappedFile", wraps=sut._MappedFile) as mapped_file_mock:
+            result = sut.load_catalog(locales_path, "en")
+
+    # Assert
+    mapped_file_mock.assert_called_once()
+    assert isinstance(result, gettext.GNUTranslations)
+    assert result._catalog == expected._catalog
+
+# endregion
+
+
+# region set_language()
+
+def test_set_language_given_language_installs_its_translations():
+    """Given a language, its translations must be installed and the settings
+    updated"""
+
+    # Arrange
+    original_language = app.settings.language
+    original_gettext = builtins._
+
+    # Act
+    try:
+        sut.set_language(app.settings, "es")
+        language = app.settings.language
+        installed = builtins._
+    finally:
+        sut.set_language(app.settings, original_language)
+
+    # Assert
+    assert language == "es"
+    assert installed != original_gettext
+    assert installed == sut.get_translation(app.settings.locales_path, "es").gettext
+
+# endregion
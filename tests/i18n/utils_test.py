@@ -91,6 +91,26 @@ def test_compile_po_files_given_path_when_args_not_contain_py_then_calls_subproc
     subprocess_mock.assert_called_once_with(expected_command)
 
 
+@mock.patch.object(tools_cli, "call_subprocess")
+@mock.patch.object(tools_cli, "run_commands")
+def test_compile_po_files_given_parallel_then_runs_commands_in_one_batch(run_commands_mock, subprocess_mock):
+    """ Given parallel, then runs all the msgfmt commands in one batch """
+
+    # Arrange
+    expected_files = ["foo1.po", "foo2.po"]
+    expected_commands = ["msgfmt -o foo1.mo foo1.po", "msgfmt -o foo2.mo foo2.po"]
+
+    with mock.patch.object(sut, "get_files") as file_paths:
+        file_paths.return_value = expected_files
+
+        # Act
+        sut.compile_po_files(parallel=True, max_workers=2)
+
+    # Assert
+    run_commands_mock.assert_called_once_with(expected_commands, max_workers=2)
+    subprocess_mock.assert_not_called()
+
+
 @mock.patch.object(os, "remove")
 def test_compile_po_files_given_path_when_mo_file_exist_then_calls_os_remove(os_remove_mock):
     """ Given a locale path, when a mo file already exists, should remove it first """
@@ -1,6 +1,7 @@
 """Unit core for the apache file"""
 
 import devops_toolset.project_types.aws.get_aws_resources as sut
+import devops_toolset.tools.cli as cli
 import pytest
 from unittest.mock import patch, mock_open
 
@@ -29,4 +30,55 @@ def test_main_given_json_path_should_dump_resources(json_dump_mock, json_loads_m
         json_dump_mock.assert_called_once()
 
 
+@patch("devops_toolset.tools.cli.run_commands")
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+@patch("json.dump")
+def test_main_given_parallel_should_run_commands_in_one_batch(json_dump_mock, call_subprocess_with_result_mock,
+                                                              run_commands_mock):
+    """Given parallel, should run all the commands in one batch and dump their
+    outputs in order"""
+
+    # Arrange
+    json_path = "path/to/json"
+    run_commands_mock.side_effect = lambda commands, max_workers, stop_on_failure: \
+        [cli.CommandResult(command, 0, f"[{index}]") for index, command in enumerate(commands)]
+    m = mock_open()
+
+    # Act
+    with patch("builtins.open", m, create=True):
+        sut.main(json_path, None, parallel=True)
+
+    # Assert
+    call_subprocess_with_result_mock.assert_not_called()
+    resources = json_dump_mock.call_args.args[0]
+    assert list(resources.values()) == [[index] for index in range(len(resources))]
+    assert resources["commit_repositories"] == [0] and resources["iam_roles"] == [len(resources) - 1]
+
+
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.run_commands")
+@patch("json.dump")
+def test_main_given_parallel_when_a_command_fails_should_skip_its_resources(json_dump_mock, run_commands_mock,
+                                                                           logging_error_mock):
+    """Given parallel, when a command fails or is stopped, should log it and
+    dump the resources of the other commands"""
+
+    # Arrange
+    json_path = "path/to/json"
+    run_commands_mock.side_effect = lambda commands, max_workers, stop_on_failure: \
+        [cli.CommandResult(command, 255 if index == 1 else 0, None if index == 1 else "[]")
+         for index, command in enumerate(commands)]
+    m = mock_open()
+
+    # Act
+    with patch("builtins.open", m, create=True):
+        sut.main(json_path, None, parallel=True)
+
+    # Assert
+    resources = json_dump_mock.call_args.args[0]
+    assert "codebuild_projects" not in resources and "commit_repositories" in resources
+    assert run_commands_mock.call_args.kwargs["stop_on_failure"] is False
+    logging_error_mock.assert_called_once()
+
+
 # endregion
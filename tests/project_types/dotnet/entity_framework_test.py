@@ -228,6 +228,69 @@ def test_generate_migration_sql_scripts_for_all_environments_calls_generate_migr
     generate_migration_sql_script_mock.assert_has_calls(expected_calls, any_order=True)
 
 
+@patch("logging.info")
+@mock.patch.object(cli, "run_commands")
+@mock.patch.object(cli, "call_subprocess_with_result")
+@mock.patch.object(utils, "get_appsettings_environments")
+def test_generate_migration_sql_scripts_for_all_environments_given_parallel_then_builds_once(
+        get_appsettings_environments_mock, call_subprocess_with_result_mock, run_commands_mock, logging_info_mock,
+        migrationsdata):
+    """ Given parallel, builds the project with the first migrations list only
+    and runs the rest of the commands in batches without building """
+    # Arrange
+    environments = ["staging", "production"]
+    get_appsettings_environments_mock.return_value = environments
+    call_subprocess_with_result_mock.return_value = migrationsdata.one_migration_and_applied
+    run_commands_mock.side_effect = lambda commands, max_workers, stop_on_failure: \
+        [cli.CommandResult(command, 0, migrationsdata.one_migration_and_applied) for command in commands]
+    scripts_base_path = "my_path/scripts"
+    expected_script_paths = [str(pathlib.Path.joinpath(
+        pathlib.Path(scripts_base_path), f"database-migration-{environment}-from-20220529212512.sql"))
+        for environment in environments]
+
+    # Act
+    result = sut.generate_migration_sql_scripts_for_all_environments(
+        "", scripts_base_path, False, False, True, parallel=True)
+
+    # Assert
+    assert "--no-build" not in call_subprocess_with_result_mock.call_args.args[0]
+    list_commands, script_commands = [c.args[0] for c in run_commands_mock.call_args_list]
+    assert len(list_commands) == 1 and len(script_commands) == 2
+    assert all("--no-build" in command for command in list_commands + script_commands)
+    assert result == expected_script_paths
+
+
+@patch("logging.error")
+@patch("logging.info")
+@mock.patch.object(cli, "run_commands")
+@mock.patch.object(cli, "call_subprocess_with_result")
+@mock.patch.object(utils, "get_appsettings_environments")
+def test_generate_migration_sql_scripts_for_all_environments_given_parallel_when_a_command_fails_then_skips_it(
+        get_appsettings_environments_mock, call_subprocess_with_result_mock, run_commands_mock, logging_info_mock,
+        logging_error_mock, migrationsdata):
+    """ Given parallel, when the migrations of an environment cannot be
+    listed, logs it and returns the scripts of the other environments """
+    # Arrange
+    environments = ["development", "staging", "production"]
+    get_appsettings_environments_mock.return_value = environments
+    call_subprocess_with_result_mock.return_value = None
+    run_commands_mock.side_effect = [
+        [cli.CommandResult("staging", 1), cli.CommandResult("production", 0, migrationsdata.one_migration_and_applied)],
+        [cli.CommandResult("production", 0)]]
+    scripts_base_path = "my_path/scripts"
+
+    # Act
+    result = sut.generate_migration_sql_scripts_for_all_environments(
+        "", scripts_base_path, True, False, True, parallel=True)
+
+    # Assert
+    assert all(c.kwargs["stop_on_failure"] is False for c in run_commands_mock.call_args_list)
+    assert len(run_commands_mock.call_args_list[1].args[0]) == 1
+    assert result == [str(pathlib.Path.joinpath(
+        pathlib.Path(scripts_base_path), "database-migration-production-from-20220529212512.sql"))]
+    assert logging_error_mock.call_count == 2
+
+
 # endregion generate_migration_sql_scripts_for_all_environments()
 
 # region reset_database()
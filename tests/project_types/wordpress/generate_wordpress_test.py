@@ -290,4 +290,22 @@ def test_setup_devops_toolset_given_root_path_then_call_update_devops_toolset(
 # region generate_additional_wpconfig_files
 
 
+@patch("devops_toolset.project_types.wordpress.wp_config.render_environments")
+def test_generate_additional_wpconfig_files_renders_filtered_environments(
+        render_environments_mock, wordpressdata):
+    """ Given additional environments, then renders the wp-config files of
+    those environments only, without moving wp-config.php """
+    # Arrange
+    environments = [dict(wordpressdata.environment_config_aws_cloudfront_false, name="localhost"),
+                    dict(wordpressdata.environment_config_aws_cloudfront_false, name="prod")]
+    passwords = {"prod": "secret"}
+    wordpress_path = wordpressdata.wordpress_path
+    # Act
+    with patch("shutil.move") as move_mock:
+        sut.generate_additional_wpconfig_files({}, environments, ["prod"], passwords, wordpress_path)
+    # Assert
+    render_environments_mock.assert_called_once_with([environments[1]], passwords, wordpress_path, {"prod": []})
+    move_mock.assert_not_called()
+
+
 # endregion
@@ -1,22 +1,105 @@
 """Unit core for the rollback_database file"""
 
+import pytest
 from unittest.mock import patch
 import devops_toolset.project_types.wordpress.rollback_database as sut
 
 
+@pytest.mark.parametrize("database_dump_path", ["dump.sql", "dump.sql.zst"])
+@patch("devops_toolset.project_types.wordpress.wp_dump.import_database")
 @patch("devops_toolset.project_types.wordpress.wp_cli.import_database")
 @patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
-def test_main(reset_database, import_database):
-    """Given arguments, then calls all needed WP CLI commands."""
+def test_main_given_dump_file_then_streams_it_into_the_database(reset_database, import_database,
+                                                                stream_import_database, database_dump_path):
+    """Given a plain or compressed dump, then imports it with
+    wp_dump.import_database."""
 
     # Arrange
-    wordpress_path = ""
-    database_dump_path = ""
-    quiet = True
+    wordpress_path = "wordpress"
 
     # Act
-    sut.main(wordpress_path, database_dump_path, quiet)
+    result = sut.main(wordpress_path, database_dump_path, True)
 
     # Assert
-    reset_database.assert_called()
-    import_database.assert_called()
+    assert result
+    reset_database.assert_called_once_with(wordpress_path, True, False)
+    stream_import_database.assert_called_once_with(wordpress_path, database_dump_path, False)
+    import_database.assert_not_called()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.restore_stage_chain")
+@patch("devops_toolset.project_types.wordpress.wp_dump.get_stage_chain")
+@patch("devops_toolset.project_types.wordpress.wp_cli.import_database")
+@patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
+def test_main_given_stage_then_restores_its_chain_of_dumps(reset_database, import_database, get_stage_chain,
+                                                          restore_stage_chain):
+    """Given a differentially dumped stage, then rebuilds it from its base and
+    delta dumps."""
+
+    # Arrange
+    chain = [{"stage": "core", "file": "core.sql", "base": True, "dropped": []}]
+    get_stage_chain.return_value = chain
+
+    # Act
+    sut.main("wordpress", "database", True, stage="theme")
+
+    # Assert
+    get_stage_chain.assert_called_once_with("database", "theme")
+    reset_database.assert_called_once_with("wordpress", True, False)
+    restore_stage_chain.assert_called_once_with("wordpress", ".", chain, False)
+    import_database.assert_not_called()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_table_dump.import_tables")
+@patch("devops_toolset.project_types.wordpress.wp_cli.import_database")
+@patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
+def test_main_given_table_dump_directory_then_imports_tables_concurrently(reset_database, import_database,
+                                                                         import_tables, tmp_path):
+    """Given a table by table dump directory, then imports its tables with
+    wp_table_dump.import_tables."""
+
+    # Arrange
+    (tmp_path / "tables-manifest.json").write_text("{}")
+
+    # Act
+    sut.main("wordpress", str(tmp_path), True, max_workers=8)
+
+    # Assert
+    reset_database.assert_called_once_with("wordpress", True, False)
+    import_tables.assert_called_once_with("wordpress", str(tmp_path), 8, False)
+    import_database.assert_not_called()
+
+
+@pytest.mark.parametrize("dump_type", ["tables", "stage", "compressed", "plain"])
+@patch("logging.error")
+@patch("devops_toolset.project_types.wordpress.wp_table_dump.import_tables")
+@patch("devops_toolset.project_types.wordpress.wp_dump.restore_stage_chain")
+@patch("devops_toolset.project_types.wordpress.wp_dump.import_database")
+@patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
+def test_main_when_import_fails_then_logs_it_and_returns_false(reset_database, import_database, restore_stage_chain,
+                                                               import_tables, logging_error, dump_type, tmp_path):
+    """Given a dump whose import fails, then logs the error and returns False,
+    so the rollback exits with a non-zero code."""
+
+    # Arrange
+    import_tables.return_value = None
+    restore_stage_chain.return_value = False
+    import_database.return_value = None
+    database_dump_path = str(tmp_path / "dump.sql.gz")
+    stage = None
+    if dump_type == "tables":
+        (tmp_path / "tables-manifest.json").write_text("{}")
+        database_dump_path = str(tmp_path)
+    elif dump_type == "plain":
+        database_dump_path = str(tmp_path / "dump.sql")
+    elif dump_type == "stage":
+        (tmp_path / "dumps-manifest.json").write_text(
+            '{"stages": [{"stage": "core", "file": "core.sql", "base": true, "dropped": []}]}')
+        database_dump_path, stage = str(tmp_path), "core"
+
+    # Act
+    result = sut.main("wordpress", database_dump_path, True, stage=stage)
+
+    # Assert
+    assert result is False
+    logging_error.assert_called_once()
@@ -1,12 +1,15 @@
 """Unit core for the wordpress.wp_cli file"""
+import json
+import os
 import pytest
 import devops_toolset.project_types.wordpress.wp_cli as sut
+import devops_toolset.tools.cli as cli
 from devops_toolset.core.app import App
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
 from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
-from unittest.mock import patch, ANY
+from unittest.mock import patch, ANY, call
 
 app: App = App()
 literals = LiteralsCore([WordpressLiterals])
@@ -119,6 +122,118 @@ def test_add_update_option_should_update_permalinks_when_structure_is_updated(
 
 # endregion
 
+# region add_update_options
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_add_update_options_runs_one_eval_file_with_all_options(call_subprocess_with_result_mock, wordpressdata):
+    """Given options, should pass all of them to a single wp eval-file call
+    and return the result of every option"""
+
+    # Arrange
+    options = [wordpressdata.wp_option, {"name": "blog_public", "value": 0, "autoload": True}]
+    wordpress_path = wordpressdata.wordpress_path
+    passed = {}
+    expected_results = [{"name": "permalink_structure", "result": "updated", "message": "rewrite rules flushed"},
+                        {"name": "blog_public", "result": "added", "message": ""}]
+
+    def eval_file(command):
+        with open(command[3]) as options_file:
+            passed["options"] = json.load(options_file)
+        passed["command"] = command
+        return "Notice: something\n" + json.dumps(expected_results) + "\n"
+
+    call_subprocess_with_result_mock.side_effect = eval_file
+
+    # Act
+    result = sut.add_update_options(options, wordpress_path)
+
+    # Assert
+    call_subprocess_with_result_mock.assert_called_once()
+    assert passed["command"][:3] == ["wp", "eval-file", str(sut.php_scripts_path.joinpath("options-upsert.php"))]
+    assert passed["command"][4:] == ["1", f"--path={wordpress_path}"]
+    assert passed["options"][1] == {"name": "blog_public", "value": "0", "autoload": True}
+    assert not os.path.exists(passed["command"][3])
+    assert result == expected_results
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_add_update_options_when_no_json_output_returns_error_results(call_subprocess_with_result_mock, wordpressdata):
+    """Given options, when the script does not print its results, should
+    return an error result for every option"""
+
+    # Arrange
+    options = [wordpressdata.wp_option]
+    call_subprocess_with_result_mock.return_value = None
+
+    # Act
+    result = sut.add_update_options(options, wordpressdata.wordpress_path)
+
+    # Assert
+    assert result == [{"name": "permalink_structure", "result": "error", "message": ""}]
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_add_update_options_given_snapshot_skips_unchanged_options(call_subprocess_with_result_mock, wordpressdata):
+    """Given an options snapshot, should not send the options that already
+    have their value to WP-CLI and should update the snapshot with the
+    written ones"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    options = [{"name": "blogname", "value": "Site", "autoload": True},
+               {"name": "blog_public", "value": 0, "autoload": True}]
+    passed = {}
+
+    def eval_file(command):
+        with open(command[3]) as options_file:
+            passed["options"] = json.load(options_file)
+        return json.dumps([{"name": "blog_public", "result": "updated", "message": ""}])
+
+    call_subprocess_with_result_mock.side_effect = eval_file
+    snapshots = {sut.pathlib.Path(wordpress_path).as_posix(): {"blogname": ("Site", True),
+                                                                 "blog_public": ("1", True)}}
+
+    # Act
+    with patch.dict(sut._options_snapshots, snapshots, clear=True):
+        result = sut.add_update_options(options, wordpress_path)
+        snapshot = dict(sut._options_snapshots[sut.pathlib.Path(wordpress_path).as_posix()])
+
+    # Assert
+    assert [option["name"] for option in passed["options"]] == ["blog_public"]
+    assert result == [{"name": "blogname", "result": "unchanged", "message": ""},
+                      {"name": "blog_public", "result": "updated", "message": ""}]
+    assert snapshot["blog_public"] == ("0", True)
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_add_update_options_given_snapshot_when_all_unchanged_does_not_call_wp_cli(
+        call_subprocess_with_result_mock, wordpressdata):
+    """Given an options snapshot, when every option already has its value,
+    should not run WP-CLI at all"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    options = [{"name": "blogname", "value": "Site", "autoload": False}]
+    snapshots = {sut.pathlib.Path(wordpress_path).as_posix(): {"blogname": ("Site", True)}}
+
+    # Act
+    with patch.dict(sut._options_snapshots, snapshots, clear=True):
+        result = sut.add_update_options(options, wordpress_path)
+
+    # Assert
+    call_subprocess_with_result_mock.assert_not_called()
+    assert result == [{"name": "blogname", "result": "unchanged", "message": ""}]
+
+
+def test_options_upsert_php_script_is_shipped():
+    """The php script run by add_update_options must exist"""
+
+    # Assert
+    assert sut.php_scripts_path.joinpath("options-upsert.php").is_file()
+
+# endregion
+
 # region add_database_option
 
 
@@ -174,6 +289,28 @@ def test_add_database_option_when_not_exists_calls_add_function(
 
 # endregion
 
+# region update_database_option()
+
+
+@patch("devops_toolset.tools.cli.call_subprocess")
+@patch("devops_toolset.project_types.wordpress.wp_cli.check_if_option_exists")
+def test_update_database_option_given_empty_value_then_passes_it_as_an_argument(check_if_option_exists_mock,
+                                                                                call_subprocess_mock):
+    """Given an empty option value, passes it as an (empty) argument, so WP-CLI
+    does not read the value from stdin"""
+
+    # Arrange
+    check_if_option_exists_mock.return_value = (True, "Just another WordPress site")
+
+    # Act
+    sut.update_database_option("blogdescription", "", "wordpress", False)
+
+    # Assert
+    assert call_subprocess_mock.call_args.args[0] == ["wp", "option", "update", "blogdescription", "", "--autoload=no",
+                                                      "--path=wordpress"]
+
+# endregion
+
 # region check_if_option_exists
 
 
@@ -203,6 +340,159 @@ def test_check_if_option_exists_returns_boolean(
     # Assert
     assert result == expected
 
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+@pytest.mark.parametrize("option_name, expected", [
+    ("blogname", (True, "Site")),
+    ("foo", (False, None))
+])
+def test_check_if_option_exists_given_snapshot_answers_from_it(
+        call_subprocess_with_result_mock, option_name, expected, wordpressdata):
+    """Given an options snapshot, must answer from it without running WP-CLI"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    snapshots = {sut.pathlib.Path(wordpress_path).as_posix(): {"blogname": ("Site", True)}}
+
+    # Act
+    with patch.dict(sut._options_snapshots, snapshots, clear=True):
+        result = sut.check_if_option_exists(option_name, wordpress_path, False)
+
+    # Assert
+    call_subprocess_with_result_mock.assert_not_called()
+    assert result == expected
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_check_if_option_exists_given_snapshot_when_option_written_checks_again(
+        call_subprocess_with_result_mock, wordpressdata):
+    """Given an options snapshot, when the option was written after the
+    snapshot, must run WP-CLI and refresh the snapshot"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    key = sut.pathlib.Path(wordpress_path).as_posix()
+    call_subprocess_with_result_mock.return_value = "New\n"
+
+    # Act
+    with patch.dict(sut._options_snapshots, {key: {"blogname": None}}, clear=True):
+        result = sut.check_if_option_exists("blogname", wordpress_path, False)
+        snapshot = dict(sut._options_snapshots[key])
+
+    # Assert
+    call_subprocess_with_result_mock.assert_called_once()
+    assert result == (True, "New")
+    assert snapshot["blogname"] == ("New", None)
+
+# endregion
+
+# region load_options_snapshot()
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_load_options_snapshot_lists_options_once(call_subprocess_with_result_mock, wordpressdata):
+    """Given a WordPress path, must list the options with a single WP-CLI
+    call and index them by name"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    call_subprocess_with_result_mock.return_value = json.dumps([
+        {"option_name": "blogname", "option_value": "Site", "autoload": "yes"},
+        {"option_name": "cron", "option_value": "x", "autoload": "off"}])
+
+    # Act
+    with patch.dict(sut._options_snapshots, clear=True):
+        result = sut.load_options_snapshot(wordpress_path)
+        stored = sut._options_snapshots.get(sut.pathlib.Path(wordpress_path).as_posix())
+
+    # Assert
+    call_subprocess_with_result_mock.assert_called_once_with(
+        ["wp", "option", "list", "--format=json", "--fields=option_name,option_value,autoload",
+         f"--path={wordpress_path}"])
+    assert result == {"blogname": ("Site", True), "cron": ("x", False)}
+    assert stored is result
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_load_options_snapshot_when_no_json_output_discards_snapshot(call_subprocess_with_result_mock, wordpressdata):
+    """Given a WordPress path, when the options cannot be listed, must
+    discard the existing snapshot and return None"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    key = sut.pathlib.Path(wordpress_path).as_posix()
+    call_subprocess_with_result_mock.return_value = None
+
+    # Act
+    with patch.dict(sut._options_snapshots, {key: {}}, clear=True):
+        result = sut.load_options_snapshot(wordpress_path)
+        stored = key in sut._options_snapshots
+
+    # Assert
+    assert result is None
+    assert not stored
+
+# endregion
+
+# region invalidate_options_snapshot()
+
+@patch("devops_toolset.tools.cli.call_subprocess")
+def test_invalidate_options_snapshot_when_database_reset_discards_snapshot(call_subprocess_mock, wordpressdata):
+    """Given a snapshot, when the database is reset, the snapshot of that
+    path must be discarded"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    snapshots = {sut.pathlib.Path(wordpress_path).as_posix(): {}, "/other": {}}
+
+    # Act
+    with patch.dict(sut._options_snapshots, snapshots, clear=True):
+        sut.reset_database(wordpress_path, True, False)
+        remaining = list(sut._options_snapshots)
+
+    # Assert
+    assert remaining == ["/other"]
+
+
+def test_invalidate_options_snapshot_given_no_path_discards_all():
+    """Given no path, every snapshot must be discarded"""
+
+    # Act
+    with patch.dict(sut._options_snapshots, {"/one": {}, "/other": {}}, clear=True):
+        sut.invalidate_options_snapshot()
+        remaining = list(sut._options_snapshots)
+
+    # Assert
+    assert remaining == []
+
+# endregion
+
+# region wordpress_is_downloaded()
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+@patch("devops_toolset.project_types.wordpress.wp_core.get_version")
+@pytest.mark.parametrize("version, fallback, fallback_version, expected, calls", [
+    (sut.wp_core.WordPressVersion({"wp_version": "6.4.2"}), True, None, True, 0),
+    (None, False, "6.4.2\n", False, 0),
+    (None, True, "6.4.2\n", True, 1),
+    (None, True, None, False, 1)
+])
+def test_wordpress_is_downloaded_runs_wp_cli_only_as_fallback(
+        get_version_mock, call_subprocess_with_result_mock, version, fallback, fallback_version, expected, calls,
+        wordpressdata):
+    """Given a path, must check the core files and run wp core version only
+    if they are not found and the fallback is requested"""
+
+    # Arrange
+    get_version_mock.return_value = version
+    call_subprocess_with_result_mock.return_value = fallback_version
+
+    # Act
+    result = sut.wordpress_is_downloaded(wordpressdata.wordpress_path, fallback)
+
+    # Assert
+    assert result == expected
+    assert call_subprocess_with_result_mock.call_count == calls
+
 # endregion
 
 # region check_if_option_is_valid
@@ -254,11 +544,11 @@ def test_convert_wp_parameter_autoload(value, expected):
 
 
 @pytest.mark.parametrize("value, expected", [
-    ("user", "--dbuser=\"user\""),
+    ("user", "--dbuser=user"),
     ("", ""),
     (None, "")])
 def test_convert_wp_parameter_db_user(value, expected):
-    """When not None or "", returns a --dbuser="value"."""
+    """When not None or "", returns a --dbuser=value."""
 
     # Arrange
 
@@ -274,11 +564,11 @@ def test_convert_wp_parameter_db_user(value, expected):
 
 
 @pytest.mark.parametrize("value, expected", [
-    ("password", "--dbpass=\"password\""),
+    ("password", "--dbpass=password"),
     ("", ""),
     (None, "")])
 def test_convert_wp_parameter_db_pass(value, expected):
-    """When not None or "", returns a --dbpass="value"."""
+    """When not None or "", returns a --dbpass=value."""
 
     # Arrange
 
@@ -313,7 +603,7 @@ def test_convert_wp_parameter_activate(value, expected):
 
 @pytest.mark.parametrize(
     "value, expected",
-    [("my-admin-password", "--admin_password=" + "\"" + "my-admin-password" + "\""),
+    [("my-admin-password", "--admin_password=my-admin-password"),
      ("", "")])
 def test_convert_wp_parameter_admin_password_when_admin_pass_then_return_admin_pass_parameter(
         value, expected):
@@ -473,6 +763,141 @@ def test_convert_wp_parameter_yes(value, expected):
 
 # endregion
 
+# region check_database_connection()
+
+
+@pytest.mark.parametrize("output, expected", [("1", True), (None, False)])
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_check_database_connection_given_query_output_then_returns_if_connected(call_subprocess_with_result_mock,
+                                                                                logging_error_mock, output, expected):
+    """Given the output of a trivial query, then returns True if the database
+    answered it, and logs an error otherwise"""
+
+    # Arrange
+    call_subprocess_with_result_mock.return_value = output
+
+    # Act
+    result = sut.check_database_connection("wordpress", False)
+
+    # Assert
+    assert result == expected
+    assert call_subprocess_with_result_mock.call_args.args[0] == \
+        ["wp", "db", "query", "SELECT 1", "--skip-column-names", "--path=wordpress"]
+    assert logging_error_mock.called != expected
+
+# endregion
+
+# region create_users()
+
+
+@patch("logging.info")
+@patch("logging.warning")
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_create_users_lists_logins_once_and_creates_missing_users_in_one_eval_file(
+        call_subprocess_with_result_mock, logging_warning_mock, logging_info_mock, wordpressdata):
+    """Given users, should list the existing logins once, create the missing
+    users with a single wp eval-file call, report every user in order and
+    log the password of the created ones"""
+
+    # Arrange
+    users = [{"user_login": login, "user_email": f"{login}@example.com", "role": "editor", "display_name": "",
+              "first_name": "", "last_name": "", "send_email": False} for login in ["admin", "ann", "bob", "ann"]]
+    wordpress_path = wordpressdata.wordpress_path
+    passed = {}
+
+    def call_subprocess_with_result(command):
+        if command[:3] == ["wp", "user", "list"]:
+            return json.dumps([{"user_login": "admin"}])
+        with open(command[3]) as users_file:
+            passed["users"] = json.load(users_file)
+        passed["command"] = command
+        return json.dumps([{"user_login": "ann", "result": "created", "message": "", "password": "s3cr3t"},
+                           {"user_login": "bob", "result": "error", "message": "Invalid email"}])
+
+    call_subprocess_with_result_mock.side_effect = call_subprocess_with_result
+
+    # Act
+    result = sut.create_users(users, wordpress_path, False)
+
+    # Assert
+    assert call_subprocess_with_result_mock.call_count == 2
+    assert passed["command"][:3] == ["wp", "eval-file", str(sut.php_scripts_path.joinpath("users-create.php"))]
+    assert [user["user_login"] for user in passed["users"]] == ["ann", "bob"]
+    assert [(user["user_login"], user["result"]) for user in result] == \
+        [("admin", "exists"), ("ann", "created"), ("bob", "error"), ("ann", "exists")]
+    assert result[1]["password"] == "s3cr3t"
+    logging_info_mock.assert_any_call(literals.get("wp_wpcli_user_password").format(password="s3cr3t"))
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_create_users_when_no_json_output_returns_error_results(call_subprocess_with_result_mock, wordpressdata):
+    """Given users, when the script does not print its results, should
+    return an error result for every user to be created"""
+
+    # Arrange
+    users = [{"user_login": "ann", "user_email": "ann@example.com"}]
+    call_subprocess_with_result_mock.return_value = None
+
+    # Act
+    result = sut.create_users(users, wordpressdata.wordpress_path, False)
+
+    # Assert
+    assert result == [{"user_login": "ann", "result": "error", "message": ""}]
+
+# endregion
+
+# region delete_post_type_content()
+
+
+@patch("logging.info")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_delete_post_type_content_given_post_type_deletes_in_batches_and_logs_progress(pipe_subprocess_mock,
+                                                                                       logging_info_mock):
+    """Given a post type, runs posts-delete.php with the batch size, logs the
+    progress of every batch (even split across chunks) and returns the
+    deleted posts"""
+
+    # Arrange
+    def pipe_subprocess(command, stdout_handler):
+        for chunk in [b'{"deleted": 500, "fai', b'led": 0}\n{"deleted": 1000, "failed": 0}\n',
+                      b'{"deleted": 1234, "failed": 0}\n']:
+            stdout_handler(chunk)
+        return 0, b""
+
+    pipe_subprocess_mock.side_effect = pipe_subprocess
+
+    # Act
+    result = sut.delete_post_type_content("wordpress", "product", batch_size=500)
+
+    # Assert
+    assert result == 1234
+    assert pipe_subprocess_mock.call_args.args[0] == cli.build_argv(
+        commands.get("wpcli_eval_file"), file=str(sut.php_scripts_path.joinpath("posts-delete.php")),
+        args=["product", "500"], path="wordpress", debug_info="")
+    progress = literals.get("wp_wpcli_post_delete_post_type_progress")
+    logging_info_mock.assert_has_calls([call(progress.format(post_type="product", deleted=deleted))
+                                        for deleted in [500, 1000, 1234]])
+
+
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_delete_post_type_content_when_process_fails_logs_error(pipe_subprocess_mock, logging_error_mock):
+    """Given a deletion that fails, logs the error and returns None"""
+
+    # Arrange
+    pipe_subprocess_mock.return_value = (255, b"Error: Error establishing a database connection.")
+
+    # Act
+    result = sut.delete_post_type_content("wordpress", "post")
+
+    # Assert
+    assert result is None
+    logging_error_mock.assert_called_with(
+        literals.get("wp_wpcli_post_delete_post_type_err").format(post_type="post"))
+
+# endregion
+
 # region import_database()
 
 
@@ -489,9 +914,99 @@ def test_import_database(call_subprocess, wordpressdata):
     sut.import_database(wordpress_path, dump_file_path, debug)
 
     # Assert
-    call_subprocess.assert_called_once_with(commands.get("wpcli_db_import").format(
+    call_subprocess.assert_called_once_with(cli.build_argv(commands.get("wpcli_db_import"),
         file=dump_file_path, path=wordpress_path, debug_info=sut.convert_wp_parameter_debug(debug)),
-        log_before_process=ANY, log_after_err=ANY)
+        log_before_process=ANY, log_after_err=ANY, stream=True)
+
+# endregion
+
+# region install_plugins()
+
+
+def __plugin_install_stand_in(*processes):
+    """Stands in for wp plugin install, writing the stdout and returning the
+    return code and stderr of every process in turn."""
+    processes = iter(processes)
+
+    def pipe_subprocess(command, stdout_handler):
+        out, returncode, err = next(processes)
+        stdout_handler(out)
+        return returncode, err
+
+    return pipe_subprocess
+
+
+@patch("logging.log")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_install_plugins_given_plugins_then_groups_them_by_flags(pipe_subprocess_mock, logging_log_mock,
+                                                                 wordpressdata):
+    """Given plugins, installs the ones with the same activate and force flags
+    in the same process and logs its output"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    plugins = [{"name": "a", "source": "a.zip", "activate": True, "force": True},
+               {"name": "b", "source": "b", "activate": False, "force": True},
+               {"name": "c", "source": "c.zip", "activate": True, "force": True}]
+    pipe_subprocess_mock.side_effect = __plugin_install_stand_in((b"Installing a.zip\nInstalling c.zip\n"
+                                                                  b"Success: Installed 2 of 2 plugins.\n", 0, b""),
+                                                                 (b"Success: Installed 1 of 1 plugins.\n", 0, b""))
+
+    # Act
+    result = sut.install_plugins(plugins, wordpress_path, False)
+
+    # Assert
+    assert result == {"a": True, "c": True, "b": True}
+    assert [call.args[0] for call in pipe_subprocess_mock.call_args_list] == [
+        cli.build_argv(commands.get("wpcli_plugin_install"), path=wordpress_path, activate="--activate",
+                       force="--force", source=["a.zip", "c.zip"], debug_info=""),
+        cli.build_argv(commands.get("wpcli_plugin_install"), path=wordpress_path, activate="",
+                       force="--force", source=["b"], debug_info="")]
+    assert [c.args[1] for c in logging_log_mock.call_args_list][:3] == \
+        ["Installing a.zip", "Installing c.zip", "Success: Installed 2 of 2 plugins."]
+
+
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_install_plugins_given_failed_process_then_checks_every_plugin(pipe_subprocess_mock,
+                                                                         call_subprocess_with_result, logging_error,
+                                                                         wordpressdata):
+    """Given a process that did not install every plugin, logs its stderr and
+    reports each one from the installed plugins list"""
+
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    plugins = [{"name": "a", "source": "a.zip", "activate": True, "force": False},
+               {"name": "b", "source": "b.zip", "activate": True, "force": False},
+               {"name": "c", "source": "c.zip", "activate": True, "force": False}]
+    pipe_subprocess_mock.side_effect = __plugin_install_stand_in(
+        (b"Plugin installed successfully.\n", 1, b"Error: Only installed 2 of 3 plugins."))
+    call_subprocess_with_result.return_value = '[{"name":"a","status":"active"},{"name":"b","status":"inactive"}]'
+
+    # Act
+    result = sut.install_plugins(plugins, wordpress_path, False)
+
+    # Assert
+    assert result == {"a": True, "b": False, "c": False}
+    assert logging_error.call_args_list[0] == call("Error: Only installed 2 of 3 plugins.")
+    assert logging_error.call_count == 3
+
+
+@pytest.mark.parametrize("output, expected", [
+    ("Installing...\nSuccess: Installed 3 of 3 plugins.", (3, 3)),
+    ("Error: Only installed 1 of 2 plugins.", (1, 2)),
+    ("Warning: Plugin already installed.", None),
+    (None, None)
+])
+def test_parse_plugin_install_summary(output, expected):
+    """Given wp plugin install output, returns the installed and requested plugins"""
+
+    # Act
+    result = sut.parse_plugin_install_summary(output)
+
+    # Assert
+    assert result == expected
 
 # endregion
 
@@ -511,7 +1026,7 @@ def test_reset_database(call_subprocess, wordpressdata):
     sut.reset_database(wordpress_path, quiet, debug)
 
     # Assert
-    call_subprocess.assert_called_once_with(commands.get("wpcli_db_reset").format(
+    call_subprocess.assert_called_once_with(cli.build_argv(commands.get("wpcli_db_reset"),
         path=wordpress_path, yes=sut.convert_wp_parameter_yes(quiet), debug_info=sut.convert_wp_parameter_debug(debug)),
         log_before_process=ANY, log_after_err=ANY)
 
@@ -548,7 +1063,8 @@ def test_wp_cli_info(call_subprocess):
     sut.wp_cli_info()
     # Assert
     call_subprocess.assert_called_once_with(
-        commands.get(info_command), log_before_out=log_before_literals, log_after_out=log_after_literals)
+        cli.build_argv(commands.get(info_command)),
+        log_before_out=log_before_literals, log_after_out=log_after_literals)
 
 # endregion
 
@@ -0,0 +1,122 @@
+"""Unit core for the wordpress.wp_config file"""
+
+import pytest
+import devops_toolset.project_types.wordpress.wp_config as sut
+from devops_toolset.core.app import App
+
+app: App = App.instance()
+
+ENVIRONMENT_CONFIG = {
+    "name": "localhost",
+    "database": {"host": "localhost", "db_name": "wp", "db_user": "user", "table_prefix": "wp_",
+                 "charset": "utf8mb4", "collate": ""},
+    "wp_config": {
+        "site_url": {"name": "WP_SITEURL", "type": "constant", "value": "http://localhost"},
+        "debug": {"name": "WP_DEBUG", "type": "constant", "value": True},
+        "empty_trash_days": {"name": "EMPTY_TRASH_DAYS", "type": "constant", "value": 5},
+        "var": {"name": "custom", "type": "variable", "value": "it's"}
+    },
+    "settings": {}
+}
+
+# region php_value()
+
+
+@pytest.mark.parametrize("value, raw, expected", [
+    ("value", None, "'value'"),
+    ("it's a \\ path", None, "'it\\'s a \\\\ path'"),
+    ("", None, "''"),
+    (True, None, "true"),
+    (False, None, "false"),
+    (5, None, "5"),
+    (None, None, "null"),
+    ("true", None, "'true'"),
+    ("WP_DEBUG", True, "WP_DEBUG")
+])
+def test_php_value_returns_php_literal(value, raw, expected):
+    """Given a value, returns its PHP literal, quoting only strings unless
+    raw is set"""
+
+    # Act
+    result = sut.php_value(value, raw)
+
+    # Assert
+    assert result == expected
+
+# endregion
+
+# region render()
+
+
+def test_render_given_environment_renders_whole_file():
+    """Given an environment configuration, renders database settings, salts,
+    properties and snippets before the wp-settings.php require"""
+
+    # Arrange
+    salts = {name: "salt" for name in sut.SALT_NAMES}
+
+    # Act
+    result = sut.render(ENVIRONMENT_CONFIG, "pass'word", ["// snippet"], salts)
+
+    # Assert
+    assert result.startswith("<?php\n")
+    assert "define( 'DB_NAME', 'wp' );" in result
+    assert "define( 'DB_PASSWORD', 'pass\\'word' );" in result
+    assert "define( 'DB_CHARSET', 'utf8mb4' );" in result
+    assert "define( 'NONCE_SALT', 'salt' );" in result
+    assert "$table_prefix = 'wp_';" in result
+    assert "define( 'WP_SITEURL', 'http://localhost' );" in result
+    assert "define( 'EMPTY_TRASH_DAYS', 5 );" in result
+    assert "$custom = 'it\\'s';" in result
+    assert result.count("'WP_DEBUG'") == 1
+    assert result.index("// snippet") < result.index("/* That's all, stop editing!") \
+        < result.index("require_once ABSPATH . 'wp-settings.php';")
+
+
+def test_render_without_salts_generates_new_ones():
+    """Given no salts, generates different random salts for every file"""
+
+    # Act
+    first = sut.render(ENVIRONMENT_CONFIG, "password")
+    second = sut.render(ENVIRONMENT_CONFIG, "password")
+
+    # Assert
+    assert first != second
+
+
+def test_generate_salts_returns_all_salts():
+    """Generates every key and salt with the WP-CLI length and characters"""
+
+    # Act
+    result = sut.generate_salts()
+
+    # Assert
+    assert list(result) == sut.SALT_NAMES
+    assert all(len(salt) == sut.SALT_LENGTH and set(salt) <= set(sut.SALT_CHARACTERS) for salt in result.values())
+
+# endregion
+
+# region render_environments()
+
+
+def test_render_environments_writes_a_file_per_environment(tmp_path):
+    """Given environments, writes a wp-config-<environment>.php file for each
+    one with its own password and snippets"""
+
+    # Arrange
+    environments = [ENVIRONMENT_CONFIG, dict(ENVIRONMENT_CONFIG, name="prod")]
+    passwords = {"localhost": "local-password", "prod": "prod-password"}
+
+    # Act
+    result = sut.render_environments(environments, passwords, str(tmp_path), {"prod": ["// prod snippet"]})
+
+    # Assert
+    assert result == {"localhost": str(tmp_path / "wp-config-localhost.php"),
+                      "prod": str(tmp_path / "wp-config-prod.php")}
+    prod_content = (tmp_path / "wp-config-prod.php").read_text()
+    assert "'prod-password'" in prod_content
+    assert "// prod snippet" in prod_content
+    assert "// prod snippet" not in (tmp_path / "wp-config-localhost.php").read_text()
+    assert not (tmp_path / "wp-config.php").exists()
+
+# endregion
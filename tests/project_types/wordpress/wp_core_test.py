@@ -0,0 +1,125 @@
+"""Unit core for the wordpress.wp_core file"""
+
+import pytest
+import devops_toolset.project_types.wordpress.wp_core as sut
+from devops_toolset.core.app import App
+from unittest.mock import patch
+
+app: App = App.instance()
+
+VERSION_FILE_CONTENT = """<?php
+/**
+ * WordPress Version
+ *
+ * Contains version information for the current WordPress release.
+ */
+
+/**
+ * The WordPress version string.
+ *
+ * @global string $wp_version
+ */
+$wp_version = '6.4.2';
+
+/**
+ * Holds the WordPress DB revision, increments when changes are made to the WordPress DB schema.
+ *
+ * @global int $wp_db_version
+ */
+$wp_db_version = 56657;
+
+$tinymce_version = '49110-20201110';
+
+$required_php_version = '7.0.0';
+
+$required_mysql_version = '5.0';
+
+$wp_local_package = 'es_ES';
+"""
+
+
+@pytest.fixture
+def core_path(tmp_path):
+    """Creates the layout of a WordPress core"""
+
+    for file in sut.CORE_FILES:
+        tmp_path.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file).write_text("<?php\n")
+    tmp_path.joinpath(sut.VERSION_FILE).write_text(VERSION_FILE_CONTENT)
+    return tmp_path
+
+# region get_version()
+
+
+def test_get_version_given_core_files_returns_version_info(core_path):
+    """Given a WordPress core, returns the information of version.php"""
+
+    # Act
+    result = sut.get_version(str(core_path))
+
+    # Assert
+    assert result.version == "6.4.2"
+    assert result.db_version == 56657
+    assert result.required_php_version == "7.0.0"
+    assert result.required_mysql_version == "5.0"
+    assert result.local_package == "es_ES"
+
+
+@pytest.mark.parametrize("missing_file", sut.CORE_FILES)
+def test_get_version_when_core_file_missing_returns_none(core_path, missing_file):
+    """Given a path, when any core file is missing, returns None"""
+
+    # Arrange
+    core_path.joinpath(missing_file).unlink()
+
+    # Act
+    result = sut.get_version(str(core_path))
+
+    # Assert
+    assert result is None
+
+
+def test_get_version_when_no_version_returns_none(core_path):
+    """Given a WordPress core, when version.php has no $wp_version, returns
+    None"""
+
+    # Arrange
+    core_path.joinpath(sut.VERSION_FILE).write_text("<?php\n$wp_db_version = 1;\n")
+
+    # Act
+    result = sut.get_version(str(core_path))
+
+    # Assert
+    assert result is None
+
+# endregion
+
+# region resolve_version()
+
+
+@pytest.mark.parametrize("version, offline, expected", [
+    ("6.3", False, "6.3"),
+    ("latest", False, "6.5"),
+    ("latest", True, "6.10.1")
+])
+def test_resolve_version_given_latest_asks_api_or_cache(version, offline, expected, tmp_path):
+    """Given a version, returns it if it is exact, and resolves latest with the
+    WordPress.org API, or with the newest cached core in offline mode"""
+
+    # Arrange
+    cache = sut.ArtifactCache(str(tmp_path / "cache"))
+    file_path = tmp_path / "core.zip"
+    file_path.write_bytes(b"core")
+    for cached_version in ["6.9", "6.10.1", "6.2"]:
+        cache.put(sut.get_cache_key(cached_version, "es_ES", True), str(file_path))
+    cache.put(sut.get_cache_key("7.0", "en_US", True), str(file_path))
+
+    # Act
+    with patch.object(sut, "get_latest_version", return_value="6.5") as get_latest_version_mock:
+        result = sut.resolve_version(version, "es_ES", True, cache, offline)
+
+    # Assert
+    assert result == expected
+    assert get_latest_version_mock.called == (version == "latest" and not offline)
+
+# endregion
@@ -0,0 +1,293 @@
+"""Unit core for the wordpress.wp_dump file"""
+
+import gzip
+import json
+import pytest
+import devops_toolset.project_types.wordpress.wp_dump as sut
+import devops_toolset.tools.cli as cli
+from devops_toolset.core.app import App
+from devops_toolset.core.CommandsCore import CommandsCore
+from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
+from unittest.mock import patch, ANY
+
+app: App = App.instance()
+commands = CommandsCore([WordpressCommands])
+
+SQL = b"INSERT INTO `wp_options` VALUES (1,'siteurl','http://localhost','yes'),(2,'home','http://localhost','yes');\n"
+
+# region get_compression()
+
+
+@pytest.mark.parametrize("dump_file_path, expected", [
+    ("dump.sql.gz", "gzip"),
+    ("dump.sql.ZST", "zstd"),
+    ("dump.sql", None)
+])
+def test_get_compression_given_dump_file_path_returns_compression_of_its_extension(dump_file_path, expected):
+    """Given a dump file path, returns the compression of its extension"""
+
+    # Act
+    result = sut.get_compression(dump_file_path)
+
+    # Assert
+    assert result == expected
+
+# endregion
+
+# region export_database()
+
+
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_export_database_given_gz_dump_streams_compressed_stdout_to_file(pipe_subprocess_mock, tmp_path):
+    """Given a .gz dump file, streams the stdout of wp db export - through
+    gzip into the file and returns its metrics"""
+
+    # Arrange
+    dump_file_path = str(tmp_path / "database" / "dump.sql.gz")
+
+    def pipe_subprocess(command, stdout_handler):
+        for chunk in [SQL[:10], SQL[10:]]:
+            stdout_handler(chunk)
+        return 0, b""
+
+    pipe_subprocess_mock.side_effect = pipe_subprocess
+
+    # Act
+    result = sut.export_database("wordpress", dump_file_path, extended_insert=True)
+
+    # Assert
+    assert pipe_subprocess_mock.call_args.args[0] == cli.build_argv(
+        commands.get("wpcli_db_export_stdout"), path="wordpress", tables="", extended_insert="", debug_info="")
+    with gzip.open(dump_file_path, "rb") as dump_file:
+        assert dump_file.read() == SQL
+    assert result.compression == "gzip"
+    assert result.uncompressed_size == len(SQL)
+    assert list(tmp_path.joinpath("database").iterdir()) == [tmp_path / "database" / "dump.sql.gz"]
+
+
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_export_database_when_export_fails_keeps_previous_dump(pipe_subprocess_mock, logging_error_mock, tmp_path):
+    """Given an export that fails, keeps the previous dump file and returns
+    None"""
+
+    # Arrange
+    dump_file = tmp_path / "dump.sql"
+    dump_file.write_bytes(b"previous")
+
+    def pipe_subprocess(command, stdout_handler):
+        stdout_handler(b"partial")
+        return 1, b"Error: connection refused"
+
+    pipe_subprocess_mock.side_effect = pipe_subprocess
+
+    # Act
+    result = sut.export_database("wordpress", str(dump_file), extended_insert=False)
+
+    # Assert
+    assert result is None
+    assert dump_file.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [dump_file]
+    assert "--extended-insert=false" in pipe_subprocess_mock.call_args.args[0]
+    logging_error_mock.assert_called()
+
+# endregion
+
+# region import_database()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_cli.invalidate_options_snapshot")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_import_database_given_gz_dump_streams_decompressed_dump_to_stdin(pipe_subprocess_mock, invalidate_mock,
+                                                                          tmp_path):
+    """Given a .gz dump file, streams it decompressed into the stdin of wp db
+    import - and invalidates the options snapshot"""
+
+    # Arrange
+    dump_file_path = str(tmp_path / "dump.sql.gz")
+    with gzip.open(dump_file_path, "wb") as dump_file:
+        dump_file.write(SQL)
+    passed = []
+
+    def pipe_subprocess(command, stdin_source):
+        passed.extend(iter(stdin_source, b""))
+        return 0, b""
+
+    pipe_subprocess_mock.side_effect = pipe_subprocess
+
+    # Act
+    result = sut.import_database("wordpress", dump_file_path)
+
+    # Assert
+    assert pipe_subprocess_mock.call_args.args[0] == cli.build_argv(
+        commands.get("wpcli_db_import_stdin"), path="wordpress", debug_info="")
+    assert b"".join(passed) == SQL
+    assert result.uncompressed_size == len(SQL)
+    invalidate_mock.assert_called_once_with("wordpress")
+
+
+@patch("logging.error")
+@patch("devops_toolset.project_types.wordpress.wp_cli.invalidate_options_snapshot")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_import_database_given_truncated_gz_dump_returns_none(pipe_subprocess_mock, invalidate_mock,
+                                                              logging_error_mock, tmp_path):
+    """Given a truncated .gz dump file, returns None and logs the error
+    instead of reporting the partial import as successful"""
+
+    # Arrange
+    dump_file_path = tmp_path / "dump.sql.gz"
+    with gzip.open(str(dump_file_path), "wb") as dump_file:
+        dump_file.write(SQL)
+    dump_file_path.write_bytes(dump_file_path.read_bytes()[:-8])
+
+    def pipe_subprocess(command, stdin_source):
+        for _ in iter(stdin_source, b""):
+            pass
+        return 0, b""
+
+    pipe_subprocess_mock.side_effect = pipe_subprocess
+
+    # Act
+    result = sut.import_database("wordpress", str(dump_file_path))
+
+    # Assert
+    assert result is None
+    logging_error_mock.assert_called()
+    invalidate_mock.assert_called_once_with("wordpress")
+
+# endregion
+
+# region get_changed_tables()
+
+
+def test_get_changed_tables_given_checksums_returns_changed_new_and_dropped_tables():
+    """Given the table checksums of two stages, returns the changed or new
+    tables (and the ones without checksum) and the dropped ones"""
+
+    # Arrange
+    previous = {"wp_options": {"checksum": 1, "rows": 10}, "wp_posts": {"checksum": 2, "rows": 5},
+                "wp_old": {"checksum": 3, "rows": 1}, "wp_log": {"checksum": None, "rows": 0}}
+    current = {"wp_options": {"checksum": 4, "rows": 10}, "wp_posts": {"checksum": 2, "rows": 5},
+               "wp_new": {"checksum": 5, "rows": 1}, "wp_log": {"checksum": None, "rows": 0}}
+
+    # Act
+    result = sut.get_changed_tables(previous, current)
+
+    # Assert
+    assert result == (["wp_log", "wp_new", "wp_options"], ["wp_old"])
+
+# endregion
+
+# region export_stage()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.export_database")
+@patch("devops_toolset.project_types.wordpress.wp_dump.get_table_checksums")
+def test_export_stage_given_stages_dumps_base_and_changed_tables(checksums_mock, export_database_mock, tmp_path):
+    """Given a base stage and a following one, dumps every table first and
+    then only the changed ones, recording them in the manifest"""
+
+    # Arrange
+    checksums_mock.side_effect = [
+        {"wp_options": {"checksum": 1, "rows": 10}, "wp_posts": {"checksum": 2, "rows": 5}},
+        {"wp_options": {"checksum": 3, "rows": 11}, "wp_posts": {"checksum": 2, "rows": 5}}
+    ]
+
+    # Act
+    sut.export_stage("wordpress", str(tmp_path / "core.sql.gz"), "core", base=True)
+    result = sut.export_stage("wordpress", str(tmp_path / "theme.sql.gz"), "theme")
+
+    # Assert
+    assert export_database_mock.call_args_list[0].kwargs["tables"] is None
+    assert export_database_mock.call_args_list[1].args[1] == str(tmp_path / "theme.sql.gz")
+    assert export_database_mock.call_args_list[1].kwargs["tables"] == ["wp_options"]
+    manifest = json.loads((tmp_path / sut.MANIFEST_FILE_NAME).read_text())
+    assert [(stage["stage"], stage["file"], stage["base"]) for stage in manifest["stages"]] == \
+        [("core", "core.sql.gz", True), ("theme", "theme.sql.gz", False)]
+    assert result["tables"] == ["wp_options"]
+
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.export_database")
+@patch("devops_toolset.project_types.wordpress.wp_dump.get_table_checksums")
+def test_export_stage_given_file_of_the_chain_adds_stage_to_file_name(checksums_mock, export_database_mock,
+                                                                      tmp_path):
+    """Given a stage dumped to the file of its base stage, writes it next to
+    it with the stage name instead of overwriting the base"""
+
+    # Arrange
+    checksums_mock.side_effect = [{"wp_options": {"checksum": 1, "rows": 10}},
+                                  {"wp_options": {"checksum": 2, "rows": 10}}]
+    dump_file_path = str(tmp_path / "core.sql.gz")
+
+    # Act
+    sut.export_stage("wordpress", dump_file_path, "core", base=True)
+    result = sut.export_stage("wordpress", dump_file_path, "final")
+
+    # Assert
+    assert result["file"] == "core-final.sql.gz"
+    export_database_mock.assert_called_with("wordpress", str(tmp_path / "core-final.sql.gz"), False, True,
+                                            tables=["wp_options"])
+
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.export_database")
+@patch("devops_toolset.project_types.wordpress.wp_dump.get_table_checksums")
+def test_export_stage_given_unchanged_database_writes_no_dump(checksums_mock, export_database_mock, tmp_path):
+    """Given no table changes since the previous stage, records the stage
+    without a dump file"""
+
+    # Arrange
+    checksums_mock.return_value = {"wp_options": {"checksum": 1, "rows": 10}}
+
+    # Act
+    sut.export_stage("wordpress", str(tmp_path / "core.sql"), "core", base=True)
+    result = sut.export_stage("wordpress", str(tmp_path / "theme.sql"), "theme")
+
+    # Assert
+    assert result["file"] is None
+    export_database_mock.assert_called_once()
+
+# endregion
+
+# region get_stage_chain() / restore_stage_chain()
+
+
+def test_get_stage_chain_given_stage_returns_stages_from_its_base(tmp_path):
+    """Given a stage name, returns the stages from its base dump to it"""
+
+    # Arrange
+    stages = [{"stage": "core", "file": "a.sql", "base": True}, {"stage": "theme", "file": "b.sql", "base": False},
+              {"stage": "core", "file": "c.sql", "base": True}, {"stage": "theme", "file": "d.sql", "base": False},
+              {"stage": "plugins", "file": "e.sql", "base": False}]
+    (tmp_path / sut.MANIFEST_FILE_NAME).write_text(json.dumps({"stages": stages}))
+
+    # Act
+    result = sut.get_stage_chain(str(tmp_path), "theme")
+
+    # Assert
+    assert result == stages[2:4]
+
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.import_database")
+@patch("devops_toolset.tools.cli.call_subprocess")
+def test_restore_stage_chain_given_chain_drops_tables_and_imports_dumps_in_order(call_subprocess_mock,
+                                                                                 import_database_mock):
+    """Given a chain of stages, drops the dropped tables and imports the dumps
+    in order, skipping stages without dump file"""
+
+    # Arrange
+    chain = [{"stage": "core", "file": "core.sql", "dropped": []},
+             {"stage": "theme", "file": None, "dropped": []},
+             {"stage": "plugins", "file": "plugins.sql", "dropped": ["wp_old"]}]
+
+    # Act
+    result = sut.restore_stage_chain("wordpress", "database", chain)
+
+    # Assert
+    assert result
+    assert [call.args[1] for call in import_database_mock.call_args_list] == ["database/core.sql",
+                                                                               "database/plugins.sql"]
+    call_subprocess_mock.assert_called_once_with(cli.build_argv(
+        commands.get("wpcli_db_query_drop_tables"), tables="`wp_old`", path="wordpress", debug_info=""),
+        log_after_err=ANY)
+
+# endregion
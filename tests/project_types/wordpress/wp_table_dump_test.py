@@ -0,0 +1,106 @@
+"""Unit core for the wordpress.wp_table_dump file"""
+
+import gzip
+import json
+import devops_toolset.project_types.wordpress.wp_table_dump as sut
+import devops_toolset.tools.cli as cli
+from devops_toolset.core.app import App
+from devops_toolset.core.CommandsCore import CommandsCore
+from devops_toolset.project_types.wordpress.commands import Commands as WordpressCommands
+from unittest.mock import patch
+
+app: App = App.instance()
+commands = CommandsCore([WordpressCommands])
+
+TABLES = {
+    "wp_options": b"INSERT INTO `wp_options` VALUES (1,'siteurl','http://localhost','yes');\n",
+    "wp_posts": b"INSERT INTO `wp_posts` VALUES (1,'Hello world!');\n" * 100,
+    "wp_wc_orders": b"INSERT INTO `wp_wc_orders` VALUES (1,'wc-completed');\n" * 10
+}
+
+
+def __export_stand_in(command, stdout_handler):
+    """Stands in for wp db export --tables=<table> -, writing the table SQL."""
+    table = next(arg for arg in command if arg.startswith("--tables=")).split("=", 1)[1]
+    stdout_handler(TABLES[table])
+    return 0, b""
+
+
+# region export_tables() / import_tables()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_cli.invalidate_options_snapshot")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_export_tables_then_import_tables_round_trips_every_table(call_subprocess_with_result_mock,
+                                                                  pipe_subprocess_mock, invalidate_mock, tmp_path):
+    """Given a database, exports a compressed file per table with a manifest,
+    and imports every file with foreign key checks disabled"""
+
+    # Arrange
+    call_subprocess_with_result_mock.return_value = "\n".join(TABLES) + "\n"
+    pipe_subprocess_mock.side_effect = __export_stand_in
+    imported = {}
+
+    def import_stand_in(command, stdin_source):
+        imported[len(imported)] = b"".join(iter(stdin_source, b""))
+        return 0, b""
+
+    # Act
+    exported = sut.export_tables("wordpress", str(tmp_path), max_workers=3)
+    pipe_subprocess_mock.side_effect = import_stand_in
+    result = sut.import_tables("wordpress", str(tmp_path), max_workers=3)
+
+    # Assert
+    manifest = json.loads((tmp_path / sut.MANIFEST_FILE_NAME).read_text())
+    assert [entry["file"] for entry in manifest["tables"]] == [f"{table}.sql.gz" for table in TABLES]
+    for table, sql in TABLES.items():
+        with gzip.open(tmp_path / f"{table}.sql.gz", "rb") as dump_file:
+            assert dump_file.read() == sql
+    assert len(exported) == len(result) == len(TABLES)
+    assert all(sql.startswith(sut.IMPORT_INIT_SQL) for sql in imported.values())
+    assert sorted(sql[len(sut.IMPORT_INIT_SQL):] for sql in imported.values()) == sorted(TABLES.values())
+    assert pipe_subprocess_mock.call_args.args[0] == cli.build_argv(
+        commands.get("wpcli_db_import_stdin"), path="wordpress", debug_info="")
+
+
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+def test_export_tables_when_a_table_fails_writes_no_manifest(call_subprocess_with_result_mock, pipe_subprocess_mock,
+                                                             logging_error_mock, tmp_path):
+    """Given a table export that fails, returns None and writes no manifest,
+    so the partial dump is not imported"""
+
+    # Arrange
+    call_subprocess_with_result_mock.return_value = "\n".join(TABLES)
+
+    def export_stand_in(command, stdout_handler):
+        if "--tables=wp_posts" in command:
+            return 1, b"Error: lost connection"
+        return __export_stand_in(command, stdout_handler)
+
+    pipe_subprocess_mock.side_effect = export_stand_in
+
+    # Act
+    result = sut.export_tables("wordpress", str(tmp_path), max_workers=1)
+
+    # Assert
+    assert result is None
+    assert not sut.is_table_dump(str(tmp_path))
+
+
+@patch("logging.error")
+@patch("devops_toolset.tools.cli.pipe_subprocess")
+def test_import_tables_given_no_manifest_returns_none(pipe_subprocess_mock, logging_error_mock, tmp_path):
+    """Given a directory without tables manifest, imports nothing"""
+
+    # Act
+    result = sut.import_tables("wordpress", str(tmp_path))
+
+    # Assert
+    assert result is None
+    pipe_subprocess_mock.assert_not_called()
+    logging_error_mock.assert_called_once()
+
+# endregion
@@ -333,17 +333,20 @@ def test_download_wordpress_theme_given_theme_config_when_source_type_is_feed_an
     log_warning_mock.assert_called()
 
 
-@patch("devops_toolset.filesystem.paths.download_file")
-def test_download_wordpress_theme_given_theme_config_when_source_type_is_url_then_calls_paths_download_file(
+@patch("devops_toolset.filesystem.paths.download_file_cached")
+def test_download_wordpress_theme_given_theme_config_when_source_type_is_url_then_calls_paths_download_file_cached(
         download_file_mock, themesdata):
-    """ Given theme config, when source type is url, then downloads content to the destination path"""
+    """ Given theme config, when source type is url, then downloads content to the destination path through the
+    cache"""
     # Arrange
     theme_config = json.loads(themesdata.theme_single_content_with_url)
     destination_path = "path/to/destination/"
+    cache = object()
     # Act
-    sut.download_wordpress_theme(theme_config, destination_path)
+    sut.download_wordpress_theme(theme_config, destination_path, cache, True)
     # Assert
-    download_file_mock.assert_called_once_with(theme_config["source"], destination_path, f"{theme_config['name']}.zip")
+    download_file_mock.assert_called_once_with(theme_config["source"], destination_path, f"{theme_config['name']}.zip",
+                                               cache=cache, offline=True)
 
 # endregion
 
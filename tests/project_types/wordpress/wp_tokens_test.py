@@ -0,0 +1,128 @@
+"""Unit core for the wordpress.wp_tokens file"""
+
+import datetime
+import pytest
+import devops_toolset.project_types.wordpress.wp_tokens as sut
+from devops_toolset.core.app import App
+from unittest.mock import patch
+
+app: App = App.instance()
+
+MOMENT = datetime.datetime(2021, 3, 1, 9, 5, 3, tzinfo=datetime.timezone.utc)
+
+# region format_php_date()
+
+
+@pytest.mark.parametrize("date_format, expected", [
+    ("Y.m.d-Hisve", "2021.03.01-090503000UTC"),
+    ("d D j l N S w z", "01 Mon 1 Monday 1 st 1 59"),
+    ("W F m M n t", "09 March 03 Mar 3 31"),
+    ("L o X x Y y", "0 2021 +2021 2021 2021 21"),
+    ("a A B g G h H i s u v", "am AM 420 9 9 09 09 05 03 000000 000"),
+    ("e I O P p T Z", "UTC 0 +0000 +00:00 Z UTC 0"),
+    ("c", "2021-03-01T09:05:03+00:00"),
+    ("r", "Mon, 01 Mar 2021 09:05:03 +0000"),
+    ("U", "1614589503"),
+    ("\\Y\\\\Y [Y]", "Y\\2021 [2021]")
+])
+def test_format_php_date_given_format_returns_php_date(date_format, expected):
+    """Given a PHP date format, returns the same as PHP date() under
+    WordPress (UTC)"""
+
+    # Act
+    result = sut.format_php_date(date_format, MOMENT)
+
+    # Assert
+    assert result == expected
+
+
+def test_format_php_date_given_offset_formats_timezone():
+    """Given a moment with a fixed offset, formats the timezone characters
+    like PHP"""
+
+    # Arrange
+    moment = MOMENT.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=-5, minutes=-30)))
+
+    # Act
+    result = sut.format_php_date("O P p T Z jS", moment)
+
+    # Assert
+    assert result == "-0530 -05:30 -05:30 -05:30 -19800 1st"
+
+# endregion
+
+# region expand()
+
+
+@patch("devops_toolset.tools.git.get_head_commit_sha")
+def test_expand_given_tokens_expands_them_in_one_pass(get_head_commit_sha_mock, monkeypatch):
+    """Given a text with several tokens, expands all of them with the same
+    context and reads the commit SHA only once"""
+
+    # Arrange
+    monkeypatch.setenv("DT_TOKEN_TEST", "value")
+    get_head_commit_sha_mock.return_value = "abc1234"
+    context = sut.TokenContext("production", "/pathto/repo", MOMENT)
+    text = "[date|Ymd]-[env|DT_TOKEN_TEST]-[environment]-[commit]-[git_sha]-[unknown|x]-[date|His]"
+
+    # Act
+    result = sut.expand(text, context)
+
+    # Assert
+    assert result == "20210301-value-production-abc1234-abc1234-[unknown|x]-090503"
+    get_head_commit_sha_mock.assert_called_once_with("/pathto/repo", True)
+
+
+@patch("logging.warning")
+def test_expand_given_missing_env_var_returns_empty_value(logging_warning_mock, monkeypatch):
+    """Given an env token, when the environment variable is not set, expands
+    it to an empty value"""
+
+    # Arrange
+    monkeypatch.delenv("DT_TOKEN_TEST", raising=False)
+
+    # Act
+    result = sut.expand("a[env|DT_TOKEN_TEST]b")
+
+    # Assert
+    assert result == "ab"
+    logging_warning_mock.assert_called_once()
+
+
+def test_expand_without_environment_leaves_environment_token():
+    """Given an environment token, when there is no environment in the
+    context, leaves it as it is"""
+
+    # Act
+    result = sut.expand("[environment]", sut.TokenContext())
+
+    # Assert
+    assert result == "[environment]"
+
+# endregion
+
+# region expand_configuration()
+
+
+def test_expand_configuration_expands_all_strings_except_skipped_paths():
+    """Given a configuration, expands every string with the same date but
+    the skipped key paths"""
+
+    # Arrange
+    configuration = {
+        "settings": {"title": "Site [date|Y]", "dumps": {"core": "[date|Y]-db.core.sql"}, "version": 5},
+        "environments": [{"name": "[environment]", "tags": ["[date|m]"]}]
+    }
+    context = sut.TokenContext("localhost", now=MOMENT)
+
+    # Act
+    result = sut.expand_configuration(configuration, context, skip=[("settings", "dumps")])
+
+    # Assert
+    assert result == {
+        "settings": {"title": "Site 2021", "dumps": {"core": "[date|Y]-db.core.sql"}, "version": 5},
+        "environments": [{"name": "localhost", "tags": ["03"]}]
+    }
+    assert configuration["settings"]["title"] == "Site [date|Y]"
+
+# endregion
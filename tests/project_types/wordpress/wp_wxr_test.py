@@ -0,0 +1,177 @@
+"""Unit core for the wordpress.wp_wxr file"""
+
+import json
+import pathlib
+import xml.etree.ElementTree as ElementTree
+import devops_toolset.project_types.wordpress.wp_wxr as sut
+from devops_toolset.core.app import App
+from devops_toolset.filesystem.cache import ArtifactCache
+from devops_toolset.tools.cli import CommandResult
+from unittest.mock import patch
+
+app: App = App.instance()
+
+WP = "http://wordpress.org/export/1.2/"
+
+
+def __item(post_id: int, post_type: str = "post", post_parent: int = 0, attachment_url: str = None) -> str:
+    attachment = f"<wp:attachment_url>{attachment_url}</wp:attachment_url>" if attachment_url else ""
+    return f"""<item><title>Post {post_id}</title>
+<content:encoded><![CDATA[<p>Content {post_id}</p>]]></content:encoded>
+<excerpt:encoded><![CDATA[Excerpt {post_id}]]></excerpt:encoded>
+<wp:post_id>{post_id}</wp:post_id><wp:post_date>2023-05-01 10:00:00</wp:post_date>
+<wp:post_date_gmt>2023-05-01 08:00:00</wp:post_date_gmt><wp:post_name>post-{post_id}</wp:post_name>
+<wp:post_parent>{post_parent}</wp:post_parent><wp:post_type>{post_type}</wp:post_type>{attachment}
+<wp:postmeta><wp:meta_key>_wp_attachment_image_alt</wp:meta_key><wp:meta_value>Alt {post_id}</wp:meta_value></wp:postmeta>
+</item>
+"""
+
+
+def write_wxr(path: pathlib.Path, items: str) -> str:
+    path.write_text(f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:excerpt="http://wordpress.org/export/1.2/excerpt/"
+    xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:wp="{WP}">
+<channel>
+<title>Site</title>
+<wp:wxr_version>1.2</wp:wxr_version>
+<wp:author><wp:author_login>admin</wp:author_login></wp:author>
+<wp:category><wp:category_nicename>news</wp:category_nicename></wp:category>
+{items}
+</channel>
+</rss>
+""", encoding="utf-8")
+    return str(path)
+
+
+def get_post_ids(chunk_path: str) -> list:
+    return [item.findtext(f"{{{WP}}}post_id") for item in ElementTree.parse(chunk_path).getroot().iter("item")]
+
+
+# region split_wxr()
+
+
+def test_split_wxr_given_posts_writes_chunks_with_header_and_takes_attachments_out(tmp_path):
+    """Given a WXR file with posts and an attachment, writes chunks of posts
+    that keep the authors and terms, and returns the attachment apart"""
+
+    # Arrange
+    wxr_path = write_wxr(tmp_path / "post.xml", "".join(__item(post_id) for post_id in range(1, 6)) +
+                         __item(9, "attachment", 1, "https://example.com/uploads/image.jpg"))
+
+    # Act
+    result = sut.split_wxr(wxr_path, str(tmp_path / "chunks"), chunk_size=2)
+
+    # Assert
+    assert [get_post_ids(chunk) for chunk in result.chunks] == [["1", "2"], ["3", "4"], ["5"]]
+    for chunk in result.chunks + [result.header_path]:
+        channel = ElementTree.parse(chunk).getroot().find("channel")
+        assert channel.find(f"{{{WP}}}author/{{{WP}}}author_login").text == "admin"
+        assert channel.find(f"{{{WP}}}wxr_version").text == "1.2"
+    assert get_post_ids(result.header_path) == []
+    assert 'xmlns:wp="http://wordpress.org/export/1.2/"' in pathlib.Path(result.chunks[0]).read_text()
+    assert result.posts == 5
+    assert not result.deferred
+    attachment = result.attachments[0]
+    assert (attachment["post_id"], attachment["post_parent"], attachment["url"]) == \
+           ("9", "1", "https://example.com/uploads/image.jpg")
+    assert attachment["post_content"] == "<p>Content 9</p>"
+    assert attachment["post_excerpt"] == "Excerpt 9"
+    assert attachment["postmeta"] == [{"key": "_wp_attachment_image_alt", "value": "Alt 9"}]
+
+
+def test_split_wxr_given_child_posts_writes_a_single_chunk(tmp_path):
+    """Given a WXR file with child posts, writes all of them in one chunk so
+    the importer can link them to their parents"""
+
+    # Arrange
+    wxr_path = write_wxr(tmp_path / "page.xml", __item(1, "page") + __item(2, "page", 1) + __item(3, "page"))
+
+    # Act
+    result = sut.split_wxr(wxr_path, str(tmp_path / "chunks"), chunk_size=1)
+
+    # Assert
+    assert [get_post_ids(chunk) for chunk in result.chunks] == [["1", "2", "3"]]
+
+
+def test_split_wxr_given_menu_items_defers_the_file(tmp_path):
+    """Given a WXR file with menu items, writes a single chunk to be imported
+    after the other files"""
+
+    # Arrange
+    wxr_path = write_wxr(tmp_path / "nav_menu_item.xml", __item(1, "nav_menu_item") + __item(2, "nav_menu_item"))
+
+    # Act
+    result = sut.split_wxr(wxr_path, str(tmp_path / "chunks"), chunk_size=1)
+
+    # Assert
+    assert len(result.chunks) == 1
+    assert result.deferred
+
+# endregion
+
+# region import_wxr_files()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_cli.invalidate_options_snapshot")
+@patch("devops_toolset.project_types.wordpress.wp_cli.eval_file")
+@patch("devops_toolset.filesystem.paths.download_file_cached")
+@patch("devops_toolset.tools.cli.run_commands")
+def test_import_wxr_files_imports_headers_then_chunks_then_deferred_files_and_attachments(
+        run_commands_mock, download_mock, eval_file_mock, invalidate_mock, tmp_path):
+    """Given WXR files, imports the headers one by one, the chunks
+    concurrently, the deferred files after them and the downloaded
+    attachments at the end, reporting the throughput"""
+
+    # Arrange
+    post_path = write_wxr(tmp_path / "post.xml", "".join(__item(post_id) for post_id in range(1, 5)) +
+                          __item(9, "attachment", 1, "https://example.com/uploads/image.jpg"))
+    menu_path = write_wxr(tmp_path / "nav_menu_item.xml", __item(20, "nav_menu_item"))
+    run_commands_mock.side_effect = lambda commands, max_workers: [CommandResult(command, 0) for command in commands]
+    download_mock.side_effect = lambda url, destination, save_as, cache: (save_as, pathlib.Path(destination, save_as))
+    attachments = []
+
+    def eval_file(file_path, wordpress_path, args, debug):
+        attachments.extend(json.loads(pathlib.Path(args[0]).read_text()))
+        return json.dumps([{"post_id": "9", "result": "imported", "message": ""}])
+
+    eval_file_mock.side_effect = eval_file
+    cache = ArtifactCache(str(tmp_path / "cache"))
+
+    # Act
+    result = sut.import_wxr_files("wordpress", [post_path, menu_path], "skip", max_workers=3, chunk_size=2,
+                                  cache=cache)
+
+    # Assert
+    batches = [(len(call.args[0]), call.kwargs["max_workers"]) for call in run_commands_mock.call_args_list]
+    assert batches == [(2, 1), (2, 3), (1, 1)]
+    assert pathlib.Path(run_commands_mock.call_args_list[2].args[0][0][2]).name == "nav_menu_item-0000.xml"
+    download_mock.assert_called_once_with("https://example.com/uploads/image.jpg", download_mock.call_args.args[1],
+                                          "9-image.jpg", cache=cache)
+    assert attachments[0]["file"].endswith("9-image.jpg")
+    assert (result.posts, result.attachments, result.workers) == (5, 1, 3)
+    assert result.posts_per_second > 0
+    invalidate_mock.assert_called_with("wordpress")
+
+
+@patch("logging.error")
+@patch("devops_toolset.project_types.wordpress.wp_cli.invalidate_options_snapshot")
+@patch("devops_toolset.project_types.wordpress.wp_cli.eval_file")
+@patch("devops_toolset.tools.cli.run_commands")
+def test_import_wxr_files_when_a_chunk_fails_returns_none(run_commands_mock, eval_file_mock, invalidate_mock,
+                                                          logging_error_mock, tmp_path):
+    """Given a chunk import that fails, stops and imports no attachments"""
+
+    # Arrange
+    post_path = write_wxr(tmp_path / "post.xml", __item(1) + __item(2))
+    run_commands_mock.side_effect = lambda commands, max_workers: [CommandResult(command, 1) for command in commands]
+
+    # Act
+    result = sut.import_wxr_files("wordpress", [post_path], "skip", cache=ArtifactCache(str(tmp_path / "cache")))
+
+    # Assert
+    assert result is None
+    assert run_commands_mock.call_count == 1
+    eval_file_mock.assert_not_called()
+
+# endregion
@@ -11,7 +11,7 @@ from devops_toolset.project_types.wordpress.basic_structure_starter import Basic
 from devops_toolset.devops_platforms import constants as devops_platform_constants
 from devops_toolset.core.LiteralsCore import LiteralsCore
 from devops_toolset.project_types.wordpress.Literals import Literals as WordpressLiterals
-from unittest.mock import patch, mock_open, call
+from unittest.mock import patch, mock_open, call, ANY
 from tests.project_types.wordpress.conftest import WordPressData, mocked_requests_get, \
     mocked_requests_get_json_content, PluginsData
 
@@ -36,6 +36,23 @@ def test_add_wp_options_given_options_then_calls_wp_cli_add_update_option(add_up
         calls.append(call(option, wordpress_path, False))
     add_update_option_mock.assert_has_calls(calls)
 
+
+@patch("devops_toolset.project_types.wordpress.wp_cli.add_update_option")
+@patch("devops_toolset.project_types.wordpress.wp_cli.add_update_options")
+def test_add_wp_options_given_batch_then_calls_wp_cli_add_update_options_once(
+        add_update_options_mock, add_update_option_mock, wordpressdata):
+    """ Given options dict and batch, then calls wp_cli.add_update_options once with all the options """
+    # Arrange
+    options = json.loads(wordpressdata.site_config_content)["settings"]["options"]
+    wordpress_path = wordpressdata.wordpress_path
+
+    # Act
+    sut.add_wp_options(options, wordpress_path, batch=True)
+
+    # Assert
+    add_update_options_mock.assert_called_once_with(options, wordpress_path, False)
+    add_update_option_mock.assert_not_called()
+
 # endregion add_wp_options
 
 
@@ -54,19 +71,30 @@ def test_convert_wp_config_token_given_token_when_no_match_then_return_bare_toke
 
 
 @patch("devops_toolset.project_types.wordpress.wp_cli.eval_code")
-def test_convert_wp_config_token_given_token_when_date_match_then_calls_wp_cli_eval_code(
+def test_convert_wp_config_token_given_token_when_date_match_then_formats_date_without_wp_cli(
         eval_code_mock, wordpressdata):
-    """Given token, when match "date|", then parses and calls wp_cli.eval_code with necessary data"""
+    """Given token, when match "date|", then formats the date in Python
+    without calling wp_cli.eval_code"""
     # Arrange
     token = "some-data-[date|Y.m.d-Hisve]"
-    date_formatted = "some-formatted-date"
-    eval_code_mock.return_value = date_formatted
-    expected_result = f"some-data-{date_formatted}"
     wordpress_path = wordpressdata.wordpress_path
     # Act
     result = sut.convert_wp_config_token(token, wordpress_path)
     # Assert
-    assert result == expected_result
+    eval_code_mock.assert_not_called()
+    assert re.fullmatch(r"some-data-\d{4}\.\d{2}\.\d{2}-\d{6}000UTC", result)
+
+
+@patch("devops_toolset.project_types.wordpress.wp_tokens.expand_configuration")
+def test_expand_site_configuration_tokens_skips_dumps(expand_configuration_mock, wordpressdata):
+    """Given site configuration, then expands its tokens in one pass but
+    the dump file names"""
+    # Arrange
+    site_config = json.loads(wordpressdata.site_config_content)
+    # Act
+    sut.expand_site_configuration_tokens(site_config, "localhost", wordpressdata.root_path)
+    # Assert
+    expand_configuration_mock.assert_called_once_with(site_config, ANY, skip=[("settings", "dumps")])
 
 
 # endregion
@@ -125,38 +153,117 @@ def test_create_configuration_file_then_calls_wp_cli_create_configuration_with_d
 # region download_wordpress()
 
 
+@patch("devops_toolset.project_types.wordpress.wp_core.get_latest_version")
 @patch("devops_toolset.project_types.wordpress.wp_cli.download_wordpress")
-def test_download_wordpress_given_invalid_path_raises_valueerror(download_wordpress_mock, wordpressdata):
+def test_download_wordpress_given_invalid_path_raises_valueerror(
+        download_wordpress_mock, get_latest_version_mock, wordpressdata, tmp_path):
     """Given an invalid path, raises ValueError"""
 
     # Arrange
     site_configuration = json.loads(wordpressdata.site_config_content)
     path = wordpressdata.wordpress_path_err
+    get_latest_version_mock.return_value = None
 
     # Act
-    with pytest.raises(ValueError):
-        # Assert
-        sut.download_wordpress(site_configuration, path)
+    with patch.object(sut.app.settings, "cache_path", tmp_path):
+        with pytest.raises(ValueError):
+            # Assert
+            sut.download_wordpress(site_configuration, path)
 
 
 @patch("devops_toolset.tools.git.purge_gitkeep")
+@patch("devops_toolset.project_types.wordpress.wp_core.get_latest_version")
 @patch("devops_toolset.project_types.wordpress.wp_cli.download_wordpress")
 def test_download_wordpress_given_valid_arguments_calls_subprocess(
-        download_wordpress_mock, purge_gitkeep, wordpressdata):
+        download_wordpress_mock, get_latest_version_mock, purge_gitkeep, wordpressdata, tmp_path):
     """Given valid arguments, calls subprocess"""
 
     # Arrange
     site_configuration = json.loads(wordpressdata.site_config_content)
     path = wordpressdata.wordpress_path
+    get_latest_version_mock.return_value = "6.4.2"
 
     # Act
-    sut.download_wordpress(site_configuration, path)
+    with patch.object(sut.app.settings, "cache_path", tmp_path):
+        sut.download_wordpress(site_configuration, path)
 
     # Assert
     download_wordpress_mock.assert_called_once()
     purge_gitkeep.assert_called_once()
 
 
+@patch("devops_toolset.tools.git.purge_gitkeep")
+@patch("devops_toolset.project_types.wordpress.wp_cli.download_wordpress")
+def test_download_wordpress_when_downloaded_before_extracts_core_from_cache(
+        download_wordpress_mock, purge_gitkeep, wordpressdata, tmp_path):
+    """Given a version downloaded before, extracts it from the cache without
+    calling WP-CLI again, even in offline mode"""
+
+    # Arrange
+    site_configuration = json.loads(wordpressdata.site_config_content)
+    site_configuration["settings"]["version"] = "6.4.2"
+    first_path = tmp_path.joinpath("first")
+    second_path = tmp_path.joinpath("second")
+    second_path.mkdir()
+
+    def download_wordpress(destination_path, *args):
+        for file in sut.wp_core.CORE_FILES:
+            pathlib.Path(destination_path, file).parent.mkdir(parents=True, exist_ok=True)
+            pathlib.Path(destination_path, file).write_text("<?php\n")
+        pathlib.Path(destination_path, sut.wp_core.VERSION_FILE).write_text("<?php\n$wp_version = '6.4.2';\n")
+
+    first_path.mkdir()
+    first_path.joinpath("README.md").write_text("not core")
+    download_wordpress_mock.side_effect = download_wordpress
+
+    # Act
+    with patch.object(sut.app.settings, "cache_path", tmp_path.joinpath("cache")):
+        sut.download_wordpress(site_configuration, str(first_path))
+        sut.download_wordpress(site_configuration, str(second_path), offline=True)
+
+    # Assert
+    download_wordpress_mock.assert_called_once()
+    assert sut.wp_core.get_version(str(second_path)).version == "6.4.2"
+    assert not second_path.joinpath("README.md").exists()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_cli.download_wordpress")
+def test_download_wordpress_when_offline_and_not_cached_raises_valueerror(
+        download_wordpress_mock, wordpressdata, tmp_path):
+    """Given offline mode, when the core is not in the cache, raises
+    ValueError without downloading it"""
+
+    # Arrange
+    site_configuration = json.loads(wordpressdata.site_config_content)
+
+    # Act
+    with patch.object(sut.app.settings, "cache_path", tmp_path):
+        with pytest.raises(ValueError):
+            sut.download_wordpress(site_configuration, str(tmp_path.joinpath("wordpress")), offline=True)
+
+    # Assert
+    download_wordpress_mock.assert_not_called()
+
+
+# endregion
+
+# region download_wordpress_plugin()
+
+
+@patch("devops_toolset.filesystem.paths.download_file_cached")
+def test_download_wordpress_plugin_given_plugin_config_downloads_to_plugin_path_through_cache(download_file_mock,
+                                                                                           pluginsdata):
+    """ Given plugin config, downloads the plugin through the package cache to its path"""
+    # Arrange
+    plugin_config = json.loads(pluginsdata.plugins_content_single_url_source)[0]
+    destination_path = pathlib.Path("path/to/plugins/plugin-name.zip")
+    cache = object()
+    # Act
+    sut.download_wordpress_plugin(plugin_config, str(destination_path), cache, True)
+    # Assert
+    download_file_mock.assert_called_once_with(plugin_config["source"], str(destination_path.parent),
+                                               "plugin-name.zip", cache=cache, offline=True)
+
 # endregion
 
 # region export_database()
@@ -174,6 +281,62 @@ def test_export_database_calls_wp_cli_export_database(export_database_mock, word
     # Assert
     export_database_mock.assert_called_once_with(wordpress_path, dump_file_path, environment_config["wp_cli_debug"])
 
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.export_database")
+@patch("devops_toolset.project_types.wordpress.wp_cli.export_database")
+@pytest.mark.parametrize("dump_file_path, extended_insert", [("dump.sql.gz", False), ("dump.sql", True)])
+def test_export_database_given_compressed_dump_or_extended_insert_calls_wp_dump_export_database(
+        wp_cli_export_mock, wp_dump_export_mock, dump_file_path, extended_insert, wordpressdata):
+    """Given a .gz dump file or extended inserts, should stream the dump with wp_dump.export_database"""
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    environment_config = json.loads(wordpressdata.site_config_content)["environments"][0]
+    environment_config["database"]["dump_extended_insert"] = extended_insert
+    # Act
+    sut.export_database(environment_config, wordpress_path, dump_file_path)
+    # Assert
+    wp_dump_export_mock.assert_called_once_with(wordpress_path, dump_file_path, environment_config["wp_cli_debug"],
+                                                extended_insert)
+    wp_cli_export_mock.assert_not_called()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_dump.export_stage")
+@patch("devops_toolset.project_types.wordpress.wp_cli.export_database")
+def test_export_database_given_differential_dumps_and_stage_calls_wp_dump_export_stage(
+        wp_cli_export_mock, export_stage_mock, wordpressdata):
+    """Given an environment with differential dumps and a stage, should dump
+    the stage with wp_dump.export_stage"""
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    environment_config = json.loads(wordpressdata.site_config_content)["environments"][0]
+    environment_config["database"]["differential_dumps"] = True
+    dump_file_path = "theme.sql.gz"
+    # Act
+    sut.export_database(environment_config, wordpress_path, dump_file_path, "theme")
+    # Assert
+    export_stage_mock.assert_called_once_with(wordpress_path, dump_file_path, "theme", False,
+                                              environment_config["wp_cli_debug"], False)
+    wp_cli_export_mock.assert_not_called()
+
+
+@patch("devops_toolset.project_types.wordpress.wp_table_dump.export_tables")
+@patch("devops_toolset.project_types.wordpress.wp_cli.export_database")
+def test_export_database_given_dump_workers_calls_wp_table_dump_export_tables(
+        wp_cli_export_mock, export_tables_mock, wordpressdata):
+    """Given an environment with several dump workers, should dump every table
+    concurrently with wp_table_dump.export_tables"""
+    # Arrange
+    wordpress_path = wordpressdata.wordpress_path
+    environment_config = json.loads(wordpressdata.site_config_content)["environments"][0]
+    environment_config["database"]["dump_workers"] = 6
+    dump_file_path = "core.sql.zst"
+    # Act
+    sut.export_database(environment_config, wordpress_path, dump_file_path, "core", base=True)
+    # Assert
+    export_tables_mock.assert_called_once_with(wordpress_path, dump_file_path, 6, environment_config["wp_cli_debug"],
+                                               False, "zstd")
+    wp_cli_export_mock.assert_not_called()
+
 # endregion
 
 # region get_environment()
@@ -347,6 +510,37 @@ def test_import_content_from_configuration_file_given_args_then_call_import_wxr_
     import_wxr_content.assert_has_calls(expected_calls)
 
 
+@patch("devops_toolset.project_types.wordpress.wp_wxr.import_wxr_files")
+@patch("devops_toolset.project_types.wordpress.wp_cli.import_wxr_content")
+@patch("devops_toolset.project_types.wordpress.wp_cli.delete_post_type_content")
+def test_import_content_from_configuration_file_given_import_workers_then_deletes_and_imports_concurrently(
+        delete_content_mock, import_wxr_content, import_wxr_files, wordpressdata):
+    """ Given content with several import workers, should delete the content of every type and then import all
+    the files with wp_wxr.import_wxr_files """
+
+    # Arrange
+    site_config = json.loads(wordpressdata.site_config_content)
+    environment_config = site_config["environments"][0]
+    constants = json.loads(wordpressdata.constants_file_content)
+    root_path = wordpressdata.root_path
+    wordpress_path = str(pathlib.Path.joinpath(pathlib.Path(root_path), constants["paths"]["wordpress"]))
+    wxr_path = pathlib.Path.joinpath(pathlib.Path(root_path), constants["paths"]["content"]["wxr"])
+    site_config["content"] = json.loads(wordpressdata.import_content_skip_author)
+    site_config["content"]["import_workers"] = 4
+    site_config["content"]["chunk_size"] = 100
+
+    # Act
+    sut.import_content_from_configuration_file(site_config, environment_config, root_path, constants)
+
+    # Assert
+    assert delete_content_mock.call_count == 2
+    import_wxr_files.assert_called_once_with(
+        wordpress_path, [str(pathlib.Path.joinpath(wxr_path, "page.xml")),
+                         str(pathlib.Path.joinpath(wxr_path, "nav_menu_item.xml"))],
+        "skip", environment_config["wp_cli_debug"], 4, 100)
+    import_wxr_content.assert_not_called()
+
+
 @patch("devops_toolset.project_types.wordpress.wp_cli.import_wxr_content")
 def test_import_content_from_configuration_file_given_args_when_no_content_then_return_without_import(
         import_wxr_content, wordpressdata):
@@ -448,6 +642,118 @@ def test_install_plugins_given_configuration_file_when_plugins_present_then_inst
         calls.append(plugin_call)
     install_plugin_mock.assert_has_calls(calls)
 
+
+@patch("logging.info")
+@patch("devops_toolset.project_types.wordpress.wp_cli.install_plugin")
+@patch("devops_toolset.project_types.wordpress.wptools.download_wordpress_plugin")
+@patch("devops_toolset.project_types.wordpress.wptools.export_plugins_database_dump")
+@pytest.mark.parametrize("per_plugin_dumps, expected_dumps", [(False, 1), (True, 2)])
+def test_install_plugins_given_partial_dumps_then_collapses_them_unless_per_plugin_dumps(
+        export_mock, download_wordpress_plugin_mock, install_plugin_mock, logging_mock, per_plugin_dumps,
+        expected_dumps, wordpressdata, pluginsdata):
+    """ Given the configuration values, when partial dumps are not skipped, then dumps the database once after
+    installing all the plugins, or after every plugin if per_plugin_dumps is set"""
+
+    # Arrange
+    site_config = json.loads(wordpressdata.site_config_content)
+    site_config["settings"]["plugins"] = json.loads(pluginsdata.plugins_content_two_plugins_with_url_and_zip_sources)
+    environment_config = site_config["environments"][0]
+    constants = json.loads(wordpressdata.constants_file_content)
+    root_path = wordpressdata.root_path
+
+    # Act
+    sut.install_plugins_from_configuration_file(site_config, environment_config, constants, root_path, False,
+                                                per_plugin_dumps=per_plugin_dumps)
+
+    # Assert
+    assert export_mock.call_count == expected_dumps
+    assert install_plugin_mock.call_count == 2
+
+
+@patch("logging.info")
+@patch("logging.warning")
+@patch("devops_toolset.project_types.wordpress.wp_cli.install_plugin")
+@patch("devops_toolset.project_types.wordpress.wptools.download_wordpress_plugin")
+def test_install_plugins_given_url_plugins_then_downloads_all_before_installing_in_order(
+        download_wordpress_plugin_mock, install_plugin_mock, logging_warn_mock, logging_mock, wordpressdata):
+    """ Given several url plugins, then starts every download and installs the plugins in the configuration
+    order once their files are ready"""
+
+    # Arrange
+    site_config = json.loads(wordpressdata.site_config_content)
+    site_config["settings"]["plugins"] = [
+        {"name": name, "source_type": "url", "source": f"https://{name}.zip", "force": True, "activate": True}
+        for name in ["plugin-a", "plugin-b", "plugin-c"]]
+    environment_config = site_config["environments"][0]
+    constants = json.loads(wordpressdata.constants_file_content)
+    root_path = wordpressdata.root_path
+    events = []
+    download_wordpress_plugin_mock.side_effect = lambda plugin, *args: events.append(("download", plugin["name"]))
+    install_plugin_mock.side_effect = lambda name, *args: events.append(("install", name))
+
+    # Act
+    sut.install_plugins_from_configuration_file(site_config, environment_config, constants, root_path, True,
+                                                max_download_workers=1)
+
+    # Assert
+    assert [event for event in events if event[0] == "install"] == \
+        [("install", "plugin-a"), ("install", "plugin-b"), ("install", "plugin-c")]
+    assert events.index(("download", "plugin-b")) < events.index(("install", "plugin-b"))
+    assert all(plugin["source_type"] == "zip" for plugin in site_config["settings"]["plugins"])
+
+
+@patch("logging.info")
+@patch("devops_toolset.project_types.wordpress.wp_cli.install_plugins")
+@patch("devops_toolset.project_types.wordpress.wp_cli.install_plugin")
+@patch("devops_toolset.project_types.wordpress.wptools.download_wordpress_plugin")
+@patch("devops_toolset.project_types.wordpress.wptools.export_plugins_database_dump")
+def test_install_plugins_given_batch_then_installs_all_plugins_at_once(
+        export_mock, download_wordpress_plugin_mock, install_plugin_mock, install_plugins_mock, logging_mock,
+        wordpressdata, pluginsdata):
+    """ Given batch, then installs every plugin with wp_cli.install_plugins once they are downloaded and dumps the
+    database once"""
+
+    # Arrange
+    site_config = json.loads(wordpressdata.site_config_content)
+    site_config["settings"]["plugins"] = json.loads(pluginsdata.plugins_content_two_plugins_with_url_and_zip_sources)
+    environment_config = site_config["environments"][0]
+    constants = json.loads(wordpressdata.constants_file_content)
+    wordpress_path = str(pathlib.Path(wordpressdata.root_path, constants["paths"]["wordpress"]))
+
+    # Act
+    sut.install_plugins_from_configuration_file(site_config, environment_config, constants, wordpressdata.root_path,
+                                                False, per_plugin_dumps=True, batch=True)
+
+    # Assert
+    install_plugin_mock.assert_not_called()
+    install_plugins_mock.assert_called_once_with(site_config["settings"]["plugins"], wordpress_path,
+                                                 environment_config["wp_cli_debug"])
+    assert all(plugin["source_type"] == "zip" for plugin in site_config["settings"]["plugins"])
+    export_mock.assert_called_once()
+
+
+@patch("logging.info")
+@patch("devops_toolset.project_types.wordpress.wp_cli.install_plugin")
+@patch("devops_toolset.project_types.wordpress.wptools.download_wordpress_plugin")
+def test_install_plugins_given_failed_download_then_raises_and_stops_installing(
+        download_wordpress_plugin_mock, install_plugin_mock, logging_mock, wordpressdata, pluginsdata):
+    """ Given a plugin that cannot be downloaded, then raises the download error without installing it"""
+
+    # Arrange
+    site_config = json.loads(wordpressdata.site_config_content)
+    site_config["settings"]["plugins"] = json.loads(pluginsdata.plugins_content_single_url_source)
+    environment_config = site_config["environments"][0]
+    constants = json.loads(wordpressdata.constants_file_content)
+    download_wordpress_plugin_mock.side_effect = ValueError("download failed")
+
+    # Act
+    with pytest.raises(ValueError):
+        sut.install_plugins_from_configuration_file(site_config, environment_config, constants,
+                                                    wordpressdata.root_path, True)
+
+    # Assert
+    install_plugin_mock.assert_not_called()
+
 # endregion
 
 # region install_wp_cli()
@@ -581,12 +887,13 @@ def test_install_wordpress_core_then_calls_cli_install_wordpress_core(install_wo
 @patch("devops_toolset.project_types.wordpress.wptools.get_constants")
 @patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
 @patch("devops_toolset.project_types.wordpress.wp_cli.update_database_option")
+@patch("devops_toolset.project_types.wordpress.wp_cli.load_options_snapshot")
 @patch("devops_toolset.project_types.wordpress.wptools.install_wordpress_core")
 @patch("devops_toolset.project_types.wordpress.wptools.export_database")
 @patch("devops_toolset.project_types.wordpress.wptools.convert_wp_config_token")
 @patch("pathlib.Path.as_posix")
 def test_install_wordpress_site_then_calls_install_wordpress_core(
-        path_mock, convert_wp_config_token, export_database, install_wordpress_core,
+        path_mock, convert_wp_config_token, export_database, install_wordpress_core, load_options_snapshot_mock,
         update_database, reset_database_mock, get_constants_mock, purge_gitkeep_mock, wordpressdata):
     """ Given site_configuration, then calls install_wordpress_core """
     # Arrange
@@ -606,12 +913,13 @@ def test_install_wordpress_site_then_calls_install_wordpress_core(
 @patch("devops_toolset.project_types.wordpress.wptools.get_constants")
 @patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
 @patch("devops_toolset.project_types.wordpress.wp_cli.update_database_option")
+@patch("devops_toolset.project_types.wordpress.wp_cli.load_options_snapshot")
 @patch("devops_toolset.project_types.wordpress.wptools.install_wordpress_core")
 @patch("devops_toolset.project_types.wordpress.wptools.export_database")
 @patch("devops_toolset.project_types.wordpress.wptools.convert_wp_config_token")
 @patch("pathlib.Path.as_posix")
 def test_install_wordpress_site_then_calls_cli_update_option(
-        path_mock, convert_wp_config_token, export_database, install_wordpress_core,
+        path_mock, convert_wp_config_token, export_database, install_wordpress_core, load_options_snapshot_mock,
         update_database, reset_database_mock, get_constants_mock, purge_gitkeep_mock, wordpressdata):
     """ Given site_configuration, then calls cli's update database  option """
     # Arrange
@@ -632,12 +940,13 @@ def test_install_wordpress_site_then_calls_cli_update_option(
 @patch("devops_toolset.project_types.wordpress.wptools.get_constants")
 @patch("devops_toolset.project_types.wordpress.wp_cli.reset_database")
 @patch("devops_toolset.project_types.wordpress.wp_cli.update_database_option")
+@patch("devops_toolset.project_types.wordpress.wp_cli.load_options_snapshot")
 @patch("devops_toolset.project_types.wordpress.wptools.install_wordpress_core")
 @patch("devops_toolset.project_types.wordpress.wptools.export_database")
 @patch("devops_toolset.project_types.wordpress.wptools.convert_wp_config_token")
 @patch("pathlib.Path.as_posix")
 def test_install_wordpress_site_then_calls_cli_export_database(
-        path_mock, convert_wp_config_token, export_database, install_wordpress_core,
+        path_mock, convert_wp_config_token, export_database, install_wordpress_core, load_options_snapshot_mock,
         update_database, reset_database_mock, get_constants_mock, purge_gitkeep_mock, wordpressdata):
     """ Given site_configuration, then calls cli's export_database"""
     # Arrange
@@ -650,7 +959,7 @@ def test_install_wordpress_site_then_calls_cli_export_database(
     # Act
     sut.install_wordpress_site(site_config, environment_config, constants, root_path, admin_pass)
     # Assert
-    export_database.assert_called_with(environment_config, root_path, root_path)
+    export_database.assert_called_with(environment_config, root_path, root_path, "core", base=True)
 
 
 # endregion
@@ -690,28 +999,58 @@ def test_main_given_parameters_must_call_add_item(add_item_mock, get_project_str
 
 # region set_wordpress_config_from_configuration_file
 
-@patch("devops_toolset.project_types.wordpress.wptools.add_cloudfront_forwarded_proto_to_config")
-@patch("devops_toolset.project_types.wordpress.wptools.create_configuration_file")
+@patch("devops_toolset.project_types.wordpress.wptools.get_snippet_cloudfront")
 @patch("devops_toolset.project_types.wordpress.wp_cli.set_configuration_value")
 @pytest.mark.parametrize("aws_cloudfront", [True, False])
-def test_set_wordpress_config_from_configuration_file(set_configuration_value_mock, create_configuration_file_mock,
-                                                      add_cloudfront_mock, wordpressdata, aws_cloudfront):
-    """Given site_configuration, then calls
-    add_cloudfront_forwarded_proto_to_config."""
+def test_set_wordpress_config_from_configuration_file(set_configuration_value_mock, get_snippet_cloudfront_mock,
+                                                      tmp_path, wordpressdata, aws_cloudfront):
+    """Given site_configuration, then renders the whole wp-config.php file,
+    with the cloudfront snippet if needed, without WP-CLI."""
 
     # Arrange
-    environment_config = wordpressdata.environment_config_aws_cloudfront_true \
-        if aws_cloudfront else wordpressdata.environment_config_aws_cloudfront_false
-    wordpress_path = wordpressdata.wordpress_path
+    environment_config = dict(wordpressdata.environment_config_aws_cloudfront_true
+                              if aws_cloudfront else wordpressdata.environment_config_aws_cloudfront_false)
+    environment_config["database"] = {"host": "localhost", "db_name": "wp", "db_user": "user", "table_prefix": "wp_",
+                                      "charset": "utf8mb4", "collate": "", "skip_check": True}
+    wordpress_path = str(tmp_path)
     devops_toolset_wordpress_path = wordpressdata.devops_toolset_wordpress_path
     database_user_pass = "my-password"
+    get_snippet_cloudfront_mock.return_value = "// AWS Cloudfront"
 
     # Act
     sut.set_wordpress_config_from_configuration_file(
         environment_config, wordpress_path, devops_toolset_wordpress_path, database_user_pass)
 
     # Assert
-    add_cloudfront_mock.assert_called_once()
+    content = tmp_path.joinpath("wp-config.php").read_text()
+    set_configuration_value_mock.assert_not_called()
+    assert "define( 'DB_PASSWORD', 'my-password' );" in content
+    assert "define( 'name1', 'value1' );" in content
+    assert ("// AWS Cloudfront" in content) == aws_cloudfront
+
+
+@patch("devops_toolset.project_types.wordpress.wp_cli.check_database_connection")
+@pytest.mark.parametrize("skip_check", [True, False])
+def test_set_wordpress_config_from_configuration_file_given_skip_check_false_then_checks_the_database_connection(
+        check_database_connection_mock, tmp_path, wordpressdata, skip_check):
+    """Given site_configuration, when skip_check is false, then checks the
+    database connection after writing wp-config.php, as wp config create did."""
+
+    # Arrange
+    environment_config = dict(wordpressdata.environment_config_aws_cloudfront_false)
+    environment_config["database"] = {"host": "localhost", "db_name": "wp", "db_user": "user", "table_prefix": "wp_",
+                                      "charset": "utf8mb4", "collate": "", "skip_check": skip_check}
+
+    # Act
+    sut.set_wordpress_config_from_configuration_file(
+        environment_config, str(tmp_path), wordpressdata.devops_toolset_wordpress_path, "my-password")
+
+    # Assert
+    assert tmp_path.joinpath("wp-config.php").exists()
+    if skip_check:
+        check_database_connection_mock.assert_not_called()
+    else:
+        check_database_connection_mock.assert_called_once_with(str(tmp_path), True)
 
 # endregion set_wordpress_config_from_configuration_file
 
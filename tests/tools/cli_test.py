@@ -1,8 +1,11 @@
 """Unit core for the tools file"""
 
+import gzip
+import pytest
 import unittest.mock as mock
 import devops_toolset.tools.cli as sut
 import subprocess
+import sys
 import devops_toolset.core.log_tools as log_tools
 
 
@@ -67,3 +70,337 @@ def test_call_subprocess_given_command_srt_when_stderr_has_lines_then_log_error(
         logging_mock.assert_called_once_with(expected_log_message, log_level)
 
 # endregion call_subprocess(str)
+
+
+# region call_subprocess(str, stream=True)
+
+def python_command(code: str) -> str:
+    """Builds a shell command that runs Python code with this interpreter"""
+    return f'"{sys.executable}" -c "{code}"'
+
+
+def test_stream_subprocess_given_command_hands_lines_as_they_arrive():
+    """ Given a command, then hands every stdout and stderr line to the handlers
+    and returns the return code"""
+
+    # Arrange
+    command = python_command("import sys; print('out1'); print('out2'); "
+                             "sys.stderr.write('err1\\n'); sys.exit(3)")
+    out_lines = []
+    err_lines = []
+
+    # Act
+    result = sut.stream_subprocess(command, out_lines.append, err_lines.append)
+
+    # Assert
+    assert result == 3
+    assert [line.strip() for line in out_lines] == [b"out1", b"out2"]
+    assert [line.strip() for line in err_lines] == [b"err1"]
+
+
+def test_call_subprocess_given_stream_when_process_fails_then_logs_stderr_tail_as_error():
+    """ Given stream=True, when the process fails, then logs only the last
+    stderr lines as error"""
+
+    # Arrange
+    command = python_command("import sys; [sys.stderr.write(str(i) + '\\n') for i in range(5)]; sys.exit(1)")
+
+    # Act
+    with mock.patch.object(sut, "STREAM_TAIL_LINES", 2):
+        with mock.patch.object(log_tools, "log_stdouterr") as logging_mock:
+            sut.call_subprocess(command, stream=True)
+
+    # Assert
+    error_calls = [c for c in logging_mock.call_args_list if c.args[1] == log_tools.LogLevel.error]
+    assert len(error_calls) == 1
+    assert error_calls[0].args[0].split() == [b"3", b"4"]
+
+
+def test_call_subprocess_given_stream_when_stdout_has_lines_then_logs_each_line_as_info():
+    """ Given stream=True, when stdout has lines, then logs every line as info
+    and nothing as error"""
+
+    # Arrange
+    command = python_command("print('a'); print('b')")
+
+    # Act
+    with mock.patch.object(log_tools, "log_stdouterr") as logging_mock:
+        sut.call_subprocess(command, stream=True)
+
+    # Assert
+    info_calls = [c for c in logging_mock.call_args_list if c.args[1] == log_tools.LogLevel.info]
+    assert [c.args[0].strip() for c in info_calls] == [b"a", b"b"]
+    assert all(c.args[1] != log_tools.LogLevel.error for c in logging_mock.call_args_list)
+
+
+def test_call_subprocess_with_result_given_stream_then_returns_whole_stdout():
+    """ Given stream=True, then returns the whole stdout decoded"""
+
+    # Arrange
+    command = python_command("print('a'); print('b')")
+
+    # Act
+    result = sut.call_subprocess_with_result(command, stream=True)
+
+    # Assert
+    assert result.split() == ["a", "b"]
+
+# endregion call_subprocess(str, stream=True)
+
+# region pipe_subprocess()
+
+
+def test_pipe_subprocess_given_stdin_source_and_stdout_handler_then_moves_bytes_through_the_process():
+    """ Given a stdin source and a stdout handler, then writes every chunk to
+    the process and hands its whole binary stdout to the handler"""
+
+    # Arrange
+    command = [sys.executable, "-c", "import sys; sys.stdout.buffer.write(sys.stdin.buffer.read().upper())"]
+    chunks = iter([b"abc\x00", b"def", b""])
+    out = []
+
+    # Act
+    returncode, err = sut.pipe_subprocess(command, out.append, lambda: next(chunks), chunk_size=2)
+
+    # Assert
+    assert returncode == 0
+    assert b"".join(out) == b"ABC\x00DEF"
+    assert err == b""
+
+
+def test_pipe_subprocess_when_process_fails_then_returns_stderr_tail():
+    """ Given a failing process that does not read its stdin, then returns its
+    return code and stderr"""
+
+    # Arrange
+    command = [sys.executable, "-c", "import sys; sys.stderr.write('broken\\n'); sys.exit(2)"]
+    chunks = iter([b"x" * 1024 * 1024] * 4 + [b""])
+
+    # Act
+    returncode, err = sut.pipe_subprocess(command, stdin_source=lambda: next(chunks))
+
+    # Assert
+    assert returncode == 2
+    assert err.strip() == b"broken"
+
+
+def test_pipe_subprocess_when_stdin_source_fails_then_kills_the_process_and_raises(tmp_path):
+    """ Given a stdin source that fails, such as a truncated .gz file, then
+    kills the process before it takes the partial input as complete, and
+    raises the error"""
+
+    # Arrange
+    dump_file_path = tmp_path / "dump.sql.gz"
+    with gzip.open(str(dump_file_path), "wb") as dump_file:
+        dump_file.write(b"x" * 1024)
+    dump_file_path.write_bytes(dump_file_path.read_bytes()[:-8])
+    command = [sys.executable, "-c", "import sys; sys.stdin.buffer.read(); open(sys.argv[1], 'w').close()",
+               str(tmp_path / "completed")]
+
+    # Act
+    with gzip.open(str(dump_file_path), "rb") as dump_file:
+        with pytest.raises(EOFError):
+            sut.pipe_subprocess(command, stdin_source=lambda: dump_file.read(100))
+
+    # Assert
+    assert not (tmp_path / "completed").exists()
+
+# endregion pipe_subprocess()
+
+
+# region build_argv()
+
+def test_build_argv_given_quoted_placeholder_then_value_is_a_single_argument():
+    """ Given a quoted placeholder, then its value is a single argument with no
+    quotes, whatever its content"""
+
+    # Arrange
+    template = "wp option add {option_name} \"{option_value}\" --path={path}"
+
+    # Act
+    result = sut.build_argv(template, option_name="blogname", option_value="My \"quoted\" $site", path="/wp")
+
+    # Assert
+    assert result == ["wp", "option", "add", "blogname", "My \"quoted\" $site", "--path=/wp"]
+
+
+def test_build_argv_given_empty_or_none_values_then_drops_their_tokens():
+    """ Given "" or None values, then their tokens are not in the result"""
+
+    # Arrange
+    template = "wp core version --path={path} {debug_info} {skip}"
+
+    # Act
+    result = sut.build_argv(template, path="/wp", debug_info="", skip=None)
+
+    # Assert
+    assert result == ["wp", "core", "version", "--path=/wp"]
+
+
+def test_build_argv_given_empty_value_of_quoted_placeholder_then_keeps_it_as_an_argument():
+    """ Given "" for a quoted placeholder, then it is an empty argument, so the
+    command does not miss (and prompt for) the value"""
+
+    # Arrange
+    template = "wp option update {option_name} \"{option_value}\" {autoload} --path={path} {debug_info}"
+
+    # Act
+    result = sut.build_argv(template, option_name="blogdescription", option_value="", autoload="", path="/wp",
+                            debug_info="")
+
+    # Assert
+    assert result == ["wp", "option", "update", "blogdescription", "", "--path=/wp"]
+
+
+def test_build_argv_given_list_value_then_splices_its_items():
+    """ Given a list value for a placeholder token, then every item is an
+    argument"""
+
+    # Arrange
+    template = "git {auth} push origin {tag_name}"
+    auth = sut.build_argv("-c http.extraheader=\"AUTHORIZATION: {auth_header}\"", auth_header="basic foo")
+
+    # Act
+    result = sut.build_argv(template, auth=auth, tag_name="v1")
+
+    # Assert
+    assert result == ["git", "-c", "http.extraheader=AUTHORIZATION: basic foo", "push", "origin", "v1"]
+
+# endregion build_argv()
+
+
+# region call_subprocess(list)
+
+@mock.patch.object(subprocess, "Popen")
+def test_call_subprocess_given_argv_then_calls_popen_without_shell(subprocess_mock):
+    """ Given a list of arguments, then calls subprocess.Popen without a shell
+    and with the executable resolved"""
+
+    # Arrange
+    command = [sys.executable, "-V"]
+    subprocess_mock.return_value.communicate.return_value = (b"", b"")
+
+    # Act
+    sut.call_subprocess(command)
+
+    # Assert
+    subprocess_mock.assert_called_once_with(command, executable=sys.executable, close_fds=False,
+                                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                            stdin=subprocess.DEVNULL)
+
+
+def test_call_subprocess_with_result_given_argv_then_arguments_are_not_interpreted():
+    """ Given a list of arguments, then they reach the process as they are"""
+
+    # Arrange
+    command = [sys.executable, "-c", "import sys; print(sys.argv[1])", "$HOME \"*\""]
+
+    # Act
+    result = sut.call_subprocess_with_result(command)
+
+    # Assert
+    assert result.strip() == "$HOME \"*\""
+
+
+def test_call_subprocess_given_argv_when_executable_not_found_then_logs_error():
+    """ Given a list of arguments, when the executable does not exist, then
+    logs the error instead of raising"""
+
+    # Arrange
+    command = ["devops-toolset-not-found-executable"]
+
+    # Act
+    with mock.patch.object(log_tools, "log_stdouterr") as logging_mock:
+        sut.call_subprocess(command)
+
+    # Assert
+    logging_mock.assert_called_once_with(mock.ANY, log_tools.LogLevel.error)
+
+
+def test_call_subprocess_with_result_given_argv_when_executable_not_found_then_returns_none():
+    """ Given a list of arguments, when the executable does not exist, then
+    returns None"""
+
+    # Arrange
+    command = ["devops-toolset-not-found-executable"]
+
+    # Act
+    result = sut.call_subprocess_with_result(command)
+
+    # Assert
+    assert result is None
+
+# endregion call_subprocess(list)
+
+
+# region run_commands()
+
+def test_run_commands_given_commands_then_returns_results_in_input_order():
+    """ Given several commands, then returns their results in the same order,
+    whatever order they finish in"""
+
+    # Arrange
+    commands = [[sys.executable, "-c", f"import time; time.sleep({delay}); print({index})"]
+                for index, delay in enumerate([0.3, 0, 0.1])]
+
+    # Act
+    results = sut.run_commands(commands, max_workers=3)
+
+    # Assert
+    assert [result.out.strip() for result in results] == ["0", "1", "2"]
+    assert all(result.succeeded for result in results)
+
+
+def test_run_commands_given_stop_on_failure_when_command_fails_then_stops_the_rest():
+    """ Given stop_on_failure, when a command fails, then the running commands
+    are terminated and the pending ones are not started"""
+
+    # Arrange
+    commands = [[sys.executable, "-c", "import time; time.sleep(30)"],
+                [sys.executable, "-c", "import sys; sys.exit(2)"],
+                [sys.executable, "-c", "print('never')"]]
+
+    # Act
+    results = sut.run_commands(commands, max_workers=2)
+
+    # Assert
+    assert results[0].stopped and results[0].returncode != 0
+    assert not results[1].stopped and results[1].returncode == 2
+    assert results[2].stopped and results[2].returncode is None
+
+
+def test_run_commands_given_no_stop_on_failure_when_command_fails_then_runs_the_rest():
+    """ Given stop_on_failure False, when a command fails, then the other
+    commands are run"""
+
+    # Arrange
+    commands = [python_command("import sys; sys.exit(1)"), python_command("print('ok')")]
+
+    # Act
+    results = sut.run_commands(commands, max_workers=1, stop_on_failure=False)
+
+    # Assert
+    assert [result.succeeded for result in results] == [False, True]
+    assert results[1].out.strip() == "ok"
+
+
+def test_run_commands_given_commands_then_logs_each_output_together():
+    """ Given several commands running at the same time, then the output of
+    each one is logged right after its command"""
+
+    # Arrange
+    code = "import sys, time\nfor i in range(3): print(sys.argv[1]); sys.stdout.flush(); time.sleep(0.05)"
+    commands = [[sys.executable, "-c", code, name] for name in ["a", "b"]]
+    logged = []
+
+    # Act
+    with mock.patch.object(log_tools, "log_stdouterr", side_effect=lambda output, level: logged.append(output)):
+        with mock.patch.object(log_tools, "log_list", side_effect=lambda logs, level: logged.extend(logs)):
+            sut.run_commands(commands, max_workers=2)
+
+    # Assert
+    assert len(logged) == 4
+    for command_text, output in (logged[0:2], logged[2:4]):
+        assert output.split() == [command_text[-1].encode()] * 3
+
+# endregion run_commands()
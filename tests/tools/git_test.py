@@ -3,6 +3,7 @@
 import io
 import pathlib
 import pytest
+import devops_toolset.tools.cli as cli
 import devops_toolset.tools.git as sut
 import devops_toolset.filesystem.paths as path_tools
 from unittest.mock import patch, mock_open, call, ANY
@@ -79,6 +80,30 @@ def test_find_gitignore_exclusion_given_path_when_exclusion_exists_then_returns_
 
 # endregion
 
+# region get_head_commit_sha()
+
+
+@patch("devops_toolset.tools.cli.call_subprocess_with_result")
+@pytest.mark.parametrize("short, output, expected_argv, expected", [
+    (True, "abc1234\n", ["git", "-C", "/pathto/repo", "rev-parse", "--short", "HEAD"], "abc1234"),
+    (False, None, ["git", "-C", "/pathto/repo", "rev-parse", "HEAD"], None)
+])
+def test_get_head_commit_sha_returns_sha(call_subprocess_with_result_mock, short, output, expected_argv, expected):
+    """Given a path, returns the SHA of the HEAD commit, or None if it cannot
+    be read"""
+
+    # Arrange
+    call_subprocess_with_result_mock.return_value = output
+
+    # Act
+    result = sut.get_head_commit_sha("/pathto/repo", short)
+
+    # Assert
+    call_subprocess_with_result_mock.assert_called_once_with(expected_argv)
+    assert result == expected
+
+# endregion
+
 # region get_gitignore_path()
 
 
@@ -151,8 +176,9 @@ def test_git_commit_when_not_skip_then_call_subprocess(call_subprocess):
 
     # Arrange
     skip = False
-    expected_command_1 = commands.get("git_add")
-    expected_command_2 = commands.get("git_commit_m").format(message=literals.get("git_add_project_structure_message"))
+    expected_command_1 = cli.build_argv(commands.get("git_add"))
+    expected_command_2 = cli.build_argv(commands.get("git_commit_m"),
+                                        message=literals.get("git_add_project_structure_message"))
 
     # Act
     sut.git_commit(skip)
@@ -315,7 +341,7 @@ def test_git_tag_add_calls_git_tag_add_command(call_subprocess):
     # Arrange
     tag_name = 'test'
     commit_name = 'bnd6f45'
-    expected_command = commands.get("git_tag_add").format(tag_name=tag_name, commit_name=commit_name)
+    expected_command = cli.build_argv(commands.get("git_tag_add"), tag_name=tag_name, commit_name=commit_name)
 
     # Act
     sut.git_tag_add(tag_name, commit_name, False)
@@ -331,9 +357,9 @@ def test_git_tag_add_calls_git_push_tag_command(call_subprocess, clidata):
     tag_name = 'test'
     commit_name = 'bnd6f45'
     auth_header = clidata.auth_header
-    auth_part = commands.get("git_auth").format(auth_header=auth_header)
-    expected_command_1 = commands.get("git_tag_add").format(tag_name=tag_name, commit_name=commit_name)
-    expected_command_2 = commands.get("git_push_tag").format(tag_name=tag_name, auth=auth_part)
+    auth_part = cli.build_argv(commands.get("git_auth"), auth_header=auth_header)
+    expected_command_1 = cli.build_argv(commands.get("git_tag_add"), tag_name=tag_name, commit_name=commit_name)
+    expected_command_2 = cli.build_argv(commands.get("git_push_tag"), tag_name=tag_name, auth=auth_part)
 
     # Act
     sut.git_tag_add(tag_name, commit_name, True, auth_header)
@@ -355,7 +381,7 @@ def test_git_tag_delete_calls_git_tag_add_command(call_subprocess):
     # Arrange
     tag_name = 'test'
     commit_name = 'bnd6f45'
-    expected_command = commands.get("git_tag_delete").format(tag_name=tag_name, commit_name=commit_name)
+    expected_command = cli.build_argv(commands.get("git_tag_delete"), tag_name=tag_name, commit_name=commit_name)
 
     # Act
     sut.git_tag_delete(tag_name, False)
@@ -370,9 +396,9 @@ def test_git_tag_delete_calls_git_push_tag_command(call_subprocess, clidata):
     # Arrange
     tag_name = 'test'
     auth_header = clidata.auth_header
-    auth_part = commands.get("git_auth").format(auth_header=auth_header)
-    expected_command_1 = commands.get("git_tag_delete").format(tag_name=tag_name)
-    expected_command_2 = commands.get("git_push_tag_delete").format(tag_name=tag_name, auth=auth_part)
+    auth_part = cli.build_argv(commands.get("git_auth"), auth_header=auth_header)
+    expected_command_1 = cli.build_argv(commands.get("git_tag_delete"), tag_name=tag_name)
+    expected_command_2 = cli.build_argv(commands.get("git_push_tag_delete"), tag_name=tag_name, auth=auth_part)
 
     # Act
     sut.git_tag_delete(tag_name, True, auth_header)
@@ -393,9 +419,9 @@ def test_git_tag_exist_calls_git_tag_check_command(call_subprocess, clidata):
     """ Calls git_tag_check command with necessary parameters """
     # Arrange
     tag_name = 'test'
-    auth_header = commands.get("git_auth").format(auth_header=clidata.auth_header)
+    auth_header = cli.build_argv(commands.get("git_auth"), auth_header=clidata.auth_header)
     remote_name = 'origin'
-    expected_command = commands.get("git_tag_check").format(
+    expected_command = cli.build_argv(commands.get("git_tag_check"),
         remote_name=remote_name, auth=auth_header, tag_name=tag_name)
 
     # Act
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch, ANY
 
+import devops_toolset.tools.cli as cli
 import devops_toolset.tools.svn as sut
 from devops_toolset.core.CommandsCore import CommandsCore
 from devops_toolset.core.LiteralsCore import LiteralsCore
@@ -20,7 +21,7 @@ def test_svn_add_calls_svnadd_command(call_subprocess_mock, svndata):
     """Checks if svn add command is called as subprocess"""
 
     # Arrange
-    expected_command = commands.get("svn_add").format(files_glob=svndata.glob)
+    expected_command = cli.build_argv(commands.get("svn_add"), files_glob=svndata.glob)
 
     # Act
     sut.svn_add(svndata.glob)
@@ -41,7 +42,7 @@ def test_svn_checkin_calls_checkin_command(call_subprocess_mock, svndata):
     """Checks if svn check in command is called as subprocess"""
 
     # Arrange
-    expected_command = commands.get("svn_checkin").format(comment=svndata.comment,
+    expected_command = cli.build_argv(commands.get("svn_checkin"), comment=svndata.comment,
                                                           username=svndata.username,
                                                           password=svndata.password)
 
@@ -64,7 +65,7 @@ def test_svn_checkout_calls_checkout_command(call_subprocess_mock, svndata):
     """Checks if svn check out command is called as subprocess"""
 
     # Arrange
-    expected_command = commands.get("svn_checkout").format(url=svndata.repo_url,
+    expected_command = cli.build_argv(commands.get("svn_checkout"), url=svndata.repo_url,
                                                            local_path=svndata.path)
 
     # Act
@@ -86,7 +87,7 @@ def test_svn_copy_calls_copy_command(call_subprocess_mock, svndata):
     """Checks if svn copy command is called as subprocess"""
 
     # Arrange
-    expected_command = commands.get("svn_copy").format(origin=svndata.path,
+    expected_command = cli.build_argv(commands.get("svn_copy"), origin=svndata.path,
                                                        destination=svndata.path)
 
     # Act